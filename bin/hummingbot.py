@@ -21,6 +21,7 @@ from hummingbot import (
 )
 from hummingbot.client.ui.stdout_redirection import patch_stdout
 from hummingbot.core.management.console import start_management_console
+from hummingbot.core.management.metrics_exporter import start_metrics_exporter
 from hummingbot.core.utils.async_utils import safe_gather
 
 
@@ -59,6 +60,9 @@ async def main():
         if global_config_map.get("debug_console").value:
             management_port: int = detect_available_port(8211)
             tasks.append(start_management_console(locals(), host="localhost", port=management_port))
+        if global_config_map.get("metrics_exporter_enabled").value:
+            tasks.append(start_metrics_exporter(host="localhost",
+                                                port=global_config_map.get("metrics_exporter_port").value))
         await safe_gather(*tasks)
 
 if __name__ == "__main__":
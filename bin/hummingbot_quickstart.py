@@ -26,6 +26,7 @@ from hummingbot.client.settings import STRATEGIES
 from hummingbot.core.utils.wallet_setup import unlock_wallet
 from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.management.console import start_management_console
+from hummingbot.core.management.metrics_exporter import start_metrics_exporter
 from bin.hummingbot import (
     detect_available_port,
     main as normal_start,
@@ -96,6 +97,9 @@ async def quick_start():
             if global_config_map.get("debug_console").value:
                 management_port: int = detect_available_port(8211)
                 tasks.append(start_management_console(locals(), host="localhost", port=management_port))
+            if global_config_map.get("metrics_exporter_enabled").value:
+                tasks.append(start_metrics_exporter(host="localhost",
+                                                    port=global_config_map.get("metrics_exporter_port").value))
             await safe_gather(*tasks)
 
     except Exception as e:
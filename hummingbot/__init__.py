@@ -92,7 +92,7 @@ def add_remote_logger_handler(loggers):
     try:
         remote_logger = ReportingProxyHandler(level="DEBUG",
                                               proxy_url="https://api.coinalpha.com/reporting-proxy",
-                                              capacity=5
+                                              capacity=100
                                               )
         root_logger.addHandler(remote_logger)
         for logger_name in loggers:
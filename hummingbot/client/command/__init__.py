@@ -8,6 +8,7 @@ from .help_command import HelpCommand
 from .history_command import HistoryCommand
 from .list_command import ListCommand
 from .paper_trade_command import PaperTradeCommand
+from .profile_command import ProfileCommand
 from .start_command import StartCommand
 from .status_command import StatusCommand
 from .stop_command import StopCommand
@@ -24,6 +25,7 @@ __all__ = [
     HistoryCommand,
     ListCommand,
     PaperTradeCommand,
+    ProfileCommand,
     StartCommand,
     StatusCommand,
     StopCommand,
@@ -1,36 +1,119 @@
+import itertools
+import numpy as np
+import os
 import pandas as pd
 import threading
 from os.path import (
     join,
     dirname
 )
-from typing import List
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+)
 from hummingbot.model.trade_fill import TradeFill
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from hummingbot.client.hummingbot_application import HummingbotApplication
 
+EXPORT_CHUNK_SIZE = 10000
+EXPORT_FORMATS = ["csv", "npz"]
+
+
+def iter_trade_chunks(trades: Iterable[Any], chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    """
+    Converts trades to display data frames of at most `chunk_size` rows each, so that exports never hold more than one
+    chunk in memory. Data frame indices continue across chunks.
+    """
+    trades_iterator: Iterator[Any] = iter(trades)
+    offset: int = 0
+    while True:
+        chunk: List[Any] = list(itertools.islice(trades_iterator, chunk_size))
+        if len(chunk) == 0:
+            return
+        df: pd.DataFrame = TradeFill.to_pandas(chunk)
+        df.index = pd.RangeIndex(offset, offset + len(df))
+        offset += len(df)
+        yield df
+
+
+def export_trades_to_csv(trades: Iterable[Any], path: str, chunk_size: int = EXPORT_CHUNK_SIZE) -> int:
+    """
+    Writes trades to a csv file, one chunk at a time.
+
+    :return: number of trades written
+    """
+    num_trades: int = 0
+    for df in iter_trade_chunks(trades, chunk_size):
+        df.to_csv(path, header=(num_trades == 0), mode="w" if num_trades == 0 else "a")
+        num_trades += len(df)
+    return num_trades
+
+
+def export_trades_to_npz(trades: Iterable[Any], path: str, chunk_size: int = EXPORT_CHUNK_SIZE) -> int:
+    """
+    Writes trades to a directory of compressed columnar `.npz` files, one file per chunk, each holding one array per
+    display column. Load them with `load_npz_trades_export()`.
+
+    :return: number of trades written
+    """
+    num_trades: int = 0
+    for part, df in enumerate(iter_trade_chunks(trades, chunk_size)):
+        if part == 0:
+            os.makedirs(path, exist_ok=True)
+        columns: Dict[str, np.ndarray] = {}
+        for i, column in enumerate(TradeFill.DISPLAY_COLUMNS):
+            values: np.ndarray = df[column].to_numpy()
+            # Store text columns as fixed width unicode arrays, so they can be loaded without pickling.
+            columns[f"col_{i}"] = values.astype(str) if values.dtype.kind == "O" else values
+        np.savez_compressed(join(path, f"part-{part:05d}.npz"), **columns)
+        num_trades += len(df)
+    return num_trades
+
+
+def load_npz_trades_export(path: str) -> pd.DataFrame:
+    parts: List[pd.DataFrame] = []
+    for file_name in sorted(os.listdir(path)):
+        if file_name.startswith("part-") and file_name.endswith(".npz"):
+            with np.load(join(path, file_name)) as part:
+                parts.append(pd.DataFrame({column: part[f"col_{i}"]
+                                           for i, column in enumerate(TradeFill.DISPLAY_COLUMNS)}))
+    if len(parts) == 0:
+        return pd.DataFrame(columns=TradeFill.DISPLAY_COLUMNS)
+    return pd.concat(parts, ignore_index=True)
+
 
 class ExportTradesCommand:
     def export_trades(self,  # type: HummingbotApplication
-                      path: str = ""):
+                      path: str = "",
+                      export_format: str = "csv"):
         if threading.current_thread() != threading.main_thread():
-            self.ev_loop.call_soon_threadsafe(self.export_trades, path)
+            self.ev_loop.call_soon_threadsafe(self.export_trades, path, export_format)
+            return
+
+        if export_format not in EXPORT_FORMATS:
+            self._notify(f"Invalid export format {export_format}. Supported formats are: {', '.join(EXPORT_FORMATS)}.")
             return
 
         if not path:
-            fname = f"trades_{pd.Timestamp.now().strftime('%Y-%m-%d-%H-%M-%S')}.csv"
+            fname = f"trades_{pd.Timestamp.now().strftime('%Y-%m-%d-%H-%M-%S')}.{export_format}"
             path = join(dirname(__file__), f"../../../logs/{fname}")
 
-        trades: List[TradeFill] = self._get_trades_from_session(self.init_time)
-        
-        if len(trades) > 0:
-            try:
-                df: pd.DataFrame = TradeFill.to_pandas(trades)
-                df.to_csv(path, header=True)
-                self._notify(f"Successfully saved trades to {path}")
-            except Exception as e:
-                self._notify(f"Error saving trades to {path}: {e}")
+        try:
+            trades: Iterator[Any] = self._iter_trades_from_session(self.init_time)
+            if export_format == "npz":
+                num_trades: int = export_trades_to_npz(trades, path)
+            else:
+                num_trades: int = export_trades_to_csv(trades, path)
+        except Exception as e:
+            self._notify(f"Error saving trades to {path}: {e}")
+            return
+
+        if num_trades > 0:
+            self._notify(f"Successfully saved {num_trades} trades to {path}")
         else:
             self._notify("No past trades to export.")
@@ -42,10 +42,11 @@ class HistoryCommand:
             self._notify("  Balance snapshots are not available before bot starts")
             return
         rows = []
+        current_balances: Dict[str, Dict[str, float]] = self.balance_snapshot()
         for market_name, market in self.markets.items():
             for asset in set(a.upper() for a in self.assets):
                 starting_balance = self.starting_balances.get(asset).get(market_name)
-                current_balance = self.balance_snapshot().get(asset).get(market_name)
+                current_balance = current_balances.get(asset).get(market_name)
                 rows.append([market.display_name,
                              asset,
                              float(starting_balance),
@@ -62,6 +63,7 @@ class HistoryCommand:
                                                       ) -> PerformanceAnalysis:
         performance_analysis = PerformanceAnalysis()
         dedup_set: Set[Tuple[str, str, bool]] = set()
+        current_balances: Dict[str, Dict[str, float]] = self.balance_snapshot()
 
         for market_trading_pair_tuple in self.market_trading_pair_tuples:
             for is_base in [True, False]:
@@ -74,7 +76,7 @@ class HistoryCommand:
                         amount = self.starting_balances[asset_name][market_name]
                     else:
                         amount = self.starting_balances[asset_name][market_name] if is_starting \
-                            else self.balance_snapshot()[asset_name][market_name]
+                            else current_balances[asset_name][market_name]
                     amount = float(amount)
 
                     # Adding this check to prevent assets in the same market to be added multiple times
@@ -7,6 +7,7 @@ from sqlalchemy.orm import (
 from typing import (
     List,
     Any,
+    Iterator,
     Optional,
 )
 
@@ -70,21 +71,44 @@ class ListCommand:
 
     def _get_trades_from_session(self,  # type: HummingbotApplication
                                  start_timestamp: int,
-                                 number_of_rows: Optional[int] = None) -> List[TradeFill]:
+                                 number_of_rows: Optional[int] = None) -> List[Any]:
+        """
+        :return: the trades since `start_timestamp` in ascending timestamp order - or if `number_of_rows` is given, the
+                 latest `number_of_rows` of them - as rows of `TradeFill.display_query_columns()`.
+        """
+        if self.markets_recorder is not None:
+            self.markets_recorder.flush_for_read()
         session: Session = self.trade_fill_db.get_shared_session()
         query: Query = (session
-                        .query(TradeFill)
+                        .query(*TradeFill.display_query_columns())
                         .filter(TradeFill.timestamp >= start_timestamp)
                         .order_by(TradeFill.timestamp.desc()))
         if number_of_rows is None:
-            result: List[TradeFill] = query.all() or []
+            result: List[Any] = query.all() or []
         else:
-            result: List[TradeFill] = query.limit(number_of_rows).all() or []
+            result: List[Any] = query.limit(number_of_rows).all() or []
 
         # Get the latest 100 trades in ascending timestamp order
         result.reverse()
         return result
 
+    def _iter_trades_from_session(self,  # type: HummingbotApplication
+                                  start_timestamp: int,
+                                  batch_size: int = 1000) -> Iterator[Any]:
+        """
+        Streams the trades since `start_timestamp` in ascending timestamp order, as rows of
+        `TradeFill.display_query_columns()`, loading `batch_size` rows at a time.
+        """
+        if self.markets_recorder is not None:
+            self.markets_recorder.flush_for_read()
+        with self.trade_fill_db.begin() as session:
+            query: Query = (session
+                            .query(*TradeFill.display_query_columns())
+                            .filter(TradeFill.timestamp >= start_timestamp)
+                            .order_by(TradeFill.timestamp)
+                            .yield_per(batch_size))
+            yield from query
+
     def list_trades(self,  # type: HummingbotApplication
                     ):
         if threading.current_thread() != threading.main_thread():
@@ -98,8 +122,8 @@ class ListCommand:
             self._notify("Bot not started. No past trades.")
         else:
             # Query for maximum number of trades to display + 1
-            queried_trades: List[TradeFill] = self._get_trades_from_session(self.init_time,
-                                                                            MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT + 1)
+            queried_trades: List[Any] = self._get_trades_from_session(self.init_time,
+                                                                      MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT + 1)
             df: pd.DataFrame = TradeFill.to_pandas(queried_trades)
 
             if len(df) > 0:
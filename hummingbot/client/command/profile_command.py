@@ -0,0 +1,52 @@
+import threading
+import time
+from os.path import (
+    join,
+    dirname
+)
+from typing import Optional
+
+from hummingbot.core.utils.tick_profiler import TickProfiler
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication
+
+
+class ProfileCommand:
+    def profile(self,  # type: HummingbotApplication
+                action: Optional[str] = None,
+                path: str = "",
+                top: int = 10):
+        if threading.current_thread() != threading.main_thread():
+            self.ev_loop.call_soon_threadsafe(self.profile, action, path, top)
+            return
+
+        profiler: TickProfiler = TickProfiler.get_instance()
+        if action is None:
+            action = "stop" if profiler.enabled else "start"
+
+        if action == "start":
+            if profiler.enabled:
+                self._notify("Profiling is already running. Use `profile report` or `profile stop` to see results.")
+                return
+            profiler.start()
+            self._notify("Profiling clock ticks and event dispatch. Use `profile stop` to save a flame graph.")
+            return
+
+        if not profiler.enabled and profiler.num_ticks == 0:
+            self._notify("No profile to report. Use `profile start` first.")
+            return
+        if action == "stop" and profiler.enabled:
+            profiler.stop()
+
+        if not path:
+            fname = f"profile_{time.strftime('%Y-%m-%d-%H-%M-%S')}.folded"
+            path = join(dirname(__file__), f"../../../logs/{fname}")
+        self._notify(profiler.format_report(top))
+        try:
+            profiler.write_collapsed(path)
+        except Exception as e:
+            self._notify(f"Error saving profile to {path}: {e}")
+            return
+        self._notify(f"\n  Saved collapsed stacks to {path}. Open them with flamegraph.pl or speedscope.")
@@ -26,6 +26,8 @@ from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.data_feed.data_feed_base import DataFeedBase
 from hummingbot.data_feed.coin_cap_data_feed import CoinCapDataFeed
 from hummingbot.core.utils.kill_switch import KillSwitch
+from hummingbot.core.utils.loop_watchdog import LoopWatchdog
+from hummingbot.market.order_latency_recorder import OrderLatencyRecorder
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -98,8 +100,13 @@ class StartCommand:
                     if len(market.limit_orders) > 0:
                         self._notify(f"  Cancelling dangling limit orders on {market.name}...")
                         await market.cancel_all(5.0)
+            self.order_latency_recorder = OrderLatencyRecorder([market for market in self.markets.values()
+                                                                if market is not None])
+            self.order_latency_recorder.start()
             if self.strategy:
                 self.clock.add_iterator(self.strategy)
+            self.loop_watchdog = LoopWatchdog(self)
+            self.loop_watchdog.start()
             self.strategy_task: asyncio.Task = safe_ensure_future(self._run_clock(), loop=self.ev_loop)
             self._notify(f"\n  '{strategy_name}' strategy started.\n"
                          f"  You can use the `status` command to query the progress.")
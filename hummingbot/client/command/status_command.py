@@ -128,6 +128,10 @@ class StatusCommand:
         else:
             self._notify(self.strategy.format_status() + "\n")
 
+        # Event loop stalls and clock tick overruns.
+        if self.loop_watchdog is not None:
+            self._notify(self.loop_watchdog.format_status() + "\n")
+
         # Application warnings.
         self._expire_old_application_warnings()
         if check_dev_mode() and len(self._app_warnings) > 0:
@@ -49,9 +49,17 @@ class StopCommand:
         if self.kill_switch is not None:
             self.kill_switch.stop()
 
+        if self.order_latency_recorder is not None:
+            self.order_latency_recorder.stop()
+
+        if self.loop_watchdog is not None:
+            self.loop_watchdog.stop()
+
         self.wallet = None
         self.strategy_task = None
         self.strategy = None
         self.market_pair = None
         self.clock = None
         self.markets_recorder = None
+        self.order_latency_recorder = None
+        self.loop_watchdog = None
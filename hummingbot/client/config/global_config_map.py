@@ -47,6 +47,16 @@ global_config_map = {
                                                   type_str="bool",
                                                   required_if=lambda: False,
                                                   default=False),
+    "metrics_exporter_enabled":         ConfigVar(key="metrics_exporter_enabled",
+                                                  prompt=None,
+                                                  type_str="bool",
+                                                  required_if=lambda: False,
+                                                  default=False),
+    "metrics_exporter_port":            ConfigVar(key="metrics_exporter_port",
+                                                  prompt=None,
+                                                  type_str="int",
+                                                  required_if=lambda: False,
+                                                  default=9108),
     "strategy_report_interval":         ConfigVar(key="strategy_report_interval",
                                                   prompt=None,
                                                   type_str="float",
@@ -152,6 +162,17 @@ global_config_map = {
                                                   prompt="Which Ethereum node would you like your client to connect "
                                                          "to? >>> ",
                                                   required_if=using_wallet),
+    # Optional websocket endpoint of the Ethereum node, to receive new blocks through a newHeads subscription.
+    "ethereum_ws_url":                  ConfigVar(key="ethereum_ws_url",
+                                                  prompt=None,
+                                                  required_if=lambda: False,
+                                                  default=None),
+    # Whether or not to save recent Ethereum block headers on exit, so they aren't fetched again on the next start.
+    "ethereum_block_cache_persistent":  ConfigVar(key="ethereum_block_cache_persistent",
+                                                  prompt=None,
+                                                  required_if=lambda: False,
+                                                  type_str="bool",
+                                                  default=False),
     # Whether or not to invoke cancel_all on exit if marketing making on a open order book DEX (e.g. Radar Relay)
     "on_chain_cancel_on_exit":          ConfigVar(key="on_chain_cancel_on_exit",
                                                   prompt="Would you like to cancel transactions on chain if using an "
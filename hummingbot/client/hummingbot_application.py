@@ -5,6 +5,7 @@ from collections import deque
 import logging
 import time
 from eth_account.local import LocalAccount
+from os.path import join
 from typing import (
     List,
     Dict,
@@ -14,6 +15,7 @@ from typing import (
     Deque
 )
 
+from hummingbot import data_path
 from hummingbot.client.command import __all__ as commands
 from hummingbot.core.clock import Clock
 from hummingbot.core.data_type.order_book_tracker import OrderBookTrackerDataSourceType
@@ -52,6 +54,8 @@ from hummingbot.strategy.strategy_base import StrategyBase
 from hummingbot.strategy.cross_exchange_market_making import CrossExchangeMarketPair
 
 from hummingbot.core.utils.kill_switch import KillSwitch
+from hummingbot.core.utils.loop_watchdog import LoopWatchdog
+from hummingbot.market.order_latency_recorder import OrderLatencyRecorder
 from hummingbot.data_feed.data_feed_base import DataFeedBase
 from hummingbot.notifier.notifier_base import NotifierBase
 from hummingbot.notifier.telegram_notifier import TelegramNotifier
@@ -121,6 +125,8 @@ class HummingbotApplication(*commands):
         self.data_feed: Optional[DataFeedBase] = None
         self.notifiers: List[NotifierBase] = []
         self.kill_switch: Optional[KillSwitch] = None
+        self.order_latency_recorder: Optional[OrderLatencyRecorder] = None
+        self.loop_watchdog: Optional[LoopWatchdog] = None
         self.liquidity_bounty: Optional[LiquidityBounty] = None
         self._initialize_liquidity_bounty()
         self._app_warnings: Deque[ApplicationWarning] = deque()
@@ -216,13 +222,19 @@ class HummingbotApplication(*commands):
 
     def _initialize_wallet(self, token_symbols: List[str]):
         ethereum_rpc_url = global_config_map.get("ethereum_rpc_url").value
+        ethereum_ws_url = global_config_map.get("ethereum_ws_url").value
+        block_cache_path: Optional[str] = (join(data_path(), "ethereum_block_cache.json")
+                                           if global_config_map.get("ethereum_block_cache_persistent").value
+                                           else None)
         erc20_token_addresses = get_erc20_token_addresses(token_symbols)
 
         if self.acct is not None:
             self.wallet: Web3Wallet = Web3Wallet(private_key=self.acct.privateKey,
                                                  backend_urls=[ethereum_rpc_url],
                                                  erc20_token_addresses=erc20_token_addresses,
-                                                 chain=EthereumChain.MAIN_NET)
+                                                 chain=EthereumChain.MAIN_NET,
+                                                 backend_websocket_urls=[ethereum_ws_url],
+                                                 block_cache_path=block_cache_path)
 
     def _initialize_markets(self, market_names: List[Tuple[str, List[str]]]):
         ethereum_rpc_url = global_config_map.get("ethereum_rpc_url").value
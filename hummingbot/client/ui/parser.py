@@ -61,6 +61,8 @@ def load_parser(hummingbot) -> ThrowingArgumentParser:
 
     export_trades_parser = subparsers.add_parser("export_trades", help="Export your trades to a csv file")
     export_trades_parser.add_argument("-p", "--path", help="Save csv to specific path")
+    export_trades_parser.add_argument("-f", "--format", dest="export_format", choices=["csv", "npz"], default="csv",
+                                      help="Export as csv, or as a directory of compressed columnar npz files")
     export_trades_parser.set_defaults(func=hummingbot.export_trades)
 
     get_balance_parser = subparsers.add_parser("get_balance", help="Print balance of a certain currency ")
@@ -84,6 +86,13 @@ def load_parser(hummingbot) -> ThrowingArgumentParser:
     paper_trade_parser = subparsers.add_parser("paper_trade", help="Enable / Disable paper trade mode.")
     paper_trade_parser.set_defaults(func=hummingbot.paper_trade)
 
+    profile_parser = subparsers.add_parser("profile", help="Profile clock ticks and event dispatch")
+    profile_parser.add_argument("action", nargs="?", default=None, choices=["start", "stop", "report"],
+                                help="Start or stop profiling, or report without stopping. Toggles if not given")
+    profile_parser.add_argument("-p", "--path", default="", help="Save the flame graph stacks to specific path")
+    profile_parser.add_argument("-t", "--top", type=int, default=10, help="Number of slowest ticks to show")
+    profile_parser.set_defaults(func=hummingbot.profile)
+
     start_parser = subparsers.add_parser("start", help="Start market making with Hummingbot")
     start_parser.add_argument("--log-level", help="Level of logging")
     start_parser.set_defaults(func=hummingbot.start)
@@ -8,9 +8,44 @@ from typing import List
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.utils.metrics import (
+    Counter,
+    Histogram,
+    MetricsRegistry,
+)
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
+CLOCK_TICK_SECONDS: Histogram = MetricsRegistry.get_instance().histogram(
+    "clock_tick_seconds",
+    "Time spent in the clock tick of each time iterator, by iterator class.",
+    ["iterator"]
+)
+CLOCK_TICK_OVERRUNS: Counter = MetricsRegistry.get_instance().counter(
+    "clock_tick_overruns",
+    "Clock ticks that took longer than the tick size, by the slowest time iterator of the tick.",
+    ["iterator"]
+)
+_tick_profiler = None
+_tick_watchdog = None
+
+
+def set_tick_profiler(profiler):
+    """
+    Sets the profiler every clock tick and time iterator tick is reported to - see TickProfiler. None to disable
+    profiling.
+    """
+    global _tick_profiler
+    _tick_profiler = profiler
+
+
+def set_tick_watchdog(watchdog):
+    """
+    Sets the watchdog that clock ticks taking longer than the tick size are reported to - see LoopWatchdog. None to
+    disable reporting.
+    """
+    global _tick_watchdog
+    _tick_watchdog = watchdog
 
 
 cdef class Clock:
@@ -90,6 +125,12 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            double tick_start_time
+            double tick_run_start_time
+            double iterator_time
+            double slowest_iterator_time
+            object slowest_iterator
+            object profiler
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -113,15 +154,46 @@ cdef class Clock:
                 self._current_tick = next_tick_time
 
                 # Run through all the child iterators.
-                for ci in self._current_context:
-                    child_iterator = ci
-                    try:
-                        child_iterator.c_tick(self._current_tick)
-                    except StopIteration:
-                        self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
-                        return
-                    except Exception:
-                        self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                profiler = _tick_profiler
+                if profiler is not None:
+                    profiler.begin_tick(self._current_tick)
+                tick_run_start_time = time.perf_counter()
+                slowest_iterator = None
+                slowest_iterator_time = 0.0
+                try:
+                    for ci in self._current_context:
+                        child_iterator = ci
+                        if profiler is not None:
+                            profiler.enter_iterator(child_iterator)
+                        tick_start_time = time.perf_counter()
+                        try:
+                            child_iterator.c_tick(self._current_tick)
+                        except StopIteration:
+                            self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
+                            return
+                        except Exception:
+                            self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                        finally:
+                            iterator_time = time.perf_counter() - tick_start_time
+                            CLOCK_TICK_SECONDS.labels(child_iterator.__class__.__name__).observe(iterator_time)
+                            if iterator_time > slowest_iterator_time:
+                                slowest_iterator = child_iterator
+                                slowest_iterator_time = iterator_time
+                            if profiler is not None:
+                                profiler.exit_iterator()
+
+                    # Report ticks that took longer than the tick size, along with their slowest time iterator.
+                    iterator_time = time.perf_counter() - tick_run_start_time
+                    if iterator_time > self._tick_size and slowest_iterator is not None:
+                        CLOCK_TICK_OVERRUNS.labels(slowest_iterator.__class__.__name__).inc()
+                        if _tick_watchdog is not None:
+                            _tick_watchdog.tick_overrun(self._current_tick,
+                                                        iterator_time,
+                                                        slowest_iterator.__class__.__name__,
+                                                        slowest_iterator_time)
+                finally:
+                    if profiler is not None:
+                        profiler.end_tick()
         finally:
             for ci in self._current_context:
                 child_iterator = ci
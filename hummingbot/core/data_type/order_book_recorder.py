@@ -0,0 +1,363 @@
+#!/usr/bin/env python
+
+import asyncio
+from collections import deque
+import logging
+import numpy as np
+import os
+import time
+from typing import (
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+# Side column values for diff and snapshot rows. Trade rows store the `TradeType` value of the trade instead.
+BID_SIDE = 0
+ASK_SIDE = 1
+
+CAPTURE_COLUMNS: Tuple[str, ...] = ("timestamp", "update_id", "message_type", "side", "price", "amount")
+INT64_MIN: int = -2 ** 63
+INT64_MAX: int = 2 ** 63 - 1
+
+
+class CaptureBatch(NamedTuple):
+    symbol: str
+    partition: str
+    sequence: int
+    columns: Dict[str, np.ndarray]
+
+
+class _ColumnBuffer:
+    """
+    Fixed capacity columnar row buffer for a single symbol. Memory use is bounded by the capacity given at creation.
+    """
+    def __init__(self, capacity: int):
+        self._capacity: int = capacity
+        self._size: int = 0
+        self._timestamp: np.ndarray = np.empty(capacity, dtype=np.float64)
+        self._update_id: np.ndarray = np.empty(capacity, dtype=np.int64)
+        self._message_type: np.ndarray = np.empty(capacity, dtype=np.int8)
+        self._side: np.ndarray = np.empty(capacity, dtype=np.int8)
+        self._price: np.ndarray = np.empty(capacity, dtype=np.float64)
+        self._amount: np.ndarray = np.empty(capacity, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def full(self) -> bool:
+        return self._size >= self._capacity
+
+    @property
+    def first_timestamp(self) -> float:
+        return float(self._timestamp[0]) if self._size > 0 else float("nan")
+
+    def append(self, timestamp: float, update_id: int, message_type: int, side: int, price: float, amount: float):
+        i: int = self._size
+        self._timestamp[i] = timestamp
+        self._update_id[i] = update_id
+        self._message_type[i] = message_type
+        self._side[i] = side
+        self._price[i] = price
+        self._amount[i] = amount
+        self._size = i + 1
+
+    def drain(self) -> Dict[str, np.ndarray]:
+        n: int = self._size
+        columns: Dict[str, np.ndarray] = {
+            "timestamp": self._timestamp[:n].copy(),
+            "update_id": self._update_id[:n].copy(),
+            "message_type": self._message_type[:n].copy(),
+            "side": self._side[:n].copy(),
+            "price": self._price[:n].copy(),
+            "amount": self._amount[:n].copy(),
+        }
+        self._size = 0
+        return columns
+
+
+class OrderBookRecorder:
+    """
+    Records the raw diff, snapshot and trade messages flowing through an order book tracker into per-symbol,
+    time-partitioned, compressed columnar capture files.
+
+    Captures are laid out as `<capture_dir>/<symbol>/<partition>/<first_timestamp_ms>-<session>-<sequence>.npz`, where
+    every file holds equal length arrays for each of `CAPTURE_COLUMNS`. Messages are buffered per symbol in fixed size column buffers, and full
+    buffers are handed over to a bounded write queue that is drained by a background task writing on the shared
+    executor. If the disk cannot keep up, whole batches are dropped (and counted) instead of blocking the event loop.
+
+    Recording is opt-in, per order book tracker: create a recorder and pass it to `OrderBookTracker.attach_recorder()`
+    before the tracker is started, e.g. from a data collection script. The tracker starts the recorder along with
+    itself, and `OrderBookTracker.close()` writes out everything the recorder has buffered before stopping it. Messages that can't be recorded - e.g. trade ids that don't fit in 64 bits - are
+    skipped and counted in `unsupported_messages`, and never affect the tracker.
+    """
+    DEFAULT_BATCH_SIZE = 4096
+    DEFAULT_MAX_PENDING_BATCHES = 64
+    DEFAULT_FLUSH_INTERVAL = 5.0
+    DEFAULT_PARTITION_INTERVAL = 3600.0
+    DEFAULT_CLOSE_TIMEOUT = 30.0
+
+    _obr_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._obr_logger is None:
+            cls._obr_logger = logging.getLogger(__name__)
+        return cls._obr_logger
+
+    def __init__(self,
+                 capture_dir: str,
+                 batch_size: int = DEFAULT_BATCH_SIZE,
+                 max_pending_batches: int = DEFAULT_MAX_PENDING_BATCHES,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+                 partition_interval: float = DEFAULT_PARTITION_INTERVAL):
+        self._capture_dir: str = capture_dir
+        self._batch_size: int = batch_size
+        self._max_pending_batches: int = max_pending_batches
+        self._flush_interval: float = flush_interval
+        self._partition_interval: float = partition_interval
+        self._buffers: Dict[str, _ColumnBuffer] = {}
+        self._sequences: Dict[str, int] = {}
+        self._pending_batches: Deque[CaptureBatch] = deque()
+        self._batch_ready: Optional[asyncio.Event] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        self._session_id: int = int(time.time() * 1e3)
+        self._rows_recorded: int = 0
+        self._rows_dropped: int = 0
+        self._batches_written: int = 0
+        self._unsupported_messages: int = 0
+
+    @property
+    def capture_dir(self) -> str:
+        return self._capture_dir
+
+    @property
+    def rows_recorded(self) -> int:
+        return self._rows_recorded
+
+    @property
+    def rows_dropped(self) -> int:
+        return self._rows_dropped
+
+    @property
+    def batches_written(self) -> int:
+        return self._batches_written
+
+    @property
+    def unsupported_messages(self) -> int:
+        return self._unsupported_messages
+
+    @property
+    def pending_batches(self) -> int:
+        return len(self._pending_batches)
+
+    @property
+    def running(self) -> bool:
+        return self._writer_task is not None
+
+    def start(self):
+        self.stop()
+        self._batch_ready = asyncio.Event()
+        self._writer_task = safe_ensure_future(self._writer_loop())
+        self._flush_task = safe_ensure_future(self._flush_loop())
+
+    def stop(self):
+        """
+        Stops the recorder right away. Buffered messages and batches that aren't written yet are lost - see `close()`.
+        """
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            self._writer_task = None
+
+    async def close(self, timeout: float = DEFAULT_CLOSE_TIMEOUT):
+        """
+        Writes all buffered messages, then stops the recorder. Waits at most `timeout` seconds for the writer, including
+        any write that is already in progress.
+        """
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        self.flush()
+        if self._writer_task is not None:
+            deadline: float = time.time() + timeout
+            # Batches are only removed from the queue once they are written.
+            while len(self._pending_batches) > 0 and not self._writer_task.done() and time.time() < deadline:
+                await asyncio.sleep(0.01)
+        if len(self._pending_batches) > 0:
+            self.logger().warning(f"Order book capture writer did not finish within {timeout} seconds. "
+                                  f"{len(self._pending_batches)} batches were not written.")
+        self.stop()
+
+    def record(self, message: OrderBookMessage):
+        """
+        Appends a tracker message to its symbol's buffer. Must be cheap - this is called inline with the data source
+        putting the message into the tracker's stream.
+        """
+        try:
+            message_type: OrderBookMessageType = message.type
+            symbol: str = message.symbol
+            timestamp: float = float(message.timestamp or time.time())
+            if message_type is OrderBookMessageType.TRADE:
+                content: Dict[str, any] = message.content
+                trade_id: int = self._to_int64(message.trade_id)
+                self._append(symbol, timestamp, trade_id, message_type.value,
+                             int(float(content["trade_type"])), float(content["price"]), float(content["amount"]))
+            else:
+                # Rows are only appended once the whole message is known to be convertible.
+                update_id: int = self._to_int64(message.update_id)
+                rows: List[Tuple[int, float, float]] = (
+                    [(BID_SIDE, float(row.price), float(row.amount)) for row in message.bids] +
+                    [(ASK_SIDE, float(row.price), float(row.amount)) for row in message.asks]
+                )
+                for side, price, amount in rows:
+                    self._append(symbol, timestamp, update_id, message_type.value, side, price, amount)
+        except (NotImplementedError, KeyError):
+            # Exchanges with order-based (rather than level-based) message semantics are not captured.
+            self._unsupported_messages += 1
+        except (ValueError, OverflowError, TypeError):
+            # E.g. trade ids that aren't 64 bit integers.
+            self._unsupported_messages += 1
+            self.logger().debug("Skipped recording an order book message that can't be stored in the capture "
+                                "columns - %s.", message, exc_info=True)
+
+    @staticmethod
+    def _to_int64(value: any) -> int:
+        int_value: int = int(value)
+        if not INT64_MIN <= int_value <= INT64_MAX:
+            raise OverflowError(f"{value} does not fit in 64 bits.")
+        return int_value
+
+    def flush(self):
+        """
+        Hands all non-empty buffers over to the writer, regardless of how full they are.
+        """
+        for symbol, buffer in self._buffers.items():
+            if len(buffer) > 0:
+                self._enqueue(symbol, buffer)
+
+    def _append(self, symbol: str, timestamp: float, update_id: int, message_type: int, side: int,
+                price: float, amount: float):
+        buffer: Optional[_ColumnBuffer] = self._buffers.get(symbol)
+        if buffer is None:
+            buffer = self._buffers[symbol] = _ColumnBuffer(self._batch_size)
+        buffer.append(timestamp, update_id, message_type, side, price, amount)
+        self._rows_recorded += 1
+        if buffer.full:
+            self._enqueue(symbol, buffer)
+
+    def _enqueue(self, symbol: str, buffer: _ColumnBuffer):
+        partition: str = self._partition_name(buffer.first_timestamp)
+        num_rows: int = len(buffer)
+        columns: Dict[str, np.ndarray] = buffer.drain()
+        if len(self._pending_batches) >= self._max_pending_batches:
+            self._rows_dropped += num_rows
+            self.logger().debug("Order book capture writer is falling behind. Dropped %d rows for %s.",
+                                num_rows, symbol)
+            return
+        sequence: int = self._sequences.get(symbol, 0)
+        self._sequences[symbol] = sequence + 1
+        self._pending_batches.append(CaptureBatch(symbol, partition, sequence, columns))
+        if self._batch_ready is not None:
+            self._batch_ready.set()
+
+    def _partition_name(self, timestamp: float) -> str:
+        partition_start: int = int(timestamp // self._partition_interval * self._partition_interval)
+        return time.strftime("%Y%m%d-%H%M%S", time.gmtime(partition_start))
+
+    def _write_batch(self, batch: CaptureBatch):
+        partition_dir: str = os.path.join(self._capture_dir, batch.symbol, batch.partition)
+        os.makedirs(partition_dir, exist_ok=True)
+        first_timestamp_ms: int = int(batch.columns["timestamp"][0] * 1e3)
+        file_name: str = f"{first_timestamp_ms:015d}-{self._session_id}-{batch.sequence:08d}.npz"
+        tmp_path: str = os.path.join(partition_dir, f".{file_name}.tmp")
+        with open(tmp_path, "wb") as fd:
+            np.savez_compressed(fd, **batch.columns)
+        # Readers only ever see complete files.
+        os.replace(tmp_path, os.path.join(partition_dir, file_name))
+
+    async def _writer_loop(self):
+        from hummingbot import get_executor
+        while True:
+            try:
+                await self._batch_ready.wait()
+                self._batch_ready.clear()
+                while len(self._pending_batches) > 0:
+                    batch: CaptureBatch = self._pending_batches[0]
+                    await self._ev_loop.run_in_executor(get_executor(), self._write_batch, batch)
+                    self._pending_batches.popleft()
+                    self._batches_written += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network("Unexpected error writing order book capture files.", exc_info=True,
+                                      app_warning_msg="Could not write order book capture files. "
+                                                      "Check the capture directory and free disk space.")
+                # Drop the offending batch so a single bad write does not wedge the recorder.
+                if len(self._pending_batches) > 0:
+                    self._rows_dropped += len(self._pending_batches.popleft().columns["timestamp"])
+                await asyncio.sleep(5.0)
+
+    async def _flush_loop(self):
+        while True:
+            try:
+                await asyncio.sleep(self._flush_interval)
+                self.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error flushing order book capture buffers.", exc_info=True)
+
+
+def iter_capture_files(capture_dir: str, symbol: str) -> Iterable[str]:
+    symbol_dir: str = os.path.join(capture_dir, symbol)
+    if not os.path.isdir(symbol_dir):
+        return
+    for partition in sorted(os.listdir(symbol_dir)):
+        partition_dir: str = os.path.join(symbol_dir, partition)
+        if not os.path.isdir(partition_dir):
+            continue
+        # File names start with the zero padded timestamp of their first row, so name order is time order.
+        for file_name in sorted(os.listdir(partition_dir)):
+            if file_name.endswith(".npz") and not file_name.startswith("."):
+                yield os.path.join(partition_dir, file_name)
+
+
+def load_capture(capture_dir: str,
+                 symbol: str,
+                 start_timestamp: float = 0.0,
+                 end_timestamp: float = float("inf")) -> Dict[str, np.ndarray]:
+    """
+    Loads all captured rows of a symbol within [start_timestamp, end_timestamp) as a dict of concatenated columns.
+    """
+    chunks: Dict[str, List[np.ndarray]] = {column: [] for column in CAPTURE_COLUMNS}
+    for file_path in iter_capture_files(capture_dir, symbol):
+        with np.load(file_path) as data:
+            timestamps: np.ndarray = data["timestamp"]
+            mask: np.ndarray = (timestamps >= start_timestamp) & (timestamps < end_timestamp)
+            if not mask.any():
+                continue
+            for column in CAPTURE_COLUMNS:
+                chunks[column].append(data[column][mask])
+    dtypes: Dict[str, type] = {"timestamp": np.float64, "update_id": np.int64, "message_type": np.int8,
+                               "side": np.int8, "price": np.float64, "amount": np.float64}
+    return {
+        column: np.concatenate(arrays) if len(arrays) > 0 else np.empty(0, dtype=dtypes[column])
+        for column, arrays in chunks.items()
+    }
@@ -0,0 +1,234 @@
+#!/usr/bin/env python
+
+import asyncio
+import logging
+import numpy as np
+import os
+from typing import (
+    Dict,
+    List,
+    Optional,
+)
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import (
+    ASK_SIDE,
+    BID_SIDE,
+    CAPTURE_COLUMNS,
+    load_capture,
+)
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
+from hummingbot.core.event.events import (
+    OrderBookTradeEvent,
+    TradeType,
+)
+from hummingbot.core.py_time_iterator import PyTimeIterator
+from hummingbot.logger import HummingbotLogger
+
+SNAPSHOT_MESSAGE_TYPE = OrderBookMessageType.SNAPSHOT.value
+DIFF_MESSAGE_TYPE = OrderBookMessageType.DIFF.value
+TRADE_MESSAGE_TYPE = OrderBookMessageType.TRADE.value
+
+
+def prepare_replay_dataset(capture_dir: str,
+                           symbols: List[str],
+                           dataset_dir: str,
+                           start_timestamp: float = 0.0,
+                           end_timestamp: float = float("inf")):
+    """
+    Converts the compressed capture files of an order book recorder into a replay dataset, with one uncompressed
+    `.npy` file per symbol and column, so that the dataset can be memory mapped read-only by many backtest processes.
+
+    Rows are stably sorted by timestamp, since rows from different message streams are not guaranteed to be captured in
+    timestamp order.
+    """
+    for symbol in symbols:
+        columns: Dict[str, np.ndarray] = load_capture(capture_dir, symbol, start_timestamp, end_timestamp)
+        order: np.ndarray = np.argsort(columns["timestamp"], kind="mergesort")
+        symbol_dir: str = os.path.join(dataset_dir, symbol)
+        os.makedirs(symbol_dir, exist_ok=True)
+        for column in CAPTURE_COLUMNS:
+            np.save(os.path.join(symbol_dir, f"{column}.npy"), columns[column][order])
+
+
+def load_replay_dataset(dataset_dir: str, symbols: List[str], mmap_mode: Optional[str] = "r") -> Dict[str, "ReplayData"]:
+    """
+    Opens a replay dataset written by `prepare_replay_dataset()`. By default the columns are memory mapped read-only,
+    so processes replaying the same dataset share its pages rather than each holding a private copy.
+    """
+    return {
+        symbol: ReplayData({
+            column: np.load(os.path.join(dataset_dir, symbol, f"{column}.npy"), mmap_mode=mmap_mode)
+            for column in CAPTURE_COLUMNS
+        })
+        for symbol in symbols
+    }
+
+
+class ReplayData:
+    """
+    Captured rows of a single symbol, split into runs of rows that came from the same order book message. Run
+    boundaries are computed once, so replaying never has to look at rows one at a time.
+    """
+    def __init__(self, columns: Dict[str, np.ndarray]):
+        self.columns: Dict[str, np.ndarray] = columns
+        timestamps: np.ndarray = columns["timestamp"]
+        message_types: np.ndarray = columns["message_type"]
+        update_ids: np.ndarray = columns["update_id"]
+        if len(timestamps) > 0:
+            boundaries: np.ndarray = np.flatnonzero((np.diff(message_types) != 0) |
+                                                    (np.diff(update_ids) != 0) |
+                                                    (np.diff(timestamps) != 0)) + 1
+            self.run_starts: np.ndarray = np.concatenate(([0], boundaries))
+            self.run_ends: np.ndarray = np.append(boundaries, len(timestamps))
+        else:
+            self.run_starts: np.ndarray = np.empty(0, dtype=np.int64)
+            self.run_ends: np.ndarray = np.empty(0, dtype=np.int64)
+        self.run_timestamps: np.ndarray = np.asarray(timestamps[self.run_starts])
+
+    def __len__(self) -> int:
+        return len(self.run_starts)
+
+    @property
+    def start_timestamp(self) -> float:
+        return float(self.run_timestamps[0]) if len(self) > 0 else float("nan")
+
+    @property
+    def end_timestamp(self) -> float:
+        return float(self.run_timestamps[-1]) if len(self) > 0 else float("nan")
+
+
+class ReplayOrderBookTrackerDataSource(OrderBookTrackerDataSource):
+    """
+    Data source of a replay order book tracker. Replayed messages are applied directly by `OrderBookReplayIterator`,
+    so there is nothing to listen to.
+    """
+    def __init__(self, symbols: List[str]):
+        super().__init__()
+        self._symbols: List[str] = symbols
+
+    async def get_active_exchange_markets(self):
+        raise NotImplementedError("Replay data sources do not track exchange markets.")
+
+    async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
+        return {}
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+
+class ReplayOrderBookTracker(OrderBookTracker):
+    """
+    Order book tracker for backtests. Order books are created lazily, on first access, with the data source's order
+    book create function - so markets that swap in their own order book type (e.g. `PaperTradeMarket`) get it.
+    """
+    def __init__(self, symbols: List[str], exchange_name: str = "replay"):
+        super().__init__()
+        self._data_source: ReplayOrderBookTrackerDataSource = ReplayOrderBookTrackerDataSource(symbols)
+        self._symbols: List[str] = symbols
+        self._exchange_name: str = exchange_name
+
+    @property
+    def data_source(self) -> OrderBookTrackerDataSource:
+        return self._data_source
+
+    @property
+    def exchange_name(self) -> str:
+        return self._exchange_name
+
+    @property
+    def order_books(self) -> Dict[str, OrderBook]:
+        if len(self._order_books) < len(self._symbols):
+            for symbol in self._symbols:
+                if symbol not in self._order_books:
+                    self._order_books[symbol] = self._data_source.order_book_create_function()
+        return self._order_books
+
+    async def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+
+class OrderBookReplayIterator(PyTimeIterator):
+    """
+    Applies replayed order book messages to a replay tracker's order books as a backtest clock advances. Every tick
+    applies all messages with timestamps up to and including the tick, a whole snapshot or diff message at a time.
+
+    Add this iterator to the clock before the markets and strategies using the order books, so they see the state of
+    the books as of the current tick.
+    """
+    _obri_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._obri_logger is None:
+            cls._obri_logger = logging.getLogger(__name__)
+        return cls._obri_logger
+
+    def __init__(self, order_book_tracker: ReplayOrderBookTracker, dataset: Dict[str, ReplayData]):
+        super().__init__()
+        self._order_book_tracker: ReplayOrderBookTracker = order_book_tracker
+        self._dataset: Dict[str, ReplayData] = dataset
+        self._cursors: Dict[str, int] = {symbol: 0 for symbol in dataset.keys()}
+        self._messages_replayed: int = 0
+
+    @property
+    def messages_replayed(self) -> int:
+        return self._messages_replayed
+
+    @property
+    def finished(self) -> bool:
+        return all(self._cursors[symbol] >= len(data) for symbol, data in self._dataset.items())
+
+    def tick(self, timestamp: float):
+        order_books: Dict[str, OrderBook] = self._order_book_tracker.order_books
+        for symbol, data in self._dataset.items():
+            cursor: int = self._cursors[symbol]
+            next_cursor: int = int(np.searchsorted(data.run_timestamps, timestamp, side="right"))
+            if next_cursor <= cursor:
+                continue
+            order_book: OrderBook = order_books[symbol]
+            for run in range(cursor, next_cursor):
+                self._apply_run(symbol, order_book, data, run)
+            self._messages_replayed += next_cursor - cursor
+            self._cursors[symbol] = next_cursor
+
+    def _apply_run(self, symbol: str, order_book: OrderBook, data: ReplayData, run: int):
+        columns: Dict[str, np.ndarray] = data.columns
+        start: int = int(data.run_starts[run])
+        end: int = int(data.run_ends[run])
+        message_type: int = int(columns["message_type"][start])
+        sides: np.ndarray = columns["side"][start:end]
+        prices: np.ndarray = columns["price"][start:end]
+        amounts: np.ndarray = columns["amount"][start:end]
+
+        if message_type == TRADE_MESSAGE_TYPE:
+            timestamp: float = float(columns["timestamp"][start])
+            for side, price, amount in zip(sides, prices, amounts):
+                order_book.apply_trade(OrderBookTradeEvent(symbol, timestamp, TradeType(int(side)),
+                                                           float(price), float(amount)))
+            return
+
+        rows: np.ndarray = np.empty((end - start, 3), dtype=np.float64)
+        rows[:, 0] = prices
+        rows[:, 1] = amounts
+        rows[:, 2] = columns["update_id"][start:end]
+        bids: np.ndarray = rows[sides == BID_SIDE]
+        asks: np.ndarray = rows[sides == ASK_SIDE]
+        if message_type == SNAPSHOT_MESSAGE_TYPE:
+            order_book.apply_numpy_snapshot(bids, asks)
+        elif message_type == DIFF_MESSAGE_TYPE:
+            order_book.apply_numpy_diffs(bids, asks)
+        else:
+            self.logger().debug("Skipping unknown replay message type %d for %s.", message_type, symbol)
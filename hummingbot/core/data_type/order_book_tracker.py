@@ -20,21 +20,64 @@ from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.metrics import (
+    Counter,
+    CounterChild,
+    CounterDeltas,
+    Histogram,
+    HistogramChild,
+    MetricsRegistry,
+)
 from .order_book_message import (
     OrderBookMessageType,
     OrderBookMessage,
 )
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecorder
 
 TRADING_PAIR_FILTER = re.compile(r"(BTC|ETH|USDT)$")
 
 
+class RecordedMessageQueue(asyncio.Queue):
+    """
+    Message stream that tees every message put into it to an order book recorder.
+    """
+    def __init__(self, recorder: OrderBookRecorder, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._recorder: OrderBookRecorder = recorder
+
+    def put_nowait(self, item: OrderBookMessage):
+        try:
+            self._recorder.record(item)
+        except Exception:
+            # Recording must never break the data source listener putting the message.
+            logging.getLogger(__name__).error("Unexpected error recording order book message.", exc_info=True)
+        super().put_nowait(item)
+
+
 class OrderBookTrackerDataSourceType(Enum):
     # LOCAL_CLUSTER = 1 deprecated
     REMOTE_API = 2
     EXCHANGE_API = 3
 
 
+ORDER_BOOK_MESSAGES: Counter = MetricsRegistry.get_instance().counter(
+    "order_book_messages",
+    "Order book messages routed by the order book trackers.",
+    ["exchange", "message_type", "outcome"]
+)
+ORDER_BOOK_DIFFS_APPLIED: Counter = MetricsRegistry.get_instance().counter(
+    "order_book_diffs_applied",
+    "Order book diff messages applied to the tracked order books.",
+    ["exchange", "symbol"]
+)
+ORDER_BOOK_DIFF_LAG_SECONDS: Histogram = MetricsRegistry.get_instance().histogram(
+    "order_book_diff_lag_seconds",
+    "Time from the timestamp of an order book diff message to when it is applied to its order book.",
+    ["exchange", "symbol"]
+)
+
+
 class OrderBookTracker(ABC):
     PAST_DIFF_WINDOW_SIZE: int = 32
     _obt_logger: Optional[HummingbotLogger] = None
@@ -64,6 +107,14 @@ class OrderBookTracker(ABC):
         self._order_book_snapshot_router_task: Optional[asyncio.Task] = None
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._refresh_tracking_task: Optional[asyncio.Task] = None
+        self._recorder: Optional[OrderBookRecorder] = None
+
+    @property
+    def exchange_name(self) -> str:
+        """
+        Name of the exchange, used to label the tracker's metrics.
+        """
+        return self.__class__.__name__
 
     @property
     @abstractmethod
@@ -95,12 +146,55 @@ class OrderBookTracker(ABC):
             for symbol, order_book in self._order_books.items()
         }
 
+    @property
+    def recorder(self) -> Optional[OrderBookRecorder]:
+        return self._recorder
+
+    def attach_recorder(self, recorder: OrderBookRecorder):
+        """
+        Records all diff, snapshot and trade messages received by this tracker. Must be called before `start()`, since
+        the message streams are handed over to the data source listeners on start. Recording is off unless a recorder
+        is attached, e.g.:
+
+            tracker.attach_recorder(OrderBookRecorder(os.path.join(data_path(), "order_book_captures")))
+            safe_ensure_future(tracker.start())
+            ...
+            await tracker.close()
+        """
+        if self._order_book_diff_listener_task is not None or self._order_book_snapshot_listener_task is not None:
+            raise EnvironmentError("Order book recorders must be attached before the tracker is started.")
+        self._recorder = recorder
+        self._order_book_diff_stream = self._recorded_stream(self._order_book_diff_stream)
+        self._order_book_snapshot_stream = self._recorded_stream(self._order_book_snapshot_stream)
+        self._order_book_trade_stream = self._recorded_stream(self._order_book_trade_stream)
+
+    def _recorded_stream(self, stream: asyncio.Queue) -> RecordedMessageQueue:
+        recorded_stream: RecordedMessageQueue = RecordedMessageQueue(self._recorder)
+        # Carry over any messages that were already queued.
+        while not stream.empty():
+            recorded_stream.put_nowait(stream.get_nowait())
+        return recorded_stream
+
     async def start(self):
+        if self._recorder is not None:
+            self._recorder.start()
         self._emit_trade_event_task = safe_ensure_future(
             self._emit_trade_event_loop()
         )
 
+    async def close(self):
+        """
+        Stops the tracker, after writing out everything its recorder has buffered.
+        """
+        if self._recorder is not None:
+            await self._recorder.close()
+        self.stop()
+
     def stop(self):
+        if self._recorder is not None and self._recorder.running:
+            # Writing out the recorder's buffers takes a while, so it finishes in the background. Await `close()`
+            # instead to wait for it.
+            safe_ensure_future(self._recorder.close())
         if self._emit_trade_event_task is not None:
             self._emit_trade_event_task.cancel()
             self._emit_trade_event_task = None
@@ -163,8 +257,9 @@ class OrderBookTracker(ABC):
         Route the real-time order book diff messages to the correct order book.
         """
         last_message_timestamp: float = time.time()
-        messages_accepted: int = 0
-        messages_rejected: int = 0
+        messages_accepted: CounterChild = ORDER_BOOK_MESSAGES.labels(self.exchange_name, "diff", "accepted")
+        messages_rejected: CounterChild = ORDER_BOOK_MESSAGES.labels(self.exchange_name, "diff", "rejected")
+        logged_messages: CounterDeltas = CounterDeltas(messages_accepted, messages_rejected)
 
         while True:
             try:
@@ -172,26 +267,22 @@ class OrderBookTracker(ABC):
                 symbol: str = ob_message.symbol
 
                 if symbol not in self._tracking_message_queues:
-                    messages_rejected += 1
+                    messages_rejected.inc()
                     continue
                 message_queue: asyncio.Queue = self._tracking_message_queues[symbol]
                 # Check the order book's initial update ID. If it's larger, don't bother.
                 order_book: OrderBook = self._order_books[symbol]
 
                 if order_book.snapshot_uid > ob_message.update_id:
-                    messages_rejected += 1
+                    messages_rejected.inc()
                     continue
                 await message_queue.put(ob_message)
-                messages_accepted += 1
+                messages_accepted.inc()
 
                 # Log some statistics.
                 now: float = time.time()
                 if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                    self.logger().info("Diff messages processed: %d, rejected: %d",
-                                       messages_accepted,
-                                       messages_rejected)
-                    messages_accepted = 0
-                    messages_rejected = 0
+                    self.logger().info("Diff messages processed: %d, rejected: %d", *logged_messages.take())
 
                 last_message_timestamp = now
             except asyncio.CancelledError:
@@ -225,7 +316,9 @@ class OrderBookTracker(ABC):
         message_queue: asyncio.Queue = self._tracking_message_queues[symbol]
         order_book: OrderBook = self._order_books[symbol]
         last_message_timestamp: float = time.time()
-        diff_messages_accepted: int = 0
+        diff_messages_accepted: CounterChild = ORDER_BOOK_DIFFS_APPLIED.labels(self.exchange_name, symbol)
+        logged_diff_messages: CounterDeltas = CounterDeltas(diff_messages_accepted)
+        diff_lag: HistogramChild = ORDER_BOOK_DIFF_LAG_SECONDS.labels(self.exchange_name, symbol)
 
         while True:
             try:
@@ -235,14 +328,15 @@ class OrderBookTracker(ABC):
                     past_diffs_window.append(message)
                     while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
                         past_diffs_window.popleft()
-                    diff_messages_accepted += 1
+                    diff_messages_accepted.inc()
+                    if message.timestamp is not None:
+                        diff_lag.observe(time.time() - message.timestamp)
 
                     # Output some statistics periodically.
                     now: float = time.time()
                     if int(now / 60.0) > int(last_message_timestamp / 60.0):
                         self.logger().debug("Processed %d order book diffs for %s.",
-                                            diff_messages_accepted, symbol)
-                        diff_messages_accepted = 0
+                                            *logged_diff_messages.take(), symbol)
                     last_message_timestamp = now
                 elif message.type is OrderBookMessageType.SNAPSHOT:
                     past_diffs: List[OrderBookMessage] = list(past_diffs_window)
@@ -256,15 +350,16 @@ class OrderBookTracker(ABC):
 
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
-        messages_accepted: int = 0
-        messages_rejected: int = 0
+        messages_accepted: CounterChild = ORDER_BOOK_MESSAGES.labels(self.exchange_name, "trade", "accepted")
+        messages_rejected: CounterChild = ORDER_BOOK_MESSAGES.labels(self.exchange_name, "trade", "rejected")
+        logged_messages: CounterDeltas = CounterDeltas(messages_accepted, messages_rejected)
         while True:
             try:
                 trade_message: OrderBookMessage = await self._order_book_trade_stream.get()
                 symbol: str = trade_message.symbol
 
                 if symbol not in self._order_books:
-                    messages_rejected += 1
+                    messages_rejected.inc()
                     continue
 
                 order_book: OrderBook = self._order_books[symbol]
@@ -277,16 +372,12 @@ class OrderBookTracker(ABC):
                     trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.SELL
                 ))
 
-                messages_accepted += 1
+                messages_accepted.inc()
 
                 # Log some statistics.
                 now: float = time.time()
                 if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                    self.logger().debug("Trade messages processed: %d, rejected: %d",
-                                        messages_accepted,
-                                        messages_rejected)
-                    messages_accepted = 0
-                    messages_rejected = 0
+                    self.logger().debug("Trade messages processed: %d, rejected: %d", *logged_messages.take())
 
                 last_message_timestamp = now
             except asyncio.CancelledError:
@@ -0,0 +1,19 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+from libcpp.deque cimport deque
+from libcpp.utility cimport pair
+
+
+cdef class RollingExtremumWindow:
+    cdef:
+        int64_t _window_size
+        bint _is_max
+        int64_t _next_sequence
+        int64_t _nan_count
+        deque[double] _samples
+        deque[pair[int64_t, double]] _candidates
+
+    cdef c_append(self, double value)
+    cdef double c_get_extremum(self)
+    cdef double c_get_extremum_with(self, double value)
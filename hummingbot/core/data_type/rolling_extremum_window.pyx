@@ -0,0 +1,107 @@
+# distutils: language=c++
+
+from libc.math cimport isnan
+from libc.stdint cimport int64_t
+from libcpp.utility cimport pair
+from typing import List
+
+NaN = float("nan")
+
+
+cdef class RollingExtremumWindow:
+    """
+    Fixed size window over the most recent samples of a series, that keeps track of the window's maximum (or minimum)
+    and of whether the window holds any NaN samples.
+
+    The extremum is maintained with a monotonic deque of candidate samples - a sample is dropped from the candidates as
+    soon as a newer sample at least as extreme arrives, since it can never be the extremum again. Appending is
+    amortised O(1), and querying the extremum is O(1).
+    """
+    def __init__(self, window_size: int, is_max: bool = True):
+        if window_size < 1:
+            raise ValueError(f"Window size must be positive, got {window_size}.")
+        self._window_size = window_size
+        self._is_max = is_max
+        self._next_sequence = 0
+        self._nan_count = 0
+
+    def __len__(self) -> int:
+        return self._samples.size()
+
+    @property
+    def window_size(self) -> int:
+        return self._window_size
+
+    @property
+    def is_max(self) -> bool:
+        return self._is_max
+
+    @property
+    def has_nan(self) -> bool:
+        return self._nan_count > 0
+
+    @property
+    def samples(self) -> List[float]:
+        return [self._samples[i] for i in range(self._samples.size())]
+
+    @property
+    def extremum(self) -> float:
+        return self.c_get_extremum()
+
+    def append(self, value: float):
+        self.c_append(value)
+
+    def extremum_with(self, value: float) -> float:
+        return self.c_get_extremum_with(value)
+
+    cdef c_append(self, double value):
+        cdef:
+            int64_t sequence = self._next_sequence
+            int64_t oldest_sequence
+
+        self._next_sequence += 1
+        self._samples.push_back(value)
+        if isnan(value):
+            self._nan_count += 1
+        else:
+            if self._is_max:
+                while not self._candidates.empty() and self._candidates.back().second <= value:
+                    self._candidates.pop_back()
+            else:
+                while not self._candidates.empty() and self._candidates.back().second >= value:
+                    self._candidates.pop_back()
+            self._candidates.push_back(pair[int64_t, double](sequence, value))
+
+        if <int64_t>self._samples.size() > self._window_size:
+            if isnan(self._samples.front()):
+                self._nan_count -= 1
+            self._samples.pop_front()
+            oldest_sequence = self._next_sequence - self._window_size
+            if not self._candidates.empty() and self._candidates.front().first < oldest_sequence:
+                self._candidates.pop_front()
+
+    cdef double c_get_extremum(self):
+        """
+        :return: the extremum of the non-NaN samples in the window, or NaN if there are none
+        """
+        if self._candidates.empty():
+            return NaN
+        return self._candidates.front().second
+
+    cdef double c_get_extremum_with(self, double value):
+        """
+        Calculates the extremum of the window's samples together with an additional value, with the same semantics as
+        Python's `max(samples + [value])` (or `min()`) - a NaN value never replaces the window's extremum.
+
+        :param value: an additional value that is not part of the window
+        :return: the extremum of the window and the value
+        """
+        cdef:
+            double extremum
+
+        if self._candidates.empty():
+            return value
+        extremum = self._candidates.front().second
+        if self._is_max:
+            return value if value > extremum else extremum
+        return value if value < extremum else extremum
@@ -47,6 +47,7 @@ class IncomingEthWatcherEvent(Enum):
 class ERC20WatcherEvent(Enum):
     ReceivedToken = 601
     ApprovedToken = 602
+    SentToken = 603
 
 
 class OrderBookEvent(Enum):
@@ -82,6 +83,18 @@ class WalletReceivedAssetEvent(NamedTuple):
     asset_name: str
     amount_received: float
     raw_amount_received: int
+    block_number: int = -1
+
+
+class WalletSentAssetEvent(NamedTuple):
+    timestamp: float
+    tx_hash: str
+    from_address: str
+    to_address: str
+    asset_name: str
+    amount_sent: float
+    raw_amount_sent: int
+    block_number: int = -1
 
 
 class WalletWrappedEthEvent(NamedTuple):
@@ -90,6 +103,7 @@ class WalletWrappedEthEvent(NamedTuple):
     address: str
     amount: float
     raw_amount: int
+    block_number: int = -1
 
 
 class WalletUnwrappedEthEvent(NamedTuple):
@@ -98,6 +112,7 @@ class WalletUnwrappedEthEvent(NamedTuple):
     address: str
     amount: float
     raw_amount: int
+    block_number: int = -1
 
 
 class MarketReceivedAssetEvent(NamedTuple):
@@ -160,6 +175,7 @@ class EthereumGasUsedEvent(NamedTuple):
     gas_used: int
     eth_amount: float
     eth_amount_raw: int
+    block_number: int = -1
 
 
 class TokenApprovedEvent(NamedTuple):
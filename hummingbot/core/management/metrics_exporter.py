@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+
+from aiohttp import web
+import logging
+import math
+from typing import (
+    List,
+    Optional,
+    Sequence,
+)
+
+from hummingbot.core.utils.metrics import (
+    HistogramSnapshot,
+    LabelValues,
+    Metric,
+    MetricsRegistry,
+)
+
+METRIC_NAME_PREFIX = "hummingbot_"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _format_labels(label_names: Sequence[str], label_values: LabelValues, extra: str = "") -> str:
+    labels: List[str] = [f'{name}="{_escape_label_value(value)}"' for name, value in zip(label_names, label_values)]
+    if extra:
+        labels.append(extra)
+    return "{" + ",".join(labels) + "}" if labels else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def format_metric(metric: Metric) -> List[str]:
+    name: str = METRIC_NAME_PREFIX + metric.name
+    if metric.metric_type == "counter" and not name.endswith("_total"):
+        name += "_total"
+    lines: List[str] = [f"# HELP {name} {metric.description}", f"# TYPE {name} {metric.metric_type}"]
+    for label_values, value in metric.snapshot().items():
+        if metric.metric_type != "histogram":
+            lines.append(f"{name}{_format_labels(metric.label_names, label_values)} {_format_value(value)}")
+            continue
+        histogram: HistogramSnapshot = value
+        cumulative_count: int = 0
+        for bound, bucket_count in zip(histogram.bucket_bounds, histogram.bucket_counts):
+            cumulative_count += bucket_count
+            le: str = f'le="{_format_value(bound)}"'
+            lines.append(f"{name}_bucket{_format_labels(metric.label_names, label_values, le)} {cumulative_count}")
+        inf_le: str = 'le="+Inf"'
+        lines.append(f"{name}_bucket{_format_labels(metric.label_names, label_values, inf_le)} {histogram.count}")
+        lines.append(f"{name}_sum{_format_labels(metric.label_names, label_values)} {_format_value(histogram.sum)}")
+        lines.append(f"{name}_count{_format_labels(metric.label_names, label_values)} {histogram.count}")
+    return lines
+
+
+def format_metrics(registry: MetricsRegistry) -> str:
+    """
+    Renders the metrics of a registry in the Prometheus text exposition format.
+    """
+    lines: List[str] = []
+    for metric in registry.metrics:
+        lines.extend(format_metric(metric))
+    return "\n".join(lines) + "\n"
+
+
+async def start_metrics_exporter(host: str = "localhost",
+                                 port: int = 9108,
+                                 registry: Optional[MetricsRegistry] = None) -> web.AppRunner:
+    """
+    Serves the metrics of the shared metrics registry at http://{host}:{port}/metrics, for Prometheus or any other
+    OpenMetrics compatible scraper.
+    """
+    registry = registry or MetricsRegistry.get_instance()
+
+    async def handle_metrics(request: web.Request) -> web.Response:
+        return web.Response(body=format_metrics(registry).encode("utf-8"), headers={"Content-Type": CONTENT_TYPE})
+
+    app: web.Application = web.Application()
+    app.router.add_get("/metrics", handle_metrics)
+    runner: web.AppRunner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    logging.getLogger(__name__).info(f"Started metrics exporter at http://{host}:{port}/metrics.")
+    return runner
@@ -22,6 +22,15 @@ from hummingbot.core.event.event_listener import EventListener
 from hummingbot.core.event.event_listener cimport EventListener
 
 class_logger = None
+_event_profiler = None
+
+
+def set_event_profiler(profiler):
+    """
+    Sets the profiler every event listener call is reported to - see TickProfiler. None to disable profiling.
+    """
+    global _event_profiler
+    _event_profiler = profiler
 
 
 cdef class PubSub:
@@ -151,6 +160,7 @@ cdef class PubSub:
             EventListenersCollection listeners
             object listener_weafref
             EventListener typed_listener
+            object profiler = _event_profiler
         if it == self._events.end():
             return
 
@@ -162,7 +172,14 @@ cdef class PubSub:
             typed_listener = <object>PyWeakref_GetObject(listener_weafref)
             try:
                 typed_listener.c_set_event_info(event_tag, self)
-                typed_listener.c_call(arg)
+                if profiler is not None:
+                    profiler.enter_listener(event_tag, typed_listener)
+                    try:
+                        typed_listener.c_call(arg)
+                    finally:
+                        profiler.exit()
+                else:
+                    typed_listener.c_call(arg)
             except Exception:
                 self.c_log_exception(event_tag, arg)
             finally:
@@ -3,6 +3,7 @@
 import asyncio
 from async_timeout import timeout
 import logging
+import time
 from typing import (
     Optional,
     Coroutine,
@@ -13,6 +14,24 @@ from typing import (
 import hummingbot
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.metrics import (
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+)
+
+ASYNC_CALL_QUEUE_WAIT_SECONDS: Histogram = MetricsRegistry.get_instance().histogram(
+    "async_call_queue_wait_seconds",
+    "Time scheduled calls wait in the async call scheduler queue before they start."
+)
+ASYNC_CALL_SECONDS: Histogram = MetricsRegistry.get_instance().histogram(
+    "async_call_seconds",
+    "Duration of the calls run by the async call scheduler."
+)
+ASYNC_CALL_QUEUE_SIZE: Gauge = MetricsRegistry.get_instance().gauge(
+    "async_call_queue_size",
+    "Number of calls waiting in the async call scheduler queue."
+)
 
 
 class AsyncCallSchedulerItem(NamedTuple):
@@ -20,6 +39,7 @@ class AsyncCallSchedulerItem(NamedTuple):
     coroutine: Coroutine
     timeout_seconds: float
     app_warning_msg: str = "API call error."
+    enqueue_time: float = 0.0
 
 
 class AsyncCallScheduler:
@@ -75,9 +95,15 @@ class AsyncCallScheduler:
         while True:
             app_warning_msg = "API call error."
             try:
-                fut, coro, timeout_seconds, app_warning_msg = await coro_queue.get()
-                async with timeout(timeout_seconds):
-                    fut.set_result(await coro)
+                fut, coro, timeout_seconds, app_warning_msg, enqueue_time = await coro_queue.get()
+                call_start_time: float = time.perf_counter()
+                ASYNC_CALL_QUEUE_WAIT_SECONDS.observe(call_start_time - enqueue_time)
+                ASYNC_CALL_QUEUE_SIZE.set(coro_queue.qsize())
+                try:
+                    async with timeout(timeout_seconds):
+                        fut.set_result(await coro)
+                finally:
+                    ASYNC_CALL_SECONDS.observe(time.perf_counter() - call_start_time)
             except asyncio.CancelledError:
                 try:
                     fut.cancel()
@@ -111,7 +137,9 @@ class AsyncCallScheduler:
                                   app_warning_msg: str = "API call error.") -> any:
         fut: asyncio.Future = self._ev_loop.create_future()
         self._coro_queue.put_nowait(AsyncCallSchedulerItem(fut, coro, timeout_seconds,
-                                                           app_warning_msg=app_warning_msg))
+                                                           app_warning_msg=app_warning_msg,
+                                                           enqueue_time=time.perf_counter()))
+        ASYNC_CALL_QUEUE_SIZE.set(self._coro_queue.qsize())
         if self._coro_scheduler_task is None:
             self.start()
         return await fut
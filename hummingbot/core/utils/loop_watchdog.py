@@ -0,0 +1,248 @@
+import asyncio
+from collections import deque
+import inspect
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import (
+    Deque,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.metrics import (
+    Counter,
+    Histogram,
+    HistogramChild,
+    HistogramSnapshot,
+    MetricsRegistry,
+)
+from hummingbot.logger import HummingbotLogger
+from hummingbot.logger.application_warning import ApplicationWarning
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication
+
+EVENT_LOOP_LAG_SECONDS: Histogram = MetricsRegistry.get_instance().histogram(
+    "event_loop_lag_seconds",
+    "Delay between the scheduled and the actual wake up time of the event loop watchdog.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+)
+EVENT_LOOP_STALLS: Counter = MetricsRegistry.get_instance().counter(
+    "event_loop_stalls",
+    "Event loop stalls above the watchdog's lag threshold (loop_lag), and clock ticks that took longer than the tick "
+    "size (tick_overrun).",
+    ["kind"]
+)
+COROUTINE_FLAGS = inspect.CO_COROUTINE | inspect.CO_ITERABLE_COROUTINE | inspect.CO_ASYNC_GENERATOR
+
+# (culprit, formatted stack) of the event loop thread.
+StackSample = Tuple[str, str]
+
+
+class LoopStall(NamedTuple):
+    timestamp: float
+    kind: str
+    duration: float
+    culprit: str
+    stack: Optional[str]
+
+
+def _frame_location(frame) -> str:
+    return f"{frame.f_code.co_name} ({frame.f_code.co_filename}:{frame.f_lineno})"
+
+
+def sample_culprit(frame) -> str:
+    """
+    :return: the innermost coroutine of a stack - the task that is blocking the event loop - or, for plain callbacks,
+             the callback run by the event loop.
+    """
+    innermost_frame = frame
+    callback_frame = None
+    while frame is not None:
+        if frame.f_code.co_flags & COROUTINE_FLAGS:
+            return _frame_location(frame)
+        caller = frame.f_back
+        if caller is not None and caller.f_code.co_name == "_run" and caller.f_code.co_filename.endswith("events.py"):
+            callback_frame = frame
+        frame = caller
+    return _frame_location(callback_frame or innermost_frame)
+
+
+class LoopWatchdog:
+    """
+    Detects event loop stalls caused by synchronous work - database commits, status rendering, blocking web3 calls.
+
+    A watchdog coroutine wakes up every `check_interval` seconds and measures how late it wakes up. While the loop is
+    blocked for more than `lag_threshold` seconds, a sampler thread takes stack samples of the event loop thread, so
+    the stall can be attributed to the coroutine or callback that caused it. The clock also reports ticks that take
+    longer than the tick size, with the slowest time iterator of the tick.
+
+    Stalls are logged with their stack, shown by the `status` command, and surfaced as application warnings.
+    """
+    MAX_STALLS = 50
+    MAX_SAMPLES_PER_STALL = 20
+    STACK_LIMIT = 30
+
+    lw_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls.lw_logger is None:
+            cls.lw_logger = logging.getLogger(__name__)
+        return cls.lw_logger
+
+    def __init__(self,
+                 hummingbot_application: Optional["HummingbotApplication"] = None,
+                 check_interval: float = 0.1,
+                 lag_threshold: float = 0.5,
+                 sample_interval: float = 0.05,
+                 warning_interval: float = 60.0):
+        self._hummingbot_application = hummingbot_application
+        self._check_interval: float = check_interval
+        self._lag_threshold: float = lag_threshold
+        self._sample_interval: float = sample_interval
+        self._warning_interval: float = warning_interval
+        self._lag: HistogramChild = EVENT_LOOP_LAG_SECONDS.labels()
+        self._lag_at_start: HistogramSnapshot = self._lag.snapshot()
+        self._stalls: Deque[LoopStall] = deque(maxlen=self.MAX_STALLS)
+        self._samples: List[StackSample] = []
+        self._samples_lock: threading.Lock = threading.Lock()
+        self._heartbeat: float = time.perf_counter()
+        self._last_warning_timestamp: float = 0.0
+        self._last_tick_overrun: float = 0.0
+        self._loop_thread_id: Optional[int] = None
+        self._monitor_task: Optional[asyncio.Task] = None
+        self._sampler_thread: Optional[threading.Thread] = None
+        self._sampler_stop: threading.Event = threading.Event()
+        self._started: bool = False
+
+    @property
+    def stalls(self) -> List[LoopStall]:
+        return list(self._stalls)
+
+    def start(self):
+        from hummingbot.core.clock import set_tick_watchdog
+
+        self.stop()
+        self._lag_at_start = self._lag.snapshot()
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.perf_counter()
+        self._monitor_task = safe_ensure_future(self._monitor_loop())
+        self._start_sampler()
+        set_tick_watchdog(self)
+        self._started = True
+
+    def stop(self):
+        if self._started:
+            from hummingbot.core.clock import set_tick_watchdog
+            set_tick_watchdog(None)
+            self._started = False
+        if self._monitor_task is not None and not self._monitor_task.done():
+            self._monitor_task.cancel()
+        self._monitor_task = None
+        self._sampler_stop.set()
+        self._sampler_thread = None
+
+    def _start_sampler(self):
+        self._sampler_stop = threading.Event()
+        self._sampler_thread = threading.Thread(target=self._sample_loop,
+                                                args=(self._sampler_stop,),
+                                                name="LoopWatchdogSampler",
+                                                daemon=True)
+        self._sampler_thread.start()
+
+    def _sample_loop(self, sampler_stop: threading.Event):
+        while not sampler_stop.wait(self._sample_interval):
+            if time.perf_counter() - self._heartbeat < self._check_interval + self._lag_threshold:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            sample: StackSample = (sample_culprit(frame),
+                                   "".join(traceback.format_stack(frame, limit=self.STACK_LIMIT)))
+            del frame
+            with self._samples_lock:
+                if len(self._samples) < self.MAX_SAMPLES_PER_STALL:
+                    self._samples.append(sample)
+
+    def _take_samples(self) -> Tuple[Optional[str], Optional[str]]:
+        """
+        :return: the most frequently sampled culprit of the current stall and its last sampled stack.
+        """
+        with self._samples_lock:
+            samples: List[StackSample] = self._samples
+            self._samples = []
+        if len(samples) < 1:
+            return None, None
+        culprit_counts: Dict[str, int] = {}
+        culprit_stacks: Dict[str, str] = {}
+        for culprit, stack in samples:
+            culprit_counts[culprit] = culprit_counts.get(culprit, 0) + 1
+            culprit_stacks[culprit] = stack
+        culprit: str = max(culprit_counts, key=culprit_counts.get)
+        return culprit, culprit_stacks[culprit]
+
+    async def _monitor_loop(self):
+        while True:
+            try:
+                self._heartbeat = time.perf_counter()
+                await asyncio.sleep(self._check_interval)
+                lag: float = max(time.perf_counter() - self._heartbeat - self._check_interval, 0.0)
+                self._lag.observe(lag)
+                if lag > self._lag_threshold:
+                    culprit, stack = self._take_samples()
+                    if culprit is None and self._last_tick_overrun >= self._heartbeat:
+                        # The clock tick reported as an overrun took the stack samples of this stall.
+                        culprit = "clock tick overrun"
+                    self._record_stall("loop_lag", lag, culprit or "unknown", stack)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error in event loop watchdog.", exc_info=True)
+
+    def tick_overrun(self, timestamp: float, duration: float, iterator_name: str, iterator_duration: float):
+        """
+        Called by the clock, from within the tick, when a tick took longer than the tick size.
+        """
+        self._last_tick_overrun = time.perf_counter()
+        _, stack = self._take_samples()
+        self._record_stall("tick_overrun", duration, f"{iterator_name} took {iterator_duration:.3f}s", stack)
+
+    def _record_stall(self, kind: str, duration: float, culprit: str, stack: Optional[str]):
+        stall: LoopStall = LoopStall(time.time(), kind, duration, culprit, stack)
+        self._stalls.append(stall)
+        EVENT_LOOP_STALLS.labels(kind).inc()
+
+        message: str = (f"Clock tick took {duration:.3f}s - {culprit}." if kind == "tick_overrun"
+                        else f"Event loop was blocked for {duration:.3f}s by {culprit}.")
+        self.logger().warning(message + (f" Event loop stack:\n{stack}" if stack is not None else ""))
+        if self._hummingbot_application is not None and \
+                stall.timestamp - self._last_warning_timestamp >= self._warning_interval:
+            self._last_warning_timestamp = stall.timestamp
+            self._hummingbot_application.add_application_warning(ApplicationWarning(
+                stall.timestamp,
+                self.logger().name,
+                ("(unknown file)", 0, culprit, stack),
+                message + " Check the logs for the stack of the event loop."
+            ))
+
+    def format_status(self, limit: int = 5) -> str:
+        lag: HistogramSnapshot = self._lag.snapshot()
+        checks: int = lag.count - self._lag_at_start.count
+        mean_lag_ms: float = (lag.sum - self._lag_at_start.sum) / checks * 1e3 if checks > 0 else 0.0
+        lines: List[str] = [f"\n  Event loop: mean lag {mean_lag_ms:.1f}ms, "
+                            f"{sum(1 for stall in self._stalls if stall.kind == 'loop_lag')} stalls, "
+                            f"{sum(1 for stall in self._stalls if stall.kind == 'tick_overrun')} clock tick overruns."]
+        for stall in list(self._stalls)[-limit:][::-1]:
+            stall_time: str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(stall.timestamp))
+            kind: str = "tick overrun" if stall.kind == "tick_overrun" else "stall"
+            lines.append(f"    * {stall_time} - {stall.duration:.3f}s {kind} - {stall.culprit}")
+        return "\n".join(lines)
@@ -0,0 +1,308 @@
+#!/usr/bin/env python
+
+from bisect import bisect_left
+from functools import lru_cache
+import re
+import sys
+import time
+from typing import (
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+LabelValues = Tuple[str, ...]
+
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0,
+                                              2.5, 5.0, 10.0)
+
+VERSION_PATH_SEGMENT_PATTERN = re.compile(r"v\d+(\.\d+)*")
+URL_PATTERN = re.compile(r"^(?:[a-z]+://)?([^/?#]*)([^?#]*)")
+
+
+@lru_cache(maxsize=1024)
+def url_endpoint_label(url: str) -> str:
+    """
+    Turns a request URL into a low cardinality endpoint label: the host and path, without the query string, and with
+    path segments that look like IDs - order IDs, hashes, addresses - replaced by ":id".
+
+    e.g. https://api.ddex.io/v3/orders/0x6ef3...?status=all -> api.ddex.io/v3/orders/:id
+    """
+    match = URL_PATTERN.match(url)
+    host, path = match.group(1), match.group(2)
+    segments: List[str] = [
+        ":id" if any(c.isdigit() for c in segment) and not VERSION_PATH_SEGMENT_PATTERN.fullmatch(segment) else segment
+        for segment in path.split("/")
+    ]
+    return host + "/".join(segments)
+
+
+class CounterChild:
+    """
+    A counter of a single label value combination. Updates are plain attribute updates - there are no locks, so
+    counters must only be updated from a single thread, normally the event loop.
+    """
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value: float = 0.0
+
+    def inc(self, amount: float = 1.0):
+        self.value += amount
+
+    def reset(self):
+        self.value = 0.0
+
+
+class CounterDeltas:
+    """
+    Increases of a fixed set of counters since the previous call to `take()`, for periodic log lines that report
+    per-interval numbers off cumulative counters.
+    """
+    __slots__ = ("_counters", "_last_values")
+
+    def __init__(self, *counters: CounterChild):
+        self._counters: Tuple[CounterChild, ...] = counters
+        self._last_values: List[float] = [counter.value for counter in counters]
+
+    def take(self) -> List[float]:
+        values: List[float] = [counter.value for counter in self._counters]
+        deltas: List[float] = [value - last_value for value, last_value in zip(values, self._last_values)]
+        self._last_values = values
+        return deltas
+
+
+class GaugeChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value: float = 0.0
+
+    def set(self, value: float):
+        self.value = value
+
+    def inc(self, amount: float = 1.0):
+        self.value += amount
+
+    def dec(self, amount: float = 1.0):
+        self.value -= amount
+
+    def reset(self):
+        self.value = 0.0
+
+
+class HistogramSnapshot(NamedTuple):
+    count: int
+    sum: float
+    min: float
+    max: float
+    bucket_bounds: Tuple[float, ...]
+    bucket_counts: Tuple[int, ...]
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count > 0 else float("nan")
+
+
+class _HistogramTimer:
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram: "HistogramChild"):
+        self._histogram: HistogramChild = histogram
+        self._start: float = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._histogram.observe(time.perf_counter() - self._start)
+
+
+class HistogramChild:
+    """
+    A histogram of a single label value combination, with fixed bucket upper bounds. The last bucket counts the
+    observations above the highest bound.
+    """
+    __slots__ = ("_bounds", "bucket_counts", "count", "sum", "min", "max")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self._bounds: Tuple[float, ...] = bounds
+        self.bucket_counts: List[int] = [0] * (len(bounds) + 1)
+        self.count: int = 0
+        self.sum: float = 0.0
+        self.min: float = float("inf")
+        self.max: float = float("-inf")
+
+    def observe(self, value: float):
+        self.bucket_counts[bisect_left(self._bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def time(self) -> _HistogramTimer:
+        """
+        :return: a context manager that observes the number of seconds spent in it.
+        """
+        return _HistogramTimer(self)
+
+    def snapshot(self) -> HistogramSnapshot:
+        return HistogramSnapshot(self.count, self.sum, self.min, self.max, self._bounds, tuple(self.bucket_counts))
+
+    def reset(self):
+        self.bucket_counts = [0] * (len(self._bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+
+MetricChild = Union[CounterChild, GaugeChild, HistogramChild]
+
+
+class Metric:
+    """
+    A named metric with a fixed list of label names. Children - one per label value combination - are created on first
+    use, with interned label values, and should be kept by hot paths so that updates are single attribute updates.
+    """
+    metric_type: str = ""
+
+    def __init__(self, name: str, description: str, label_names: Sequence[str] = ()):
+        self.name: str = name
+        self.description: str = description
+        self.label_names: Tuple[str, ...] = tuple(label_names)
+        self._children: Dict[LabelValues, MetricChild] = {}
+
+    def _new_child(self) -> MetricChild:
+        raise NotImplementedError
+
+    def labels(self, *label_values: str) -> MetricChild:
+        child: Optional[MetricChild] = self._children.get(label_values)
+        if child is None:
+            # Children are stored by the string form of their label values, so non-string values (e.g. ints) find
+            # the same child on every call.
+            key: LabelValues = tuple(sys.intern(str(value)) for value in label_values)
+            child = self._children.get(key)
+            if child is None:
+                if len(label_values) != len(self.label_names):
+                    raise ValueError(f"Metric {self.name} expects labels {self.label_names}, got {label_values}.")
+                child = self._new_child()
+                self._children[key] = child
+        return child
+
+    @property
+    def children(self) -> Dict[LabelValues, MetricChild]:
+        return self._children
+
+    def _child_snapshot(self, child: MetricChild) -> Union[float, HistogramSnapshot]:
+        return child.value
+
+    def snapshot(self, reset: bool = False) -> Dict[LabelValues, Union[float, HistogramSnapshot]]:
+        """
+        :param reset: zero the children after taking the snapshot. Children are reset in place, so handles kept by hot
+                      paths stay valid.
+        :return: the current value of every child, by label values.
+        """
+        snapshots: Dict[LabelValues, Union[float, HistogramSnapshot]] = {}
+        for label_values, child in self._children.items():
+            snapshots[label_values] = self._child_snapshot(child)
+            if reset:
+                child.reset()
+        return snapshots
+
+
+class Counter(Metric):
+    metric_type = "counter"
+
+    def _new_child(self) -> CounterChild:
+        return CounterChild()
+
+    def inc(self, amount: float = 1.0):
+        self.labels().inc(amount)
+
+
+class Gauge(Metric):
+    metric_type = "gauge"
+
+    def _new_child(self) -> GaugeChild:
+        return GaugeChild()
+
+    def set(self, value: float):
+        self.labels().set(value)
+
+
+class Histogram(Metric):
+    metric_type = "histogram"
+
+    def __init__(self,
+                 name: str,
+                 description: str,
+                 label_names: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        super().__init__(name, description, label_names)
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+
+    def _new_child(self) -> HistogramChild:
+        return HistogramChild(self.buckets)
+
+    def observe(self, value: float):
+        self.labels().observe(value)
+
+    def _child_snapshot(self, child: HistogramChild) -> HistogramSnapshot:
+        return child.snapshot()
+
+
+class MetricsRegistry:
+    """
+    A set of named metrics.
+
+    The shared instance holds cumulative process-wide metrics, and must not be reset since any number of readers may
+    be looking at it. Components that need periodic windows of their own metrics - e.g. the report aggregator - keep
+    their own registry, and take resetting snapshots of it.
+    """
+    _mr_shared_instance: Optional["MetricsRegistry"] = None
+
+    @classmethod
+    def get_instance(cls) -> "MetricsRegistry":
+        if cls._mr_shared_instance is None:
+            cls._mr_shared_instance = MetricsRegistry()
+        return cls._mr_shared_instance
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+
+    @property
+    def metrics(self) -> List[Metric]:
+        return list(self._metrics.values())
+
+    def _get_or_create(self, metric_class, name: str, *args, **kwargs) -> Metric:
+        metric: Optional[Metric] = self._metrics.get(name)
+        if metric is None:
+            metric = metric_class(name, *args, **kwargs)
+            self._metrics[name] = metric
+        elif not isinstance(metric, metric_class):
+            raise ValueError(f"Metric {name} is already registered as a {metric.metric_type}.")
+        return metric
+
+    def counter(self, name: str, description: str, label_names: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, description, label_names)
+
+    def gauge(self, name: str, description: str, label_names: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, description, label_names)
+
+    def histogram(self,
+                  name: str,
+                  description: str,
+                  label_names: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, description, label_names, buckets)
+
+    def snapshot(self, reset: bool = False) -> Dict[str, Dict[LabelValues, Union[float, HistogramSnapshot]]]:
+        return {name: metric.snapshot(reset) for name, metric in self._metrics.items()}
@@ -0,0 +1,221 @@
+#!/usr/bin/env python
+
+from collections import defaultdict
+import heapq
+import time
+from typing import (
+    Any,
+    DefaultDict,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from hummingbot.core.event.events import (
+    ERC20WatcherEvent,
+    IncomingEthWatcherEvent,
+    MarketEvent,
+    NewBlocksWatcherEvent,
+    OrderBookEvent,
+    WalletEvent,
+)
+
+CLOCK_TICK_FRAME = "Clock.tick"
+EVENT_ENUMS = [WalletEvent, MarketEvent, NewBlocksWatcherEvent, IncomingEthWatcherEvent, ERC20WatcherEvent,
+               OrderBookEvent]
+
+
+class SlowTick(NamedTuple):
+    duration: float
+    timestamp: float
+    iterator_durations: Tuple[Tuple[str, float], ...]
+
+
+def _frame_name(name: str) -> str:
+    # Collapsed stack lines are ";" separated frames, followed by a space and the sample count.
+    return name.replace(";", ":").replace(" ", "_")
+
+
+class TickProfiler:
+    """
+    Instrumenting profiler for the clock tick chain. While started, the clock reports every tick and every time
+    iterator tick to it, and PubSub reports every listener call, so the time spent in the Cython `c_tick()` chain can be
+    broken down without profiling the whole process.
+
+    Time is aggregated by call stack - e.g. Clock.tick;BinanceMarket;MarketEvent.OrderFilled:Strategy - and written out
+    in the collapsed stack format read by flamegraph.pl and speedscope, with self times in microseconds as sample
+    counts. The slowest ticks are kept with their per iterator breakdown.
+
+    The hooks are module level variables in clock.pyx and pubsub.pyx, so profiling is toggled at run time. Stopped, the
+    only overhead left is a None check per tick and per event dispatch.
+    """
+    _tp_shared_instance: Optional["TickProfiler"] = None
+
+    @classmethod
+    def get_instance(cls) -> "TickProfiler":
+        if cls._tp_shared_instance is None:
+            cls._tp_shared_instance = TickProfiler()
+        return cls._tp_shared_instance
+
+    def __init__(self, max_slow_ticks: int = 20):
+        self._max_slow_ticks: int = max_slow_ticks
+        self._enabled: bool = False
+        self._event_names: Dict[int, str] = {}
+        self._reset()
+
+    def _reset(self):
+        # Each frame is [stack path, start time, time spent in child frames].
+        self._stack: List[List[Any]] = []
+        self._self_times: DefaultDict[str, float] = defaultdict(float)
+        self._call_counts: DefaultDict[str, int] = defaultdict(int)
+        self._tick_timestamp: float = 0.0
+        self._iterator_durations: List[Tuple[str, float]] = []
+        self._slow_ticks: List[SlowTick] = []
+        self._num_ticks: int = 0
+        self._total_tick_time: float = 0.0
+        self._start_time: float = time.time()
+        self._stop_time: Optional[float] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @property
+    def num_ticks(self) -> int:
+        return self._num_ticks
+
+    @property
+    def duration(self) -> float:
+        return (self._stop_time or time.time()) - self._start_time
+
+    def start(self):
+        from hummingbot.core.clock import set_tick_profiler
+        from hummingbot.core.pubsub import set_event_profiler
+
+        self._reset()
+        self._enabled = True
+        set_tick_profiler(self)
+        set_event_profiler(self)
+
+    def stop(self):
+        from hummingbot.core.clock import set_tick_profiler
+        from hummingbot.core.pubsub import set_event_profiler
+
+        set_tick_profiler(None)
+        set_event_profiler(None)
+        self._enabled = False
+        self._stop_time = time.time()
+        self._stack.clear()
+
+    def enter(self, name: str):
+        path: str = f"{self._stack[-1][0]};{name}" if len(self._stack) > 0 else name
+        self._stack.append([path, time.perf_counter(), 0.0])
+
+    def exit(self) -> float:
+        """
+        Closes the innermost frame.
+
+        :return: the time spent in the frame, including child frames.
+        """
+        path, start, child_time = self._stack.pop()
+        elapsed: float = time.perf_counter() - start
+        self._self_times[path] += elapsed - child_time
+        self._call_counts[path] += 1
+        if len(self._stack) > 0:
+            self._stack[-1][2] += elapsed
+        return elapsed
+
+    def begin_tick(self, timestamp: float):
+        self._tick_timestamp = timestamp
+        self._iterator_durations = []
+        self.enter(CLOCK_TICK_FRAME)
+
+    def end_tick(self):
+        duration: float = self.exit()
+        self._num_ticks += 1
+        self._total_tick_time += duration
+        if len(self._slow_ticks) < self._max_slow_ticks or duration > self._slow_ticks[0].duration:
+            slow_tick: SlowTick = SlowTick(duration, self._tick_timestamp, tuple(self._iterator_durations))
+            if len(self._slow_ticks) < self._max_slow_ticks:
+                heapq.heappush(self._slow_ticks, slow_tick)
+            else:
+                heapq.heapreplace(self._slow_ticks, slow_tick)
+
+    def enter_iterator(self, iterator: Any):
+        self.enter(iterator.__class__.__name__)
+
+    def exit_iterator(self):
+        name: str = self._stack[-1][0].rsplit(";", 1)[-1]
+        self._iterator_durations.append((name, self.exit()))
+
+    def _event_name(self, event_tag: int) -> str:
+        event_name: Optional[str] = self._event_names.get(event_tag)
+        if event_name is None:
+            event_name = f"event_{event_tag}"
+            for event_enum in EVENT_ENUMS:
+                try:
+                    event_name = f"{event_enum.__name__}.{event_enum(event_tag).name}"
+                    break
+                except ValueError:
+                    continue
+            self._event_names[event_tag] = event_name
+        return event_name
+
+    def enter_listener(self, event_tag: int, listener: Any):
+        # Event forwarders are named after the function they forward to, other listeners after their class.
+        to_function: Any = getattr(listener, "_to_function", None)
+        listener_name: str = getattr(to_function, "__qualname__", None) or listener.__class__.__name__
+        self.enter(_frame_name(f"{self._event_name(event_tag)}:{listener_name}"))
+
+    def collapsed_stacks(self) -> List[str]:
+        """
+        :return: one "frame;frame;... microseconds" line per call stack, with the self time of the innermost frame.
+        """
+        lines: List[str] = []
+        for path, self_time in sorted(self._self_times.items()):
+            microseconds: int = int(round(self_time * 1e6))
+            if microseconds > 0:
+                lines.append(f"{path} {microseconds}")
+        return lines
+
+    def write_collapsed(self, path: str):
+        with open(path, "w") as fd:
+            for line in self.collapsed_stacks():
+                fd.write(line + "\n")
+
+    def slowest_ticks(self) -> List[SlowTick]:
+        return sorted(self._slow_ticks, reverse=True)
+
+    def frame_totals(self) -> List[Tuple[str, float, int]]:
+        """
+        :return: (frame, self time, calls) for every frame name - iterator or listener - across all its call stacks,
+                 by descending self time.
+        """
+        totals: DefaultDict[str, float] = defaultdict(float)
+        calls: DefaultDict[str, int] = defaultdict(int)
+        for path, self_time in self._self_times.items():
+            frame: str = path.rsplit(";", 1)[-1]
+            totals[frame] += self_time
+            calls[frame] += self._call_counts[path]
+        return sorted(((frame, total, calls[frame]) for frame, total in totals.items()),
+                      key=lambda t: t[1], reverse=True)
+
+    def format_report(self, top: int = 10) -> str:
+        mean_tick_ms: float = self._total_tick_time / self._num_ticks * 1e3 if self._num_ticks > 0 else 0.0
+        lines: List[str] = [f"  Profiled {self._num_ticks} ticks over {self.duration:.0f} seconds, "
+                            f"mean tick time {mean_tick_ms:.3f}ms.",
+                            "",
+                            "  Self time by iterator / listener:"]
+        for frame, total, calls in self.frame_totals()[:top]:
+            lines.append(f"    {total * 1e3:10.3f}ms {calls:8d} calls  {frame}")
+        lines.extend(["", "  Slowest ticks:"])
+        for slow_tick in self.slowest_ticks()[:top]:
+            breakdown: str = ", ".join(f"{name} {duration * 1e3:.3f}ms"
+                                       for name, duration in sorted(slow_tick.iterator_durations,
+                                                                    key=lambda t: t[1],
+                                                                    reverse=True)[:3])
+            tick_time: str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(slow_tick.timestamp))
+            lines.append(f"    {slow_tick.duration * 1e3:10.3f}ms at {tick_time}  ({breakdown})")
+        return "\n".join(lines)
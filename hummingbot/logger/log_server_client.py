@@ -1,17 +1,34 @@
 import asyncio
 import logging
-from typing import Optional
+import threading
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+)
 import aiohttp
 
 from hummingbot.core.network_base import NetworkBase, NetworkStatus
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
 
 
 class LogServerClient(NetworkBase):
+    """
+    Sends log requests to the log server.
+
+    Requests wait in a bounded queue, and are posted by a fixed number of concurrent senders sharing one client
+    session. When the queue is full - e.g. the log server is slow or unreachable during an error storm - new requests
+    are dropped and counted, rather than piling up in memory. Registered flush callbacks are called every
+    `flush_interval` seconds, so that batching log handlers can send partially filled batches.
+    """
     lsc_logger: Optional[HummingbotLogger] = None
     _lsc_shared_instance: "LogServerClient" = None
 
+    DEFAULT_CHECK_NETWORK_URL = "https://api.coinalpha.com/reporting-proxy/"
+
     @classmethod
     def get_instance(cls) -> "LogServerClient":
         if cls._lsc_shared_instance is None:
@@ -24,44 +41,89 @@ class LogServerClient(NetworkBase):
             cls.lsc_logger = logging.getLogger(__name__)
         return cls.lsc_logger
 
-    def __init__(self):
+    def __init__(self,
+                 max_queue_size: int = 100,
+                 max_concurrent_requests: int = 4,
+                 flush_interval: float = 5.0,
+                 check_network_url: str = DEFAULT_CHECK_NETWORK_URL):
         super().__init__()
-        self.queue = asyncio.Queue()
-        self.consume_queue_task = None
+        self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self.consume_queue_task: Optional[asyncio.Task] = None
+        self.flush_task: Optional[asyncio.Task] = None
+        self._max_concurrent_requests: int = max_concurrent_requests
+        self._flush_interval: float = flush_interval
+        self._check_network_url: str = check_network_url
+        self._flush_callbacks: List[Callable[[], Any]] = []
+        self._requests_sent: int = 0
+        self._requests_failed: int = 0
+        self._requests_dropped: int = 0
+
+    @property
+    def requests_sent(self) -> int:
+        return self._requests_sent
+
+    @property
+    def requests_failed(self) -> int:
+        return self._requests_failed
+
+    @property
+    def requests_dropped(self) -> int:
+        return self._requests_dropped
+
+    @property
+    def pending_requests(self) -> int:
+        return self.queue.qsize()
+
+    def add_flush_callback(self, callback: Callable[[], Any]):
+        self._flush_callbacks.append(callback)
 
-    def request(self, req):
+    def remove_flush_callback(self, callback: Callable[[], Any]):
+        if callback in self._flush_callbacks:
+            self._flush_callbacks.remove(callback)
+
+    def request(self, req: Dict[str, Any]):
         if not self.started:
             self.start()
-        self.queue.put_nowait(req)
+        if threading.current_thread() is threading.main_thread():
+            self._enqueue(req)
+        else:
+            self._ev_loop.call_soon_threadsafe(self._enqueue, req)
+
+    def _enqueue(self, req: Dict[str, Any]):
+        try:
+            self.queue.put_nowait(req)
+        except asyncio.QueueFull:
+            self._requests_dropped += 1
 
-    async def consume_queue(self, session):
+    async def consume_queue(self, session: aiohttp.ClientSession):
         while True:
+            req = await self.queue.get()
             try:
-                req = await self.queue.get()
-                self.logger().debug(
-                    f"Remote logging payload: {req}"
-                )
+                self.logger().debug(f"Remote logging payload: {req['method']} {req['url']}",
+                                    extra={"do_not_send": True})
                 async with session.request(req["method"], req["url"], **req["request_obj"]) as resp:
                     resp_text = await resp.text()
                     self.logger().debug(f"Sent logs: {resp.status} {resp.url} {resp_text} ",
                                         extra={"do_not_send": True})
-
+                self._requests_sent += 1
             except asyncio.CancelledError:
                 raise
             except aiohttp.ClientError:
+                self._requests_failed += 1
                 self.logger().network(f"Network error sending logs.", exc_info=True, extra={"do_not_send": True})
-                return
             except Exception:
+                self._requests_failed += 1
                 self.logger().network(f"Unexpected error sending logs.", exc_info=True, extra={"do_not_send": True})
-                return
 
     async def request_loop(self):
         while True:
             loop = asyncio.get_event_loop()
             try:
-                async with aiohttp.ClientSession(loop=loop,
-                                                 connector=aiohttp.TCPConnector(verify_ssl=False)) as session:
-                    await self.consume_queue(session)
+                connector: aiohttp.TCPConnector = aiohttp.TCPConnector(verify_ssl=False,
+                                                                       limit=self._max_concurrent_requests)
+                async with aiohttp.ClientSession(loop=loop, connector=connector) as session:
+                    await safe_gather(*[self.consume_queue(session) for _ in range(self._max_concurrent_requests)])
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -69,20 +131,33 @@ class LogServerClient(NetworkBase):
                                       exc_info=True, extra={"do_not_send": True})
                 await asyncio.sleep(5.0)
 
+    async def flush_loop(self):
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            for callback in self._flush_callbacks:
+                try:
+                    callback()
+                except Exception:
+                    self.logger().error("Error flushing logs.", exc_info=True, extra={"do_not_send": True})
+
     async def start_network(self):
         self.consume_queue_task = safe_ensure_future(self.request_loop())
+        self.flush_task = safe_ensure_future(self.flush_loop())
 
     async def stop_network(self):
         if self.consume_queue_task is not None:
             self.consume_queue_task.cancel()
             self.consume_queue_task = None
+        if self.flush_task is not None:
+            self.flush_task.cancel()
+            self.flush_task = None
 
     async def check_network(self) -> NetworkStatus:
         try:
             loop = asyncio.get_event_loop()
             async with aiohttp.ClientSession(loop=loop,
                                              connector=aiohttp.TCPConnector(verify_ssl=False)) as session:
-                async with session.get("https://api.coinalpha.com/reporting-proxy/") as resp:
+                async with session.get(self._check_network_url) as resp:
                     status_text = await resp.text()
                     if status_text != "OK":
                         raise Exception("Log proxy server is down.")
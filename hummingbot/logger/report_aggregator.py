@@ -1,18 +1,32 @@
 import asyncio
-import copy
 import logging
 
 from hummingbot.logger import REPORT_EVENT_QUEUE
 from hummingbot.logger.struct_logger import StructLogger
 from collections import defaultdict
-from typing import Optional
+from decimal import Decimal
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.utils.exchange_rate_conversion import ExchangeRateConversion
+from hummingbot.core.utils.metrics import (
+    Counter,
+    Histogram,
+    HistogramSnapshot,
+    LabelValues,
+    MetricsRegistry,
+)
 from hummingbot.market.bamboo_relay.bamboo_relay_market import BambooRelayMarket
 from hummingbot.market.binance.binance_market import BinanceMarket
 from hummingbot.market.coinbase_pro.coinbase_pro_market import CoinbaseProMarket
 from hummingbot.market.ddex.ddex_market import DDEXMarket
 from hummingbot.market.huobi.huobi_market import HuobiMarket
+from hummingbot.market.market_base import MarketBase
 from hummingbot.market.idex.idex_market import IDEXMarket
 from hummingbot.market.radar_relay.radar_relay_market import RadarRelayMarket
 
@@ -42,7 +56,20 @@ class ReportAggregator:
 
         self.log_report_interval: float = log_report_interval
         self.report_aggregation_interval: float = report_aggregation_interval
-        self.stats: dict = defaultdict(list)
+        # The aggregator's own registry, which is reset on every report. Process-wide metrics live in the shared
+        # MetricsRegistry instance.
+        self.metrics: MetricsRegistry = MetricsRegistry()
+        self._order_filled_quote_volume: Counter = self.metrics.counter(
+            "order_filled_quote_volume",
+            "Quote volume of order fills since the last report.",
+            ["market", "symbol", "order_side", "order_type"]
+        )
+        self._open_order_quote_volume_sum: Histogram = self.metrics.histogram(
+            "open_order_quote_volume_sum",
+            "Quote volume of the strategy's open orders, sampled every report aggregation interval.",
+            ["market", "symbol"],
+            buckets=()
+        )
         self.hummingbot_app: "HummingbotApplication" = hummingbot_app
         self.get_open_order_stats_task: Optional[asyncio.Task] = None
         self.get_event_task: Optional[asyncio.Task] = None
@@ -52,74 +79,89 @@ class ReportAggregator:
     def receive_event(self, event):
         event_name = event["event_name"]
         if event_name == "OrderFilledEvent":
-            self.stats[f"order_filled_quote_volume.{event['event_source']}.{event['symbol']}."
-                       f"{str(event['trade_type']).replace('.', '-')}."
-                       f"{str(event['order_type']).replace('.', '-')}"].append(
-                (event["ts"], event["price"] * event["amount"])
+            self._order_filled_quote_volume.labels(event["event_source"],
+                                                   event["symbol"],
+                                                   str(event["trade_type"]).replace(".", "-"),
+                                                   str(event["order_type"]).replace(".", "-")).inc(
+                event["price"] * event["amount"]
             )
 
+    def log_open_order_metrics(self, timestamp: float, market_name: str, trading_pair: str, avg_volume: float):
+        quote_token = MARKETS[market_name].split_symbol(trading_pair)[1].upper()
+        usd_avg_volume = self.exchange_converter.exchange_rate.get(quote_token, 1) * avg_volume
+        metric_attributes = {
+            "type": "gauge",
+            "tags": [f"symbol:{trading_pair}",
+                     f"market:{market_name}"]
+        }
+        open_order_quote_volume_sum_metrics = {
+            "metric": "hummingbot_client.open_order_quote_volume_sum",
+            "points": [[timestamp, avg_volume]],
+            **metric_attributes
+        }
+        open_order_usd_volume_sum_metrics = {
+            "metric": "hummingbot_client.open_order_usd_volume_sum",
+            "points": [[timestamp, usd_avg_volume]],
+            **metric_attributes
+        }
+        self.logger().metric_log(open_order_quote_volume_sum_metrics)
+        self.logger().metric_log(open_order_usd_volume_sum_metrics)
+        self.logger().debug(
+            f"Open metrics logged: {open_order_quote_volume_sum_metrics}"
+        )
+
+    def log_filled_metrics(self,
+                           timestamp: float,
+                           market_name: str,
+                           trading_pair: str,
+                           order_side: str,
+                           order_type: str,
+                           sum_volume: float):
+        quote_token = MARKETS[market_name].split_symbol(trading_pair)[1].upper()
+        usd_sum_volume = self.exchange_converter.exchange_rate.get(quote_token, 1) * sum_volume
+        metric_attributes = {
+            "type": "gauge",
+            "tags": [f"symbol:{trading_pair}",
+                     f"market:{market_name}",
+                     f"order_side:{order_side}",
+                     f"order_type:{order_type}"]
+        }
+        order_filled_quote_volume_metrics = {
+            "metric": "hummingbot_client.order_filled_quote_volume",
+            "points": [[timestamp, sum_volume]],
+            **metric_attributes
+        }
+        order_filled_usd_volume_metrics = {
+            "metric": "hummingbot_client.order_filled_usd_volume",
+            "points": [[timestamp, usd_sum_volume]],
+            **metric_attributes
+        }
+        self.logger().metric_log(order_filled_quote_volume_metrics)
+        self.logger().metric_log(order_filled_usd_volume_metrics)
+        self.logger().debug(
+            f"Filled metrics logged: {order_filled_quote_volume_metrics}"
+        )
+
+    def log_metrics(self):
+        timestamp: float = self.hummingbot_app.clock.current_timestamp
+        open_order_stats: Dict[LabelValues, HistogramSnapshot] = self._open_order_quote_volume_sum.snapshot(
+            reset=True)
+        filled_stats: Dict[LabelValues, float] = self._order_filled_quote_volume.snapshot(reset=True)
+        for (market_name, trading_pair), open_order_snapshot in open_order_stats.items():
+            if open_order_snapshot.count == 0:
+                continue
+            self.log_open_order_metrics(timestamp, market_name, trading_pair, float(open_order_snapshot.mean))
+        for (market_name, trading_pair, order_side, order_type), sum_volume in filled_stats.items():
+            if sum_volume == 0:
+                continue
+            self.log_filled_metrics(timestamp, market_name, trading_pair, order_side, order_type, float(sum_volume))
+
     async def log_report(self):
         while True:
             try:
                 # Handle clock is None error when the bot stops and restarts
                 if self.hummingbot_app.clock is not None:
-                    stats = copy.deepcopy(self.stats)
-                    self.stats = defaultdict(list)
-                    for metric_name, value_list in stats.items():
-                        if not value_list:
-                            continue
-                        namespaces = metric_name.split(".")
-                        market_name = namespaces[1]
-                        trading_pair = namespaces[2]
-                        quote_token = MARKETS[market_name].split_symbol(trading_pair)[1].upper()
-                        if namespaces[0] == "open_order_quote_volume_sum":
-                            avg_volume = float(sum([value[1] for value in value_list]) / len(value_list))
-                            usd_avg_volume = self.exchange_converter.exchange_rate.get(quote_token, 1) * avg_volume
-                            metric_attributes = {
-                                "type": "gauge",
-                                "tags": [f"symbol:{trading_pair}",
-                                         f"market:{market_name}"]
-                            }
-                            open_order_quote_volume_sum_metrics = {
-                                "metric": "hummingbot_client.open_order_quote_volume_sum",
-                                "points": [[self.hummingbot_app.clock.current_timestamp, avg_volume]],
-                                **metric_attributes
-                            }
-                            open_order_usd_volume_sum_metrics = {
-                                "metric": "hummingbot_client.open_order_usd_volume_sum",
-                                "points": [[self.hummingbot_app.clock.current_timestamp, usd_avg_volume]],
-                                **metric_attributes
-                            }
-                            self.logger().metric_log(open_order_quote_volume_sum_metrics)
-                            self.logger().metric_log(open_order_usd_volume_sum_metrics)
-                            self.logger().debug(
-                                f"Open metrics logged: {open_order_quote_volume_sum_metrics}"
-                            )
-                        if namespaces[0] == "order_filled_quote_volume":
-                            sum_volume = float(sum([value[1] for value in value_list]))
-                            usd_sum_volume = self.exchange_converter.exchange_rate.get(quote_token, 1) * sum_volume
-                            metric_attributes = {
-                                "type": "gauge",
-                                "tags": [f"symbol:{trading_pair}",
-                                         f"market:{market_name}",
-                                         f"order_side:{namespaces[3]}",
-                                         f"order_type:{namespaces[4]}"]
-                            }
-                            order_filled_quote_volume_metrics = {
-                                "metric": "hummingbot_client.order_filled_quote_volume",
-                                "points": [[self.hummingbot_app.clock.current_timestamp, sum_volume]],
-                                **metric_attributes
-                            }
-                            order_filled_usd_volume_metrics = {
-                                "metric": "hummingbot_client.order_filled_usd_volume",
-                                "points": [[self.hummingbot_app.clock.current_timestamp, usd_sum_volume]],
-                                **metric_attributes
-                            }
-                            self.logger().metric_log(order_filled_quote_volume_metrics)
-                            self.logger().metric_log(order_filled_usd_volume_metrics)
-                            self.logger().debug(
-                                f"Filled metrics logged: {order_filled_quote_volume_metrics}"
-                            )
+                    self.log_metrics()
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -127,6 +169,15 @@ class ReportAggregator:
 
             await asyncio.sleep(self.log_report_interval)
 
+    def sample_open_orders(self, active_maker_orders: List[Tuple[MarketBase, LimitOrder]]):
+        # Order prices and quantities are Decimals, so the sums are kept in Decimal until they are observed.
+        _open_orders: Dict[Tuple[str, str], Decimal] = defaultdict(Decimal)
+
+        for maker_market, order in active_maker_orders:
+            _open_orders[(maker_market.name, order.symbol)] += order.price * order.quantity
+        for (market_name, trading_pair), quote_volume_sum in _open_orders.items():
+            self._open_order_quote_volume_sum.labels(market_name, trading_pair).observe(float(quote_volume_sum))
+
     async def get_open_order_stats(self):
         while True:
             try:
@@ -134,15 +185,7 @@ class ReportAggregator:
                     await asyncio.sleep(5.0)
                     continue
 
-                _open_orders = defaultdict(list)
-
-                for maker_market, order in self.hummingbot_app.strategy.active_maker_orders:
-                    key = f"{maker_market.name}.{order.symbol}"
-                    _open_orders[key].append(order.price * order.quantity)
-                for market_name, quote_volumes in _open_orders.items():
-                    metric_name = f"open_order_quote_volume_sum.{market_name}"
-                    metric_value = (self.hummingbot_app.clock.current_timestamp, sum(quote_volumes))
-                    self.stats[metric_name].append(metric_value)
+                self.sample_open_orders(self.hummingbot_app.strategy.active_maker_orders)
 
             except asyncio.CancelledError:
                 raise
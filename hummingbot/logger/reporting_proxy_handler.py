@@ -1,6 +1,14 @@
+from collections import deque
+import gzip
 import io
 import traceback
-from typing import Optional
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    List,
+    Optional,
+)
 import logging
 import json
 from hummingbot.client.config.global_config_map import global_config_map
@@ -16,6 +24,14 @@ CLIENT_VERSION = open(VERSIONFILE, "rt").read()
 
 
 class ReportingProxyHandler(logging.Handler):
+    """
+    Ships log, event and metric records to the reporting proxy in batches.
+
+    `emit()` only formats the record into a bounded ring buffer; when a buffer holds `capacity` records, its records
+    are sent as one gzip compressed request. Partially filled buffers are sent every flush interval of the log server
+    client. When a buffer is full because records arrive faster than they can be sent, the oldest records are dropped
+    and counted in `records_dropped`.
+    """
     _rrh_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -27,15 +43,22 @@ class ReportingProxyHandler(logging.Handler):
     def __init__(self,
                  level=logging.INFO,
                  proxy_url="https://127.0.0.1:9000",
-                 capacity=1):
+                 capacity=100,
+                 max_buffer_size=10000,
+                 compress=True,
+                 log_server_client: Optional[LogServerClient] = None):
         super().__init__()
         self.setLevel(level)
-        self._log_queue: list = []
-        self._event_queue: list = []
-        self._metrics_queue: list = []
-        self.capacity: int = capacity
+        self._log_queue: Deque[Dict[str, Any]] = deque(maxlen=max_buffer_size)
+        self._event_queue: Deque[Dict[str, Any]] = deque(maxlen=max_buffer_size)
+        self._metrics_queue: Deque[Dict[str, Any]] = deque(maxlen=max_buffer_size)
+        self.capacity: int = max(capacity, 1)
+        self.max_buffer_size: int = max_buffer_size
+        self.compress: bool = compress
         self.proxy_url: str = proxy_url
-        self.log_server_client: LogServerClient = LogServerClient.get_instance()
+        self.records_dropped: int = 0
+        self.log_server_client: LogServerClient = log_server_client or LogServerClient.get_instance()
+        self.log_server_client.add_flush_callback(self.flush_all)
 
     @property
     def client_id(self):
@@ -54,7 +77,10 @@ class ReportingProxyHandler(logging.Handler):
         else:
             self.process_log(record)
 
-        self.flush()
+        if (len(self._log_queue) >= self.capacity or
+                len(self._event_queue) >= self.capacity or
+                len(self._metrics_queue) >= self.capacity):
+            self.flush()
 
     def formatException(self, ei):
         """
@@ -87,12 +113,12 @@ class ReportingProxyHandler(logging.Handler):
             message["exc_info"] = self.formatException(log.exc_info)
             message["exception_type"] = str(log.exc_info[0])
             message["exception_msg"] = str(log.exc_info[1])
-        self._log_queue.append(message)
+        self._append(self._log_queue, message)
 
     def process_event_log(self, log):
         event_dict = log.__dict__.get("dict_msg", {})
         if event_dict:
-            self._event_queue.append(event_dict)
+            self._append(self._event_queue, event_dict)
 
     def process_metric_log(self, log):
         metric_dict = log.__dict__.get("dict_msg", {})
@@ -100,17 +126,28 @@ class ReportingProxyHandler(logging.Handler):
             metric_dict["tags"] = (metric_dict.get("tags", []) +
                                    [f"client_id:{self.client_id}", "source:hummingbot-client"])
 
-            self._metrics_queue.append(metric_dict)
+            self._append(self._metrics_queue, metric_dict)
+
+    def _append(self, queue: Deque[Dict[str, Any]], message: Dict[str, Any]):
+        if len(queue) >= self.max_buffer_size:
+            # The deque drops its oldest message.
+            self.records_dropped += 1
+        queue.append(message)
+
+    def _request_body(self, obj: Any) -> Dict[str, Any]:
+        data: bytes = json.dumps(obj, default=log_encoder).encode("utf8")
+        headers: Dict[str, str] = {"Content-Type": "application/json"}
+        if self.compress:
+            data = gzip.compress(data, compresslevel=5)
+            headers["Content-Encoding"] = "gzip"
+        return {"headers": headers, "data": data}
 
     def send_logs(self, logs):
         request_obj = {
             "url": f"{self.proxy_url}/logs",
             "method": "POST",
             "request_obj": {
-                "headers": {
-                    'Content-Type': "application/json"
-                },
-                "data": json.dumps(logs, default=log_encoder),
+                **self._request_body(logs),
                 "params": {"ddtags": f"client_id:{self.client_id},"
                                      f"client_version:{CLIENT_VERSION},"
                                      f"type:log",
@@ -124,10 +161,7 @@ class ReportingProxyHandler(logging.Handler):
             "url": f"{self.proxy_url}/logs",
             "method": "POST",
             "request_obj": {
-                "headers": {
-                    'Content-Type': "application/json"
-                },
-                "data": json.dumps(logs, default=log_encoder),
+                **self._request_body(logs),
                 "params": {"ddtags": f"client_id:{self.client_id},"
                                      f"client_version:{CLIENT_VERSION},"
                                      f"type:event",
@@ -140,42 +174,40 @@ class ReportingProxyHandler(logging.Handler):
         request_obj = {
             "url": f"{self.proxy_url}/metrics",
             "method": "POST",
-            "request_obj": {
-                "headers": {
-                    'Content-Type': "application/json"
-                },
-                "data": json.dumps(
-                    {"series": logs},
-                    default=log_encoder
-                )
-            }
+            "request_obj": self._request_body({"series": logs})
         }
         self.log_server_client.request(request_obj)
 
+    @staticmethod
+    def _take_batch(queue: Deque[Dict[str, Any]], batch_size: int) -> List[Dict[str, Any]]:
+        return [queue.popleft() for _ in range(min(batch_size, len(queue)))]
+
     def flush(self, send_all=False):
+        """
+        Sends every full batch of buffered records - and with `send_all`, the remaining partial batches too.
+        """
         self.acquire()
-        min_send_capacity = self.capacity
-        if send_all:
-            min_send_capacity = 0
+        min_send_capacity = 1 if send_all else self.capacity
         try:
-            if len(self._log_queue) > min_send_capacity:
-                self.send_logs(self._log_queue)
-                self._log_queue = []
-            if len(self._event_queue) > min_send_capacity:
-                self.send_event_logs(self._event_queue)
-                self._event_queue = []
-            if len(self._metrics_queue) > min_send_capacity:
-                self.send_metric_logs(self._metrics_queue)
-                self._metrics_queue = []
+            while len(self._log_queue) >= min_send_capacity:
+                self.send_logs(self._take_batch(self._log_queue, self.capacity))
+            while len(self._event_queue) >= min_send_capacity:
+                self.send_event_logs(self._take_batch(self._event_queue, self.capacity))
+            while len(self._metrics_queue) >= min_send_capacity:
+                self.send_metric_logs(self._take_batch(self._metrics_queue, self.capacity))
 
         except Exception:
             self.logger().error(f"Error sending logs.", exc_info=True, extra={"do_not_send": True})
         finally:
             self.release()
 
+    def flush_all(self):
+        self.flush(send_all=True)
+
     def close(self):
         try:
             self.flush(send_all=True)
+            self.log_server_client.remove_flush_callback(self.flush_all)
             self.log_server_client.stop()
         finally:
             logging.Handler.close(self)
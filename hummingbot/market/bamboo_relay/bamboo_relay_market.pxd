@@ -28,6 +28,7 @@ cdef class BambooRelayMarket(MarketBase):
         TransactionTracker _tx_tracker
         object _w3
         object _exchange
+        object _order_signer
         object _coordinator
         bint _use_coordinator
         bint _pre_emptive_soft_cancels
@@ -62,6 +62,7 @@ from hummingbot.wallet.ethereum.ethereum_chain import EthereumChain
 from hummingbot.wallet.ethereum.web3_wallet import Web3Wallet
 from hummingbot.wallet.ethereum.zero_ex.zero_ex_custom_utils import fix_signature
 from hummingbot.wallet.ethereum.zero_ex.zero_ex_exchange import ZeroExExchange
+from hummingbot.wallet.ethereum.zero_ex.zero_ex_order_signer import ZeroExOrderSigner
 from hummingbot.wallet.ethereum.zero_ex.zero_ex_coordinator import ZeroExCoordinator
 
 brm_logger = None
@@ -202,6 +203,7 @@ cdef class BambooRelayMarket(MarketBase):
             coordinator_registry_address = Web3.toChecksumAddress(ZERO_EX_KOVAN_COORDINATOR_REGISTRY_ADDRESS)
             self._wallet_spender_address = Web3.toChecksumAddress(ZERO_EX_KOVAN_ERC20_PROXY)
         self._exchange = ZeroExExchange(self._w3, self._exchange_address, wallet)
+        self._order_signer = ZeroExOrderSigner(wallet, self._exchange_address)
         self._coordinator = ZeroExCoordinator(self._provider,
                                               self._w3,
                                               self._exchange_address,
@@ -281,6 +283,13 @@ cdef class BambooRelayMarket(MarketBase):
             }
         }
 
+    def tracking_state_entry(self, order_id: str) -> Optional[Tuple[List[str], Dict[str, any]]]:
+        if order_id in self._in_flight_market_orders:
+            return ["market_orders", order_id], self._in_flight_market_orders[order_id].to_json()
+        if order_id in self._in_flight_limit_orders:
+            return ["limit_orders", order_id], self._in_flight_limit_orders[order_id].to_json()
+        return None
+
     def reset_state(self):
         self._in_flight_market_orders = {}
         self._in_flight_limit_orders = {}
@@ -312,15 +321,17 @@ cdef class BambooRelayMarket(MarketBase):
                 self._poll_notifier = asyncio.Event()
                 await self._poll_notifier.wait()
 
-                self._update_balances()
-                await safe_gather(
-                    self._update_trading_rules(),
-                    self._update_limit_order_status(),
-                    self._update_market_order_status()
-                )
+                with self.status_poll_timer():
+                    self._update_balances()
+                    await safe_gather(
+                        self._update_trading_rules(),
+                        self._update_limit_order_status(),
+                        self._update_market_order_status()
+                    )
             except asyncio.CancelledError:
                 raise
             except Exception:
+                self.record_status_poll_error()
                 self.logger().network(
                     "Unexpected error while fetching account updates.",
                     exc_info=True,
@@ -649,28 +660,29 @@ cdef class BambooRelayMarket(MarketBase):
                            url: str,
                            data: Optional[Dict[str, Any]] = None,
                            headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
-        async with aiohttp.ClientSession() as client:
-            async with client.request(http_method,
-                                      url=url,
-                                      timeout=self.API_CALL_TIMEOUT,
-                                      json=data,
-                                      headers=headers) as response:
-                try:
-                    if response.status == 201:
-                        return response
-                    elif response.status == 200:
-                        response_json = await response.json()
-                        return response_json
-                    else:
-                        raise IOError
-                except Exception:
-                    if response.status == 502:
-                        raise IOError(f"Error fetching data from {url}. "
-                                      f"HTTP status is {response.status} - Server Error: Bad Gateway.")
-                    else:
-                        response_text = await response.text()
-                        raise IOError(f"Error fetching data from {url}. "
-                                      f"HTTP status is {response.status} - {response_text}.")
+        with self.rest_request_timer(http_method, url):
+            async with aiohttp.ClientSession() as client:
+                async with client.request(http_method,
+                                          url=url,
+                                          timeout=self.API_CALL_TIMEOUT,
+                                          json=data,
+                                          headers=headers) as response:
+                    try:
+                        if response.status == 201:
+                            return response
+                        elif response.status == 200:
+                            response_json = await response.json()
+                            return response_json
+                        else:
+                            raise IOError
+                    except Exception:
+                        if response.status == 502:
+                            raise IOError(f"Error fetching data from {url}. "
+                                          f"HTTP status is {response.status} - Server Error: Bad Gateway.")
+                        else:
+                            response_text = await response.text()
+                            raise IOError(f"Error fetching data from {url}. "
+                                          f"HTTP status is {response.status} - {response_text}.")
 
     async def request_signed_market_orders(self, symbol: str, trade_type: TradeType, amount: str) -> Dict[str, Any]:
         if trade_type is TradeType.BUY:
@@ -836,9 +848,9 @@ cdef class BambooRelayMarket(MarketBase):
                                                                        price=price,
                                                                        expires=expires)
         unsigned_limit_order["makerAddress"] = self._wallet.address.lower()
-        order_hash_hex = self.get_order_hash_hex(unsigned_limit_order)
+        # Orders placed together, e.g. multiple order levels, are hashed and signed in a batch off the event loop.
+        order_hash_hex, signature = await self._order_signer.sign_order(unsigned_limit_order)
         signed_limit_order = copy.deepcopy(unsigned_limit_order)
-        signature = self.get_zero_ex_signature(order_hash_hex)
         signed_limit_order["signature"] = signature
         try:
             await self._api_request(http_method="post", url=url, data=signed_limit_order, headers={"User-Agent": "hummingbot"})
@@ -1190,6 +1202,7 @@ cdef class BambooRelayMarket(MarketBase):
 
     async def stop_network(self):
         self._stop_network()
+        await self._coordinator.close()
 
     async def check_network(self) -> NetworkStatus:
         if self._wallet.network_status is not NetworkStatus.CONNECTED:
@@ -15,6 +15,9 @@ from typing import (
 from hummingbot.core.event.events import TradeType
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book_tracker import (
+    ORDER_BOOK_DIFF_LAG_SECONDS,
+    ORDER_BOOK_DIFFS_APPLIED,
+    ORDER_BOOK_MESSAGES,
     OrderBookTracker,
     OrderBookTrackerDataSourceType
 )
@@ -27,6 +30,11 @@ from hummingbot.core.data_type.order_book_message import (
 )
 from hummingbot.core.data_type.order_book_tracker_entry import BambooRelayOrderBookTrackerEntry
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.metrics import (
+    CounterChild,
+    CounterDeltas,
+    HistogramChild,
+)
 from hummingbot.market.bamboo_relay.bamboo_relay_order_book import BambooRelayOrderBook
 from hummingbot.market.bamboo_relay.bamboo_relay_active_order_tracker import BambooRelayActiveOrderTracker
 from hummingbot.wallet.ethereum.ethereum_chain import EthereumChain
@@ -121,9 +129,10 @@ class BambooRelayOrderBookTracker(OrderBookTracker):
         Route the real-time order book diff messages to the correct order book.
         """
         last_message_timestamp: float = time.time()
-        messages_queued: int = 0
-        messages_accepted: int = 0
-        messages_rejected: int = 0
+        messages_queued: CounterChild = ORDER_BOOK_MESSAGES.labels(self.exchange_name, "diff", "queued")
+        messages_accepted: CounterChild = ORDER_BOOK_MESSAGES.labels(self.exchange_name, "diff", "accepted")
+        messages_rejected: CounterChild = ORDER_BOOK_MESSAGES.labels(self.exchange_name, "diff", "rejected")
+        logged_messages: CounterDeltas = CounterDeltas(messages_accepted, messages_rejected, messages_queued)
         address_token_map: Dict[str, any] = await self._data_source.get_all_token_info()
         while True:
             try:
@@ -135,7 +144,7 @@ class BambooRelayOrderBookTracker(OrderBookTracker):
                 trading_pair_symbol: str = f"{base_token_symbol}-{quote_token_symbol}"
 
                 if trading_pair_symbol not in self._tracking_message_queues:
-                    messages_queued += 1
+                    messages_queued.inc()
                     # Save diff messages received before snapshots are ready
                     self._saved_message_queues[trading_pair_symbol].append(ob_message)
                     continue
@@ -144,7 +153,7 @@ class BambooRelayOrderBookTracker(OrderBookTracker):
                 order_book: BambooRelayOrderBook = self._order_books[trading_pair_symbol]
 
                 if order_book.snapshot_uid > ob_message.update_id:
-                    messages_rejected += 1
+                    messages_rejected.inc()
                     continue
                 await message_queue.put(ob_message)
 
@@ -160,18 +169,13 @@ class BambooRelayOrderBookTracker(OrderBookTracker):
                         "amount": ob_message.content["order"]["filledBaseTokenAmount"]
                     }, timestamp=ob_message.timestamp))
 
-                messages_accepted += 1
+                messages_accepted.inc()
 
                 # Log some statistics.
                 now: float = time.time()
                 if int(now / 60.0) > int(last_message_timestamp / 60.0):
                     self.logger().debug("Diff messages processed: %d, rejected: %d, queued: %d",
-                                       messages_accepted,
-                                       messages_rejected,
-                                       messages_queued)
-                    messages_accepted = 0
-                    messages_rejected = 0
-                    messages_queued = 0
+                                        *logged_messages.take())
 
                 last_message_timestamp = now
             except asyncio.CancelledError:
@@ -193,7 +197,9 @@ class BambooRelayOrderBookTracker(OrderBookTracker):
         active_order_tracker: BambooRelayActiveOrderTracker = self._active_order_trackers[symbol]
 
         last_message_timestamp: float = time.time()
-        diff_messages_accepted: int = 0
+        diff_messages_accepted: CounterChild = ORDER_BOOK_DIFFS_APPLIED.labels(self.exchange_name, symbol)
+        logged_diff_messages: CounterDeltas = CounterDeltas(diff_messages_accepted)
+        diff_lag: HistogramChild = ORDER_BOOK_DIFF_LAG_SECONDS.labels(self.exchange_name, symbol)
 
         while True:
             try:
@@ -211,14 +217,15 @@ class BambooRelayOrderBookTracker(OrderBookTracker):
                     past_diffs_window.append(message)
                     while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
                         past_diffs_window.popleft()
-                    diff_messages_accepted += 1
+                    diff_messages_accepted.inc()
+                    if message.timestamp is not None:
+                        diff_lag.observe(time.time() - message.timestamp)
 
                     # Output some statistics periodically.
                     now: float = time.time()
                     if int(now / 60.0) > int(last_message_timestamp / 60.0):
                         self.logger().debug("Processed %d order book diffs for %s.",
-                                           diff_messages_accepted, symbol)
-                        diff_messages_accepted = 0
+                                            *logged_diff_messages.take(), symbol)
                     last_message_timestamp = now
                 elif message.type is OrderBookMessageType.SNAPSHOT:
                     past_diffs: List[BambooRelayOrderBookMessage] = list(past_diffs_window)
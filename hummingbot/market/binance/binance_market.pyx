@@ -237,6 +237,10 @@ cdef class BinanceMarket(MarketBase):
             for key, value in self._in_flight_orders.items()
         }
 
+    def tracking_state_entry(self, order_id: str) -> Optional[Tuple[List[str], Dict[str, any]]]:
+        in_flight_order = self._in_flight_orders.get(order_id)
+        return ([order_id], in_flight_order.to_json()) if in_flight_order is not None else None
+
     def restore_tracking_states(self, saved_states: Dict[str, any]):
         self._in_flight_orders.update({
             key: BinanceInFlightOrder.from_json(value)
@@ -717,15 +721,17 @@ cdef class BinanceMarket(MarketBase):
             try:
                 self._poll_notifier = asyncio.Event()
                 await self._poll_notifier.wait()
-                await safe_gather(
-                    self._update_balances(),
-                    self._update_order_status(),
-                    self._update_order_fills_from_trades()
-                )
-                self._last_pull_timestamp = self._current_timestamp
+                with self.status_poll_timer():
+                    await safe_gather(
+                        self._update_balances(),
+                        self._update_order_status(),
+                        self._update_order_fills_from_trades()
+                    )
+                    self._last_pull_timestamp = self._current_timestamp
             except asyncio.CancelledError:
                 raise
             except Exception:
+                self.record_status_poll_error()
                 self.logger().network("Unexpected error while fetching account updates.", exc_info=True,
                                       app_warning_msg="Could not fetch account updates from Binance. "
                                                       "Check API key and network connection.")
@@ -12,6 +12,7 @@ from typing import (
     List,
     Optional,
     AsyncIterable,
+    Tuple,
 )
 from libc.stdint cimport int64_t
 
@@ -226,6 +227,10 @@ cdef class CoinbaseProMarket(MarketBase):
             for key, value in self._in_flight_orders.items()
         }
 
+    def tracking_state_entry(self, order_id: str) -> Optional[Tuple[List[str], Dict[str, any]]]:
+        in_flight_order = self._in_flight_orders.get(order_id)
+        return ([order_id], in_flight_order.to_json()) if in_flight_order is not None else None
+
     def restore_tracking_states(self, saved_states: Dict[str, any]):
         """
         *required
@@ -350,12 +355,13 @@ cdef class CoinbaseProMarket(MarketBase):
         headers = self.coinbase_auth.get_headers(http_method, path_url, data_str)
 
         client = await self._http_client()
-        async with client.request(http_method,
-                                  url=url, timeout=self.API_CALL_TIMEOUT, data=data_str, headers=headers) as response:
-            data = await response.json()
-            if response.status != 200:
-                raise IOError(f"Error fetching data from {url}. HTTP status is {response.status}. {data}")
-            return data
+        with self.rest_request_timer(http_method, url):
+            async with client.request(http_method,
+                                      url=url, timeout=self.API_CALL_TIMEOUT, data=data_str, headers=headers) as response:
+                data = await response.json()
+                if response.status != 200:
+                    raise IOError(f"Error fetching data from {url}. HTTP status is {response.status}. {data}")
+                return data
 
     cdef object c_get_fee(self,
                           str base_currency,
@@ -914,13 +920,15 @@ cdef class CoinbaseProMarket(MarketBase):
                 self._poll_notifier = asyncio.Event()
                 await self._poll_notifier.wait()
 
-                await safe_gather(
-                    self._update_balances(),
-                    self._update_order_status(),
-                )
+                with self.status_poll_timer():
+                    await safe_gather(
+                        self._update_balances(),
+                        self._update_order_status(),
+                    )
             except asyncio.CancelledError:
                 raise
             except Exception:
+                self.record_status_poll_error()
                 self.logger().network(
                     "Unexpected error while fetching account updates.",
                     exc_info=True,
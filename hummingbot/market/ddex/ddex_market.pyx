@@ -14,7 +14,8 @@ from typing import (
     Any,
     Dict,
     List,
-    Optional
+    Optional,
+    Tuple
 )
 from decimal import Decimal
 from libc.stdint cimport int64_t
@@ -208,6 +209,10 @@ cdef class DDEXMarket(MarketBase):
             for key, value in self._in_flight_orders.items()
         }
 
+    def tracking_state_entry(self, order_id: str) -> Optional[Tuple[List[str], Dict[str, any]]]:
+        in_flight_order = self._in_flight_orders.get(order_id)
+        return ([order_id], in_flight_order.to_json()) if in_flight_order is not None else None
+
     def restore_tracking_states(self, saved_states: Dict[str, any]):
         self._in_flight_orders.update({
             key: DDEXInFlightOrder.from_json(value)
@@ -223,17 +228,19 @@ cdef class DDEXMarket(MarketBase):
                 self._poll_notifier = asyncio.Event()
                 await self._poll_notifier.wait()
 
-                self._update_balances()
-                await safe_gather(
-                    self._update_available_balances(),
-                    self._update_trading_rules(),
-                    self._update_order_fills_from_trades(),
-                    self._update_order_status(),
-                    self._update_trade_fees()
-                )
+                with self.status_poll_timer():
+                    self._update_balances()
+                    await safe_gather(
+                        self._update_available_balances(),
+                        self._update_trading_rules(),
+                        self._update_order_fills_from_trades(),
+                        self._update_order_status(),
+                        self._update_trade_fees()
+                    )
             except asyncio.CancelledError:
                 raise
             except Exception:
+                self.record_status_poll_error()
                 self.logger().network(
                     "Unexpected error while fetching account and status updates.",
                     exc_info=True,
@@ -490,18 +497,19 @@ cdef class DDEXMarket(MarketBase):
                            params: Optional[Dict[str, Any]] = None,
                            headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         client = await self._http_client()
-        async with client.request(http_method, url=url, timeout=self.API_CALL_TIMEOUT, data=data, params=params,
-                                  headers=headers) as response:
-            if response.status != 200:
-                raise IOError(f"Error fetching data from {url}. HTTP status is {response.status}.")
-            data = await response.json()
-            if data["status"] is not 0:
-                raise IOError(f"Request to {url} has failed", data)
-
-            # Keep an auto-expired record of the response and the request URL for debugging and logging purpose.
-            self._api_response_records[url] = response
-
-            return data
+        with self.rest_request_timer(http_method, url):
+            async with client.request(http_method, url=url, timeout=self.API_CALL_TIMEOUT, data=data, params=params,
+                                      headers=headers) as response:
+                if response.status != 200:
+                    raise IOError(f"Error fetching data from {url}. HTTP status is {response.status}.")
+                data = await response.json()
+                if data["status"] is not 0:
+                    raise IOError(f"Request to {url} has failed", data)
+
+                # Keep an auto-expired record of the response and the request URL for debugging and logging purpose.
+                self._api_response_records[url] = response
+
+                return data
 
     async def _update_trade_fees(self):
         cdef:
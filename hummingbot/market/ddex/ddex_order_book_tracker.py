@@ -15,6 +15,9 @@ from typing import (
 from hummingbot.market.ddex.ddex_active_order_tracker import DDEXActiveOrderTracker
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book_tracker import (
+    ORDER_BOOK_DIFF_LAG_SECONDS,
+    ORDER_BOOK_DIFFS_APPLIED,
+    ORDER_BOOK_MESSAGES,
     OrderBookTracker,
     OrderBookTrackerDataSourceType
 )
@@ -22,6 +25,11 @@ from hummingbot.market.ddex.ddex_order_book import DDEXOrderBook
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.remote_api_order_book_data_source import RemoteAPIOrderBookDataSource
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.metrics import (
+    CounterChild,
+    CounterDeltas,
+    HistogramChild,
+)
 from hummingbot.market.ddex.ddex_api_order_book_data_source import DDEXAPIOrderBookDataSource
 
 from hummingbot.core.data_type.order_book_message import (
@@ -125,9 +133,10 @@ class DDEXOrderBookTracker(OrderBookTracker):
         Route the real-time order book diff messages to the correct order book.
         """
         last_message_timestamp: float = time.time()
-        messages_queued: int = 0
-        messages_accepted: int = 0
-        messages_rejected: int = 0
+        messages_queued: CounterChild = ORDER_BOOK_MESSAGES.labels(self.exchange_name, "diff", "queued")
+        messages_accepted: CounterChild = ORDER_BOOK_MESSAGES.labels(self.exchange_name, "diff", "accepted")
+        messages_rejected: CounterChild = ORDER_BOOK_MESSAGES.labels(self.exchange_name, "diff", "rejected")
+        logged_messages: CounterDeltas = CounterDeltas(messages_accepted, messages_rejected, messages_queued)
 
         while True:
             try:
@@ -135,7 +144,7 @@ class DDEXOrderBookTracker(OrderBookTracker):
                 symbol: str = ob_message.symbol
 
                 if symbol not in self._tracking_message_queues:
-                    messages_queued += 1
+                    messages_queued.inc()
                     # Save diff messages received before snapshots are ready
                     self._saved_message_queues[symbol].append(ob_message)
                     continue
@@ -144,7 +153,7 @@ class DDEXOrderBookTracker(OrderBookTracker):
                 order_book: DDEXOrderBook = self._order_books[symbol]
 
                 if order_book.snapshot_uid > ob_message.update_id:
-                    messages_rejected += 1
+                    messages_rejected.inc()
                     continue
 
                 if ob_message.type == OrderBookMessageType.DIFF:
@@ -152,18 +161,13 @@ class DDEXOrderBookTracker(OrderBookTracker):
                 elif ob_message.type == OrderBookMessageType.TRADE:
                     self._order_book_trade_stream.put_nowait(ob_message)
 
-                messages_accepted += 1
+                messages_accepted.inc()
 
                 # Log some statistics.
                 now: float = time.time()
                 if int(now / 60.0) > int(last_message_timestamp / 60.0):
                     self.logger().debug("Diff messages processed: %d, rejected: %d, queued: %d",
-                                        messages_accepted,
-                                        messages_rejected,
-                                        messages_queued)
-                    messages_accepted = 0
-                    messages_rejected = 0
-                    messages_queued = 0
+                                        *logged_messages.take())
 
                 last_message_timestamp = now
             except asyncio.CancelledError:
@@ -185,7 +189,9 @@ class DDEXOrderBookTracker(OrderBookTracker):
         active_order_tracker: DDEXActiveOrderTracker = self._active_order_trackers[symbol]
 
         last_message_timestamp: float = time.time()
-        diff_messages_accepted: int = 0
+        diff_messages_accepted: CounterChild = ORDER_BOOK_DIFFS_APPLIED.labels(self.exchange_name, symbol)
+        logged_diff_messages: CounterDeltas = CounterDeltas(diff_messages_accepted)
+        diff_lag: HistogramChild = ORDER_BOOK_DIFF_LAG_SECONDS.labels(self.exchange_name, symbol)
 
         while True:
             try:
@@ -203,14 +209,15 @@ class DDEXOrderBookTracker(OrderBookTracker):
                     past_diffs_window.append(message)
                     while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
                         past_diffs_window.popleft()
-                    diff_messages_accepted += 1
+                    diff_messages_accepted.inc()
+                    if message.timestamp is not None:
+                        diff_lag.observe(time.time() - message.timestamp)
 
                     # Output some statistics periodically.
                     now: float = time.time()
                     if int(now / 60.0) > int(last_message_timestamp / 60.0):
                         self.logger().debug("Processed %d order book diffs for %s.",
-                                            diff_messages_accepted, symbol)
-                        diff_messages_accepted = 0
+                                            *logged_diff_messages.take(), symbol)
                     last_message_timestamp = now
                 elif message.type is OrderBookMessageType.SNAPSHOT:
                     past_diffs: List[DDEXOrderBookMessage] = list(past_diffs_window)
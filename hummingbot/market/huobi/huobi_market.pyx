@@ -171,6 +171,10 @@ cdef class HuobiMarket(MarketBase):
             for key, value in self._in_flight_orders.items()
         }
 
+    def tracking_state_entry(self, order_id: str) -> Optional[Tuple[List[str], Dict[str, Any]]]:
+        in_flight_order = self._in_flight_orders.get(order_id)
+        return ([order_id], in_flight_order.to_json()) if in_flight_order is not None else None
+
     def restore_tracking_states(self, saved_states: Dict[str, Any]):
         self._in_flight_orders.update({
             key: HuobiInFlightOrder.from_json(value)
@@ -248,24 +252,25 @@ cdef class HuobiMarket(MarketBase):
         client = await self._http_client()
         if is_auth_required:
             params = self._huobi_auth.add_auth_to_params(method, path_url, params)
-        async with client.request(method=method,
-                                  url=url,
-                                  headers=headers,
-                                  params=params,
-                                  data=ujson.dumps(data),
-                                  timeout=self.API_CALL_TIMEOUT) as response:
-            if response.status != 200:
-                raise IOError(f"Error fetching data from {url}. HTTP status is {response.status}.")
-            try:
-                parsed_response = await response.json()
-            except Exception:
-                raise IOError(f"Error parsing data from {url}.")
-
-            data = parsed_response.get("data")
-            if data is None:
-                self.logger().error(f"Error received from {url}. Response is {parsed_response}.")
-                return {"error": parsed_response}
-            return data
+        with self.rest_request_timer(method, url):
+            async with client.request(method=method,
+                                      url=url,
+                                      headers=headers,
+                                      params=params,
+                                      data=ujson.dumps(data),
+                                      timeout=self.API_CALL_TIMEOUT) as response:
+                if response.status != 200:
+                    raise IOError(f"Error fetching data from {url}. HTTP status is {response.status}.")
+                try:
+                    parsed_response = await response.json()
+                except Exception:
+                    raise IOError(f"Error parsing data from {url}.")
+
+                data = parsed_response.get("data")
+                if data is None:
+                    self.logger().error(f"Error received from {url}. Response is {parsed_response}.")
+                    return {"error": parsed_response}
+                return data
 
     async def _update_account_id(self) -> str:
         accounts = await self._api_request("get", path_url="account/accounts", is_auth_required=True)
@@ -489,14 +494,16 @@ cdef class HuobiMarket(MarketBase):
                 self._poll_notifier = asyncio.Event()
                 await self._poll_notifier.wait()
 
-                await safe_gather(
-                    self._update_balances(),
-                    self._update_order_status(),
-                )
-                self._last_poll_timestamp = self._current_timestamp
+                with self.status_poll_timer():
+                    await safe_gather(
+                        self._update_balances(),
+                        self._update_order_status(),
+                    )
+                    self._last_poll_timestamp = self._current_timestamp
             except asyncio.CancelledError:
                 raise
             except Exception:
+                self.record_status_poll_error()
                 self.logger().network("Unexpected error while fetching account updates.",
                                       exc_info=True,
                                       app_warning_msg="Could not fetch account updates from Huobi. "
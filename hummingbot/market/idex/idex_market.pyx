@@ -216,6 +216,10 @@ cdef class IDEXMarket(MarketBase):
             for key, value in self._in_flight_orders.items()
         }
 
+    def tracking_state_entry(self, order_id: str) -> Optional[Tuple[List[str], Dict[str, any]]]:
+        in_flight_order = self._in_flight_orders.get(order_id)
+        return ([order_id], in_flight_order.to_json()) if in_flight_order is not None else None
+
     @property
     def nonce(self) -> int:
         next_nonce = int(time.time() * 1e3)
@@ -240,15 +244,17 @@ cdef class IDEXMarket(MarketBase):
             try:
                 self._poll_notifier = asyncio.Event()
                 await self._poll_notifier.wait()
-                await safe_gather(
-                    self._update_balances(),
-                    self._update_order_status(),
-                    self._update_asset_info(),
-                    self._update_contract_address()
-                )
+                with self.status_poll_timer():
+                    await safe_gather(
+                        self._update_balances(),
+                        self._update_order_status(),
+                        self._update_asset_info(),
+                        self._update_contract_address()
+                    )
             except asyncio.CancelledError:
                 raise
             except Exception as e:
+                self.record_status_poll_error()
                 self.logger().debug(f"IDEX Status Polling Loop Error: {e}")
                 self.logger().network(
                     "Unexpected error while fetching account and status updates.",
@@ -416,19 +422,20 @@ cdef class IDEXMarket(MarketBase):
         client = await self._http_client()
         default_headers = {"API-Key": self._idex_api_key, "User-Agent": "hummingbot"}
         headers_with_ua = {**headers, **default_headers} if headers else default_headers
-        async with client.request(http_method,
-                                  url=url,
-                                  timeout=self.API_CALL_TIMEOUT,
-                                  data=data,
-                                  params=params,
-                                  headers=headers_with_ua,
-                                  json=json) as response:
-            data = await response.json()
-            if response.status != 200:
-                raise IOError(f"Error fetching data from {url}. HTTP status is {response.status} - {data}")
-            # Keep an auto-expired record of the response and the request URL for debugging and logging purpose.
-            self._api_response_records[url] = response
-            return data
+        with self.rest_request_timer(http_method, url):
+            async with client.request(http_method,
+                                      url=url,
+                                      timeout=self.API_CALL_TIMEOUT,
+                                      data=data,
+                                      params=params,
+                                      headers=headers_with_ua,
+                                      json=json) as response:
+                data = await response.json()
+                if response.status != 200:
+                    raise IOError(f"Error fetching data from {url}. HTTP status is {response.status} - {data}")
+                # Keep an auto-expired record of the response and the request URL for debugging and logging purpose.
+                self._api_response_records[url] = response
+                return data
 
     async def _sequential_api_request(self,
                                       http_method: str,
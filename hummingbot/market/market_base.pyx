@@ -3,6 +3,7 @@ import pandas as pd
 from typing import (
     Dict,
     List,
+    Optional,
     Tuple,
 )
 
@@ -17,11 +18,33 @@ from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.network_iterator import NetworkIterator
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.utils.metrics import (
+    Counter,
+    Histogram,
+    MetricsRegistry,
+    url_endpoint_label,
+)
 
 from .deposit_info import DepositInfo
 
 NaN = float("nan")
 
+MARKET_STATUS_POLL_SECONDS: Histogram = MetricsRegistry.get_instance().histogram(
+    "market_status_poll_seconds",
+    "Duration of the markets' account and order status polls.",
+    ["market"]
+)
+MARKET_STATUS_POLL_ERRORS: Counter = MetricsRegistry.get_instance().counter(
+    "market_status_poll_errors",
+    "Failed account and order status polls of the markets.",
+    ["market"]
+)
+MARKET_REST_REQUEST_SECONDS: Histogram = MetricsRegistry.get_instance().histogram(
+    "market_rest_request_seconds",
+    "Duration of the markets' REST API requests, by endpoint.",
+    ["market", "method", "endpoint"]
+)
+
 
 cdef class MarketBase(NetworkIterator):
     MARKET_EVENTS = [
@@ -68,6 +91,21 @@ cdef class MarketBase(NetworkIterator):
     def event_logs(self) -> List[any]:
         return self.event_logger.event_log
 
+    def status_poll_timer(self):
+        """
+        :return: a context manager that records the duration of a status poll in the market's poll metrics.
+        """
+        return MARKET_STATUS_POLL_SECONDS.labels(self.name).time()
+
+    def record_status_poll_error(self):
+        MARKET_STATUS_POLL_ERRORS.labels(self.name).inc()
+
+    def rest_request_timer(self, http_method: str, url: str):
+        """
+        :return: a context manager that records the duration of a REST API request in the market's request metrics.
+        """
+        return MARKET_REST_REQUEST_SECONDS.labels(self.name, http_method.upper(), url_endpoint_label(url)).time()
+
     @property
     def order_books(self) -> Dict[str, OrderBook]:
         raise NotImplementedError
@@ -84,6 +122,23 @@ cdef class MarketBase(NetworkIterator):
     def tracking_states(self) -> Dict[str, any]:
         return {}
 
+    def tracking_state_entry(self, order_id: str) -> Optional[Tuple[List[str], Dict[str, any]]]:
+        """
+        Returns the tracking state of a single order, without serializing the other orders' states.
+
+        Markets should override this, since the default implementation builds all of `tracking_states`.
+
+        :param order_id: client order id
+        :return: the path of the order's entry in `tracking_states` and the entry, or None if the order isn't tracked
+        """
+        saved_states: Dict[str, any] = self.tracking_states
+        if order_id in saved_states:
+            return [order_id], saved_states[order_id]
+        for key, value in saved_states.items():
+            if isinstance(value, dict) and order_id in value:
+                return [key, order_id], value[order_id]
+        return None
+
     def restore_tracking_states(self, saved_states: Dict[str, any]):
         """
         Restores the tracking states from a previously saved state.
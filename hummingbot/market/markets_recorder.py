@@ -1,6 +1,9 @@
 #!/usr/bin/env python
 
 import asyncio
+import copy
+import logging
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import (
     Session,
     Query
@@ -8,8 +11,10 @@ from sqlalchemy.orm import (
 import time
 import threading
 from typing import (
+    Any,
     Dict,
     List,
+    NamedTuple,
     Optional,
     Tuple,
     Union
@@ -25,28 +30,216 @@ from hummingbot.core.event.events import (
     OrderCancelledEvent,
     OrderExpiredEvent,
     MarketEvent,
-    TradeFee,
-    TradeType)
+    TradeFee)
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.logger import HummingbotLogger
 from hummingbot.market.market_base import MarketBase
 from hummingbot.model.market_state import MarketState
+from hummingbot.model.market_state_delta import MarketStateDelta
 from hummingbot.model.order import Order
 from hummingbot.model.order_status import OrderStatus
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 from hummingbot.model.trade_fill import TradeFill
 
 
+class OrderCreatedRecord(NamedTuple):
+    order_id: str
+    config_file_path: str
+    strategy: str
+    market: str
+    symbol: str
+    base_asset: str
+    quote_asset: str
+    timestamp: int
+    order_type: str
+    amount: float
+    price: float
+    status: str
+
+
+class OrderFilledRecord(NamedTuple):
+    order_id: str
+    config_file_path: str
+    strategy: str
+    market: str
+    symbol: str
+    base_asset: str
+    quote_asset: str
+    timestamp: int
+    trade_type: str
+    order_type: str
+    price: float
+    amount: float
+    trade_fee: Dict[str, Any]
+    exchange_trade_id: str
+    status: str
+
+
+class OrderStatusRecord(NamedTuple):
+    order_id: str
+    timestamp: int
+    status: str
+
+
+class MarketStateRecord(NamedTuple):
+    config_file_path: str
+    market: str
+    timestamp: int
+    saved_state: Dict[str, Any]
+
+
+class MarketStateDeltaRecord(NamedTuple):
+    config_file_path: str
+    market: str
+    timestamp: int
+    path: List[str]
+    saved_state: Optional[Any]
+
+
+JournalRecord = Union[OrderCreatedRecord, OrderFilledRecord, OrderStatusRecord, MarketStateRecord,
+                      MarketStateDeltaRecord]
+
+
+def tracking_state_deltas(old_states: Dict[str, Any],
+                          new_states: Dict[str, Any],
+                          path: Tuple[str, ...] = ()) -> List[Tuple[List[str], Optional[Any]]]:
+    """
+    Compares two tracking states of a market, and returns the entries that were added or changed, with their new
+    values, and the entries that were removed, with None values.
+
+    Tracking states are either a dict of entries (e.g. in-flight orders by order id), or a dict of such dicts (e.g.
+    market orders and limit orders). Comparison descends into dicts that only contain dicts, and treats anything else
+    as an entry.
+    """
+    deltas: List[Tuple[List[str], Optional[Any]]] = []
+    for key, new_value in new_states.items():
+        old_value: Any = old_states.get(key)
+        if old_value == new_value:
+            continue
+        if _is_tracking_state_container(old_value) and _is_tracking_state_container(new_value):
+            deltas.extend(tracking_state_deltas(old_value, new_value, path + (key,)))
+        else:
+            deltas.append((list(path + (key,)), new_value))
+    for key in old_states.keys():
+        if key not in new_states:
+            deltas.append((list(path + (key,)), None))
+    return deltas
+
+
+def find_tracking_state_entry(saved_states: Dict[str, Any],
+                              entry_key: str,
+                              path: Tuple[str, ...] = ()) -> Optional[List[str]]:
+    """
+    Returns the path of the entry with the given key - e.g. an order id - in a tracking state, or None if there is no
+    such entry.
+    """
+    if entry_key in saved_states:
+        return list(path + (entry_key,))
+    for key, value in saved_states.items():
+        if _is_tracking_state_container(value):
+            entry_path: Optional[List[str]] = find_tracking_state_entry(value, entry_key, path + (key,))
+            if entry_path is not None:
+                return entry_path
+    return None
+
+
+def tracking_state_entry_deltas(old_states: Dict[str, Any],
+                                entry_key: str,
+                                new_entry: Optional[Tuple[List[str], Any]]) -> List[Tuple[List[str], Optional[Any]]]:
+    """
+    Same as `tracking_state_deltas()`, but only for a single entry - e.g. the order an event is about - so the cost
+    doesn't grow with the number of entries tracked.
+
+    :param new_entry: the path and new value of the entry, as returned by `MarketBase.tracking_state_entry()`, or
+                      None if it's no longer tracked
+    """
+    deltas: List[Tuple[List[str], Optional[Any]]] = []
+    old_path: Optional[List[str]] = find_tracking_state_entry(old_states, entry_key)
+    if old_path is not None and (new_entry is None or old_path != list(new_entry[0])):
+        deltas.append((old_path, None))
+    if new_entry is not None:
+        new_path: List[str] = list(new_entry[0])
+        old_value: Optional[Any] = None
+        if old_path == new_path:
+            container: Dict[str, Any] = old_states
+            for key in old_path[:-1]:
+                container = container[key]
+            old_value = container[old_path[-1]]
+        if old_value != new_entry[1]:
+            deltas.append((new_path, new_entry[1]))
+    return deltas
+
+
+def apply_tracking_state_deltas(saved_states: Dict[str, Any], deltas: List[Tuple[List[str], Optional[Any]]]):
+    """
+    Applies deltas from `tracking_state_deltas()` to a tracking state, in place.
+    """
+    for path, value in deltas:
+        container: Dict[str, Any] = saved_states
+        for key in path[:-1]:
+            container = container.setdefault(key, {})
+        if value is None:
+            container.pop(path[-1], None)
+        else:
+            container[path[-1]] = value
+
+
+def _is_tracking_state_container(value: Any) -> bool:
+    return isinstance(value, dict) and all(isinstance(item, dict) for item in value.values())
+
+
 class MarketsRecorder:
+    """
+    Persists the orders, order status changes, trade fills and market tracking states of a set of markets.
+
+    By default, recording is write-behind: market event callbacks only turn events into journal records and append them
+    to an in-memory journal, which is written to the database in batched transactions by a dedicated writer thread.
+    The journal is written strictly in the order events arrived, a batch is only removed from the journal after its
+    transaction commits, and the journal is flushed at most `flush_interval` seconds after an event - and on `stop()`.
+    Read methods flush the journal first, waiting at most `flush_timeout` seconds, so they see every event recorded
+    before they were called unless the database is unavailable.
+
+    Batches failing with an `OperationalError` (e.g. a locked database) are retried up to `max_write_attempts` times.
+    Batches failing otherwise, or too many times, are written one record at a time, and the records that still fail
+    are logged and dropped - a bad record never blocks the journal.
+
+    Market tracking states are saved incrementally. The first event of a market after the recorder starts saves a full
+    `MarketState` snapshot; later events only append `MarketStateDelta` rows for the tracking state entry of the order
+    they are about, if it changed. Every `compaction_interval` deltas - and on `stop()` - a new snapshot replaces the
+    snapshot and its deltas, which also saves the changes no event was recorded for.
+    """
+    DEFAULT_FLUSH_INTERVAL = 0.5
+    DEFAULT_MAX_BATCH_SIZE = 1000
+    DEFAULT_COMPACTION_INTERVAL = 500
+    DEFAULT_MAX_WRITE_ATTEMPTS = 5
+    DEFAULT_FLUSH_TIMEOUT = 10.0
+    DEFAULT_STOP_TIMEOUT = 30.0
+
     market_event_tag_map: Dict[int, MarketEvent] = {
         event_obj.value: event_obj
         for event_obj in MarketEvent.__members__.values()
     }
 
+    _mr_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._mr_logger is None:
+            cls._mr_logger = logging.getLogger(__name__)
+        return cls._mr_logger
+
     def __init__(self,
                  sql: SQLConnectionManager,
                  markets: List[MarketBase],
                  config_file_path: str,
-                 strategy_name: str):
+                 strategy_name: str,
+                 write_behind: bool = True,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+                 max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+                 compaction_interval: int = DEFAULT_COMPACTION_INTERVAL,
+                 max_write_attempts: int = DEFAULT_MAX_WRITE_ATTEMPTS,
+                 flush_timeout: float = DEFAULT_FLUSH_TIMEOUT,
+                 stop_timeout: float = DEFAULT_STOP_TIMEOUT):
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -55,6 +248,28 @@ class MarketsRecorder:
         self._markets: List[MarketBase] = markets
         self._config_file_path: str = config_file_path
         self._strategy_name: str = strategy_name
+        self._write_behind: bool = write_behind
+        self._flush_interval: float = flush_interval
+        self._max_batch_size: int = max_batch_size
+        self._compaction_interval: int = compaction_interval
+        self._max_write_attempts: int = max_write_attempts
+        self._flush_timeout: float = flush_timeout
+        self._stop_timeout: float = stop_timeout
+
+        # The tracking states of each market as recorded so far - i.e. its last snapshot with the deltas since applied -
+        # and the number of deltas recorded since its last snapshot.
+        self._recorded_market_states: Dict[str, Dict[str, Any]] = {}
+        self._market_state_delta_counts: Dict[str, int] = {}
+
+        # Journal records waiting to be written, and the number of records appended / committed so far. Guarded by
+        # `_journal_cond`.
+        self._journal: List[JournalRecord] = []
+        self._journal_cond: threading.Condition = threading.Condition()
+        self._records_appended: int = 0
+        self._records_committed: int = 0
+        self._records_dropped: int = 0
+        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_stopping: bool = False
 
         self._create_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_create_order)
         self._fill_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_fill_order)
@@ -94,7 +309,30 @@ class MarketsRecorder:
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
 
+    @property
+    def write_behind(self) -> bool:
+        return self._write_behind
+
+    @property
+    def pending_records(self) -> int:
+        with self._journal_cond:
+            return self._records_appended - self._records_committed
+
+    @property
+    def dropped_records(self) -> int:
+        """
+        Number of journal records that could not be written to the database, and were dropped.
+        """
+        with self._journal_cond:
+            return self._records_dropped
+
     def start(self):
+        if self._write_behind and self._writer_thread is None:
+            self._writer_stopping = False
+            self._writer_thread = threading.Thread(target=self._writer_loop,
+                                                   name="MarketsRecorderWriter",
+                                                   daemon=True)
+            self._writer_thread.start()
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
@@ -103,9 +341,40 @@ class MarketsRecorder:
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.remove_listener(event_pair[0], event_pair[1])
+        # Compact the market states that have deltas, so they can be restored from their snapshots alone.
+        for market in self._markets:
+            if self._market_state_delta_counts.get(market.display_name, 0) > 0:
+                self.save_market_states(self._config_file_path, market)
+        if self._writer_thread is not None:
+            with self._journal_cond:
+                self._writer_stopping = True
+                self._journal_cond.notify_all()
+            # The writer drains the journal before exiting.
+            self._writer_thread.join(self._stop_timeout)
+            if self._writer_thread.is_alive():
+                self.logger().error(f"Markets recorder writer did not finish within {self._stop_timeout} seconds. "
+                                    f"{self.pending_records} records have not been written to the database.")
+            self._writer_thread = None
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Blocks until every journal record appended before the call has been committed to the database.
+
+        :return: False if the timeout expired first.
+        """
+        with self._journal_cond:
+            target: int = self._records_appended
+            if self._records_committed >= target:
+                return True
+            if self._writer_thread is None:
+                # Nothing is going to write the journal - e.g. the recorder has already been stopped.
+                self.logger().warning("Markets recorder journal has unwritten records, but the writer is not running.")
+                return False
+            self._journal_cond.notify_all()
+            return self._journal_cond.wait_for(lambda: self._records_committed >= target, timeout)
 
     def get_orders_for_config_and_market(self, config_file_path: str, market: MarketBase) -> List[Order]:
-        session: Session = self.session
+        session: Session = self._flushed_session()
         query: Query = (session
                         .query(Order)
                         .filter(Order.config_file_path == config_file_path,
@@ -114,7 +383,7 @@ class MarketsRecorder:
         return query.all()
 
     def get_trades_for_config(self, config_file_path: str, number_of_rows: Optional[int] = None) -> List[TradeFill]:
-        session: Session = self.session
+        session: Session = self._flushed_session()
         query: Query = (session
                         .query(TradeFill)
                         .filter(TradeFill.config_file_path == config_file_path)
@@ -125,22 +394,7 @@ class MarketsRecorder:
             return query.limit(number_of_rows).all()
 
     def save_market_states(self, config_file_path: str, market: MarketBase, no_commit: bool = False):
-        session: Session = self.session
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market)
-        timestamp: int = self.db_timestamp
-
-        if market_states is not None:
-            market_states.saved_state = market.tracking_states
-            market_states.timestamp = timestamp
-        else:
-            market_states = MarketState(config_file_path=config_file_path,
-                                        market=market.display_name,
-                                        timestamp=timestamp,
-                                        saved_state=market.tracking_states)
-            session.add(market_states)
-
-        if not no_commit:
-            session.commit()
+        self._record([self._market_state_snapshot_record(config_file_path, market, self.db_timestamp)])
 
     def restore_market_states(self, config_file_path: str, market: MarketBase):
         market_states: Optional[MarketState] = self.get_market_states(config_file_path, market)
@@ -149,13 +403,242 @@ class MarketsRecorder:
             market.restore_tracking_states(market_states.saved_state)
 
     def get_market_states(self, config_file_path: str, market: MarketBase) -> Optional[MarketState]:
-        session: Session = self.session
+        """
+        :return: the market state snapshot of the market, with any deltas recorded after it applied to `saved_state`.
+        """
+        session: Session = self._flushed_session()
         query: Query = (session
                         .query(MarketState)
                         .filter(MarketState.config_file_path == config_file_path,
                                 MarketState.market == market.display_name))
         market_states: Optional[MarketState] = query.one_or_none()
-        return market_states
+        if market_states is None:
+            return None
+
+        deltas: List[MarketStateDelta] = (session
+                                          .query(MarketStateDelta)
+                                          .filter(MarketStateDelta.config_file_path == config_file_path,
+                                                  MarketStateDelta.market == market.display_name)
+                                          .order_by(MarketStateDelta.id)
+                                          .all())
+        if len(deltas) == 0:
+            return market_states
+
+        # Return a copy rather than modifying the snapshot row in the shared session.
+        saved_state: Dict[str, Any] = copy.deepcopy(market_states.saved_state)
+        apply_tracking_state_deltas(saved_state, [(delta.path, delta.saved_state) for delta in deltas])
+        return MarketState(id=market_states.id,
+                           config_file_path=market_states.config_file_path,
+                           market=market_states.market,
+                           timestamp=deltas[-1].timestamp,
+                           saved_state=saved_state)
+
+    def _flushed_session(self) -> Session:
+        """
+        Returns the shared session for reading, after the journal has been written - so reads see all recorded events.
+        """
+        session: Session = self.session
+        if self._write_behind:
+            self.flush_for_read()
+            # Rows were written by the writer thread's session, so don't serve stale objects from the identity map.
+            session.expire_all()
+        return session
+
+    def flush_for_read(self):
+        """
+        Writes the journal before reading from the database, waiting at most `flush_timeout` seconds.
+        """
+        if self._write_behind and not self.flush(self._flush_timeout):
+            self.logger().warning(f"Markets recorder journal was not written within {self._flush_timeout} seconds. "
+                                  f"Reading without the {self.pending_records} latest records.")
+
+    def _record(self, records: List[JournalRecord]):
+        if not self._write_behind:
+            with self._sql.begin() as session:
+                self._write_records(session, records)
+            return
+        with self._journal_cond:
+            self._journal.extend(records)
+            self._records_appended += len(records)
+            if len(self._journal) >= self._max_batch_size:
+                self._journal_cond.notify_all()
+
+    def _writer_loop(self):
+        while True:
+            with self._journal_cond:
+                if not self._writer_stopping and len(self._journal) < self._max_batch_size:
+                    self._journal_cond.wait(self._flush_interval)
+                batch: List[JournalRecord] = self._journal[:self._max_batch_size]
+                if len(batch) == 0:
+                    if self._writer_stopping:
+                        return
+                    continue
+            dropped: int = self._write_batch(batch)
+            with self._journal_cond:
+                # Records are only taken off the journal once they are committed, or dropped.
+                del self._journal[:len(batch)]
+                self._records_committed += len(batch)
+                self._records_dropped += dropped
+                self._journal_cond.notify_all()
+
+    def _write_batch(self, batch: List[JournalRecord]) -> int:
+        """
+        Writes a batch of journal records in one transaction, retrying operational errors. If a record can't be
+        written, the batch is written one record per transaction, so only the failing records are dropped.
+
+        :return: the number of records dropped.
+        """
+        attempt: int = 0
+        while True:
+            attempt += 1
+            try:
+                with self._sql.begin() as session:
+                    self._write_records(session, batch)
+                return 0
+            except OperationalError:
+                if attempt >= self._max_write_attempts:
+                    self.logger().error(f"Error writing {len(batch)} trade records to the database after {attempt} "
+                                        f"attempts. The records have been dropped.", exc_info=True)
+                    return len(batch)
+                self.logger().warning(f"Error writing {len(batch)} trade records to the database. Retrying in "
+                                      f"{self._flush_interval * attempt} seconds.", exc_info=True)
+                time.sleep(self._flush_interval * attempt)
+            except Exception:
+                # Retrying won't help if the records themselves can't be written.
+                if len(batch) == 1:
+                    self.logger().error(f"Unexpected error writing a trade record to the database. The record has "
+                                        f"been dropped - {batch[0]}.", exc_info=True)
+                    return 1
+                self.logger().error(f"Unexpected error writing {len(batch)} trade records to the database. Writing "
+                                    f"them one at a time.", exc_info=True)
+                return sum(self._write_batch([record]) for record in batch)
+
+    @staticmethod
+    def _write_records(session: Session, records: List[JournalRecord]):
+        """
+        Applies journal records, in order, within the given session.
+        """
+        for record in records:
+            if isinstance(record, MarketStateDeltaRecord):
+                session.add(MarketStateDelta(config_file_path=record.config_file_path,
+                                             market=record.market,
+                                             timestamp=record.timestamp,
+                                             path=record.path,
+                                             saved_state=record.saved_state))
+            elif isinstance(record, MarketStateRecord):
+                market_states: Optional[MarketState] = (session
+                                                        .query(MarketState)
+                                                        .filter(MarketState.config_file_path == record.config_file_path,
+                                                                MarketState.market == record.market)
+                                                        .one_or_none())
+                if market_states is not None:
+                    market_states.saved_state = record.saved_state
+                    market_states.timestamp = record.timestamp
+                else:
+                    session.add(MarketState(config_file_path=record.config_file_path,
+                                            market=record.market,
+                                            timestamp=record.timestamp,
+                                            saved_state=record.saved_state))
+                # The snapshot supersedes every delta recorded before it.
+                (session
+                 .query(MarketStateDelta)
+                 .filter(MarketStateDelta.config_file_path == record.config_file_path,
+                         MarketStateDelta.market == record.market)
+                 .delete(synchronize_session=False))
+            elif isinstance(record, OrderCreatedRecord):
+                order_record: Order = Order(id=record.order_id,
+                                            config_file_path=record.config_file_path,
+                                            strategy=record.strategy,
+                                            market=record.market,
+                                            symbol=record.symbol,
+                                            base_asset=record.base_asset,
+                                            quote_asset=record.quote_asset,
+                                            creation_timestamp=record.timestamp,
+                                            order_type=record.order_type,
+                                            amount=record.amount,
+                                            price=record.price,
+                                            last_status=record.status,
+                                            last_update_timestamp=record.timestamp)
+                session.add(order_record)
+                session.add(OrderStatus(order=order_record,
+                                        timestamp=record.timestamp,
+                                        status=record.status))
+            elif isinstance(record, OrderFilledRecord):
+                # Try to find the order record, and update it if necessary.
+                order_record: Optional[Order] = session.query(Order).filter(Order.id == record.order_id).one_or_none()
+                if order_record is not None:
+                    order_record.last_status = record.status
+                    order_record.last_update_timestamp = record.timestamp
+
+                # Order status and trade fill record should be added even if the order record is not found, because
+                # it's possible for fill event to come in before the order created event for market orders.
+                session.add(OrderStatus(order_id=record.order_id,
+                                        timestamp=record.timestamp,
+                                        status=record.status))
+                session.add(TradeFill(config_file_path=record.config_file_path,
+                                      strategy=record.strategy,
+                                      market=record.market,
+                                      symbol=record.symbol,
+                                      base_asset=record.base_asset,
+                                      quote_asset=record.quote_asset,
+                                      timestamp=record.timestamp,
+                                      order_id=record.order_id,
+                                      trade_type=record.trade_type,
+                                      order_type=record.order_type,
+                                      price=record.price,
+                                      amount=record.amount,
+                                      trade_fee=record.trade_fee,
+                                      exchange_trade_id=record.exchange_trade_id))
+            elif isinstance(record, OrderStatusRecord):
+                order_record: Optional[Order] = session.query(Order).filter(Order.id == record.order_id).one_or_none()
+                if order_record is not None:
+                    order_record.last_status = record.status
+                    order_record.last_update_timestamp = record.timestamp
+                    session.add(OrderStatus(order_id=record.order_id,
+                                            timestamp=record.timestamp,
+                                            status=record.status))
+            # Later records may query rows added by earlier ones.
+            session.flush()
+
+    def _market_state_snapshot_record(self,
+                                      config_file_path: str,
+                                      market: MarketBase,
+                                      timestamp: int) -> MarketStateRecord:
+        saved_state: Dict[str, Any] = market.tracking_states
+        if config_file_path == self._config_file_path:
+            # A copy, since deltas are applied to it while the snapshot record may not be written yet.
+            self._recorded_market_states[market.display_name] = copy.deepcopy(saved_state)
+            self._market_state_delta_counts[market.display_name] = 0
+        return MarketStateRecord(config_file_path=config_file_path,
+                                 market=market.display_name,
+                                 timestamp=timestamp,
+                                 saved_state=saved_state)
+
+    def _market_state_records(self, market: MarketBase, order_id: str, timestamp: int) -> List[JournalRecord]:
+        """
+        Returns the records that save the current tracking states of a market after an event about an order - a
+        snapshot, if the market has no recorded snapshot yet or enough deltas have piled up since the last one, or else
+        the delta of the order's entry.
+        """
+        recorded_states: Optional[Dict[str, Any]] = self._recorded_market_states.get(market.display_name)
+        delta_count: int = self._market_state_delta_counts.get(market.display_name, 0)
+        if recorded_states is None or delta_count >= self._compaction_interval:
+            return [self._market_state_snapshot_record(self._config_file_path, market, timestamp)]
+
+        # Only the order's entry is serialized - building all of `tracking_states` costs O(in-flight orders).
+        deltas: List[Tuple[List[str], Optional[Any]]] = tracking_state_entry_deltas(
+            recorded_states,
+            order_id,
+            market.tracking_state_entry(order_id)
+        )
+        apply_tracking_state_deltas(recorded_states, deltas)
+        self._market_state_delta_counts[market.display_name] = delta_count + len(deltas)
+        return [MarketStateDeltaRecord(config_file_path=self._config_file_path,
+                                       market=market.display_name,
+                                       timestamp=timestamp,
+                                       path=path,
+                                       saved_state=value)
+                for path, value in deltas]
 
     def _did_create_order(self,
                           event_tag: int,
@@ -165,31 +648,23 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_create_order, event_tag, market, evt)
             return
 
-        session: Session = self.session
         base_asset, quote_asset = market.split_symbol(evt.symbol)
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
-        trade_type: TradeType = TradeType.BUY if type(evt) == BuyOrderCreatedEvent else TradeType.SELL
-        order_record: Order = Order(id=evt.order_id,
-                                    config_file_path=self._config_file_path,
-                                    strategy=self._strategy_name,
-                                    market=market.display_name,
-                                    symbol=evt.symbol,
-                                    base_asset=base_asset,
-                                    quote_asset=quote_asset,
-                                    creation_timestamp=timestamp,
-                                    order_type=evt.type.name,
-                                    amount=evt.amount,
-                                    price=evt.price,
-                                    last_status=event_type.name,
-                                    last_update_timestamp=timestamp)
-        order_status: OrderStatus = OrderStatus(order=order_record,
-                                                timestamp=timestamp,
-                                                status=event_type.name)
-        session.add(order_record)
-        session.add(order_status)
-        self.save_market_states(self._config_file_path, market, no_commit=True)
-        session.commit()
+        self._record([
+            OrderCreatedRecord(order_id=evt.order_id,
+                               config_file_path=self._config_file_path,
+                               strategy=self._strategy_name,
+                               market=market.display_name,
+                               symbol=evt.symbol,
+                               base_asset=base_asset,
+                               quote_asset=quote_asset,
+                               timestamp=timestamp,
+                               order_type=evt.type.name,
+                               amount=evt.amount,
+                               price=evt.price,
+                               status=event_type.name)
+        ] + self._market_state_records(market, evt.order_id, timestamp))
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -199,41 +674,26 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_fill_order, event_tag, market, evt)
             return
 
-        session: Session = self.session
         base_asset, quote_asset = market.split_symbol(evt.symbol)
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
-        order_id: str = evt.order_id
-
-        # Try to find the order record, and update it if necessary.
-        order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-        if order_record is not None:
-            order_record.last_status = event_type.name
-            order_record.last_update_timestamp = timestamp
-
-        # Order status and trade fill record should be added even if the order record is not found, because it's
-        # possible for fill event to come in before the order created event for market orders.
-        order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                timestamp=timestamp,
-                                                status=event_type.name)
-        trade_fill_record: TradeFill = TradeFill(config_file_path=self.config_file_path,
-                                                 strategy=self.strategy_name,
-                                                 market=market.display_name,
-                                                 symbol=evt.symbol,
-                                                 base_asset=base_asset,
-                                                 quote_asset=quote_asset,
-                                                 timestamp=timestamp,
-                                                 order_id=order_id,
-                                                 trade_type=evt.trade_type.name,
-                                                 order_type=evt.order_type.name,
-                                                 price=evt.price,
-                                                 amount=evt.amount,
-                                                 trade_fee=TradeFee.to_json(evt.trade_fee),
-                                                 exchange_trade_id=evt.exchange_trade_id)
-        session.add(order_status)
-        session.add(trade_fill_record)
-        self.save_market_states(self._config_file_path, market, no_commit=True)
-        session.commit()
+        self._record([
+            OrderFilledRecord(order_id=evt.order_id,
+                              config_file_path=self._config_file_path,
+                              strategy=self._strategy_name,
+                              market=market.display_name,
+                              symbol=evt.symbol,
+                              base_asset=base_asset,
+                              quote_asset=quote_asset,
+                              timestamp=timestamp,
+                              trade_type=evt.trade_type.name,
+                              order_type=evt.order_type.name,
+                              price=evt.price,
+                              amount=evt.amount,
+                              trade_fee=TradeFee.to_json(evt.trade_fee),
+                              exchange_trade_id=evt.exchange_trade_id,
+                              status=event_type.name)
+        ] + self._market_state_records(market, evt.order_id, timestamp))
 
     def _update_order_status(self,
                              event_tag: int,
@@ -247,23 +707,13 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._update_order_status, event_tag, market, evt)
             return
 
-        session: Session = self.session
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
-        order_id: str = evt.order_id
-        order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-
-        if order_record is not None:
-            order_record.last_status = event_type.name
-            order_record.last_update_timestamp = timestamp
-            order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                    timestamp=timestamp,
-                                                    status=event_type.name)
-            session.add(order_status)
-            self.save_market_states(self._config_file_path, market, no_commit=True)
-            session.commit()
-        else:
-            session.rollback()
+        self._record([
+            OrderStatusRecord(order_id=evt.order_id,
+                              timestamp=timestamp,
+                              status=event_type.name)
+        ] + self._market_state_records(market, evt.order_id, timestamp))
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -0,0 +1,92 @@
+import time
+from typing import (
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import MarketEvent
+from hummingbot.core.utils.metrics import (
+    Histogram,
+    MetricsRegistry,
+)
+from hummingbot.market.market_base import MarketBase
+
+ORDER_LATENCY_SECONDS: Histogram = MetricsRegistry.get_instance().histogram(
+    "order_latency_seconds",
+    "Time from an order's submission to its acknowledgement by the exchange (ack), its first fill (first_fill) and "
+    "its completion (complete).",
+    ["market", "stage"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0, 3600.0)
+)
+
+
+def order_submission_time(client_order_id: str) -> Optional[float]:
+    """
+    Markets' client order IDs end with a tracking nonce - the submission time in microseconds,
+    e.g. buy-ETH-USDT-1565170000123456.
+
+    :return: the submission time of the order in seconds, or None if the order ID has no tracking nonce.
+    """
+    try:
+        return int(client_order_id.rsplit("-", 1)[-1]) * 1e-6
+    except ValueError:
+        return None
+
+
+class OrderLatencyRecorder:
+    """
+    Records order submission to acknowledgement, first fill and completion latencies of the orders on a set of markets,
+    by listening to the markets' order events.
+    """
+    def __init__(self, markets: List[MarketBase]):
+        self._markets: List[MarketBase] = markets
+        self._filled_order_ids: Set[str] = set()
+        self._create_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_create_order)
+        self._fill_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_fill_order)
+        self._complete_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_complete_order)
+        self._end_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_end_order)
+        self._event_pairs: List[Tuple[MarketEvent, SourceInfoEventForwarder]] = [
+            (MarketEvent.BuyOrderCreated, self._create_order_forwarder),
+            (MarketEvent.SellOrderCreated, self._create_order_forwarder),
+            (MarketEvent.OrderFilled, self._fill_order_forwarder),
+            (MarketEvent.BuyOrderCompleted, self._complete_order_forwarder),
+            (MarketEvent.SellOrderCompleted, self._complete_order_forwarder),
+            (MarketEvent.OrderCancelled, self._end_order_forwarder),
+            (MarketEvent.OrderExpired, self._end_order_forwarder),
+            (MarketEvent.OrderFailure, self._end_order_forwarder),
+        ]
+
+    def start(self):
+        for market in self._markets:
+            for event_tag, forwarder in self._event_pairs:
+                market.add_listener(event_tag, forwarder)
+
+    def stop(self):
+        for market in self._markets:
+            for event_tag, forwarder in self._event_pairs:
+                market.remove_listener(event_tag, forwarder)
+        self._filled_order_ids.clear()
+
+    @staticmethod
+    def _observe(market: MarketBase, stage: str, order_id: str):
+        submission_time: Optional[float] = order_submission_time(order_id)
+        if submission_time is not None:
+            ORDER_LATENCY_SECONDS.labels(market.name, stage).observe(time.time() - submission_time)
+
+    def _did_create_order(self, event_tag: int, market: MarketBase, evt):
+        self._observe(market, "ack", evt.order_id)
+
+    def _did_fill_order(self, event_tag: int, market: MarketBase, evt):
+        if evt.order_id not in self._filled_order_ids:
+            self._filled_order_ids.add(evt.order_id)
+            self._observe(market, "first_fill", evt.order_id)
+
+    def _did_complete_order(self, event_tag: int, market: MarketBase, evt):
+        self._filled_order_ids.discard(evt.order_id)
+        self._observe(market, "complete", evt.order_id)
+
+    def _did_end_order(self, event_tag: int, market: MarketBase, evt):
+        self._filled_order_ids.discard(evt.order_id)
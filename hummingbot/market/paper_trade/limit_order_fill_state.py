@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+
+
+class LimitOrderFillState:
+    """
+    Simulated exchange side state of a paper trade limit order.
+
+    `queue_ahead` is the order book volume that was resting at the order's price level when the order was placed. Public
+    trades at the order's price consume that volume first, and only the trade volume left over fills the order. Trades
+    through the order's price imply the whole level was taken, so they fill the order directly.
+    """
+    __slots__ = ("order_id", "is_buy", "price", "quantity", "queue_ahead", "remaining_quantity",
+                 "filled_base", "filled_quote", "fee_paid")
+
+    def __init__(self, order_id: str, is_buy: bool, price: float, quantity: float, queue_ahead: float = 0.0):
+        self.order_id: str = order_id
+        self.is_buy: bool = is_buy
+        self.price: float = price
+        self.quantity: float = quantity
+        self.queue_ahead: float = queue_ahead
+        self.remaining_quantity: float = quantity
+        self.filled_base: float = 0.0
+        self.filled_quote: float = 0.0
+        self.fee_paid: float = 0.0
+
+    def __repr__(self) -> str:
+        return (f"LimitOrderFillState('{self.order_id}', {self.is_buy}, {self.price}, {self.quantity}, "
+                f"queue_ahead={self.queue_ahead}, remaining_quantity={self.remaining_quantity})")
+
+    @property
+    def is_done(self) -> bool:
+        return self.remaining_quantity <= 0
+
+    def match_trade(self, trade_price: float, trade_quantity: float, available_quantity: float) -> float:
+        """
+        Matches a public trade, where this order is on the maker side, against the order's queue position.
+
+        :param trade_price: price of the public trade
+        :param trade_quantity: base amount of the public trade
+        :param available_quantity: part of the trade amount not yet used to fill other simulated orders
+        :return: amount of this order filled by the trade
+        """
+        if self.is_buy:
+            is_through = trade_price < self.price
+        else:
+            is_through = trade_price > self.price
+
+        if is_through:
+            self.queue_ahead = 0.0
+        elif trade_price == self.price:
+            queue_consumed: float = min(self.queue_ahead, trade_quantity)
+            self.queue_ahead -= queue_consumed
+            trade_quantity -= queue_consumed
+        else:
+            return 0.0
+
+        return self.fill(min(trade_quantity, available_quantity))
+
+    def match_crossed_book(self, available_volume: float) -> float:
+        """
+        Fills the order against the opposite side of the order book after it has moved through the order's price.
+
+        :param available_volume: opposite side volume priced at or better than this order
+        :return: amount of this order filled
+        """
+        self.queue_ahead = 0.0
+        return self.fill(available_volume)
+
+    def fill(self, amount: float) -> float:
+        if amount <= 0 or self.remaining_quantity <= 0:
+            return 0.0
+        fill_amount: float = min(self.remaining_quantity, amount)
+        if fill_amount == self.remaining_quantity:
+            self.remaining_quantity = 0.0
+        else:
+            self.remaining_quantity -= fill_amount
+        self.filled_base += fill_amount
+        self.filled_quote += fill_amount * self.price
+        return fill_amount
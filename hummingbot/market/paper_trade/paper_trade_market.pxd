@@ -37,6 +37,7 @@ cdef class PaperTradeMarket(MarketBase):
         object _order_book_tracker
         object _config
         object _queued_orders
+        dict _limit_order_fill_states
         dict _quantization_params
         object _order_book_trade_listener
         object _market_order_filled_listener
@@ -52,19 +53,24 @@ cdef class PaperTradeMarket(MarketBase):
                               LimitOrders *limit_orders_map_ptr,
                               LimitOrdersIterator *map_it_ptr,
                               const SingleSymbolLimitOrdersIterator orders_it)
+    cdef double c_get_queue_ahead(self, str symbol, bint is_buy, double price) except? -1
+    cdef double c_consume_order_book_depth(self, str symbol, bint is_buy, double price, double amount) except? -1
     cdef c_process_limit_order(self,
                                bint is_buy,
                                LimitOrders *limit_orders_map_ptr,
                                LimitOrdersIterator *map_it_ptr,
-                               SingleSymbolLimitOrdersIterator orders_it)
+                               SingleSymbolLimitOrdersIterator orders_it,
+                               double fill_amount)
     cdef c_process_limit_bid_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleSymbolLimitOrdersIterator orders_it)
+                                   SingleSymbolLimitOrdersIterator orders_it,
+                                   double fill_amount)
     cdef c_process_limit_ask_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleSymbolLimitOrdersIterator orders_it)
+                                   SingleSymbolLimitOrdersIterator orders_it,
+                                   double fill_amount)
     cdef c_process_crossed_limit_orders_for_symbol(self,
                                                    bint is_buy,
                                                    LimitOrders *limit_orders_map_ptr,
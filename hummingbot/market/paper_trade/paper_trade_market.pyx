@@ -60,6 +60,7 @@ from hummingbot.core.event.events import (
 from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.market.market_base import MarketBase
+from hummingbot.market.paper_trade.limit_order_fill_state import LimitOrderFillState
 from hummingbot.market.paper_trade.trading_pair import TradingPair
 from hummingbot.core.utils.async_utils import safe_ensure_future
 
@@ -185,6 +186,7 @@ cdef class PaperTradeMarket(MarketBase):
         self._account_balance = {}
         self._config = config
         self._queued_orders = deque()
+        self._limit_order_fill_states = {}
         self._quantization_params = {}
         self._order_tracker_task = None
         self._order_book_tracker = order_book_tracker
@@ -280,14 +282,22 @@ cdef class PaperTradeMarket(MarketBase):
 
         return retval
 
+    @property
+    def limit_order_fill_states(self) -> Dict[str, LimitOrderFillState]:
+        return self._limit_order_fill_states
+
     @property
     def on_hold_balances(self) -> Dict[str, Decimal]:
         _on_hold_balances = defaultdict(Decimal)
         for limit_order in self.limit_orders:
+            remaining_quantity = limit_order.quantity
+            fill_state = self._limit_order_fill_states.get(limit_order.client_order_id)
+            if fill_state is not None:
+                remaining_quantity -= Decimal(str(fill_state.filled_base))
             if limit_order.is_buy:
-                _on_hold_balances[limit_order.quote_currency] += limit_order.quantity * limit_order.price
+                _on_hold_balances[limit_order.quote_currency] += remaining_quantity * limit_order.price
             else:
-                _on_hold_balances[limit_order.base_currency] += limit_order.quantity
+                _on_hold_balances[limit_order.base_currency] += remaining_quantity
         return _on_hold_balances
 
     @property
@@ -308,7 +318,7 @@ cdef class PaperTradeMarket(MarketBase):
 
     async def stop_network(self):
         if self._order_tracker_task is not None:
-            self._order_book_tracker.stop()
+            await self._order_book_tracker.close()
             self._order_tracker_task.cancel()
 
     async def check_network(self) -> NetworkStatus:
@@ -375,6 +385,13 @@ cdef class PaperTradeMarket(MarketBase):
                 <PyObject *> quantized_price,
                 <PyObject *> quantized_amount
             ))
+            self._limit_order_fill_states[order_id] = LimitOrderFillState(
+                order_id,
+                True,
+                float(quantized_price),
+                float(quantized_amount),
+                self.c_get_queue_ahead(trading_pair_str, True, float(quantized_price))
+            )
         self.c_trigger_event(self.MARKET_BUY_ORDER_CREATED_EVENT_TAG,
                              BuyOrderCreatedEvent(
                                  self._current_timestamp,
@@ -429,6 +446,13 @@ cdef class PaperTradeMarket(MarketBase):
                 <PyObject *> quantized_price,
                 <PyObject *> quantized_amount
             ))
+            self._limit_order_fill_states[order_id] = LimitOrderFillState(
+                order_id,
+                False,
+                float(quantized_price),
+                float(quantized_amount),
+                self.c_get_queue_ahead(trading_pair_str, False, float(quantized_price))
+            )
         self.c_trigger_event(self.MARKET_SELL_ORDER_CREATED_EVENT_TAG,
                              SellOrderCreatedEvent(
                                  self._current_timestamp,
@@ -453,20 +477,26 @@ cdef class PaperTradeMarket(MarketBase):
         buy_entries = order_book.simulate_buy(amount)
         # Calculate the quote currency needed, including fees.
         total_quote_needed = sum(row.price * row.amount for row in buy_entries)
+        # Calculate the base currency acquired, including fees.
+        total_base_acquired = sum(row.amount for row in buy_entries)
+        if config.buy_fees_asset is AssetType.BASE_CURRENCY:
+            fee_amount = total_base_acquired * config.buy_fees_amount
+            total_base_acquired -= fee_amount
+        else:
+            fee_amount = total_quote_needed * config.buy_fees_amount
+            total_quote_needed += fee_amount
 
         if total_quote_needed > quote_balance:
             raise ValueError(f"Insufficient {quote_asset} balance available for buy order. "
                              f"{quote_balance} {quote_asset} available vs. "
                              f"{total_quote_needed} {quote_asset} required for the order.")
 
-        # Calculate the base currency acquired, including fees.
-        total_base_acquired = sum(row.amount for row in buy_entries)
-
         self.c_set_balance(quote_asset, quote_balance - total_quote_needed)
         self.c_set_balance(base_asset, base_balance + total_base_acquired)
 
         order_filled_events = OrderFilledEvent.order_filled_events_from_order_book_rows(
-            self._current_timestamp, order_id, trading_pair, TradeType.BUY, OrderType.MARKET, TradeFee(0.0), buy_entries
+            self._current_timestamp, order_id, trading_pair, TradeType.BUY, OrderType.MARKET,
+            TradeFee(config.buy_fees_amount), buy_entries
         )
 
         for order_filled_event in order_filled_events:
@@ -482,7 +512,7 @@ cdef class PaperTradeMarket(MarketBase):
                                                         quote_asset),
                                                     total_base_acquired,
                                                     total_quote_needed,
-                                                    0,
+                                                    fee_amount,
                                                     OrderType.MARKET))
 
     cdef c_execute_sell(self, str order_id, str trading_pair_str, double amount):
@@ -523,7 +553,7 @@ cdef class PaperTradeMarket(MarketBase):
 
         order_filled_events = OrderFilledEvent.order_filled_events_from_order_book_rows(
             self._current_timestamp, order_id, trading_pair_str, TradeType.SELL,
-            OrderType.MARKET, TradeFee(0.0), sell_entries
+            OrderType.MARKET, TradeFee(config.sell_fees_amount), sell_entries
         )
 
         for order_filled_event in order_filled_events:
@@ -566,6 +596,7 @@ cdef class PaperTradeMarket(MarketBase):
         cdef:
             SingleSymbolLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
         try:
+            self._limit_order_fill_states.pop(deref(orders_it).getClientOrderID().decode("utf8"), None)
             orders_collection_ptr.erase(orders_it)
             if orders_collection_ptr.empty():
                 map_it_ptr[0] = limit_orders_map_ptr.erase(deref(map_it_ptr))
@@ -574,125 +605,210 @@ cdef class PaperTradeMarket(MarketBase):
             self.logger().error("Error deleting limit order.", exc_info=True)
             return False
 
+    cdef double c_get_queue_ahead(self, str symbol, bint is_buy, double price) except? -1:
+        """
+        Get the order book volume resting at exactly the given price on the given side of the order book, which a new
+        limit order at that price has to queue behind.
+        """
+        cdef:
+            object order_book = self.c_get_order_book(symbol)
+
+        if is_buy:
+            for order_book_row in order_book.bid_entries():
+                if order_book_row.price < price:
+                    break
+                if order_book_row.price == price:
+                    return order_book_row.amount
+        else:
+            for order_book_row in order_book.ask_entries():
+                if order_book_row.price > price:
+                    break
+                if order_book_row.price == price:
+                    return order_book_row.amount
+        return 0.0
+
+    cdef double c_consume_order_book_depth(self, str symbol, bint is_buy, double price, double amount) except? -1:
+        """
+        Take up to `amount` from the opposite side of the order book, at prices up to `price`, and record the consumed
+        rows in the composite order book so the same depth cannot fill another simulated order.
+
+        :return: the amount taken from the order book
+        """
+        cdef:
+            object order_book = self.c_get_order_book(symbol)
+            double remaining_amount = amount
+            double row_amount
+            list consumed_rows = []
+
+        entries = order_book.ask_entries() if is_buy else order_book.bid_entries()
+        for order_book_row in entries:
+            if remaining_amount <= 0:
+                break
+            if (is_buy and order_book_row.price > price) or (not is_buy and order_book_row.price < price):
+                break
+            row_amount = min(remaining_amount, order_book_row.amount)
+            consumed_rows.append((order_book_row.price, row_amount))
+            remaining_amount -= row_amount
+
+        for row_price, row_amount in consumed_rows:
+            order_book.record_filled_order(OrderFilledEvent(self._current_timestamp,
+                                                            "",
+                                                            symbol,
+                                                            TradeType.BUY if is_buy else TradeType.SELL,
+                                                            OrderType.LIMIT,
+                                                            row_price,
+                                                            row_amount,
+                                                            TradeFee(0.0)))
+        return amount - remaining_amount
+
     cdef c_process_limit_bid_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleSymbolLimitOrdersIterator orders_it):
+                                   SingleSymbolLimitOrdersIterator orders_it,
+                                   double fill_amount):
         cdef:
             const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
             str symbol = cpp_limit_order_ptr.getSymbol().decode("utf8")
             str quote_asset = cpp_limit_order_ptr.getQuoteCurrency().decode("utf8")
             str base_asset = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
             str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
+            double price = float(<object> cpp_limit_order_ptr.getPrice())
             double quote_asset_balance = self.c_get_balance(quote_asset)
-            double quote_asset_traded = (float(<object> cpp_limit_order_ptr.getPrice()) *
-                                         float(<object> cpp_limit_order_ptr.getQuantity()))
-            double base_asset_traded = float(<object> cpp_limit_order_ptr.getQuantity())
+            double base_asset_traded = fill_amount
+            double quote_asset_traded = price * fill_amount
+            double base_asset_received = base_asset_traded
+            double quote_asset_paid = quote_asset_traded
+            double fee_amount
+
+        config = self._config
+        fill_state = self._limit_order_fill_states[order_id]
+        if config.buy_fees_asset is AssetType.BASE_CURRENCY:
+            fee_amount = base_asset_traded * config.buy_fees_amount
+            base_asset_received -= fee_amount
+        else:
+            fee_amount = quote_asset_traded * config.buy_fees_amount
+            quote_asset_paid += fee_amount
 
-        # Check if there's enough balance to satisfy the order. If not, remove the limit order without doing anything.
-        if quote_asset_balance < quote_asset_traded:
+        # Check if there's enough balance to satisfy the fill. If not, remove the limit order without doing anything.
+        if quote_asset_balance < quote_asset_paid:
             self.logger().warning(f"Not enough {quote_asset} balance to fill limit buy order on {symbol}. "
-                                  f"{quote_asset_traded:.8g} {quote_asset} needed vs. "
+                                  f"{quote_asset_paid:.8g} {quote_asset} needed vs. "
                                   f"{quote_asset_balance:.8g} {quote_asset} available.")
 
             self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
             return
 
         # Adjust the market balances according to the trade done.
-        self.c_set_balance(quote_asset, self.c_get_balance(quote_asset) - quote_asset_traded)
-        self.c_set_balance(base_asset, self.c_get_balance(base_asset) + base_asset_traded)
-
-        # Emit the trade and order completed events.
-        config = self._config
+        self.c_set_balance(quote_asset, quote_asset_balance - quote_asset_paid)
+        self.c_set_balance(base_asset, self.c_get_balance(base_asset) + base_asset_received)
+        fill_state.fee_paid += fee_amount
 
+        # Emit the trade event, and the order completed event if there's nothing left to fill.
         self.c_trigger_event(self.ORDER_FILLED_EVENT_TAG,
                              OrderFilledEvent(self._current_timestamp,
                                               order_id,
                                               symbol,
                                               TradeType.BUY,
                                               OrderType.LIMIT,
-                                              float(<object> cpp_limit_order_ptr.getPrice()),
-                                              float(<object> cpp_limit_order_ptr.getQuantity()),
-                                              TradeFee(0.0)
+                                              price,
+                                              base_asset_traded,
+                                              TradeFee(config.buy_fees_amount)
                                               ))
 
-        self.c_trigger_event(self.BUY_ORDER_COMPLETED_EVENT_TAG,
-                             BuyOrderCompletedEvent(self._current_timestamp,
-                                                    order_id,
-                                                    base_asset,
-                                                    quote_asset,
-                                                    (base_asset if
-                                                        config.buy_fees_asset is AssetType.BASE_CURRENCY else
-                                                        quote_asset),
-                                                    base_asset_traded,
-                                                    quote_asset_traded,
-                                                    0.0,
-                                                    OrderType.LIMIT))
-        self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+        if fill_state.is_done:
+            self.c_trigger_event(self.BUY_ORDER_COMPLETED_EVENT_TAG,
+                                 BuyOrderCompletedEvent(self._current_timestamp,
+                                                        order_id,
+                                                        base_asset,
+                                                        quote_asset,
+                                                        (base_asset if
+                                                            config.buy_fees_asset is AssetType.BASE_CURRENCY else
+                                                            quote_asset),
+                                                        fill_state.filled_base,
+                                                        fill_state.filled_quote,
+                                                        fill_state.fee_paid,
+                                                        OrderType.LIMIT))
+            self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
 
     cdef c_process_limit_ask_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleSymbolLimitOrdersIterator orders_it):
+                                   SingleSymbolLimitOrdersIterator orders_it,
+                                   double fill_amount):
         cdef:
             const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
             str trading_pair_str = cpp_limit_order_ptr.getSymbol().decode("utf8")
             str quote_asset = cpp_limit_order_ptr.getQuoteCurrency().decode("utf8")
             str base_asset = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
             str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
+            double price = float(<object> cpp_limit_order_ptr.getPrice())
             double base_asset_balance = self.c_get_balance(base_asset)
-            double quote_asset_traded = (float(<object> cpp_limit_order_ptr.getPrice()) *
-                                         float(<object> cpp_limit_order_ptr.getQuantity()))
-            double base_asset_traded = float(<object> cpp_limit_order_ptr.getQuantity())
+            double base_asset_traded = fill_amount
+            double quote_asset_traded = price * fill_amount
+            double base_asset_paid = base_asset_traded
+            double quote_asset_received = quote_asset_traded
+            double fee_amount
+
+        config = self._config
+        fill_state = self._limit_order_fill_states[order_id]
+        if config.sell_fees_asset is AssetType.BASE_CURRENCY:
+            fee_amount = base_asset_traded * config.sell_fees_amount
+            base_asset_paid += fee_amount
+        else:
+            fee_amount = quote_asset_traded * config.sell_fees_amount
+            quote_asset_received -= fee_amount
 
-        # Check if there's enough balance to satisfy the order. If not, remove the limit order without doing anything.
-        if base_asset_balance < base_asset_traded:
+        # Check if there's enough balance to satisfy the fill. If not, remove the limit order without doing anything.
+        if base_asset_balance < base_asset_paid:
             self.logger().warning(f"Not enough {base_asset} balance to fill limit sell order on {trading_pair_str}. "
-                                  f"{base_asset_traded:.8g} {base_asset} needed vs. "
+                                  f"{base_asset_paid:.8g} {base_asset} needed vs. "
                                   f"{base_asset_balance:.8g} {base_asset} available.")
             self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
             return
 
         # Adjust the market balances according to the trade done.
-        self.c_set_balance(quote_asset, self.c_get_balance(quote_asset) + quote_asset_traded)
-        self.c_set_balance(base_asset, self.c_get_balance(base_asset) - base_asset_traded)
+        self.c_set_balance(quote_asset, self.c_get_balance(quote_asset) + quote_asset_received)
+        self.c_set_balance(base_asset, base_asset_balance - base_asset_paid)
+        fill_state.fee_paid += fee_amount
 
-        # Emit the trade and order completed events.
-        config = self._config
+        # Emit the trade event, and the order completed event if there's nothing left to fill.
         self.c_trigger_event(self.ORDER_FILLED_EVENT_TAG,
                              OrderFilledEvent(self._current_timestamp,
                                               order_id,
                                               trading_pair_str,
                                               TradeType.SELL,
                                               OrderType.LIMIT,
-                                              float(<object> cpp_limit_order_ptr.getPrice()),
-                                              float(<object> cpp_limit_order_ptr.getQuantity()),
-                                              TradeFee(0.0)
+                                              price,
+                                              base_asset_traded,
+                                              TradeFee(config.sell_fees_amount)
                                               ))
-        self.c_trigger_event(self.SELL_ORDER_COMPLETED_EVENT_TAG,
-                             SellOrderCompletedEvent(self._current_timestamp,
-                                                     order_id,
-                                                     base_asset,
-                                                     quote_asset,
-                                                     (base_asset if
-                                                         config.sell_fees_asset is AssetType.BASE_CURRENCY else
-                                                         quote_asset),
-                                                     base_asset_traded,
-                                                     quote_asset_traded,
-                                                     0.0,
-                                                     OrderType.LIMIT))
-        self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+
+        if fill_state.is_done:
+            self.c_trigger_event(self.SELL_ORDER_COMPLETED_EVENT_TAG,
+                                 SellOrderCompletedEvent(self._current_timestamp,
+                                                         order_id,
+                                                         base_asset,
+                                                         quote_asset,
+                                                         (base_asset if
+                                                             config.sell_fees_asset is AssetType.BASE_CURRENCY else
+                                                             quote_asset),
+                                                         fill_state.filled_base,
+                                                         fill_state.filled_quote,
+                                                         fill_state.fee_paid,
+                                                         OrderType.LIMIT))
+            self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
 
     cdef c_process_limit_order(self,
                                bint is_buy,
                                LimitOrders *limit_orders_map_ptr,
                                LimitOrdersIterator *map_it_ptr,
-                               SingleSymbolLimitOrdersIterator orders_it):
+                               SingleSymbolLimitOrdersIterator orders_it,
+                               double fill_amount):
         try:
             if is_buy:
-                self.c_process_limit_bid_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+                self.c_process_limit_bid_order(limit_orders_map_ptr, map_it_ptr, orders_it, fill_amount)
             else:
-                self.c_process_limit_ask_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+                self.c_process_limit_ask_order(limit_orders_map_ptr, map_it_ptr, orders_it, fill_amount)
         except Exception as e:
             self.logger().error(f"Error processing limit order.", exc_info=True)
 
@@ -701,8 +817,10 @@ cdef class PaperTradeMarket(MarketBase):
                                                    LimitOrders *limit_orders_map_ptr,
                                                    LimitOrdersIterator *map_it_ptr):
         """
-        Trigger limit orders when the opposite side of the order book has crossed the limit order's price.
-        This implies someone was ready to fill the limit order, if that limit order was on the market.
+        Fill limit orders when the opposite side of the order book has crossed the limit order's price.
+        This implies someone was ready to fill the limit order, if that limit order was on the market - but only up to
+        the opposite side volume priced at or better than the limit order, which is then consumed from the composite
+        order book.
 
         :param is_buy: are the limit orders on the bid side?
         :param limit_orders_map_ptr: pointer to the limit orders map
@@ -716,6 +834,8 @@ cdef class PaperTradeMarket(MarketBase):
             SingleSymbolLimitOrdersRIterator orders_rit = orders_collection_ptr.rbegin()
             vector[SingleSymbolLimitOrdersIterator] process_order_its
             const CPPLimitOrder *cpp_limit_order_ptr = NULL
+            double limit_price
+            double fill_amount
 
         if is_buy:
             while orders_rit != orders_collection_ptr.rend():
@@ -734,7 +854,14 @@ cdef class PaperTradeMarket(MarketBase):
                 inc(orders_it)
 
         for orders_it in process_order_its:
-            self.c_process_limit_order(is_buy, limit_orders_map_ptr, map_it_ptr, orders_it)
+            cpp_limit_order_ptr = address(deref(orders_it))
+            limit_price = float(<object>cpp_limit_order_ptr.getPrice())
+            fill_state = self._limit_order_fill_states[cpp_limit_order_ptr.getClientOrderID().decode("utf8")]
+            fill_amount = fill_state.match_crossed_book(
+                self.c_consume_order_book_depth(symbol, is_buy, limit_price, fill_state.remaining_quantity)
+            )
+            if fill_amount > 0:
+                self.c_process_limit_order(is_buy, limit_orders_map_ptr, map_it_ptr, orders_it, fill_amount)
 
     cdef c_process_crossed_limit_orders(self):
         cdef:
@@ -757,7 +884,11 @@ cdef class PaperTradeMarket(MarketBase):
     # <editor-fold desc="Event listener functions">
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event):
         """
-        Trigger limit orders when incoming market orders have crossed the limit order's price.
+        Fill limit orders when incoming market orders have traded at or through the limit order's price.
+
+        Trades at the limit order's price first consume the order book volume queued ahead of the limit order when it
+        was placed. Whatever trade volume is left fills the limit orders, best priced first, so a single trade never
+        fills more than its own amount.
 
         :param order_book_trade_event: trade event from order book
         """
@@ -766,6 +897,8 @@ cdef class PaperTradeMarket(MarketBase):
             bint is_maker_buy = order_book_trade_event.type is TradeType.SELL
             double trade_price = order_book_trade_event.price
             double trade_quantity = order_book_trade_event.amount
+            double available_trade_quantity = trade_quantity
+            double fill_amount
             LimitOrders *limit_orders_map_ptr = (address(self._bid_limit_orders)
                                                  if is_maker_buy
                                                  else address(self._ask_limit_orders))
@@ -784,7 +917,7 @@ cdef class PaperTradeMarket(MarketBase):
             orders_rit = orders_collection_ptr.rbegin()
             while orders_rit != orders_collection_ptr.rend():
                 cpp_limit_order_ptr = address(deref(orders_rit))
-                if float(<object>cpp_limit_order_ptr.getPrice()) <= trade_price:
+                if float(<object>cpp_limit_order_ptr.getPrice()) < trade_price:
                     break
                 process_order_its.push_back(getIteratorFromReverseIterator(
                     <reverse_iterator[SingleSymbolLimitOrdersIterator]>orders_rit))
@@ -793,13 +926,20 @@ cdef class PaperTradeMarket(MarketBase):
             orders_it = orders_collection_ptr.begin()
             while orders_it != orders_collection_ptr.end():
                 cpp_limit_order_ptr = address(deref(orders_it))
-                if float(<object>cpp_limit_order_ptr.getPrice()) >= trade_price:
+                if float(<object>cpp_limit_order_ptr.getPrice()) > trade_price:
                     break
                 process_order_its.push_back(orders_it)
                 inc(orders_it)
 
         for orders_it in process_order_its:
-            self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), orders_it)
+            cpp_limit_order_ptr = address(deref(orders_it))
+            fill_state = self._limit_order_fill_states[cpp_limit_order_ptr.getClientOrderID().decode("utf8")]
+            # Every order's queue position moves with the full trade amount, even when there is no trade volume
+            # left to fill it.
+            fill_amount = fill_state.match_trade(trade_price, trade_quantity, available_trade_quantity)
+            if fill_amount > 0:
+                available_trade_quantity -= fill_amount
+                self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), orders_it, fill_amount)
 
     # </editor-fold>
     cdef double c_get_available_balance(self, str currency) except? -1:
@@ -882,7 +1022,9 @@ cdef class PaperTradeMarket(MarketBase):
                           object order_side,
                           object amount,
                           object price):
-        return TradeFee(0)
+        if order_side is TradeType.BUY:
+            return TradeFee(self._config.buy_fees_amount)
+        return TradeFee(self._config.sell_fees_amount)
 
     cdef OrderBook c_get_order_book(self, str symbol):
         if symbol not in self._trading_pairs:
@@ -24,6 +24,7 @@ cdef class RadarRelayMarket(MarketBase):
         TransactionTracker _tx_tracker
         object _w3
         object _exchange
+        object _order_signer
         dict _withdraw_rules
         dict _trading_rules
         object _pending_approval_tx_hashes
@@ -58,6 +58,7 @@ from hummingbot.market.trading_rule cimport TradingRule
 from hummingbot.wallet.ethereum.web3_wallet import Web3Wallet
 from hummingbot.wallet.ethereum.zero_ex.zero_ex_custom_utils import fix_signature
 from hummingbot.wallet.ethereum.zero_ex.zero_ex_exchange import ZeroExExchange
+from hummingbot.wallet.ethereum.zero_ex.zero_ex_order_signer import ZeroExOrderSigner
 
 rrm_logger = None
 s_decimal_0 = Decimal(0)
@@ -141,6 +142,7 @@ cdef class RadarRelayMarket(MarketBase):
         self._wallet = wallet
         self._wallet_spender_address = wallet_spender_address
         self._exchange = ZeroExExchange(self._w3, ZERO_EX_MAINNET_EXCHANGE_ADDRESS, wallet)
+        self._order_signer = ZeroExOrderSigner(wallet, ZERO_EX_MAINNET_EXCHANGE_ADDRESS)
         self._latest_salt = -1
 
     @property
@@ -211,6 +213,13 @@ cdef class RadarRelayMarket(MarketBase):
             }
         }
 
+    def tracking_state_entry(self, order_id: str) -> Optional[Tuple[List[str], Dict[str, any]]]:
+        if order_id in self._in_flight_market_orders:
+            return ["market_orders", order_id], self._in_flight_market_orders[order_id].to_json()
+        if order_id in self._in_flight_limit_orders:
+            return ["limit_orders", order_id], self._in_flight_limit_orders[order_id].to_json()
+        return None
+
     def restore_tracking_states(self, saved_states: Dict[str, any]):
         self._in_flight_market_orders.update({
             key: RadarRelayInFlightOrder.from_json(value)
@@ -230,15 +239,17 @@ cdef class RadarRelayMarket(MarketBase):
                 self._poll_notifier = asyncio.Event()
                 await self._poll_notifier.wait()
 
-                self._update_balances()
-                await safe_gather(
-                    self._update_trading_rules(),
-                    self._update_limit_order_status(),
-                    self._update_market_order_status()
-                )
+                with self.status_poll_timer():
+                    self._update_balances()
+                    await safe_gather(
+                        self._update_trading_rules(),
+                        self._update_limit_order_status(),
+                        self._update_market_order_status()
+                    )
             except asyncio.CancelledError:
                 raise
             except Exception:
+                self.record_status_poll_error()
                 self.logger().network(
                     "Unexpected error while fetching account updates.",
                     exc_info=True,
@@ -548,28 +559,29 @@ cdef class RadarRelayMarket(MarketBase):
                            url: str,
                            data: Optional[Dict[str, Any]] = None,
                            headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
-        async with aiohttp.ClientSession() as client:
-            async with client.request(http_method,
-                                      url=url,
-                                      timeout=self.API_CALL_TIMEOUT,
-                                      data=data,
-                                      headers=headers) as response:
-                try:
-                    if response.status == 201:
-                        return response
-                    elif response.status == 200:
-                        response_json = await response.json()
-                        return response_json
-                    else:
-                        raise IOError
-                except Exception:
-                    if response.status == 502:
-                        raise IOError(f"Error fetching data from {url}. "
-                                      f"HTTP status is {response.status} - Server Error: Bad Gateway.")
-                    else:
-                        response_text = await response.text()
-                        raise IOError(f"Error fetching data from {url}. "
-                                      f"HTTP status is {response.status} - {response_text}.")
+        with self.rest_request_timer(http_method, url):
+            async with aiohttp.ClientSession() as client:
+                async with client.request(http_method,
+                                          url=url,
+                                          timeout=self.API_CALL_TIMEOUT,
+                                          data=data,
+                                          headers=headers) as response:
+                    try:
+                        if response.status == 201:
+                            return response
+                        elif response.status == 200:
+                            response_json = await response.json()
+                            return response_json
+                        else:
+                            raise IOError
+                    except Exception:
+                        if response.status == 502:
+                            raise IOError(f"Error fetching data from {url}. "
+                                          f"HTTP status is {response.status} - Server Error: Bad Gateway.")
+                        else:
+                            response_text = await response.text()
+                            raise IOError(f"Error fetching data from {url}. "
+                                          f"HTTP status is {response.status} - {response_text}.")
 
     async def request_signed_market_orders(self, symbol: str, trade_type: TradeType, amount: str) -> Dict[str, Any]:
         if trade_type is TradeType.BUY:
@@ -655,9 +667,9 @@ cdef class RadarRelayMarket(MarketBase):
                                                                        price=str(price),
                                                                        expires=expires)
         unsigned_limit_order["makerAddress"] = self._wallet.address.lower()
-        order_hash_hex = self.get_order_hash_hex(unsigned_limit_order)
+        # Orders placed together, e.g. multiple order levels, are hashed and signed in a batch off the event loop.
+        order_hash_hex, signature = await self._order_signer.sign_order(unsigned_limit_order)
         signed_limit_order = copy.deepcopy(unsigned_limit_order)
-        signature = self.get_zero_ex_signature(order_hash_hex)
         signed_limit_order["signature"] = signature
         await self._api_request(http_method="post", url=url, data=signed_limit_order)
         self._latest_salt = int(unsigned_limit_order["salt"])
@@ -7,6 +7,7 @@ HummingbotBase = declarative_base()
 
 def get_declarative_base():
     from .market_state import MarketState
+    from .market_state_delta import MarketStateDelta
     from .metadata import Metadata
     from .order import Order
     from .order_status import OrderStatus
@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+
+from sqlalchemy import (
+    Column,
+    Text,
+    JSON,
+    Integer,
+    BigInteger,
+    Index
+)
+
+from . import HummingbotBase
+
+
+class MarketStateDelta(HummingbotBase):
+    """
+    A change to a single tracking state entry (e.g. an in-flight order) of a market, relative to the market's last
+    `MarketState` snapshot. `path` is the list of keys leading to the entry within the tracking states, and a null
+    `saved_state` means the entry was removed.
+    """
+    __tablename__ = "MarketStateDelta"
+    __table_args__ = (Index("msd_config_market_id_index",
+                            "config_file_path", "market", "id"),)
+
+    id = Column(Integer, primary_key=True, nullable=False)
+    config_file_path = Column(Text, nullable=False)
+    market = Column(Text, nullable=False)
+    timestamp = Column(BigInteger, nullable=False)
+    path = Column(JSON, nullable=False)
+    saved_state = Column(JSON, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"MarketStateDelta(id='{self.id}', config_file_path='{self.config_file_path}', " \
+            f"market='{self.market}', timestamp={self.timestamp}, path={self.path}, saved_state={self.saved_state})"
@@ -20,6 +20,8 @@ class OrderStatus(HummingbotBase):
     __tablename__ = "OrderStatus"
     __table_args__ = (Index("os_order_id_timestamp_index",
                             "order_id", "timestamp"),
+                      Index("os_timestamp_status_index",
+                            "timestamp", "status"),
                       )
 
     id = Column(Integer, primary_key=True, nullable=False)
@@ -5,6 +5,8 @@ import logging
 from os.path import join
 from sqlalchemy import (
     create_engine,
+    event,
+    inspect,
     MetaData,
 )
 from sqlalchemy.engine.base import Engine
@@ -14,7 +16,12 @@ from sqlalchemy.orm import (
     Session,
     Query
 )
-from typing import Optional
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Set,
+)
 
 from hummingbot import data_path
 from hummingbot.logger.logger import HummingbotLogger
@@ -30,10 +37,13 @@ class SQLSessionWrapper:
         return self._session
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if exc_type is None:
-            self._session.commit()
-        else:
-            self._session.rollback()
+        try:
+            if exc_type is None:
+                self._session.commit()
+            else:
+                self._session.rollback()
+        finally:
+            self._session.close()
 
 
 class SQLConnectionType(Enum):
@@ -45,7 +55,17 @@ class SQLConnectionManager:
     _scm_trade_fills_instance: Optional["SQLConnectionManager"] = None
 
     LOCAL_DB_VERSION_KEY = "local_db_version"
-    LOCAL_DB_VERSION_VALUE = "20190614"
+    LOCAL_DB_VERSION_VALUE = "20190901"
+
+    # Applied to every SQLite connection. WAL lets readers and the markets recorder's writer thread work concurrently,
+    # and with WAL, synchronous=NORMAL can only lose the last transactions on power loss - never corrupt the database.
+    SQLITE_PRAGMAS: Dict[str, str] = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": str(256 * 1024 * 1024),
+        "cache_size": str(-64 * 1024),      # in KiB
+        "temp_store": "MEMORY",
+    }
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -63,12 +83,24 @@ class SQLConnectionManager:
             cls._scm_trade_fills_instance = SQLConnectionManager(SQLConnectionType.TRADE_FILLS)
         return cls._scm_trade_fills_instance
 
-    def __init__(self, connection_type: SQLConnectionType, db_path: Optional[str] = None):
+    @classmethod
+    def set_sqlite_pragmas(cls, dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma, value in cls.SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {pragma}={value}")
+        cursor.close()
+
+    def __init__(self,
+                 connection_type: SQLConnectionType,
+                 db_path: Optional[str] = None,
+                 tune_sqlite: bool = True):
         if db_path is None:
             db_path = join(data_path(), "hummingbot_trades.sqlite")
 
         if connection_type is SQLConnectionType.TRADE_FILLS:
             self._engine: Engine = create_engine(f"sqlite:///{db_path}")
+            if tune_sqlite:
+                event.listen(self._engine, "connect", self.set_sqlite_pragmas)
             self._metadata: MetaData = self.get_declarative_base().metadata
             self._metadata.create_all(self._engine)
 
@@ -97,8 +129,10 @@ class SQLConnectionManager:
                 self._shared_session.add(version_info)
                 self._shared_session.commit()
             else:
-                # There's no past db version to upgrade from at this moment. So we'll just update the version value
-                # if needed.
+                if result.value < "20190901":
+                    # Databases before 20190901 lack the MarketState unique index and the OrderStatus timestamp index.
+                    self.remove_duplicate_market_states()
+                    self.create_missing_indexes()
                 if result.value < self.LOCAL_DB_VERSION_VALUE:
                     result.value = self.LOCAL_DB_VERSION_VALUE
                     self._shared_session.commit()
@@ -106,6 +140,29 @@ class SQLConnectionManager:
             self.logger().error("Unexpected error while checking and upgrading the local database.",
                                 exc_info=True)
 
+    def remove_duplicate_market_states(self):
+        """
+        Keeps only the latest MarketState row of each config file and market, so the unique index can be created.
+        """
+        with self._engine.begin() as conn:
+            conn.execute('DELETE FROM "MarketState" WHERE id NOT IN '
+                         '(SELECT MAX(id) FROM "MarketState" GROUP BY config_file_path, market)')
+
+    def create_missing_indexes(self):
+        """
+        Creates the indexes declared by the models that don't exist in the database yet. `create_all()` only creates
+        the indexes of new tables.
+        """
+        existing_tables: Set[str] = set(inspect(self._engine).get_table_names())
+        for table in self._metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing_indexes: List[str] = [index["name"] for index in inspect(self._engine).get_indexes(table.name)]
+            for index in table.indexes:
+                if index.name not in existing_indexes:
+                    self.logger().info(f"Creating index {index.name} on {table.name}.")
+                    index.create(self._engine)
+
     def commit(self):
         self._shared_session.commit()
 
@@ -22,6 +22,7 @@ from sqlalchemy import (
     JSON
 )
 from sqlalchemy.orm import relationship
+from sqlalchemy.orm.attributes import InstrumentedAttribute
 from datetime import datetime
 
 from . import HummingbotBase
@@ -63,39 +64,59 @@ class TradeFill(HummingbotBase):
             f"trade_type='{self.trade_type}', order_type='{self.order_type}', price={self.price}, " \
             f"amount={self.amount}, trade_fee={self.trade_fee}, exchange_trade_id={self.exchange_trade_id})"
 
+    DISPLAY_COLUMNS: List[str] = ["symbol",
+                                  "price",
+                                  "amount",
+                                  "order_type",
+                                  "side",
+                                  "market",
+                                  "timestamp",
+                                  "fee_percent",
+                                  "flat_fee / gas"]
+
     @classmethod
-    def to_pandas(cls, trades: List):
-        columns: List[str] = ["symbol",
-                              "price",
-                              "amount",
-                              "order_type",
-                              "side",
-                              "market",
-                              "timestamp",
-                              "fee_percent",
-                              "flat_fee / gas"]
-        data = []
-        for trade in trades:
-            flat_fees: List[Dict[str, Any]] = trade.trade_fee["flat_fees"]
-            if len(flat_fees) == 0:
-                flat_fee_str = "None"
-            else:
-                fee_strs = [f"{fee_dict['amount']} {fee_dict['symbol']}" for fee_dict in flat_fees]
-                flat_fee_str = ",".join(fee_strs)
+    def display_query_columns(cls) -> List[InstrumentedAttribute]:
+        """
+        The columns used by `to_display_row()`. Querying these instead of `TradeFill` returns plain row tuples rather
+        than ORM objects, which are much cheaper to load in bulk.
+        """
+        return [cls.symbol,
+                cls.price,
+                cls.amount,
+                cls.order_type,
+                cls.trade_type,
+                cls.market,
+                cls.timestamp,
+                cls.trade_fee]
+
+    @staticmethod
+    def to_display_row(trade) -> List[Any]:
+        """
+        :param trade: a `TradeFill`, or a row queried with `display_query_columns()`
+        """
+        flat_fees: List[Dict[str, Any]] = trade.trade_fee["flat_fees"]
+        if len(flat_fees) == 0:
+            flat_fee_str = "None"
+        else:
+            fee_strs = [f"{fee_dict['amount']} {fee_dict['symbol']}" for fee_dict in flat_fees]
+            flat_fee_str = ",".join(fee_strs)
 
-            data.append([
-                trade.symbol,
-                trade.price,
-                trade.amount,
-                trade.order_type.lower(),
-                trade.trade_type.lower(),
-                trade.market,
-                datetime.fromtimestamp(int(trade.timestamp / 1e3)).strftime("%Y-%m-%d %H:%M:%S"),
-                trade.trade_fee['percent'],
-                flat_fee_str,
-            ])
+        return [
+            trade.symbol,
+            trade.price,
+            trade.amount,
+            trade.order_type.lower(),
+            trade.trade_type.lower(),
+            trade.market,
+            datetime.fromtimestamp(int(trade.timestamp / 1e3)).strftime("%Y-%m-%d %H:%M:%S"),
+            trade.trade_fee['percent'],
+            flat_fee_str,
+        ]
 
-        return pd.DataFrame(data=data, columns=columns)
+    @classmethod
+    def to_pandas(cls, trades: List):
+        data = [cls.to_display_row(trade) for trade in trades]
+        return pd.DataFrame(data=data, columns=cls.DISPLAY_COLUMNS)
 
     @staticmethod
     def to_bounty_api_json(trade_fill: "TradeFill") -> Dict[str, Any]:
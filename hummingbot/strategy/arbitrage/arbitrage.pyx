@@ -409,11 +409,7 @@ cdef class ArbitrageStrategy(StrategyBase):
                 total_flat_fees += flat_fee_amount
             else:
                 # if the flat fee currency symbol does not match quote symbol, convert to quote currency value
-                total_flat_fees += ExchangeRateConversion.get_instance().convert_token_value(
-                    amount=flat_fee_amount,
-                    from_currency=flat_fee_currency,
-                    to_currency=quote_asset
-                )
+                total_flat_fees += self.c_convert_token_value_cached(flat_fee_amount, flat_fee_currency, quote_asset)
         return total_flat_fees
 
     cdef tuple c_find_best_profitable_amount(self, object buy_market_trading_pair_tuple, object sell_market_trading_pair_tuple):
@@ -463,7 +459,8 @@ cdef class ArbitrageStrategy(StrategyBase):
         # "flat_fees" returns list of additional fees ie: [("ETH", 0.01), ("BNB", 2.5)]
         # typically most exchanges will only have 1 flat fee (ie: gas cost of transaction in ETH)
         for bid_price_adjusted, ask_price_adjusted, bid_price, ask_price, amount in profitable_orders:
-            buy_fee = buy_market.c_get_fee(
+            buy_fee = self.c_get_fee_cached(
+                buy_market,
                 buy_market_trading_pair_tuple.base_asset,
                 buy_market_trading_pair_tuple.quote_asset,
                 OrderType.MARKET,
@@ -471,7 +468,8 @@ cdef class ArbitrageStrategy(StrategyBase):
                 Decimal(total_previous_step_base_amount + amount),
                 Decimal(ask_price)
             )
-            sell_fee = sell_market.c_get_fee(
+            sell_fee = self.c_get_fee_cached(
+                sell_market,
                 sell_market_trading_pair_tuple.base_asset,
                 sell_market_trading_pair_tuple.quote_asset,
                 OrderType.MARKET,
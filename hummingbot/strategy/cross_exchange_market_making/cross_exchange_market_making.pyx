@@ -1,7 +1,4 @@
-from collections import (
-    defaultdict,
-    deque
-)
+from collections import defaultdict
 from decimal import Decimal
 import logging
 from math import (
@@ -25,6 +22,8 @@ from hummingbot.market.market_base import (
     OrderType
 )
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.rolling_extremum_window cimport RollingExtremumWindow
+from hummingbot.core.data_type.rolling_extremum_window import RollingExtremumWindow
 from hummingbot.strategy.strategy_base cimport StrategyBase
 from hummingbot.strategy.strategy_base import StrategyBase
 from hummingbot.core.utils.exchange_rate_conversion import ExchangeRateConversion
@@ -769,7 +768,8 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
 
             if not isnan(top_bid_price):
                 # Calculate the next price above top bid
-                price_quantum = maker_market.c_get_order_price_quantum(
+                price_quantum = self.c_get_order_price_quantum_cached(
+                    maker_market,
                     market_pair.maker.trading_pair,
                     top_bid_price
                 )
@@ -785,9 +785,9 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
 
             # If quote assets are not same, convert them from taker's quote asset to maker's quote asset
             if market_pair.maker.quote_asset != market_pair.taker.quote_asset:
-                taker_price *= self._exchange_rate_conversion.convert_token_value(1,
-                                                                                  market_pair.taker.quote_asset,
-                                                                                  market_pair.maker.quote_asset)
+                taker_price *= self.c_convert_token_value_cached(1,
+                                                                 market_pair.taker.quote_asset,
+                                                                 market_pair.maker.quote_asset)
 
             # you are buying on the maker market and selling on the taker market
             maker_price = taker_price / (1 + self._min_profitability)
@@ -798,7 +798,8 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
                 if price_above_bid is not None:
                     maker_price = min(maker_price, price_above_bid)
 
-            price_quantum = maker_market.c_get_order_price_quantum(
+            price_quantum = self.c_get_order_price_quantum_cached(
+                maker_market,
                 market_pair.maker.trading_pair,
                 maker_price
             )
@@ -810,7 +811,8 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
         else:
             if not isnan(top_ask_price):
                 # Calculate the next price below top ask
-                price_quantum = maker_market.c_get_order_price_quantum(
+                price_quantum = self.c_get_order_price_quantum_cached(
+                    maker_market,
                     market_pair.maker.trading_pair,
                     top_ask_price
                 )
@@ -825,9 +827,9 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
                 return None
 
             if market_pair.maker.quote_asset != market_pair.taker.quote_asset:
-                taker_price *= self._exchange_rate_conversion.convert_token_value(1,
-                                                                                  market_pair.taker.quote_asset,
-                                                                                  market_pair.maker.quote_asset)
+                taker_price *= self.c_convert_token_value_cached(1,
+                                                                 market_pair.taker.quote_asset,
+                                                                 market_pair.maker.quote_asset)
 
             # You are buying on the taker market and selling on the maker market
             maker_price = taker_price * (1 + self._min_profitability)
@@ -838,7 +840,8 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
                 if next_price_below_top_ask is not None:
                     maker_price = max(maker_price, next_price_below_top_ask)
 
-            price_quantum = maker_market.c_get_order_price_quantum(
+            price_quantum = self.c_get_order_price_quantum_cached(
+                maker_market,
                 market_pair.maker.trading_pair,
                 maker_price
             )
@@ -883,9 +886,9 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
 
             # If quote assets are not same, convert them from taker's quote asset to maker's quote asset
             if market_pair.maker.quote_asset != market_pair.taker.quote_asset:
-                taker_price *= self._exchange_rate_conversion.convert_token_value(1,
-                                                                                  market_pair.taker.quote_asset,
-                                                                                  market_pair.maker.quote_asset)
+                taker_price *= self.c_convert_token_value_cached(1,
+                                                                 market_pair.taker.quote_asset,
+                                                                 market_pair.maker.quote_asset)
 
             return taker_price
         else:
@@ -897,22 +900,25 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
                 return None
 
             if market_pair.maker.quote_asset != market_pair.taker.quote_asset:
-                taker_price *= self._exchange_rate_conversion.convert_token_value(1,
-                                                                                  market_pair.taker.quote_asset,
-                                                                                  market_pair.maker.quote_asset)
+                taker_price *= self.c_convert_token_value_cached(1,
+                                                                 market_pair.taker.quote_asset,
+                                                                 market_pair.maker.quote_asset)
 
             return taker_price
 
     cdef tuple c_get_suggested_price_samples(self, object market_pair):
         """
-        Get the queues of order book price samples for a market pair.
+        Get the rolling windows of order book price samples for a market pair.
 
         :param market_pair: The market pair under which samples were collected for.
         :return: (bid order price samples, ask order price samples)
         """
-        if market_pair in self._suggested_price_samples:
-            return self._suggested_price_samples[market_pair]
-        return deque(), deque()
+        if market_pair not in self._suggested_price_samples:
+            self._suggested_price_samples[market_pair] = (
+                RollingExtremumWindow(self.ORDER_ADJUST_SAMPLE_WINDOW, True),
+                RollingExtremumWindow(self.ORDER_ADJUST_SAMPLE_WINDOW, False)
+            )
+        return self._suggested_price_samples[market_pair]
 
     cdef tuple c_get_top_bid_ask(self, object market_pair):
         """
@@ -961,22 +967,17 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
         :param market_pair: cross exchange market pair
         """
         cdef:
-            OrderBook maker_order_book = market_pair.maker.order_book
+            RollingExtremumWindow bid_price_samples
+            RollingExtremumWindow ask_price_samples
 
         if ((self._last_timestamp // self.ORDER_ADJUST_SAMPLE_INTERVAL) <
                 (self._current_timestamp // self.ORDER_ADJUST_SAMPLE_INTERVAL)):
-            if market_pair not in self._suggested_price_samples:
-                self._suggested_price_samples[market_pair] = (deque(), deque())
-
             top_bid_price, top_ask_price = self.c_get_top_bid_ask_from_price_samples(market_pair)
 
-            bid_price_samples_deque, ask_price_samples_deque = self._suggested_price_samples[market_pair]
-            bid_price_samples_deque.append(top_bid_price)
-            ask_price_samples_deque.append(top_ask_price)
-            while len(bid_price_samples_deque) > self.ORDER_ADJUST_SAMPLE_WINDOW:
-                bid_price_samples_deque.popleft()
-            while len(ask_price_samples_deque) > self.ORDER_ADJUST_SAMPLE_WINDOW:
-                ask_price_samples_deque.popleft()
+            # The windows drop samples older than ORDER_ADJUST_SAMPLE_WINDOW by themselves.
+            bid_price_samples, ask_price_samples = self.c_get_suggested_price_samples(market_pair)
+            bid_price_samples.c_append(top_bid_price)
+            ask_price_samples.c_append(top_ask_price)
 
     cdef tuple c_get_top_bid_ask_from_price_samples(self,
                                                     object market_pair):
@@ -986,18 +987,22 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
         :param market_pair: cross exchange market pair
         :return: (top bid, top ask)
         """
+        cdef:
+            RollingExtremumWindow bid_price_samples
+            RollingExtremumWindow ask_price_samples
+
         # Incorporate the past bid & ask price samples.
         current_top_bid_price, current_top_ask_price = self.c_get_top_bid_ask(market_pair)
 
         bid_price_samples, ask_price_samples = self.c_get_suggested_price_samples(market_pair)
 
-        if not isnan(bid_price_samples).any():
-            top_bid_price = max(list(bid_price_samples) + [current_top_bid_price])
+        if not bid_price_samples.has_nan:
+            top_bid_price = bid_price_samples.c_get_extremum_with(current_top_bid_price)
         else:
             top_bid_price = current_top_ask_price
 
-        if not isnan(ask_price_samples).any():
-            top_ask_price = min(list(ask_price_samples) + [current_top_ask_price])
+        if not ask_price_samples.has_nan:
+            top_ask_price = ask_price_samples.c_get_extremum_with(current_top_ask_price)
         else:
             top_ask_price = current_top_ask_price
 
@@ -0,0 +1,430 @@
+#!/usr/bin/env python
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import itertools
+import logging
+import math
+import numpy as np
+import os
+import pandas as pd
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.core.data_type.order_book_replay import (
+    OrderBookReplayIterator,
+    ReplayData,
+    ReplayOrderBookTracker,
+    load_replay_dataset,
+)
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    MarketEvent,
+    OrderFilledEvent,
+    TradeType,
+)
+from hummingbot.core.py_time_iterator import PyTimeIterator
+from hummingbot.market.market_base import MarketBase
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.strategy_base import StrategyBase
+
+StrategyFactory = Callable[[List[MarketTradingPairTuple], Dict[str, Any]], StrategyBase]
+
+s_logger = None
+
+
+def logger() -> logging.Logger:
+    global s_logger
+    if s_logger is None:
+        s_logger = logging.getLogger(__name__)
+    return s_logger
+
+
+class SweepMarket(NamedTuple):
+    exchange_name: str
+    symbol: str
+    base_balance: float
+    quote_balance: float
+
+
+class SweepSettings(NamedTuple):
+    """
+    Settings shared by every case of a parameter sweep.
+
+    The replay dataset is expected at `<dataset_dir>/<exchange_name>/<symbol>`, as written by `prepare_replay_dataset()`.
+    """
+    dataset_dir: str
+    markets: List[SweepMarket]
+    start_timestamp: float
+    end_timestamp: float
+    tick_size: float = 1.0
+    trading_fee: float = 0.0
+    inventory_sample_interval: float = 60.0
+
+
+class SweepResult(NamedTuple):
+    case_index: int
+    params: Dict[str, Any]
+    pnl: float
+    return_pct: float
+    buy_fills: int
+    sell_fills: int
+    filled_base_volume: float
+    inventory_timestamps: np.ndarray
+    inventory_path: np.ndarray
+    elapsed_seconds: float
+
+
+def pure_market_making_factory(market_infos: List[MarketTradingPairTuple], params: Dict[str, Any]) -> StrategyBase:
+    """
+    Builds a pure market making strategy on the first market, from parameters named like the strategy's config map.
+    """
+    from hummingbot.strategy.pure_market_making import (
+        PureMarketMakingStrategyV2,
+        ConstantSpreadPricingDelegate,
+        ConstantMultipleSpreadPricingDelegate,
+        ConstantSizeSizingDelegate,
+        StaggeredMultipleSizeSizingDelegate,
+        InventorySkewSingleSizeSizingDelegate,
+        InventorySkewMultipleSizeSizingDelegate,
+        PassThroughFilterDelegate
+    )
+    bid_place_threshold: float = params.get("bid_place_threshold", 0.01)
+    ask_place_threshold: float = params.get("ask_place_threshold", 0.01)
+    number_of_orders: int = int(params.get("number_of_orders", 1))
+    order_start_size: float = params.get("order_start_size", 1.0)
+    order_step_size: float = params.get("order_step_size", 0.0)
+    inventory_target_base_percent: float = params.get("inventory_target_base_percent", 0.5)
+    inventory_skew_enabled: bool = bool(params.get("inventory_skew_enabled", False))
+
+    if params.get("mode", "single") == "multiple":
+        pricing_delegate = ConstantMultipleSpreadPricingDelegate(bid_place_threshold,
+                                                                 ask_place_threshold,
+                                                                 params.get("order_interval_percent", 0.01),
+                                                                 number_of_orders)
+        if inventory_skew_enabled:
+            sizing_delegate = InventorySkewMultipleSizeSizingDelegate(order_start_size,
+                                                                      order_step_size,
+                                                                      number_of_orders,
+                                                                      inventory_target_base_percent)
+        else:
+            sizing_delegate = StaggeredMultipleSizeSizingDelegate(order_start_size,
+                                                                  order_step_size,
+                                                                  number_of_orders)
+    else:
+        pricing_delegate = ConstantSpreadPricingDelegate(bid_place_threshold, ask_place_threshold)
+        order_amount: float = params.get("order_amount", 1.0)
+        if inventory_skew_enabled:
+            sizing_delegate = InventorySkewSingleSizeSizingDelegate(order_amount, inventory_target_base_percent)
+        else:
+            sizing_delegate = ConstantSizeSizingDelegate(order_amount)
+
+    return PureMarketMakingStrategyV2(
+        market_infos=market_infos[:1],
+        pricing_delegate=pricing_delegate,
+        filter_delegate=PassThroughFilterDelegate(),
+        sizing_delegate=sizing_delegate,
+        cancel_order_wait_time=params.get("cancel_order_wait_time", 60.0),
+        filled_order_replenish_wait_time=params.get("filled_order_replenish_wait_time", 10.0),
+        enable_order_filled_stop_cancellation=bool(params.get("enable_order_filled_stop_cancellation", False)),
+        jump_orders_enabled=bool(params.get("jump_orders_enabled", False)),
+        jump_orders_depth=params.get("jump_orders_depth", 0.0),
+        add_transaction_costs_to_orders=True,
+        logging_options=0
+    )
+
+
+def cross_exchange_market_making_factory(market_infos: List[MarketTradingPairTuple],
+                                         params: Dict[str, Any]) -> StrategyBase:
+    """
+    Builds a cross exchange market making strategy, with the first market as the maker and the second as the taker.
+    """
+    from hummingbot.strategy.cross_exchange_market_making import (
+        CrossExchangeMarketMakingStrategy,
+        CrossExchangeMarketPair,
+    )
+    market_pair: CrossExchangeMarketPair = CrossExchangeMarketPair(maker=market_infos[0], taker=market_infos[1])
+    return CrossExchangeMarketMakingStrategy(
+        market_pairs=[market_pair],
+        min_profitability=params.get("min_profitability", 0.003),
+        order_amount=params.get("order_amount", 0.0),
+        order_size_taker_volume_factor=params.get("order_size_taker_volume_factor", 0.25),
+        order_size_taker_balance_factor=params.get("order_size_taker_balance_factor", 0.995),
+        order_size_portfolio_ratio_limit=params.get("order_size_portfolio_ratio_limit", 0.1667),
+        limit_order_min_expiration=params.get("limit_order_min_expiration", 130.0),
+        adjust_order_enabled=bool(params.get("adjust_order_enabled", True)),
+        anti_hysteresis_duration=params.get("anti_hysteresis_duration", 60.0),
+        active_order_canceling=bool(params.get("active_order_canceling", True)),
+        cancel_order_threshold=params.get("cancel_order_threshold", 0.05),
+        top_depth_tolerance=params.get("top_depth_tolerance", 0.0),
+        logging_options=0
+    )
+
+
+STRATEGY_FACTORIES: Dict[str, StrategyFactory] = {
+    "pure_market_making": pure_market_making_factory,
+    "cross_exchange_market_making": cross_exchange_market_making_factory,
+}
+
+
+def expand_parameter_grid(parameter_grid: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """
+    Expands a dict of parameter name -> candidate values into the list of all parameter combinations.
+    """
+    names: List[str] = list(parameter_grid.keys())
+    return [dict(zip(names, values)) for values in itertools.product(*(parameter_grid[name] for name in names))]
+
+
+class InventorySampler(PyTimeIterator):
+    """
+    Samples the base and quote balances of a set of markets at a fixed interval during a backtest.
+    """
+    def __init__(self, market_infos: List[MarketTradingPairTuple], sample_interval: float):
+        super().__init__()
+        self._market_infos: List[MarketTradingPairTuple] = market_infos
+        self._sample_interval: float = sample_interval
+        self._last_sample_timestamp: float = float("-inf")
+        self._timestamps: List[float] = []
+        self._samples: List[List[float]] = []
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return np.array(self._timestamps, dtype=np.float64)
+
+    @property
+    def samples(self) -> np.ndarray:
+        """
+        Array of shape (number of samples, 2 * number of markets), holding the base and quote balance of each market.
+        """
+        return np.array(self._samples, dtype=np.float64).reshape(len(self._samples), 2 * len(self._market_infos))
+
+    def tick(self, timestamp: float):
+        if timestamp - self._last_sample_timestamp < self._sample_interval:
+            return
+        self._last_sample_timestamp = timestamp
+        self._timestamps.append(timestamp)
+        row: List[float] = []
+        for market_info in self._market_infos:
+            row.append(market_info.base_balance)
+            row.append(market_info.quote_balance)
+        self._samples.append(row)
+
+
+def _portfolio_value(market_infos: List[MarketTradingPairTuple],
+                     balances: List[Tuple[float, float]],
+                     mid_prices: List[float]) -> float:
+    return sum(quote_balance + base_balance * mid_price
+               for (base_balance, quote_balance), mid_price in zip(balances, mid_prices))
+
+
+# Replay dataset of the current worker process, memory mapped once by the pool initializer and shared by every case
+# the worker runs.
+_worker_datasets: Optional[Dict[Tuple[str, str], ReplayData]] = None
+
+
+def _init_sweep_worker(dataset_dir: str, markets: List[SweepMarket]):
+    global _worker_datasets
+    _worker_datasets = {}
+    for market in markets:
+        _worker_datasets[(market.exchange_name, market.symbol)] = load_replay_dataset(
+            os.path.join(dataset_dir, market.exchange_name), [market.symbol]
+        )[market.symbol]
+
+
+def run_sweep_case(settings: SweepSettings,
+                   strategy_factory: StrategyFactory,
+                   case_index: int,
+                   params: Dict[str, Any]) -> SweepResult:
+    """
+    Backtests a single parameter combination against the replay dataset of the current process.
+    """
+    from hummingbot.market.paper_trade import MARKET_CLASSES
+    from hummingbot.market.paper_trade.market_config import MarketConfig
+    from hummingbot.market.paper_trade.paper_trade_market import PaperTradeMarket
+
+    if _worker_datasets is None:
+        _init_sweep_worker(settings.dataset_dir, settings.markets)
+
+    started: float = time.time()
+    clock: Clock = Clock(ClockMode.BACKTEST, settings.tick_size, settings.start_timestamp, settings.end_timestamp)
+    market_infos: List[MarketTradingPairTuple] = []
+    fill_loggers: List[EventLogger] = []
+    replay_iterators: List[OrderBookReplayIterator] = []
+    markets: List[MarketBase] = []
+    for sweep_market in settings.markets:
+        tracker: ReplayOrderBookTracker = ReplayOrderBookTracker([sweep_market.symbol], sweep_market.exchange_name)
+        market: PaperTradeMarket = PaperTradeMarket(tracker,
+                                                    MarketConfig.create_config(settings.trading_fee),
+                                                    MARKET_CLASSES[sweep_market.exchange_name])
+        base_asset, quote_asset = market.split_symbol(sweep_market.symbol)
+        market.set_balance(base_asset, sweep_market.base_balance)
+        market.set_balance(quote_asset, sweep_market.quote_balance)
+        fill_logger: EventLogger = EventLogger()
+        market.add_listener(MarketEvent.OrderFilled, fill_logger)
+        replay_iterators.append(OrderBookReplayIterator(
+            tracker, {sweep_market.symbol: _worker_datasets[(sweep_market.exchange_name, sweep_market.symbol)]}
+        ))
+        market_infos.append(MarketTradingPairTuple(market, sweep_market.symbol, base_asset, quote_asset))
+        fill_loggers.append(fill_logger)
+        markets.append(market)
+
+    strategy: StrategyBase = strategy_factory(market_infos, params)
+    inventory_sampler: InventorySampler = InventorySampler(market_infos, settings.inventory_sample_interval)
+
+    # Order books must be up to date before the markets match orders against them, and the strategy must see the
+    # markets' state as of the current tick.
+    for replay_iterator in replay_iterators:
+        clock.add_iterator(replay_iterator)
+    for market in markets:
+        clock.add_iterator(market)
+    clock.add_iterator(strategy)
+    clock.add_iterator(inventory_sampler)
+    clock.backtest_til(settings.end_timestamp)
+
+    mid_prices: List[float] = [
+        (market_info.order_book.get_price(True) + market_info.order_book.get_price(False)) / 2
+        for market_info in market_infos
+    ]
+    initial_value: float = _portfolio_value(market_infos,
+                                            [(m.base_balance, m.quote_balance) for m in settings.markets],
+                                            mid_prices)
+    final_value: float = _portfolio_value(market_infos,
+                                          [(m.base_balance, m.quote_balance) for m in market_infos],
+                                          mid_prices)
+    fills: List[OrderFilledEvent] = [event
+                                     for fill_logger in fill_loggers
+                                     for event in fill_logger.event_log
+                                     if isinstance(event, OrderFilledEvent)]
+    pnl: float = final_value - initial_value
+    return SweepResult(
+        case_index=case_index,
+        params=params,
+        pnl=pnl,
+        return_pct=pnl / initial_value * 100 if initial_value > 0 else float("nan"),
+        buy_fills=sum(1 for fill in fills if fill.trade_type is TradeType.BUY),
+        sell_fills=sum(1 for fill in fills if fill.trade_type is TradeType.SELL),
+        filled_base_volume=sum(fill.amount for fill in fills),
+        inventory_timestamps=inventory_sampler.timestamps,
+        inventory_path=inventory_sampler.samples,
+        elapsed_seconds=time.time() - started
+    )
+
+
+def _run_sweep_case_args(args: Tuple[SweepSettings, StrategyFactory, int, Dict[str, Any]]) -> SweepResult:
+    return run_sweep_case(*args)
+
+
+def run_parameter_sweep(settings: SweepSettings,
+                        strategy_factory: StrategyFactory,
+                        parameter_grid: Dict[str, List[Any]],
+                        max_workers: Optional[int] = None,
+                        output_dir: Optional[str] = None) -> pd.DataFrame:
+    """
+    Backtests every combination of `parameter_grid` against one replay dataset, over a process pool.
+
+    Each worker process memory maps the dataset once in its initializer, so the dataset is loaded from disk once
+    and its pages are shared between workers. The strategy factory must be a module level function, so it can be
+    sent to the workers.
+
+    :return: results table with one row per parameter combination. If `output_dir` is given, the table is also
+             written to `results.csv`, and the sampled inventory paths to `inventory_paths.npz` (keyed by case index).
+    """
+    cases: List[Dict[str, Any]] = expand_parameter_grid(parameter_grid)
+    logger().info(f"Running {len(cases)} backtests over {max_workers or os.cpu_count()} processes.")
+    results: List[SweepResult] = []
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             initializer=_init_sweep_worker,
+                             initargs=(settings.dataset_dir, settings.markets)) as executor:
+        work = [(settings, strategy_factory, case_index, params) for case_index, params in enumerate(cases)]
+        # Fewer, larger chunks keep the inter-process overhead negligible next to the backtests themselves.
+        chunk_size: int = max(1, int(math.ceil(len(work) / (4 * (max_workers or os.cpu_count() or 1)))))
+        for result in executor.map(_run_sweep_case_args, work, chunksize=chunk_size):
+            results.append(result)
+
+    results_df: pd.DataFrame = pd.DataFrame([
+        dict(case_index=result.case_index,
+             **result.params,
+             pnl=result.pnl,
+             return_pct=result.return_pct,
+             buy_fills=result.buy_fills,
+             sell_fills=result.sell_fills,
+             filled_base_volume=result.filled_base_volume,
+             elapsed_seconds=result.elapsed_seconds)
+        for result in results
+    ])
+
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+        results_df.to_csv(os.path.join(output_dir, "results.csv"), index=False)
+        inventory_arrays: Dict[str, np.ndarray] = {}
+        for result in results:
+            inventory_arrays[f"timestamps_{result.case_index}"] = result.inventory_timestamps
+            inventory_arrays[f"inventory_{result.case_index}"] = result.inventory_path
+        np.savez_compressed(os.path.join(output_dir, "inventory_paths.npz"), **inventory_arrays)
+    return results_df
+
+
+def _parse_parameter(spec: str) -> Tuple[str, List[Any]]:
+    name, _, raw_values = spec.partition("=")
+    values: List[Any] = []
+    for raw_value in raw_values.split(","):
+        try:
+            values.append(float(raw_value))
+        except ValueError:
+            values.append(raw_value)
+    return name, values
+
+
+def _parse_market(spec: str) -> SweepMarket:
+    exchange_name, symbol, base_balance, quote_balance = spec.split(":")
+    return SweepMarket(exchange_name, symbol, float(base_balance), float(quote_balance))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backtests a grid of strategy parameters against a recorded "
+                                                 "order book dataset.")
+    parser.add_argument("--dataset-dir", required=True)
+    parser.add_argument("--strategy", choices=sorted(STRATEGY_FACTORIES.keys()), default="pure_market_making")
+    parser.add_argument("--market", action="append", required=True,
+                        help="<exchange>:<symbol>:<base balance>:<quote balance>. Repeat for multi-market strategies.")
+    parser.add_argument("--param", action="append", default=[],
+                        help="<name>=<value>[,<value>...]. Every combination of the values is backtested.")
+    parser.add_argument("--start", type=float, required=True, help="Start UNIX timestamp.")
+    parser.add_argument("--end", type=float, required=True, help="End UNIX timestamp.")
+    parser.add_argument("--tick-size", type=float, default=1.0)
+    parser.add_argument("--trading-fee", type=float, default=0.0)
+    parser.add_argument("--inventory-sample-interval", type=float, default=60.0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--output-dir", required=True)
+    args = parser.parse_args()
+
+    settings: SweepSettings = SweepSettings(dataset_dir=args.dataset_dir,
+                                            markets=[_parse_market(spec) for spec in args.market],
+                                            start_timestamp=args.start,
+                                            end_timestamp=args.end,
+                                            tick_size=args.tick_size,
+                                            trading_fee=args.trading_fee,
+                                            inventory_sample_interval=args.inventory_sample_interval)
+    parameter_grid: Dict[str, List[Any]] = dict(_parse_parameter(spec) for spec in args.param)
+    results_df: pd.DataFrame = run_parameter_sweep(settings,
+                                                   STRATEGY_FACTORIES[args.strategy],
+                                                   parameter_grid,
+                                                   max_workers=args.workers,
+                                                   output_dir=args.output_dir)
+    print(results_df.sort_values("pnl", ascending=False).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -45,20 +45,24 @@ cdef class ConstantMultipleSpreadPricingDelegate(OrderPricingDelegate):
             double top_ask_price = maker_order_book.c_get_price(True)
             str market_name = maker_market.name
             double mid_price = (top_bid_price + top_ask_price) * 0.5
-            list bid_prices = [maker_market.c_quantize_order_price(market_info.trading_pair,
-                                                                   Decimal(mid_price * (1.0 - self.bid_spread)))]
-            list ask_prices = [maker_market.c_quantize_order_price(market_info.trading_pair,
-                                                                   Decimal(mid_price * (1.0 + self.ask_spread)))]
+            list bid_prices = [strategy.c_quantize_order_price_cached(maker_market,
+                                                                      market_info.trading_pair,
+                                                                      Decimal(mid_price * (1.0 - self.bid_spread)))]
+            list ask_prices = [strategy.c_quantize_order_price_cached(maker_market,
+                                                                      market_info.trading_pair,
+                                                                      Decimal(mid_price * (1.0 + self.ask_spread)))]
 
         for _ in range(self.number_of_orders - 1):
             last_bid_price = bid_prices[-1]
-            current_bid_price = maker_market.c_quantize_order_price(market_info.trading_pair,
-                                                                    last_bid_price * Decimal(1 - self.order_interval_size))
+            current_bid_price = strategy.c_quantize_order_price_cached(maker_market,
+                                                                       market_info.trading_pair,
+                                                                       last_bid_price * Decimal(1 - self.order_interval_size))
             bid_prices.append(current_bid_price)
 
             last_ask_price = ask_prices[-1]
-            current_ask_price = maker_market.c_quantize_order_price(market_info.trading_pair,
-                                                                    last_ask_price * Decimal(1 + self.order_interval_size))
+            current_ask_price = strategy.c_quantize_order_price_cached(maker_market,
+                                                                       market_info.trading_pair,
+                                                                       last_ask_price * Decimal(1 + self.order_interval_size))
             ask_prices.append(current_ask_price)
 
         return PricingProposal(bid_prices, ask_prices)
@@ -35,5 +35,5 @@ cdef class ConstantSpreadPricingDelegate(OrderPricingDelegate):
             object bid_price = mid_price * Decimal(1.0 - self._bid_spread)
             object ask_price = mid_price * Decimal(1.0 + self._ask_spread)
 
-        return PricingProposal([maker_market.c_quantize_order_price(market_info.trading_pair, bid_price)],
-                               [maker_market.c_quantize_order_price(market_info.trading_pair, ask_price)])
+        return PricingProposal([strategy.c_quantize_order_price_cached(maker_market, market_info.trading_pair, bid_price)],
+                               [strategy.c_quantize_order_price_cached(maker_market, market_info.trading_pair, ask_price)])
@@ -142,7 +142,8 @@ cdef class InventorySkewMultipleSizeSizingDelegate(OrderSizingDelegate):
                     market_info.trading_pair,
                     current_bid_order_size
                 )
-                buy_fees = market.c_get_fee(
+                buy_fees = strategy.c_get_fee_cached(
+                    market,
                     market_info.base_asset,
                     market_info.quote_asset,
                     OrderType.MARKET,
@@ -24,7 +24,6 @@ from hummingbot.market.market_base import (
 )
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.strategy_base import StrategyBase
-from hummingbot.core.utils.exchange_rate_conversion import ExchangeRateConversion
 from math import isnan
 
 from .data_types import (
@@ -328,7 +327,8 @@ cdef class PureMarketMakingStrategyV2(StrategyBase):
         # Get the top bid price in the market using jump_orders_depth and your buy order volume
         top_bid_price = maker_orderbook.c_get_price_for_volume(False,
                                                                self._jump_orders_depth + own_buy_order_depth).result_price
-        price_quantum = maker_market.c_get_order_price_quantum(
+        price_quantum = self.c_get_order_price_quantum_cached(
+            maker_market,
             market_info.trading_pair,
             top_bid_price
         )
@@ -338,13 +338,15 @@ cdef class PureMarketMakingStrategyV2(StrategyBase):
         # If the price_above_bid is lower than the price suggested by the pricing proposal,
         # lower your price to this
         lower_buy_price = min(updated_buy_order_prices[0], price_above_bid)
-        updated_buy_order_prices[0] = maker_market.c_quantize_order_price(market_info.trading_pair,
-                                                                          lower_buy_price)
+        updated_buy_order_prices[0] = self.c_quantize_order_price_cached(maker_market,
+                                                                         market_info.trading_pair,
+                                                                         lower_buy_price)
 
         # Get the top ask price in the market using jump_orders_depth and your sell order volume
         top_ask_price = maker_orderbook.c_get_price_for_volume(True,
                                                                self._jump_orders_depth + own_sell_order_depth).result_price
-        price_quantum = maker_market.c_get_order_price_quantum(
+        price_quantum = self.c_get_order_price_quantum_cached(
+            maker_market,
             market_info.trading_pair,
             top_ask_price
         )
@@ -354,8 +356,9 @@ cdef class PureMarketMakingStrategyV2(StrategyBase):
         # If the price_below_ask is higher than the price suggested by the pricing proposal,
         # increase your price to this
         higher_sell_price = max(updated_sell_order_prices[0], price_below_ask)
-        updated_sell_order_prices[0] = maker_market.c_quantize_order_price(market_info.trading_pair,
-                                                                           higher_sell_price)
+        updated_sell_order_prices[0] = self.c_quantize_order_price_cached(maker_market,
+                                                                          market_info.trading_pair,
+                                                                          higher_sell_price)
 
         return PricingProposal(updated_buy_order_prices, updated_sell_order_prices)
 
@@ -371,11 +374,7 @@ cdef class PureMarketMakingStrategyV2(StrategyBase):
                 total_flat_fees += flat_fee_amount
             else:
                 # if the flat fee currency symbol does not match quote symbol, convert to quote currency value
-                total_flat_fees += ExchangeRateConversion.get_instance().convert_token_value(
-                    amount=flat_fee_amount,
-                    from_currency=flat_fee_currency,
-                    to_currency=quote_asset
-                )
+                total_flat_fees += self.c_convert_token_value_cached(flat_fee_amount, flat_fee_currency, quote_asset)
         return total_flat_fees
 
     cdef tuple c_check_and_add_transaction_costs_to_pricing_proposal(self,
@@ -416,7 +415,8 @@ cdef class PureMarketMakingStrategyV2(StrategyBase):
         for buy_price, buy_amount in zip(pricing_proposal.buy_order_prices,
                                          sizing_proposal.buy_order_sizes):
             if buy_amount > s_decimal_zero:
-                fee_object = maker_market.c_get_fee(
+                fee_object = self.c_get_fee_cached(
+                    maker_market,
                     market_info.base_asset,
                     market_info.quote_asset,
                     OrderType.LIMIT,
@@ -435,8 +435,9 @@ cdef class PureMarketMakingStrategyV2(StrategyBase):
             else:
                 buy_price_with_tx_cost = buy_price
 
-            buy_price_with_tx_cost = maker_market.c_quantize_order_price(market_info.trading_pair,
-                                                                         Decimal(buy_price_with_tx_cost))
+            buy_price_with_tx_cost = self.c_quantize_order_price_cached(maker_market,
+                                                                        market_info.trading_pair,
+                                                                        Decimal(buy_price_with_tx_cost))
 
             # If the buy price with transaction cost is less than or equal to zero
             # do not place orders
@@ -464,7 +465,8 @@ cdef class PureMarketMakingStrategyV2(StrategyBase):
         for sell_price, sell_amount in zip(pricing_proposal.sell_order_prices,
                                            sizing_proposal.sell_order_sizes):
             if sell_amount > s_decimal_zero:
-                fee_object = maker_market.c_get_fee(
+                fee_object = self.c_get_fee_cached(
+                    maker_market,
                     market_info.base_asset,
                     market_info.quote_asset,
                     OrderType.LIMIT,
@@ -483,8 +485,9 @@ cdef class PureMarketMakingStrategyV2(StrategyBase):
             else:
                 sell_price_with_tx_cost = sell_price
 
-            sell_price_with_tx_cost = maker_market.c_quantize_order_price(market_info.trading_pair,
-                                                                          Decimal(sell_price_with_tx_cost))
+            sell_price_with_tx_cost = self.c_quantize_order_price_cached(maker_market,
+                                                                         market_info.trading_pair,
+                                                                         Decimal(sell_price_with_tx_cost))
 
             if (sell_price_with_tx_cost / sell_price) > (1 + warning_report_threshold):
                 if should_report_warnings:
@@ -72,12 +72,13 @@ cdef class StaggeredMultipleSizeSizingDelegate(OrderSizingDelegate):
 
         for idx in range(self.number_of_orders):
             current_order_size = Decimal(self.order_start_size + self.order_step_size * idx)
-            buy_fees = market.c_get_fee(market_info.base_asset,
-                                        market_info.quote_asset,
-                                        OrderType.MARKET,
-                                        TradeType.BUY,
-                                        current_order_size,
-                                        pricing_proposal.buy_order_prices[idx])
+            buy_fees = strategy.c_get_fee_cached(market,
+                                                 market_info.base_asset,
+                                                 market_info.quote_asset,
+                                                 OrderType.MARKET,
+                                                 TradeType.BUY,
+                                                 current_order_size,
+                                                 pricing_proposal.buy_order_prices[idx])
 
             if market.name == "binance":
                 # For binance fees is calculated in base token, so need to adjust for that
@@ -1,6 +1,9 @@
 # distutils: language=c++
 
+from libc.stdint cimport int64_t
+
 from hummingbot.core.time_iterator cimport TimeIterator
+from hummingbot.market.market_base cimport MarketBase
 from hummingbot.core.event.event_listener cimport EventListener
 
 from .order_tracker cimport OrderTracker
@@ -19,6 +22,22 @@ cdef class StrategyBase(TimeIterator):
         double _sb_limit_order_min_expiration
         bint _sb_delegate_lock
         OrderTracker _sb_order_tracker
+        dict _sb_tick_cache
+        int64_t _sb_tick_cache_hits
+        int64_t _sb_tick_cache_misses
+
+    cdef c_clear_tick_cache(self)
+    cdef object c_get_fee_cached(self,
+                                 MarketBase market,
+                                 str base_currency,
+                                 str quote_currency,
+                                 object order_type,
+                                 object order_side,
+                                 object amount,
+                                 object price)
+    cdef object c_get_order_price_quantum_cached(self, MarketBase market, str symbol, object price)
+    cdef object c_quantize_order_price_cached(self, MarketBase market, str symbol, object price)
+    cdef object c_convert_token_value_cached(self, object amount, str from_currency, str to_currency)
 
     cdef c_add_markets(self, list markets)
     cdef c_remove_markets(self, list markets)
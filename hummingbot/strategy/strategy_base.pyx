@@ -15,7 +15,9 @@ from hummingbot.market.market_base cimport MarketBase
 from hummingbot.core.data_type.trade import Trade
 from hummingbot.core.event.events import (
     OrderFilledEvent,
-    OrderType
+    OrderType,
+    TradeFee,
+    TradeType
 )
 
 from .order_tracker import OrderTracker
@@ -111,6 +113,10 @@ cdef class StrategyBase(TimeIterator):
 
         self._sb_order_tracker = OrderTracker()
 
+        self._sb_tick_cache = {}
+        self._sb_tick_cache_hits = 0
+        self._sb_tick_cache_misses = 0
+
     @property
     def active_markets(self) -> List[MarketBase]:
         return list(self._sb_markets)
@@ -123,6 +129,38 @@ cdef class StrategyBase(TimeIterator):
     def limit_order_min_expiration(self, double value):
         self._sb_limit_order_min_expiration = value
 
+    @property
+    def tick_cache_hits(self) -> int:
+        return self._sb_tick_cache_hits
+
+    @property
+    def tick_cache_misses(self) -> int:
+        return self._sb_tick_cache_misses
+
+    @property
+    def tick_cache_hit_rate(self) -> float:
+        cdef int64_t total = self._sb_tick_cache_hits + self._sb_tick_cache_misses
+        return self._sb_tick_cache_hits / total if total > 0 else NaN
+
+    def get_fee_cached(self,
+                       MarketBase market,
+                       base_currency: str,
+                       quote_currency: str,
+                       order_type: OrderType,
+                       order_side: TradeType,
+                       amount: Decimal,
+                       price: Decimal) -> TradeFee:
+        return self.c_get_fee_cached(market, base_currency, quote_currency, order_type, order_side, amount, price)
+
+    def get_order_price_quantum_cached(self, MarketBase market, symbol: str, price: Decimal) -> Decimal:
+        return self.c_get_order_price_quantum_cached(market, symbol, price)
+
+    def quantize_order_price_cached(self, MarketBase market, symbol: str, price: Decimal) -> Decimal:
+        return self.c_quantize_order_price_cached(market, symbol, price)
+
+    def convert_token_value_cached(self, amount: float, from_currency: str, to_currency: str) -> float:
+        return self.c_convert_token_value_cached(amount, from_currency, to_currency)
+
     def format_status(self):
         raise NotImplementedError
 
@@ -263,11 +301,87 @@ cdef class StrategyBase(TimeIterator):
     cdef c_start(self, Clock clock, double timestamp):
         TimeIterator.c_start(self, clock, timestamp)
         self._sb_order_tracker.c_start(clock, timestamp)
+        self.c_clear_tick_cache()
 
     cdef c_tick(self, double timestamp):
         TimeIterator.c_tick(self, timestamp)
+        self.c_clear_tick_cache()
         self._sb_order_tracker.c_tick(timestamp)
 
+    # <editor-fold desc="+ Tick cache">
+    cdef c_clear_tick_cache(self):
+        """
+        Invalidates the tick cache. Called at the start of every tick, so cached values never outlive the tick in which
+        they were looked up.
+        """
+        if len(self._sb_tick_cache) > 0:
+            self._sb_tick_cache.clear()
+
+    cdef object c_get_fee_cached(self,
+                                 MarketBase market,
+                                 str base_currency,
+                                 str quote_currency,
+                                 object order_type,
+                                 object order_side,
+                                 object amount,
+                                 object price):
+        """
+        Same as `market.c_get_fee()`, memoised for the rest of the current tick.
+        """
+        key = ("fee", market, base_currency, quote_currency, order_type, order_side, amount, price)
+        retval = self._sb_tick_cache.get(key)
+        if retval is not None:
+            self._sb_tick_cache_hits += 1
+            return retval
+        self._sb_tick_cache_misses += 1
+        retval = market.c_get_fee(base_currency, quote_currency, order_type, order_side, amount, price)
+        self._sb_tick_cache[key] = retval
+        return retval
+
+    cdef object c_get_order_price_quantum_cached(self, MarketBase market, str symbol, object price):
+        """
+        Same as `market.c_get_order_price_quantum()`, memoised for the rest of the current tick.
+        """
+        key = ("price_quantum", market, symbol, price)
+        retval = self._sb_tick_cache.get(key)
+        if retval is not None:
+            self._sb_tick_cache_hits += 1
+            return retval
+        self._sb_tick_cache_misses += 1
+        retval = market.c_get_order_price_quantum(symbol, price)
+        self._sb_tick_cache[key] = retval
+        return retval
+
+    cdef object c_quantize_order_price_cached(self, MarketBase market, str symbol, object price):
+        """
+        Same as `market.c_quantize_order_price()`, memoised for the rest of the current tick.
+        """
+        key = ("quantize_price", market, symbol, price)
+        retval = self._sb_tick_cache.get(key)
+        if retval is not None:
+            self._sb_tick_cache_hits += 1
+            return retval
+        self._sb_tick_cache_misses += 1
+        retval = market.c_quantize_order_price(symbol, price)
+        self._sb_tick_cache[key] = retval
+        return retval
+
+    cdef object c_convert_token_value_cached(self, object amount, str from_currency, str to_currency):
+        """
+        Same as `ExchangeRateConversion.get_instance().convert_token_value()`, memoised for the rest of the current
+        tick. Failed conversions are not cached.
+        """
+        key = ("convert_token_value", amount, from_currency, to_currency)
+        retval = self._sb_tick_cache.get(key)
+        if retval is not None:
+            self._sb_tick_cache_hits += 1
+            return retval
+        self._sb_tick_cache_misses += 1
+        retval = ExchangeRateConversion.get_instance().convert_token_value(amount, from_currency, to_currency)
+        self._sb_tick_cache[key] = retval
+        return retval
+    # </editor-fold>
+
     cdef c_stop(self, Clock clock):
         TimeIterator.c_stop(self, clock)
         self._sb_order_tracker.c_stop(clock)
@@ -0,0 +1,269 @@
+#!/usr/bin/env python
+
+import aiohttp
+import asyncio
+from async_timeout import timeout
+from eth_abi import decode_abi
+from hexbytes import HexBytes
+import logging
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from web3.contract import ContractFunction
+from web3.datastructures import AttributeDict
+from web3.middleware.pythonic import (
+    block_formatter,
+    filter_params_formatter,
+    filter_result_formatter,
+    is_not_null,
+    receipt_formatter,
+    to_integer_if_hex,
+    transaction_param_formatter,
+)
+from web3.utils.abi import (
+    get_abi_output_types,
+    map_abi_data,
+)
+from web3.utils.formatters import apply_formatter_if
+from web3.utils.normalizers import BASE_RETURN_NORMALIZERS
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.metrics import (
+    Counter,
+    Histogram,
+    MetricsRegistry,
+)
+from hummingbot.logger import HummingbotLogger
+
+ETHEREUM_RPC_CALLS: Counter = MetricsRegistry.get_instance().counter(
+    "ethereum_rpc_calls",
+    "Ethereum JSON-RPC calls made through the async JSON-RPC client, by method.",
+    ["method"]
+)
+ETHEREUM_RPC_BATCH_SIZE: Histogram = MetricsRegistry.get_instance().histogram(
+    "ethereum_rpc_batch_size",
+    "Number of Ethereum JSON-RPC calls sent in each HTTP request.",
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200)
+)
+
+# Same result formatting as web3's pythonic and attrdict middlewares, so results are interchangeable with web3.eth's.
+RESULT_FORMATTERS: Dict[str, Callable[[Any], Any]] = {
+    "eth_blockNumber": to_integer_if_hex,
+    "eth_call": HexBytes,
+    "eth_estimateGas": to_integer_if_hex,
+    "eth_gasPrice": to_integer_if_hex,
+    "eth_getBalance": to_integer_if_hex,
+    "eth_getBlockByHash": apply_formatter_if(is_not_null, block_formatter),
+    "eth_getBlockByNumber": apply_formatter_if(is_not_null, block_formatter),
+    "eth_getLogs": filter_result_formatter,
+    "eth_getTransactionCount": to_integer_if_hex,
+    "eth_getTransactionReceipt": apply_formatter_if(is_not_null, receipt_formatter),
+    "eth_sendRawTransaction": HexBytes,
+}
+
+BlockIdentifier = Union[int, str, bytes]
+PendingCall = Tuple[str, List[Any], asyncio.Future]
+
+
+class JSONRPCError(ValueError):
+    """
+    Error response of the node to a JSON-RPC call - as opposed to transport errors, where the call may or may not
+    have reached the node.
+    """
+    def __init__(self, error: Any):
+        super().__init__(error)
+        self.error: Any = error
+
+
+def _to_hex(value: Union[str, bytes]) -> str:
+    return HexBytes(value).hex() if isinstance(value, bytes) else value
+
+
+def _block_param(block_identifier: BlockIdentifier) -> str:
+    return hex(block_identifier) if isinstance(block_identifier, int) else _to_hex(block_identifier)
+
+
+def _transaction_param(transaction: Dict[str, Any]) -> Dict[str, Any]:
+    # JSON-RPC quantities and data are hex strings.
+    return {key: hex(value) if isinstance(value, int) else _to_hex(value)
+            for key, value in transaction_param_formatter(transaction).items()}
+
+
+def _is_block_hash(block_identifier: BlockIdentifier) -> bool:
+    return (isinstance(block_identifier, bytes) and len(block_identifier) == 32) or \
+        (isinstance(block_identifier, str) and len(block_identifier) == 66)
+
+
+class AsyncJSONRPCClient:
+    """
+    Ethereum JSON-RPC client that coalesces the calls made within `batch_window` seconds of each other into a single
+    JSON-RPC batch request, over a pooled keep-alive HTTP session.
+
+    e.g. the receipts of all the pending transactions of a wallet are fetched in one HTTP request, instead of one
+    request - and one thread pool hop - per transaction.
+
+    Results are formatted the same way as web3's, i.e. blocks and receipts are AttributeDicts with HexBytes hashes.
+    """
+    _ajc_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._ajc_logger is None:
+            cls._ajc_logger = logging.getLogger(__name__)
+        return cls._ajc_logger
+
+    def __init__(self,
+                 jsonrpc_url: str,
+                 batch_window: float = 0.005,
+                 max_batch_size: int = 100,
+                 request_timeout: float = 10.0):
+        self._jsonrpc_url: str = jsonrpc_url
+        self._batch_window: float = batch_window
+        self._max_batch_size: int = max_batch_size
+        self._request_timeout: float = request_timeout
+        self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self._pending_calls: List[PendingCall] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._shared_client: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def jsonrpc_url(self) -> str:
+        return self._jsonrpc_url
+
+    def _http_client(self) -> aiohttp.ClientSession:
+        if self._shared_client is None or self._shared_client.closed:
+            self._shared_client = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=20, keepalive_timeout=60.0)
+            )
+        return self._shared_client
+
+    async def close(self):
+        if self._shared_client is not None:
+            await self._shared_client.close()
+            self._shared_client = None
+
+    async def request(self, method: str, params: List[Any]) -> Any:
+        """
+        Queues a JSON-RPC call to be sent with the other calls made within the batch window.
+
+        :return: the formatted result of the call.
+        :raises JSONRPCError: if the node returned an error for the call.
+        :raises IOError: if the node's response didn't include the call.
+        """
+        future: asyncio.Future = self._ev_loop.create_future()
+        self._pending_calls.append((method, params, future))
+        ETHEREUM_RPC_CALLS.labels(method).inc()
+        if len(self._pending_calls) >= self._max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = self._ev_loop.call_later(self._batch_window, self._flush)
+
+        result: Any = await future
+        formatter: Optional[Callable[[Any], Any]] = RESULT_FORMATTERS.get(method)
+        if formatter is not None:
+            result = formatter(result)
+        if isinstance(result, dict):
+            result = AttributeDict.recursive(result)
+        elif isinstance(result, list):
+            result = [AttributeDict.recursive(item) if isinstance(item, dict) else item for item in result]
+        return result
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending_calls: List[PendingCall] = self._pending_calls
+        self._pending_calls = []
+        if len(pending_calls) > 0:
+            safe_ensure_future(self._send_batch(pending_calls))
+
+    async def _send_batch(self, pending_calls: List[PendingCall]):
+        payload: List[Dict[str, Any]] = [{"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+                                         for request_id, (method, params, _) in enumerate(pending_calls)]
+        ETHEREUM_RPC_BATCH_SIZE.observe(len(payload))
+        try:
+            async with timeout(self._request_timeout):
+                async with self._http_client().post(self._jsonrpc_url,
+                                                    json=payload if len(payload) > 1 else payload[0]) as response:
+                    if response.status != 200:
+                        raise IOError(f"Error sending JSON-RPC request to {self._jsonrpc_url}. "
+                                      f"HTTP status is {response.status}.")
+                    responses: Union[List[Dict[str, Any]], Dict[str, Any]] = await response.json(content_type=None)
+        except asyncio.CancelledError:
+            for _, _, future in pending_calls:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, _, future in pending_calls:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        if isinstance(responses, dict):
+            responses = [responses]
+        responses_by_id: Dict[int, Dict[str, Any]] = {r.get("id"): r for r in responses if isinstance(r, dict)}
+        for request_id, (method, params, future) in enumerate(pending_calls):
+            if future.done():
+                continue
+            call_response: Optional[Dict[str, Any]] = responses_by_id.get(request_id)
+            if call_response is None:
+                # A node rejects a whole batch with a single error response without an ID.
+                error: Any = responses[0].get("error") if len(responses) == 1 else None
+                if error is not None:
+                    future.set_exception(JSONRPCError(error))
+                else:
+                    future.set_exception(IOError(f"No response to JSON-RPC call {method}."))
+            elif "error" in call_response:
+                future.set_exception(JSONRPCError(call_response["error"]))
+            else:
+                future.set_result(call_response.get("result"))
+
+    async def block_number(self) -> int:
+        return await self.request("eth_blockNumber", [])
+
+    async def gas_price(self) -> int:
+        return await self.request("eth_gasPrice", [])
+
+    async def get_block(self, block_identifier: BlockIdentifier, full_transactions: bool = False) -> AttributeDict:
+        if _is_block_hash(block_identifier):
+            return await self.request("eth_getBlockByHash", [_to_hex(block_identifier), full_transactions])
+        return await self.request("eth_getBlockByNumber", [_block_param(block_identifier), full_transactions])
+
+    async def get_transaction_receipt(self, tx_hash: Union[str, bytes]) -> Optional[AttributeDict]:
+        return await self.request("eth_getTransactionReceipt", [_to_hex(tx_hash)])
+
+    async def get_balance(self, address: str, block_identifier: BlockIdentifier = "latest") -> int:
+        return await self.request("eth_getBalance", [address, _block_param(block_identifier)])
+
+    async def call(self, to: str, data: Union[str, bytes], block_identifier: BlockIdentifier = "latest") -> HexBytes:
+        return await self.request("eth_call", [{"to": to, "data": _to_hex(data)}, _block_param(block_identifier)])
+
+    async def get_transaction_count(self, address: str, block_identifier: BlockIdentifier = "pending") -> int:
+        return await self.request("eth_getTransactionCount", [address, _block_param(block_identifier)])
+
+    async def get_logs(self, filter_params: Dict[str, Any]) -> List[AttributeDict]:
+        return await self.request("eth_getLogs", [filter_params_formatter(filter_params)])
+
+    async def estimate_gas(self, transaction: Dict[str, Any]) -> int:
+        return await self.request("eth_estimateGas", [_transaction_param(transaction)])
+
+    async def send_raw_transaction(self, raw_transaction: Union[str, bytes]) -> HexBytes:
+        return await self.request("eth_sendRawTransaction", [_to_hex(raw_transaction)])
+
+    async def call_function(self, contract_function: ContractFunction, block_identifier: BlockIdentifier = "latest") -> Any:
+        """
+        Async equivalent of web3's `contract_function.call()`, with the same return value decoding.
+        """
+        return_data: HexBytes = await self.call(contract_function.address,
+                                                contract_function._encode_transaction_data(),
+                                                block_identifier)
+        output_types: List[str] = get_abi_output_types(contract_function.abi)
+        output_data: List[Any] = map_abi_data(BASE_RETURN_NORMALIZERS, output_types,
+                                              decode_abi(output_types, return_data))
+        return output_data[0] if len(output_data) == 1 else output_data
@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+
+from collections import OrderedDict
+from hexbytes import HexBytes
+import logging
+import os
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Union,
+)
+import ujson
+from web3.datastructures import AttributeDict
+
+from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.metrics import (
+    Counter,
+    MetricsRegistry,
+)
+from hummingbot.logger import HummingbotLogger
+from hummingbot.wallet.ethereum.async_jsonrpc_client import AsyncJSONRPCClient
+
+ETHEREUM_BLOCK_CACHE_LOOKUPS: Counter = MetricsRegistry.get_instance().counter(
+    "ethereum_block_cache_lookups",
+    "Block header and transaction receipt lookups in the shared block cache, by kind and result (hit or miss).",
+    ["kind", "result"]
+)
+HEADER_FIELDS = ("number", "hash", "parentHash", "timestamp", "logsBloom")
+PERSISTED_HEADER_FIELDS = ("number", "hash", "parentHash", "timestamp")
+
+
+class BlockCache:
+    """
+    Size bounded LRU cache of block headers - and so block timestamps - and transaction receipts, shared by the block
+    watchers and the wallet backend so a block or receipt is only fetched from the node once.
+
+    Receipts of blocks replaced by a chain reorganization are invalidated with their block. Given a path, the headers
+    are saved when the wallet backend stops and loaded back on the next start, so restarts don't refetch the
+    timestamps of recent blocks.
+    """
+    _bc_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._bc_logger is None:
+            cls._bc_logger = logging.getLogger(__name__)
+        return cls._bc_logger
+
+    def __init__(self, max_headers: int = 1000, max_receipts: int = 1000, path: Optional[str] = None):
+        self._max_headers: int = max_headers
+        self._max_receipts: int = max_receipts
+        self._path: Optional[str] = path
+        self._headers: OrderedDict = OrderedDict()
+        self._receipts: OrderedDict = OrderedDict()
+        self._header_hits = ETHEREUM_BLOCK_CACHE_LOOKUPS.labels("header", "hit")
+        self._header_misses = ETHEREUM_BLOCK_CACHE_LOOKUPS.labels("header", "miss")
+        self._receipt_hits = ETHEREUM_BLOCK_CACHE_LOOKUPS.labels("receipt", "hit")
+        self._receipt_misses = ETHEREUM_BLOCK_CACHE_LOOKUPS.labels("receipt", "miss")
+
+    @property
+    def path(self) -> Optional[str]:
+        return self._path
+
+    def __len__(self) -> int:
+        return len(self._headers)
+
+    def add_block(self, block: AttributeDict):
+        header: AttributeDict = AttributeDict({key: block[key] for key in HEADER_FIELDS if key in block})
+        self._headers[HexBytes(block.hash)] = header
+        self._headers.move_to_end(HexBytes(block.hash))
+        while len(self._headers) > self._max_headers:
+            self._headers.popitem(last=False)
+
+    def get_header(self, block_hash: Union[str, bytes]) -> Optional[AttributeDict]:
+        header: Optional[AttributeDict] = self._headers.get(HexBytes(block_hash))
+        if header is None:
+            self._header_misses.inc()
+            return None
+        self._header_hits.inc()
+        self._headers.move_to_end(HexBytes(block_hash))
+        return header
+
+    def add_receipt(self, receipt: AttributeDict):
+        if receipt is None or receipt.get("blockHash") is None:
+            # Receipts of pending transactions change once mined.
+            return
+        self._receipts[HexBytes(receipt.transactionHash)] = receipt
+        self._receipts.move_to_end(HexBytes(receipt.transactionHash))
+        while len(self._receipts) > self._max_receipts:
+            self._receipts.popitem(last=False)
+
+    def get_receipt(self, tx_hash: Union[str, bytes]) -> Optional[AttributeDict]:
+        receipt: Optional[AttributeDict] = self._receipts.get(HexBytes(tx_hash))
+        if receipt is None:
+            self._receipt_misses.inc()
+            return None
+        self._receipt_hits.inc()
+        self._receipts.move_to_end(HexBytes(tx_hash))
+        return receipt
+
+    def invalidate_block(self, block_hash: Union[str, bytes]):
+        """
+        Drops a block replaced by a chain reorganization, and the receipts of the transactions mined in it.
+        """
+        block_hash = HexBytes(block_hash)
+        self._headers.pop(block_hash, None)
+        for tx_hash in [tx_hash for tx_hash, receipt in self._receipts.items() if receipt.blockHash == block_hash]:
+            del self._receipts[tx_hash]
+
+    async def get_timestamp(self, jsonrpc_client: AsyncJSONRPCClient, block_hash: Union[str, bytes]) -> Optional[int]:
+        header: Optional[AttributeDict] = self.get_header(block_hash)
+        if header is None:
+            header = await jsonrpc_client.get_block(block_hash, full_transactions=False)
+            if header is None:
+                return None
+            self.add_block(header)
+        return header.timestamp
+
+    async def get_receipts(self,
+                           jsonrpc_client: AsyncJSONRPCClient,
+                           tx_hashes: Iterable[Union[str, bytes]]) -> List[Optional[AttributeDict]]:
+        """
+        :return: the receipt of each transaction, or None for transactions not mined yet. Cache misses are fetched
+                 from the node in a single JSON-RPC batch.
+        """
+        tx_hashes = list(tx_hashes)
+        receipts: List[Optional[AttributeDict]] = [self.get_receipt(tx_hash) for tx_hash in tx_hashes]
+        missing_indices: List[int] = [i for i, receipt in enumerate(receipts) if receipt is None]
+        fetched_receipts: List[Optional[AttributeDict]] = await safe_gather(*[
+            jsonrpc_client.get_transaction_receipt(tx_hashes[i]) for i in missing_indices
+        ])
+        for i, receipt in zip(missing_indices, fetched_receipts):
+            self.add_receipt(receipt)
+            receipts[i] = receipt
+        return receipts
+
+    def load(self):
+        if self._path is None or not os.path.exists(self._path):
+            return
+        try:
+            with open(self._path) as fd:
+                saved_headers: List[Dict[str, Any]] = ujson.load(fd).get("headers", [])
+            for saved_header in saved_headers[-self._max_headers:]:
+                self.add_block(AttributeDict({
+                    "number": saved_header["number"],
+                    "hash": HexBytes(saved_header["hash"]),
+                    "parentHash": HexBytes(saved_header["parentHash"]),
+                    "timestamp": saved_header["timestamp"],
+                }))
+        except Exception:
+            self.logger().warning(f"Error loading the Ethereum block cache from {self._path}. Starting empty.",
+                                  exc_info=True)
+
+    def save(self):
+        if self._path is None:
+            return
+        try:
+            saved_headers: List[Dict[str, Any]] = [
+                {key: (header[key].hex() if isinstance(header[key], bytes) else header[key])
+                 for key in PERSISTED_HEADER_FIELDS}
+                for header in self._headers.values()
+            ]
+            temp_path: str = f"{self._path}.tmp"
+            with open(temp_path, "w") as fd:
+                ujson.dump({"headers": saved_headers}, fd)
+            os.replace(temp_path, self._path)
+        except Exception:
+            self.logger().warning(f"Error saving the Ethereum block cache to {self._path}.", exc_info=True)
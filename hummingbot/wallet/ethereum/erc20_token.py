@@ -19,6 +19,7 @@ from web3.contract import (
 from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
 from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.logger import HummingbotLogger
+from hummingbot.wallet.ethereum.async_jsonrpc_client import AsyncJSONRPCClient
 from hummingbot.wallet.ethereum.ethereum_chain import EthereumChain
 
 
@@ -54,9 +55,11 @@ class ERC20Token:
     def __init__(self,
                  w3: Web3,
                  address: str,
-                 chain: EthereumChain = EthereumChain.ROPSTEN):
+                 chain: EthereumChain = EthereumChain.ROPSTEN,
+                 jsonrpc_client: Optional[AsyncJSONRPCClient] = None):
         self._address = address
         self._w3: Web3 = w3
+        self._jsonrpc_client: Optional[AsyncJSONRPCClient] = jsonrpc_client
         self._chain = chain
         self._abi: List[any] = abi
         if chain is EthereumChain.MAIN_NET:
@@ -81,23 +84,24 @@ class ERC20Token:
         self._symbol: Optional[str] = None
         self._decimals: Optional[int] = None
 
+    @staticmethod
+    def decode_string(raw_value: Union[str, bytes]) -> str:
+        # Some tokens, e.g. MKR, return their name and symbol as bytes32.
+        if isinstance(raw_value, bytes):
+            return raw_value.split(b"\x00")[0].decode("utf8")
+        return raw_value
+
     @classmethod
     def get_symbol_from_contract(cls, contract: Contract) -> str:
-        raw_symbol: Union[str, bytes] = contract.functions.symbol().call()
-        if isinstance(raw_symbol, bytes):
-            retval: str = raw_symbol.split(b"\x00")[0].decode("utf8")
-        else:
-            retval: str = raw_symbol
-        return retval
+        return cls.decode_string(contract.functions.symbol().call())
 
     @classmethod
     def get_name_from_contract(cls, contract: Contract) -> str:
-        raw_name: Union[str, bytes] = contract.functions.name().call()
-        if isinstance(raw_name, bytes):
-            retval: str = raw_name.split(b"\x00")[0].decode("utf8")
-        else:
-            retval: str = raw_name
-        return retval
+        return cls.decode_string(contract.functions.name().call())
+
+    @classmethod
+    async def get_symbol_from_contract_async(cls, jsonrpc_client: AsyncJSONRPCClient, contract: Contract) -> str:
+        return cls.decode_string(await jsonrpc_client.call_function(contract.functions.symbol()))
 
     @property
     def address(self) -> str:
@@ -115,19 +119,26 @@ class ERC20Token:
         if self._name is not None and self._symbol is not None and self._decimals is not None:
             return
 
-        tasks: List[Coroutine] = [
-            AsyncCallScheduler.shared_instance().call_async(func, *args)
-            for func, args in [
-                (self.get_name_from_contract, [self._contract]),
-                (self.get_symbol_from_contract, [self._contract]),
-                (self._contract.functions.decimals().call, [])
+        if self._jsonrpc_client is not None:
+            tasks: List[Coroutine] = [
+                self._jsonrpc_client.call_function(self._contract.functions.name()),
+                self._jsonrpc_client.call_function(self._contract.functions.symbol()),
+                self._jsonrpc_client.call_function(self._contract.functions.decimals())
+            ]
+        else:
+            tasks: List[Coroutine] = [
+                AsyncCallScheduler.shared_instance().call_async(func)
+                for func in [
+                    self._contract.functions.name().call,
+                    self._contract.functions.symbol().call,
+                    self._contract.functions.decimals().call
+                ]
             ]
-        ]
 
         try:
             name, symbol, decimals = await safe_gather(*tasks)
-            self._name = name
-            self._symbol = symbol
+            self._name = self.decode_string(name)
+            self._symbol = self.decode_string(symbol)
             self._decimals = decimals
         except asyncio.CancelledError:
             raise
@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+
+from eth_utils import keccak
+from functools import lru_cache
+from hexbytes import HexBytes
+from typing import (
+    Iterable,
+    Union,
+)
+
+BLOOM_BITS = 2048
+
+
+@lru_cache(maxsize=4096)
+def bloom_mask(value: Union[str, bytes]) -> int:
+    """
+    :return: the 3 bits a log address or topic sets in a 2048 bit logs bloom, as an integer mask.
+    """
+    value_hash: bytes = keccak(HexBytes(value))
+    mask: int = 0
+    for i in range(0, 6, 2):
+        mask |= 1 << (((value_hash[i] << 8) | value_hash[i + 1]) % BLOOM_BITS)
+    return mask
+
+
+def bloom_to_int(logs_bloom: Union[str, bytes]) -> int:
+    return int.from_bytes(HexBytes(logs_bloom), "big")
+
+
+def bloom_contains(bloom: int, mask: int) -> bool:
+    """
+    A bloom can have false positives, but no false negatives: False means the value is not in any log of the block.
+    """
+    return bloom & mask == mask
+
+
+def bloom_contains_any(bloom: int, masks: Iterable[int]) -> bool:
+    return any(bloom & mask == mask for mask in masks)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+
+from eth_abi import (
+    decode_abi,
+    decode_single,
+    encode_abi,
+    encode_single,
+)
+from eth_utils import function_signature_to_4byte_selector
+from hexbytes import HexBytes
+import logging
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.logger import HummingbotLogger
+from hummingbot.wallet.ethereum.async_jsonrpc_client import (
+    AsyncJSONRPCClient,
+    BlockIdentifier,
+)
+from hummingbot.wallet.ethereum.ethereum_chain import EthereumChain
+
+# MakerDAO Multicall contract deployments.
+MULTICALL_ADDRESSES: Dict[EthereumChain, str] = {
+    EthereumChain.MAIN_NET: "0xeefBa1e63905eF1D7ACbA5a8513c70307C1cE441",
+    EthereumChain.KOVAN: "0x2cc8688C5f75E365aaEEb4ea8D6a480405A48D2A",
+    EthereumChain.RINKEBY: "0x42Ad527de7d4e9d9d011aC45B31D8551f8Fe9821",
+}
+AGGREGATE_SELECTOR: bytes = function_signature_to_4byte_selector("aggregate((address,bytes)[])")
+GET_ETH_BALANCE_SELECTOR: bytes = function_signature_to_4byte_selector("getEthBalance(address)")
+BALANCE_OF_SELECTOR: bytes = function_signature_to_4byte_selector("balanceOf(address)")
+
+s_logger: Optional[HummingbotLogger] = None
+
+
+def logger() -> HummingbotLogger:
+    global s_logger
+    if s_logger is None:
+        s_logger = logging.getLogger(__name__)
+    return s_logger
+
+
+async def aggregate(jsonrpc_client: AsyncJSONRPCClient,
+                    multicall_address: str,
+                    calls: List[Tuple[str, bytes]],
+                    block_identifier: BlockIdentifier = "latest") -> Tuple[int, List[bytes]]:
+    """
+    Runs a list of (contract address, call data) contract calls in a single eth_call to the Multicall contract.
+
+    :return: the block number the calls were run at, and the return data of each call.
+    """
+    data: bytes = AGGREGATE_SELECTOR + encode_abi(["(address,bytes)[]"], [calls])
+    result: HexBytes = await jsonrpc_client.call(multicall_address, data, block_identifier)
+    block_number, return_data = decode_abi(["uint256", "bytes[]"], result)
+    return block_number, list(return_data)
+
+
+async def get_account_balances(jsonrpc_client: AsyncJSONRPCClient,
+                               chain: EthereumChain,
+                               account_address: str,
+                               token_addresses: List[str],
+                               block_identifier: BlockIdentifier = "latest") -> Tuple[int, List[int]]:
+    """
+    Fetches the ETH balance and the token balances of an account in one eth_call through the Multicall contract, so
+    all the balances are read at the same block. Falls back to batched eth_getBalance and balanceOf calls on chains
+    without a known Multicall contract, or if the Multicall call fails.
+
+    :param block_identifier: the block to read the balances at - a block number, or "latest".
+
+    :return: the raw ETH balance, and the raw balance of each token.
+    """
+    encoded_account: bytes = encode_single("address", account_address)
+    multicall_address: Optional[str] = MULTICALL_ADDRESSES.get(chain)
+    if multicall_address is not None:
+        calls: List[Tuple[str, bytes]] = [(token_address, BALANCE_OF_SELECTOR + encoded_account)
+                                          for token_address in token_addresses]
+        calls.append((multicall_address, GET_ETH_BALANCE_SELECTOR + encoded_account))
+        try:
+            _, return_data = await aggregate(jsonrpc_client, multicall_address, calls, block_identifier)
+            balances: List[int] = [decode_single("uint256", data) for data in return_data]
+            return balances[-1], balances[:-1]
+        except Exception:
+            logger().debug("Error fetching account balances through Multicall. Falling back to individual calls.",
+                           exc_info=True)
+
+    results: List[int] = await safe_gather(
+        jsonrpc_client.get_balance(account_address, block_identifier),
+        *[jsonrpc_client.call(token_address, BALANCE_OF_SELECTOR + encoded_account, block_identifier)
+          for token_address in token_addresses]
+    )
+    return results[0], [decode_single("uint256", data) for data in results[1:]]
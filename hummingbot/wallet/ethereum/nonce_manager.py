@@ -0,0 +1,261 @@
+#!/usr/bin/env python
+
+import asyncio
+from eth_account.local import LocalAccount
+import logging
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+)
+from web3.datastructures import AttributeDict
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.metrics import (
+    Counter,
+    MetricsRegistry,
+)
+from hummingbot.logger import HummingbotLogger
+from hummingbot.wallet.ethereum.async_jsonrpc_client import (
+    AsyncJSONRPCClient,
+    JSONRPCError,
+)
+
+ETHEREUM_TRANSACTIONS_SENT: Counter = MetricsRegistry.get_instance().counter(
+    "ethereum_transactions_sent",
+    "Raw transactions sent to the Ethereum node, by kind (new, rebroadcast, replacement or gap filler) and result.",
+    ["kind", "result"]
+)
+# Errors of nodes that already have the transaction in their pool.
+KNOWN_TRANSACTION_ERRORS = ("known transaction", "already known", "already imported")
+
+
+class PendingTransaction:
+    def __init__(self,
+                 transaction: Dict[str, Any],
+                 signed_transaction: AttributeDict,
+                 original_tx_hash: Optional[str] = None,
+                 kind: str = "new"):
+        self.transaction: Dict[str, Any] = transaction
+        self.signed_transaction: AttributeDict = signed_transaction
+        self.original_tx_hash: str = original_tx_hash or self.tx_hash
+        self.kind: str = kind
+        self.replaced: Optional[PendingTransaction] = None
+        self.last_sent_timestamp: float = 0.0
+
+    @property
+    def nonce(self) -> int:
+        return self.transaction["nonce"]
+
+    @property
+    def gas_price(self) -> int:
+        return self.transaction["gasPrice"]
+
+    @property
+    def tx_hash(self) -> str:
+        return self.signed_transaction.hash.hex()
+
+
+class NonceManager:
+    """
+    Allocates the nonces of the wallet's transactions locally, and sends them to the node concurrently - the raw
+    transactions sent within a JSON-RPC batch window go to the node in a single request.
+
+    The transactions are kept until mined, which is checked against the node's transaction counts on every new block:
+
+    * A nonce left unused by a transaction the node rejected would hold up every later transaction. It is filled with
+      a zero value transfer to the wallet itself.
+    * Transactions that failed to reach the node are sent again after `RESEND_DELAY` seconds, and transactions the
+      node doesn't count as pending anymore - e.g. dropped from its pool - on the next block.
+    * Optionally, transactions still not mined after `stuck_transaction_timeout` seconds are replaced by the same
+      transaction at a higher gas price.
+
+    New transaction hashes - replacements and gap fillers - are reported through `track_transaction_callback` with the
+    hash of the transaction they stand for, and rejected transactions through `transaction_failure_callback`.
+    """
+    GAS_PRICE_BUMP = 1.125  # Nodes only accept replacements paying at least 10% more gas.
+    REBROADCAST_INTERVAL = 60.0
+    RESEND_DELAY = 5.0
+    GAP_FILLER_GAS = 21000
+
+    _nm_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._nm_logger is None:
+            cls._nm_logger = logging.getLogger(__name__)
+        return cls._nm_logger
+
+    def __init__(self,
+                 account: LocalAccount,
+                 jsonrpc_client: AsyncJSONRPCClient,
+                 chain_id: int,
+                 track_transaction_callback: Callable[[str, int, str], None],
+                 transaction_failure_callback: Callable[[str], None],
+                 max_concurrent_sends: int = 16,
+                 stuck_transaction_timeout: Optional[float] = None):
+        self._account: LocalAccount = account
+        self._jsonrpc_client: AsyncJSONRPCClient = jsonrpc_client
+        self._chain_id: int = chain_id
+        self._track_transaction_callback: Callable[[str, int, str], None] = track_transaction_callback
+        self._transaction_failure_callback: Callable[[str], None] = transaction_failure_callback
+        self._stuck_transaction_timeout: Optional[float] = stuck_transaction_timeout
+        self._send_semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrent_sends)
+        self._send_queue: asyncio.Queue = asyncio.Queue()
+        # The first nonce allocated by this manager. Transactions below it were sent before it started.
+        self._base_nonce: int = -1
+        self._next_nonce: int = -1
+        self._pending_transactions: Dict[int, PendingTransaction] = {}
+
+    @property
+    def next_nonce(self) -> int:
+        return self._next_nonce
+
+    def reset(self, pending_nonce: int):
+        self._base_nonce = self._next_nonce = pending_nonce
+        self._pending_transactions.clear()
+
+    def submit(self, transaction: Dict[str, Any], signed_transaction: AttributeDict):
+        pending_transaction: PendingTransaction = PendingTransaction(transaction, signed_transaction)
+        self._pending_transactions[pending_transaction.nonce] = pending_transaction
+        self._next_nonce = max(self._next_nonce, pending_transaction.nonce + 1)
+        self._send_queue.put_nowait(pending_transaction)
+
+    async def send_transactions_loop(self):
+        while True:
+            pending_transaction: PendingTransaction = await self._send_queue.get()
+            await self._send_semaphore.acquire()
+            safe_ensure_future(self._send_transaction(pending_transaction))
+
+    async def _send_transaction(self, pending_transaction: PendingTransaction):
+        tx_hash: str = pending_transaction.tx_hash
+        try:
+            pending_transaction.last_sent_timestamp = time.time()
+            await self._jsonrpc_client.send_raw_transaction(pending_transaction.signed_transaction.rawTransaction)
+            ETHEREUM_TRANSACTIONS_SENT.labels(pending_transaction.kind, "sent").inc()
+        except asyncio.CancelledError:
+            raise
+        except JSONRPCError as e:
+            if any(error in str(e).lower() for error in KNOWN_TRANSACTION_ERRORS):
+                ETHEREUM_TRANSACTIONS_SENT.labels(pending_transaction.kind, "sent").inc()
+                return
+            ETHEREUM_TRANSACTIONS_SENT.labels(pending_transaction.kind, "rejected").inc()
+            self._did_reject_transaction(pending_transaction, e)
+        except Exception:
+            # The transaction may or may not have reached the node. Sending it again is harmless either way.
+            ETHEREUM_TRANSACTIONS_SENT.labels(pending_transaction.kind, "error").inc()
+            self.logger().network(f"Error sending transaction {tx_hash}.", exc_info=True,
+                                  app_warning_msg=f"Error sending transaction {tx_hash}. "
+                                                  f"Check wallet network connection")
+            asyncio.get_event_loop().call_later(self.RESEND_DELAY, self._resend_transaction, pending_transaction)
+        finally:
+            self._send_semaphore.release()
+
+    def _resend_transaction(self, pending_transaction: PendingTransaction):
+        if self._pending_transactions.get(pending_transaction.nonce) is not pending_transaction:
+            # Mined, rejected or replaced in the meantime.
+            return
+        pending_transaction.kind = "rebroadcast"
+        self._send_queue.put_nowait(pending_transaction)
+
+    def _did_reject_transaction(self, pending_transaction: PendingTransaction, error: Exception):
+        tx_hash: str = pending_transaction.tx_hash
+        if self._pending_transactions.get(pending_transaction.nonce) is not pending_transaction:
+            return
+        if pending_transaction.replaced is not None:
+            # The replaced transaction is still in the node's pool.
+            self.logger().warning(f"The node rejected the replacement transaction {tx_hash} - {error}.")
+            pending_transaction.replaced.last_sent_timestamp = time.time()
+            self._pending_transactions[pending_transaction.nonce] = pending_transaction.replaced
+            return
+        self.logger().network(f"The node rejected the transaction {tx_hash} - {error}.",
+                              app_warning_msg=f"Error sending transaction {tx_hash}. {error}")
+        # The nonce is now a gap, filled on the next block.
+        del self._pending_transactions[pending_transaction.nonce]
+        self._transaction_failure_callback(pending_transaction.original_tx_hash)
+
+    def update(self, latest_nonce: int, pending_nonce: int, gas_price: int):
+        """
+        Checks the pending transactions against the node's transaction counts for the wallet address.
+
+        :param latest_nonce: the number of mined transactions.
+        :param pending_nonce: the number of transactions, including the ones pending in the node's pool.
+        :param gas_price: the current gas price, for gap fillers and replacements.
+        """
+        if self._next_nonce < 0:
+            return
+        for nonce in [nonce for nonce in self._pending_transactions.keys() if nonce < latest_nonce]:
+            del self._pending_transactions[nonce]
+        # Transactions sent from the same account by something else.
+        self._next_nonce = max(self._next_nonce, pending_nonce)
+
+        now: float = time.time()
+        for nonce in range(max(latest_nonce, self._base_nonce), self._next_nonce):
+            pending_transaction: Optional[PendingTransaction] = self._pending_transactions.get(nonce)
+            if pending_transaction is None:
+                if nonce >= pending_nonce:
+                    self._fill_nonce_gap(nonce, gas_price)
+            elif pending_transaction.last_sent_timestamp == 0:
+                # Not sent yet.
+                continue
+            elif (self._stuck_transaction_timeout is not None and
+                    now - pending_transaction.last_sent_timestamp > self._stuck_transaction_timeout):
+                self._replace_transaction(pending_transaction, gas_price)
+            elif nonce >= pending_nonce and now - pending_transaction.last_sent_timestamp > self.REBROADCAST_INTERVAL:
+                pending_transaction.kind = "rebroadcast"
+                self._send_queue.put_nowait(pending_transaction)
+
+    def _sign_and_send(self,
+                       transaction: Dict[str, Any],
+                       original_tx_hash: Optional[str],
+                       kind: str) -> PendingTransaction:
+        signed_transaction: AttributeDict = self._account.signTransaction(transaction)
+        pending_transaction: PendingTransaction = PendingTransaction(transaction, signed_transaction,
+                                                                     original_tx_hash=original_tx_hash, kind=kind)
+        self._pending_transactions[pending_transaction.nonce] = pending_transaction
+        self._track_transaction_callback(pending_transaction.tx_hash,
+                                         pending_transaction.gas_price,
+                                         pending_transaction.original_tx_hash)
+        self._send_queue.put_nowait(pending_transaction)
+        return pending_transaction
+
+    def _fill_nonce_gap(self, nonce: int, gas_price: int):
+        self.logger().info(f"Filling the gap at nonce {nonce} with an empty transaction.")
+        self._sign_and_send({
+            "to": self._account.address,
+            "value": 0,
+            "gas": self.GAP_FILLER_GAS,
+            "gasPrice": gas_price,
+            "nonce": nonce,
+            "chainId": self._chain_id
+        }, original_tx_hash=None, kind="gap_filler")
+
+    def _replace_transaction(self, pending_transaction: PendingTransaction, gas_price: int):
+        new_gas_price: int = max(gas_price, int(pending_transaction.gas_price * self.GAS_PRICE_BUMP) + 1)
+        self.logger().info(f"Transaction {pending_transaction.tx_hash} is not mined after "
+                           f"{self._stuck_transaction_timeout} seconds. Replacing it with a gas price of "
+                           f"{new_gas_price * 1e-9:.2f} gwei.")
+        replacement: PendingTransaction = self._sign_and_send(
+            dict(pending_transaction.transaction, gasPrice=new_gas_price),
+            original_tx_hash=pending_transaction.original_tx_hash,
+            kind="replacement"
+        )
+        replacement.replaced = pending_transaction
+
+    def replace_transaction(self, tx_hash: str, gas_price: int) -> Optional[str]:
+        """
+        Replaces a pending transaction with the same transaction at a higher gas price.
+
+        :return: the hash of the replacement, or None if the transaction isn't pending.
+        """
+        for pending_transaction in self._pending_transactions.values():
+            if tx_hash in (pending_transaction.tx_hash, pending_transaction.original_tx_hash):
+                self._replace_transaction(pending_transaction, gas_price)
+                return self._pending_transactions[pending_transaction.nonce].tx_hash
+        return None
+
+    def get_pending_transactions(self) -> List[PendingTransaction]:
+        return [self._pending_transactions[nonce] for nonce in sorted(self._pending_transactions.keys())]
@@ -3,11 +3,12 @@
 import asyncio
 import logging
 import math
+import time
 from typing import (
     List,
     Dict,
     Optional,
-    Coroutine
+    Tuple,
 )
 from web3 import Web3
 from web3.contract import Contract
@@ -15,17 +16,60 @@ from web3.datastructures import AttributeDict
 
 from hummingbot.logger import HummingbotLogger
 from hummingbot.wallet.ethereum.erc20_token import ERC20Token
-from hummingbot.core.event.events import NewBlocksWatcherEvent
+from hummingbot.core.event.events import (
+    ERC20WatcherEvent,
+    EthereumGasUsedEvent,
+    IncomingEthWatcherEvent,
+    NewBlocksWatcherEvent,
+    WalletEvent,
+    WalletReceivedAssetEvent,
+    WalletSentAssetEvent,
+    WalletUnwrappedEthEvent,
+    WalletWrappedEthEvent,
+)
 from hummingbot.core.event.event_forwarder import EventForwarder
-from hummingbot.core.utils.async_utils import (
-    safe_ensure_future,
-    safe_gather,
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.metrics import (
+    Counter,
+    MetricsRegistry,
 )
+from hummingbot.wallet.ethereum.async_jsonrpc_client import AsyncJSONRPCClient
+from hummingbot.wallet.ethereum.ethereum_chain import EthereumChain
+from hummingbot.wallet.ethereum.multicall import get_account_balances
 from .base_watcher import BaseWatcher
+from .erc20_events_watcher import ERC20EventsWatcher
+from .incoming_eth_watcher import IncomingEthWatcher
 from .new_blocks_watcher import NewBlocksWatcher
+from .weth_watcher import WethWatcher
+
+ETHEREUM_BALANCE_RECONCILIATIONS: Counter = MetricsRegistry.get_instance().counter(
+    "ethereum_balance_reconciliations",
+    "Full account balance refreshes, by whether the balances tracked from events had drifted (drift) or not (match).",
+    ["result"]
+)
+
+# (block number, asset name, raw balance change)
+BalanceDelta = Tuple[int, str, int]
 
 
 class AccountBalanceWatcher(BaseWatcher):
+    """
+    Tracks the ETH and token balances of an account from the events of the other wallet watchers, instead of querying
+    every balance on every new block:
+
+    * Token transfers to and from the account, from the ERC20 events watcher.
+    * Incoming ETH transfers, from the incoming ETH watcher.
+    * WETH deposits and withdrawals, from the WETH watcher.
+    * The gas and the ETH value spent by the account's own transactions, reported by the wallet backend through
+      `did_use_gas()`.
+
+    Changes the events don't show - e.g. ETH sent by a contract, or transactions sent from the same account by another
+    program - are corrected by a full refresh every `reconciliation_interval` seconds. The refresh reads the balances
+    at the latest block received, and the changes from the events of later blocks - by block number, since consecutive
+    blocks can share a timestamp - are applied on top of it.
+
+    Without the ERC20 events and incoming ETH watchers, all the balances are refreshed on every new block.
+    """
     _abw_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -39,8 +83,19 @@ class AccountBalanceWatcher(BaseWatcher):
                  blocks_watcher: NewBlocksWatcher,
                  account_address: str,
                  erc20_addresses: List[str],
-                 erc20_abis: List[any]):
-        super().__init__(w3)
+                 erc20_abis: List[any],
+                 jsonrpc_client: Optional[AsyncJSONRPCClient] = None,
+                 chain: EthereumChain = EthereumChain.ROPSTEN,
+                 erc20_events_watcher: Optional[ERC20EventsWatcher] = None,
+                 incoming_eth_watcher: Optional[IncomingEthWatcher] = None,
+                 weth_watcher: Optional[WethWatcher] = None,
+                 reconciliation_interval: float = 300.0):
+        super().__init__(w3, jsonrpc_client)
+        self._chain: EthereumChain = chain
+        self._erc20_events_watcher: Optional[ERC20EventsWatcher] = erc20_events_watcher
+        self._incoming_eth_watcher: Optional[IncomingEthWatcher] = incoming_eth_watcher
+        self._weth_watcher: Optional[WethWatcher] = weth_watcher
+        self._reconciliation_interval: float = reconciliation_interval
         self._blocks_watcher: NewBlocksWatcher = blocks_watcher
         self._account_address: str = account_address
         self._addresses_to_contracts: Dict[str, Contract] = {
@@ -51,18 +106,38 @@ class AccountBalanceWatcher(BaseWatcher):
         self._erc20_contracts: Dict[str, Contract] = {}
         self._erc20_decimals: Dict[str, int] = {}
         self._event_forwarder: EventForwarder = EventForwarder(self.did_receive_new_blocks)
+        self._received_asset_forwarder: EventForwarder = EventForwarder(self.did_receive_asset)
+        self._sent_asset_forwarder: EventForwarder = EventForwarder(self.did_send_asset)
+        self._wrapped_eth_forwarder: EventForwarder = EventForwarder(self.did_wrap_eth)
+        self._unwrapped_eth_forwarder: EventForwarder = EventForwarder(self.did_unwrap_eth)
         self._raw_account_balances: Dict[str, int] = {}
 
+        # The latest block received, and the number of the block the balances were last refreshed at.
+        self._latest_block: Optional[AttributeDict] = None
+        self._balances_block_number: int = -1
+        # Changes applied since the last refresh, from the events of blocks after it.
+        self._balance_deltas: List[BalanceDelta] = []
+        self._last_reconciliation_time: float = 0
+        self._update_balances_task: Optional[asyncio.Task] = None
+
     async def start_network(self):
         account_address: str = self._account_address
-        w3: Web3 = self._w3
 
         self._blocks_watcher.add_listener(NewBlocksWatcherEvent.NewBlocks, self._event_forwarder)
+        if self._erc20_events_watcher is not None:
+            self._erc20_events_watcher.add_listener(ERC20WatcherEvent.ReceivedToken, self._received_asset_forwarder)
+            self._erc20_events_watcher.add_listener(ERC20WatcherEvent.SentToken, self._sent_asset_forwarder)
+        if self._incoming_eth_watcher is not None:
+            self._incoming_eth_watcher.add_listener(IncomingEthWatcherEvent.ReceivedEther,
+                                                    self._received_asset_forwarder)
+        if self._weth_watcher is not None:
+            self._weth_watcher.add_listener(WalletEvent.WrappedEth, self._wrapped_eth_forwarder)
+            self._weth_watcher.add_listener(WalletEvent.UnwrappedEth, self._unwrapped_eth_forwarder)
 
         app_warning_msg: str = "Could not get ETH balance. Check Ethereum node connection."
         try:
             self._raw_account_balances: Dict[str, int] = {
-                "ETH": await self.call_async(w3.eth.getBalance, account_address, app_warning_msg=app_warning_msg)
+                "ETH": await self._jsonrpc_client.get_balance(account_address)
             }
         except asyncio.CancelledError:
             raise
@@ -73,12 +148,13 @@ class AccountBalanceWatcher(BaseWatcher):
             if len(self._erc20_contracts) < len(self._addresses_to_contracts):
                 for address, contract in self._addresses_to_contracts.items():
                     contract: Contract = contract
-                    asset_name: str = await self.call_async(ERC20Token.get_symbol_from_contract, contract)
-                    decimals: int = await self.call_async(contract.functions.decimals().call)
+                    asset_name: str = await ERC20Token.get_symbol_from_contract_async(self._jsonrpc_client,
+                                                                                      contract)
+                    decimals: int = await self._jsonrpc_client.call_function(contract.functions.decimals())
                     self._erc20_contracts[asset_name] = contract
                     self._erc20_decimals[asset_name] = decimals
-                    self._raw_account_balances[asset_name] = await self.call_async(
-                        contract.functions.balanceOf(account_address).call
+                    self._raw_account_balances[asset_name] = await self._jsonrpc_client.call_function(
+                        contract.functions.balanceOf(account_address)
                     )
         except asyncio.CancelledError:
             raise
@@ -93,6 +169,23 @@ class AccountBalanceWatcher(BaseWatcher):
 
     async def stop_network(self):
         self._blocks_watcher.remove_listener(NewBlocksWatcherEvent.NewBlocks, self._event_forwarder)
+        if self._erc20_events_watcher is not None:
+            self._erc20_events_watcher.remove_listener(ERC20WatcherEvent.ReceivedToken,
+                                                       self._received_asset_forwarder)
+            self._erc20_events_watcher.remove_listener(ERC20WatcherEvent.SentToken, self._sent_asset_forwarder)
+        if self._incoming_eth_watcher is not None:
+            self._incoming_eth_watcher.remove_listener(IncomingEthWatcherEvent.ReceivedEther,
+                                                       self._received_asset_forwarder)
+        if self._weth_watcher is not None:
+            self._weth_watcher.remove_listener(WalletEvent.WrappedEth, self._wrapped_eth_forwarder)
+            self._weth_watcher.remove_listener(WalletEvent.UnwrappedEth, self._unwrapped_eth_forwarder)
+        if self._update_balances_task is not None:
+            self._update_balances_task.cancel()
+            self._update_balances_task = None
+
+    @property
+    def event_driven(self) -> bool:
+        return self._erc20_events_watcher is not None and self._incoming_eth_watcher is not None
 
     @property
     def address(self) -> str:
@@ -122,24 +215,67 @@ class AccountBalanceWatcher(BaseWatcher):
             raise ValueError(f"{asset_name} is not a recognized asset in this watcher.")
         return self._erc20_decimals[asset_name]
 
-    def did_receive_new_blocks(self, _: List[AttributeDict]):
-        safe_ensure_future(self.update_balances())
+    def did_receive_new_blocks(self, new_blocks: List[AttributeDict]):
+        if len(new_blocks) > 0:
+            self._latest_block = new_blocks[-1]
+        if not self.event_driven or time.time() - self._last_reconciliation_time >= self._reconciliation_interval:
+            if self._update_balances_task is None or self._update_balances_task.done():
+                self._update_balances_task = safe_ensure_future(self.update_balances())
 
-    async def update_balances(self):
-        asset_symbols: List[str] = []
-        asset_update_tasks: List[Coroutine] = []
+    def did_receive_asset(self, received_asset_event: WalletReceivedAssetEvent):
+        self._apply_balance_delta(received_asset_event.block_number,
+                                  received_asset_event.asset_name,
+                                  received_asset_event.raw_amount_received)
+
+    def did_send_asset(self, sent_asset_event: WalletSentAssetEvent):
+        self._apply_balance_delta(sent_asset_event.block_number,
+                                  sent_asset_event.asset_name,
+                                  -sent_asset_event.raw_amount_sent)
 
-        for asset_name, contract in self._erc20_contracts.items():
-            asset_symbols.append(asset_name)
-            asset_update_tasks.append(self.call_async(contract.functions.balanceOf(self._account_address).call))
+    def did_wrap_eth(self, wrapped_eth_event: WalletWrappedEthEvent):
+        # The ETH side is the value of the deposit transaction, reported with its gas through did_use_gas().
+        self._apply_balance_delta(wrapped_eth_event.block_number, "WETH", wrapped_eth_event.raw_amount)
 
-        asset_symbols.append("ETH")
-        asset_update_tasks.append(self.call_async(self._w3.eth.getBalance, self._account_address))
+    def did_unwrap_eth(self, unwrapped_eth_event: WalletUnwrappedEthEvent):
+        self._apply_balance_delta(unwrapped_eth_event.block_number, "WETH", -unwrapped_eth_event.raw_amount)
+        self._apply_balance_delta(unwrapped_eth_event.block_number, "ETH", unwrapped_eth_event.raw_amount)
+
+    def did_use_gas(self, gas_used_event: EthereumGasUsedEvent, raw_eth_value: int = 0):
+        """
+        Accounts for a mined transaction sent from the account.
+
+        :param gas_used_event: the gas used event of the transaction.
+        :param raw_eth_value: the ETH value sent by the transaction, if it succeeded.
+        """
+        self._apply_balance_delta(gas_used_event.block_number, "ETH",
+                                  -(gas_used_event.eth_amount_raw + raw_eth_value))
+
+    def _apply_balance_delta(self, block_number: int, asset_name: str, raw_delta: int):
+        if asset_name not in self._raw_account_balances:
+            return
+        if block_number < 0 and self._latest_block is not None:
+            # Events without a block number are from a block already received.
+            block_number = self._latest_block.number
+        if block_number <= self._balances_block_number:
+            # The event's block was included in the last refresh.
+            return
+        self._balance_deltas.append((block_number, asset_name, raw_delta))
+        self._raw_account_balances[asset_name] += raw_delta
+
+    async def update_balances(self):
+        asset_symbols: List[str] = list(self._erc20_contracts.keys())
+        token_addresses: List[str] = [contract.address for contract in self._erc20_contracts.values()]
 
         try:
-            asset_raw_balances: List[int] = await safe_gather(*asset_update_tasks)
-            for asset_name, raw_balance in zip(asset_symbols, asset_raw_balances):
-                self._raw_account_balances[asset_name] = raw_balance
+            # The balances are read at a known block, so the changes from later blocks can be told apart.
+            block: AttributeDict = self._latest_block or await self._jsonrpc_client.get_block("latest")
+
+            # All the balances are fetched in one eth_call through the Multicall contract, where available.
+            eth_raw_balance, token_raw_balances = await get_account_balances(self._jsonrpc_client,
+                                                                             self._chain,
+                                                                             self._account_address,
+                                                                             token_addresses,
+                                                                             block.number)
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -147,3 +283,25 @@ class AccountBalanceWatcher(BaseWatcher):
                                   exc_info=True,
                                   app_warning_msg=f"Error account balance updates. "
                                                   f"Check Ethereum node connection.")
+            return
+
+        self._last_reconciliation_time = time.time()
+        if block.number < self._balances_block_number:
+            return
+
+        raw_balances: Dict[str, int] = dict(zip(asset_symbols, token_raw_balances))
+        raw_balances["ETH"] = eth_raw_balance
+        self._balance_deltas = [delta for delta in self._balance_deltas if delta[0] > block.number]
+        for _, asset_name, raw_delta in self._balance_deltas:
+            if asset_name in raw_balances:
+                raw_balances[asset_name] += raw_delta
+
+        if self._balances_block_number >= 0:
+            drifted_assets: List[str] = [asset_name for asset_name, raw_balance in raw_balances.items()
+                                         if self._raw_account_balances.get(asset_name) != raw_balance]
+            if len(drifted_assets) > 0:
+                self.logger().debug(f"Corrected the balances of {', '.join(drifted_assets)} at block {block.number}.")
+            ETHEREUM_BALANCE_RECONCILIATIONS.labels("drift" if len(drifted_assets) > 0 else "match").inc()
+
+        self._raw_account_balances.update(raw_balances)
+        self._balances_block_number = block.number
@@ -3,18 +3,21 @@
 import asyncio
 from typing import (
     Coroutine,
-    Callable
+    Callable,
+    Optional
 )
 from web3 import Web3
 
 from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
 from hummingbot.core.pubsub import PubSub
+from hummingbot.wallet.ethereum.async_jsonrpc_client import AsyncJSONRPCClient
 
 
 class BaseWatcher(PubSub):
-    def __init__(self, w3: Web3):
+    def __init__(self, w3: Web3, jsonrpc_client: Optional[AsyncJSONRPCClient] = None):
         super().__init__()
         self._w3: Web3 = w3
+        self._jsonrpc_client: AsyncJSONRPCClient = jsonrpc_client or AsyncJSONRPCClient(w3.providers[0].endpoint_uri)
         self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
 
     @staticmethod
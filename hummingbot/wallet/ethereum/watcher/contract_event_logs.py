@@ -1,27 +1,57 @@
 import asyncio
 from collections import OrderedDict
 import cytoolz
-import functools
+from eth_utils import (
+    encode_hex,
+    event_abi_to_log_topic,
+)
 from hexbytes import HexBytes
 import logging
 from typing import (
+    Any,
     Dict,
     List,
     Optional,
-    Set
+    Set,
+    Tuple
 )
 from web3 import Web3
 from web3.datastructures import AttributeDict
+from web3.utils.abi import filter_by_type
 from web3.utils.contracts import find_matching_event_abi
 from web3.utils.events import get_event_data
 from web3.utils.filters import construct_event_filter_params
 
-from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.metrics import (
+    Counter,
+    CounterChild,
+    MetricsRegistry,
+)
 from hummingbot.logger import HummingbotLogger
+from hummingbot.wallet.ethereum.async_jsonrpc_client import AsyncJSONRPCClient
+from hummingbot.wallet.ethereum.logs_bloom import (
+    bloom_contains,
+    bloom_contains_any,
+    bloom_mask,
+    bloom_to_int,
+)
 
 DEFAULT_WINDOW_SIZE = 100
 
+BLOOM_FILTERED_BLOCKS: Counter = MetricsRegistry.get_instance().counter(
+    "ethereum_bloom_filtered_blocks",
+    "New blocks whose logs bloom ruled out any watched event (skipped), or that were queried for logs (fetched).",
+    ["logger", "result"]
+)
+
+# (transaction hash, contract address, event name)
+EventKey = Tuple[HexBytes, str, str]
+
+
+def address_to_topic(address: str) -> str:
+    return "0x" + "00" * 12 + address[2:].lower()
+
 
 class ContractEventLogger:
     _cel_logger: Optional[HummingbotLogger] = None
@@ -36,10 +66,12 @@ class ContractEventLogger:
                  w3: Web3,
                  address: str,
                  contract_abi: List[Dict[str, any]],
-                 block_events_window_size: Optional[int] = DEFAULT_WINDOW_SIZE):
+                 block_events_window_size: Optional[int] = DEFAULT_WINDOW_SIZE,
+                 jsonrpc_client: Optional[AsyncJSONRPCClient] = None):
 
         super().__init__()
         self._w3: Web3 = w3
+        self._jsonrpc_client: AsyncJSONRPCClient = jsonrpc_client or AsyncJSONRPCClient(w3.providers[0].endpoint_uri)
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._block_events_window_size = block_events_window_size
         self._address: str = address
@@ -68,8 +100,7 @@ class ContractEventLogger:
                                                                contract_address=self._address)
         tasks = []
         for block_hash in block_hashes:
-            event_filter_params["blockHash"] = block_hash.hex()
-            tasks.append(self._get_logs(event_filter_params))
+            tasks.append(self._get_logs(dict(event_filter_params, blockHash=block_hash.hex())))
 
         raw_logs = await safe_gather(*tasks, return_exceptions=True)
         logs: List[any] = list(cytoolz.concat(raw_logs))
@@ -99,7 +130,6 @@ class ContractEventLogger:
     async def _get_logs(self,
                         event_filter_params: Dict[str, any],
                         max_tries: Optional[int] = 30) -> List[Dict[str, any]]:
-        async_scheduler: AsyncCallScheduler = AsyncCallScheduler.shared_instance()
         count: int = 0
         logs = []
         while True:
@@ -110,9 +140,7 @@ class ContractEventLogger:
                         f"Error fetching logs from block with filters: '{event_filter_params}'."
                     )
                     break
-                logs = await async_scheduler.call_async(
-                    functools.partial(self._w3.eth.getLogs, event_filter_params)
-                )
+                logs = await self._jsonrpc_client.get_logs(event_filter_params)
                 break
             except asyncio.CancelledError:
                 raise
@@ -120,3 +148,153 @@ class ContractEventLogger:
                 self.logger().debug(f"Block not found with filters: '{event_filter_params}'. Retrying...")
                 await asyncio.sleep(0.5)
         return logs
+
+
+class MultiContractEventLogger:
+    """
+    Fetches the events of several contracts with a single eth_getLogs query per event over a block range, instead of
+    one query per contract, per event and per block hash.
+
+    Indexed arguments can be filtered on the node by topic position, e.g. {2: [address]} for the recipient of ERC20
+    Transfer events. Logs from blocks other than the ones asked for - i.e. from a fork the blocks watcher hasn't
+    reorganized to yet - are left for the query of the replacement blocks, and already seen events are skipped.
+
+    Blocks whose logs bloom doesn't contain a watched contract, an event topic and one of the filtered indexed
+    arguments provably have no matching log, and are left out of the queried range - most new blocks, for a quiet
+    wallet, so most of the time no query is made at all.
+    """
+    _mcel_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._mcel_logger is None:
+            cls._mcel_logger = logging.getLogger(__name__)
+        return cls._mcel_logger
+
+    def __init__(self,
+                 w3: Web3,
+                 contract_abis: Dict[str, List[Dict[str, any]]],
+                 block_events_window_size: Optional[int] = DEFAULT_WINDOW_SIZE,
+                 jsonrpc_client: Optional[AsyncJSONRPCClient] = None,
+                 name: str = "contract_events"):
+        self._w3: Web3 = w3
+        self._jsonrpc_client: AsyncJSONRPCClient = jsonrpc_client or AsyncJSONRPCClient(w3.providers[0].endpoint_uri)
+        self._block_events_window_size = block_events_window_size
+        self._addresses: List[str] = [Web3.toChecksumAddress(address) for address in contract_abis.keys()]
+        self._address_bloom_masks: List[int] = [bloom_mask(address) for address in self._addresses]
+        self._skipped_blocks: CounterChild = BLOOM_FILTERED_BLOCKS.labels(name, "skipped")
+        self._fetched_blocks: CounterChild = BLOOM_FILTERED_BLOCKS.labels(name, "fetched")
+        # Contract address -> event topic -> event ABI
+        self._event_abis: Dict[str, Dict[str, Dict[str, any]]] = {
+            Web3.toChecksumAddress(address): {
+                encode_hex(event_abi_to_log_topic(event_abi)): event_abi
+                for event_abi in filter_by_type("event", contract_abi)
+            }
+            for address, contract_abi in contract_abis.items()
+        }
+        self._event_cache: Set[EventKey] = set()
+        self._block_events: OrderedDict = OrderedDict()
+
+    def _event_topic(self, event_name: str) -> str:
+        for event_abis in self._event_abis.values():
+            for topic, event_abi in event_abis.items():
+                if event_abi["name"] == event_name:
+                    return topic
+        raise ValueError(f"No contract has an event named '{event_name}'.")
+
+    def _may_contain_event(self, bloom: Optional[int], topics: List[Any]) -> bool:
+        if bloom is None:
+            return True
+        if not bloom_contains_any(bloom, self._address_bloom_masks):
+            return False
+        for topic in topics:
+            if topic is None:
+                continue
+            if isinstance(topic, list):
+                if not bloom_contains_any(bloom, (bloom_mask(t) for t in topic)):
+                    return False
+            elif not bloom_contains(bloom, bloom_mask(topic)):
+                return False
+        return True
+
+    async def get_new_entries_from_logs(self,
+                                        event_filters: Dict[str, Dict[int, List[str]]],
+                                        blocks: List[AttributeDict]) -> List[AttributeDict]:
+        """
+        :param event_filters: event name -> topic position -> addresses matched by the indexed argument at that position
+        :param blocks: the new blocks, whose block number range is queried.
+        :return: the decoded new events, in block and log index order.
+        """
+        if len(blocks) < 1:
+            return []
+        block_hashes: Set[HexBytes] = set(block.hash for block in blocks)
+        blooms: List[Optional[int]] = [bloom_to_int(block.logsBloom) if block.get("logsBloom") is not None else None
+                                       for block in blocks]
+
+        tasks = []
+        fetched_blocks: Set[HexBytes] = set()
+        for event_name, indexed_filters in event_filters.items():
+            topics: List[Any] = [self._event_topic(event_name)]
+            for position in range(1, max(indexed_filters.keys(), default=0) + 1):
+                addresses: Optional[List[str]] = indexed_filters.get(position)
+                topics.append([address_to_topic(address) for address in addresses] if addresses else None)
+            block_numbers: List[int] = [block.number for block, bloom in zip(blocks, blooms)
+                                        if self._may_contain_event(bloom, topics)]
+            if len(block_numbers) < 1:
+                continue
+            fetched_blocks.update(block.hash for block in blocks if block.number in block_numbers)
+            tasks.append(self._get_logs({
+                "fromBlock": min(block_numbers),
+                "toBlock": max(block_numbers),
+                "address": self._addresses,
+                "topics": topics
+            }))
+        self._fetched_blocks.inc(len(fetched_blocks))
+        self._skipped_blocks.inc(len(block_hashes) - len(fetched_blocks))
+        if len(tasks) < 1:
+            return []
+
+        logs: List[AttributeDict] = sorted(cytoolz.concat(await safe_gather(*tasks)),
+                                           key=lambda log: (log["blockNumber"], log["logIndex"]))
+        new_entries: List[AttributeDict] = []
+        for log in logs:
+            if log.get("removed", False) or log["blockHash"] not in block_hashes:
+                continue
+            event_abi: Optional[Dict[str, any]] = self._event_abis.get(log["address"], {}).get(
+                encode_hex(log["topics"][0])
+            )
+            if event_abi is None:
+                continue
+            event_data: AttributeDict = get_event_data(event_abi, log)
+            event_key: EventKey = (event_data["transactionHash"], event_data["address"], event_data["event"])
+            if event_key in self._event_cache:
+                self.logger().debug(
+                    f"Duplicate event transaction hash found - '{event_data['transactionHash'].hex()}'."
+                )
+                continue
+            self._event_cache.add(event_key)
+            self._block_events.setdefault(event_data["blockNumber"], []).append(event_key)
+            new_entries.append(event_data)
+
+        while len(self._block_events) > self._block_events_window_size:
+            event_keys: List[EventKey] = self._block_events.popitem(last=False)[1]
+            for event_key in event_keys:
+                self._event_cache.discard(event_key)
+        return new_entries
+
+    async def _get_logs(self,
+                        filter_params: Dict[str, any],
+                        max_tries: Optional[int] = 10) -> List[AttributeDict]:
+        count: int = 0
+        while True:
+            try:
+                count += 1
+                return await self._jsonrpc_client.get_logs(filter_params)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                if count >= max_tries:
+                    raise
+                self.logger().debug(f"Error fetching logs with filters: '{filter_params}'. Retrying...",
+                                    exc_info=True)
+                await asyncio.sleep(0.5)
@@ -1,8 +1,6 @@
 #!/usr/bin/env python
 
 import asyncio
-import cytoolz
-from hexbytes import HexBytes
 import logging
 import math
 from typing import (
@@ -20,6 +18,7 @@ from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
     NewBlocksWatcherEvent,
     WalletReceivedAssetEvent,
+    WalletSentAssetEvent,
     TokenApprovedEvent,
     ERC20WatcherEvent
 )
@@ -29,13 +28,19 @@ from hummingbot.core.utils.async_utils import (
     safe_ensure_future,
     safe_gather,
 )
+from hummingbot.wallet.ethereum.async_jsonrpc_client import AsyncJSONRPCClient
 from .base_watcher import BaseWatcher
 from .new_blocks_watcher import NewBlocksWatcher
-from .contract_event_logs import ContractEventLogger
+from .contract_event_logs import MultiContractEventLogger
 
 weth_dai_symbols: Set[str] = {"WETH", "DAI"}
 TRANSFER_EVENT_NAME = "Transfer"
 APPROVAL_EVENT_NAME = "Approval"
+# Topic positions of the indexed Transfer(from, to, value) sender and recipient, and Approval(owner, spender, value)
+# owner.
+TRANSFER_FROM_TOPIC_POSITION = 1
+TRANSFER_TO_TOPIC_POSITION = 2
+APPROVAL_OWNER_TOPIC_POSITION = 1
 
 
 class ERC20EventsWatcher(BaseWatcher):
@@ -57,11 +62,12 @@ class ERC20EventsWatcher(BaseWatcher):
                  blocks_watcher: NewBlocksWatcher,
                  contract_addresses: List[str],
                  contract_abi: List[any],
-                 watch_addresses: Iterable[str]):
+                 watch_addresses: Iterable[str],
+                 jsonrpc_client: Optional[AsyncJSONRPCClient] = None):
         if len(contract_addresses) != len(contract_abi):
             raise ValueError("Each entry in contract_addresses must have a corresponding entry in contract_abi.")
 
-        super().__init__(w3)
+        super().__init__(w3, jsonrpc_client)
         self._blocks_watcher: NewBlocksWatcher = blocks_watcher
         self._addresses_to_contracts: Dict[str, Contract] = {
             address: w3.eth.contract(address=address, abi=abi)
@@ -70,7 +76,9 @@ class ERC20EventsWatcher(BaseWatcher):
         self._watch_addresses: Set[str] = set(watch_addresses)
         self._address_to_asset_name_map: Dict[str, str] = {}
         self._asset_decimals: Dict[str, int] = {}
-        self._contract_event_loggers: Dict[str, ContractEventLogger] = {}
+        self._contract_event_logger: Optional[MultiContractEventLogger] = None
+        # Outgoing transfers are queried separately - an event is only reported once per logger.
+        self._outgoing_event_logger: Optional[MultiContractEventLogger] = None
         self._new_blocks_queue: asyncio.Queue = asyncio.Queue()
         self._event_forwarder: EventForwarder = EventForwarder(self.did_receive_new_blocks)
         self._poll_erc20_logs_task: Optional[asyncio.Task] = None
@@ -80,8 +88,9 @@ class ERC20EventsWatcher(BaseWatcher):
             for address, contract in self._addresses_to_contracts.items():
                 contract: Contract = contract
                 try:
-                    asset_name: str = await self.call_async(ERC20Token.get_symbol_from_contract, contract)
-                    decimals: int = await self.call_async(contract.functions.decimals().call)
+                    asset_name: str = await ERC20Token.get_symbol_from_contract_async(self._jsonrpc_client,
+                                                                                      contract)
+                    decimals: int = await self._jsonrpc_client.call_function(contract.functions.decimals())
                 except asyncio.CancelledError:
                     raise
                 except Exception:
@@ -91,7 +100,18 @@ class ERC20EventsWatcher(BaseWatcher):
                                           exc_info=True)
                 self._address_to_asset_name_map[address] = asset_name
                 self._asset_decimals[asset_name] = decimals
-                self._contract_event_loggers[address] = ContractEventLogger(self._w3, address, contract.abi)
+            self._contract_event_logger = MultiContractEventLogger(
+                self._w3,
+                {address: contract.abi for address, contract in self._addresses_to_contracts.items()},
+                jsonrpc_client=self._jsonrpc_client,
+                name="erc20"
+            )
+            self._outgoing_event_logger = MultiContractEventLogger(
+                self._w3,
+                {address: contract.abi for address, contract in self._addresses_to_contracts.items()},
+                jsonrpc_client=self._jsonrpc_client,
+                name="erc20_outgoing"
+            )
 
         if self._poll_erc20_logs_task is not None:
             await self.stop_network()
@@ -113,29 +133,27 @@ class ERC20EventsWatcher(BaseWatcher):
         while True:
             try:
                 new_blocks: List[AttributeDict] = await self._new_blocks_queue.get()
-                block_hashes: List[HexBytes] = [block["hash"] for block in new_blocks]
-
-                transfer_tasks = []
-                approval_tasks = []
-                for address in self._addresses_to_contracts.keys():
-                    contract_event_logger: ContractEventLogger = self._contract_event_loggers[address]
-                    transfer_tasks.append(
-                        contract_event_logger.get_new_entries_from_logs(TRANSFER_EVENT_NAME,
-                                                                        block_hashes)
-                    )
-                    approval_tasks.append(
-                        contract_event_logger.get_new_entries_from_logs(APPROVAL_EVENT_NAME,
-                                                                        block_hashes)
-                    )
 
-                raw_transfer_entries = await safe_gather(*transfer_tasks)
-                raw_approval_entries = await safe_gather(*approval_tasks)
-                transfer_entries = list(cytoolz.concat(raw_transfer_entries))
-                approval_entries = list(cytoolz.concat(raw_approval_entries))
-                for transfer_entry in transfer_entries:
-                    await self._handle_event_data(transfer_entry)
-                for approval_entry in approval_entries:
-                    await self._handle_event_data(approval_entry)
+                # One eth_getLogs over the new blocks per event, for all the token contracts - filtered on the node by
+                # the Transfer recipient and the Approval owner, and by the sender for outgoing transfers.
+                watch_addresses: List[str] = list(self._watch_addresses)
+                entries, outgoing_entries = await safe_gather(
+                    self._contract_event_logger.get_new_entries_from_logs(
+                        {
+                            TRANSFER_EVENT_NAME: {TRANSFER_TO_TOPIC_POSITION: watch_addresses},
+                            APPROVAL_EVENT_NAME: {APPROVAL_OWNER_TOPIC_POSITION: watch_addresses},
+                        },
+                        new_blocks
+                    ),
+                    self._outgoing_event_logger.get_new_entries_from_logs(
+                        {TRANSFER_EVENT_NAME: {TRANSFER_FROM_TOPIC_POSITION: watch_addresses}},
+                        new_blocks
+                    )
+                )
+                for entry in entries:
+                    await self._handle_event_data(entry)
+                for entry in outgoing_entries:
+                    await self._handle_event_data(entry, outgoing=True)
 
             except asyncio.CancelledError:
                 raise
@@ -146,13 +164,15 @@ class ERC20EventsWatcher(BaseWatcher):
                                       app_warning_msg=f"Error fetching new events from ERC20 contracts. "
                                                       f"Check wallet network connection")
 
-    async def _handle_event_data(self, event_data: AttributeDict):
+    async def _handle_event_data(self, event_data: AttributeDict, outgoing: bool = False):
         event_type: str = event_data["event"]
         timestamp: float = float(await self._blocks_watcher.get_timestamp_for_block(event_data["blockHash"]))
         tx_hash: str = event_data["transactionHash"].hex()
         contract_address: str = event_data["address"]
         token_asset_name: str = self._address_to_asset_name_map.get(contract_address)
-        if event_type == TRANSFER_EVENT_NAME:
+        if event_type == TRANSFER_EVENT_NAME and outgoing:
+            self.handle_outgoing_tokens_event(timestamp, tx_hash, token_asset_name, event_data)
+        elif event_type == TRANSFER_EVENT_NAME:
             self.handle_incoming_tokens_event(timestamp, tx_hash, token_asset_name, event_data)
         elif event_type == APPROVAL_EVENT_NAME:
             self.handle_approve_tokens_event(timestamp, tx_hash, token_asset_name, event_data)
@@ -182,7 +202,32 @@ class ERC20EventsWatcher(BaseWatcher):
         self.trigger_event(ERC20WatcherEvent.ReceivedToken,
                            WalletReceivedAssetEvent(timestamp, tx_hash,
                                                     from_address, to_address,
-                                                    asset_name, normalized_amount, raw_amount))
+                                                    asset_name, normalized_amount, raw_amount,
+                                                    event_data["blockNumber"]))
+
+    def handle_outgoing_tokens_event(self,
+                                     timestamp: float, tx_hash: str, asset_name: str, event_data: AttributeDict):
+        event_args: AttributeDict = event_data["args"]
+        decimals: int = self._asset_decimals[asset_name]
+
+        if self.is_weth_dai(asset_name) and hasattr(event_args, 'wad'):
+            raw_amount: int = event_args.wad
+            from_address: str = event_args.src
+            to_address: str = event_args.dst
+        else:
+            raw_amount: int = event_args["value"]
+            from_address: str = event_args["from"]
+            to_address: str = event_args["to"]
+        normalized_amount: float = raw_amount * math.pow(10, -decimals)
+
+        if from_address not in self._watch_addresses:
+            return
+
+        self.trigger_event(ERC20WatcherEvent.SentToken,
+                           WalletSentAssetEvent(timestamp, tx_hash,
+                                                from_address, to_address,
+                                                asset_name, normalized_amount, raw_amount,
+                                                event_data["blockNumber"]))
 
     def handle_approve_tokens_event(self, timestamp: float, tx_hash: str, asset_name: str, event_data: AttributeDict):
         event_args: AttributeDict = event_data["args"]
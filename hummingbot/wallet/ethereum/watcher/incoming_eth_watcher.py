@@ -7,8 +7,8 @@ from typing import (
     Set,
     Iterable,
     Dict,
-    Coroutine,
-    Optional
+    Optional,
+    Tuple,
 )
 from web3 import Web3
 from web3.datastructures import AttributeDict
@@ -18,27 +18,40 @@ from hummingbot.core.event.events import (
     IncomingEthWatcherEvent,
     WalletReceivedAssetEvent
 )
-from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
 from hummingbot.core.event.event_forwarder import EventForwarder
 from hummingbot.core.utils.async_utils import (
     safe_ensure_future,
     safe_gather,
 )
 from hummingbot.logger import HummingbotLogger
+from hummingbot.wallet.ethereum.async_jsonrpc_client import AsyncJSONRPCClient
+from hummingbot.wallet.ethereum.block_cache import BlockCache
 from .base_watcher import BaseWatcher
-from .new_blocks_watcher import NewBlocksWatcher
+from .new_blocks_watcher import (
+    NewBlocksWatcher,
+    has_full_transactions,
+)
 
 
 class IncomingEthWatcher(BaseWatcher):
+    """
+    Emits the ether transfers to the watched addresses found in new blocks.
+
+    Blocks received as headers, i.e. from a newHeads subscription, are only fetched with their full transactions if
+    the balance of a watched address changed in them.
+    """
     logger: Optional[HummingbotLogger] = None
 
     def __init__(self,
                  w3: Web3,
                  blocks_watcher: NewBlocksWatcher,
-                 watch_addresses: Iterable[str]):
-        super().__init__(w3)
+                 watch_addresses: Iterable[str],
+                 jsonrpc_client: Optional[AsyncJSONRPCClient] = None,
+                 block_cache: Optional[BlockCache] = None):
+        super().__init__(w3, jsonrpc_client)
         self._watch_addresses: Set[str] = set(watch_addresses)
         self._blocks_watcher: NewBlocksWatcher = blocks_watcher
+        self._block_cache: BlockCache = block_cache or blocks_watcher.block_cache
         self._event_forwarder: EventForwarder = EventForwarder(self.did_receive_new_blocks)
 
     async def start_network(self):
@@ -50,23 +63,55 @@ class IncomingEthWatcher(BaseWatcher):
     def did_receive_new_blocks(self, new_blocks: List[AttributeDict]):
         safe_ensure_future(self.check_incoming_eth(new_blocks))
 
+    async def get_blocks_to_scan(self, blocks: List[AttributeDict]) -> List[AttributeDict]:
+        """
+        Filters out the header-only blocks in which no watched address's balance changed, so they don't need to be
+        fetched with their full transactions. The balances of all the blocks are fetched in a single JSON-RPC batch.
+
+        :return: the blocks that may contain incoming ether transfers
+        """
+        header_blocks: List[AttributeDict] = [block for block in blocks if not has_full_transactions(block)]
+        if len(header_blocks) == 0:
+            return blocks
+
+        watch_addresses: List[str] = list(self._watch_addresses)
+        balance_keys: List[Tuple[int, str]] = [
+            (block_number, address)
+            for block_number in sorted(set(cytoolz.concat((block.number - 1, block.number) for block in header_blocks)))
+            for address in watch_addresses
+        ]
+        balances: List[int] = await safe_gather(*[
+            self._jsonrpc_client.get_balance(address, block_number)
+            for block_number, address in balance_keys
+        ])
+        balances_at_block: Dict[Tuple[int, str], int] = dict(zip(balance_keys, balances))
+        return [block for block in blocks
+                if has_full_transactions(block) or
+                any(balances_at_block[(block.number, address)] != balances_at_block[(block.number - 1, address)]
+                    for address in watch_addresses)]
+
     async def check_incoming_eth(self, new_blocks: List[AttributeDict]):
-        async_scheduler: AsyncCallScheduler = AsyncCallScheduler.shared_instance()
         watch_addresses: Set[str] = self._watch_addresses
         filtered_blocks: List[AttributeDict] = [block for block in new_blocks if block is not None]
         block_to_timestamp: Dict[str, float] = dict((block.hash, float(block.timestamp))
                                                     for block in filtered_blocks)
-        transactions: List[AttributeDict] = list(cytoolz.concat(b.transactions for b in filtered_blocks))
-        incoming_eth_transactions: List[AttributeDict] = [t for t in transactions
-                                                          if ((t.get("to") in watch_addresses) and
-                                                              (t.get("value", 0) > 0))]
-
-        get_receipt_tasks: List[Coroutine] = [
-            async_scheduler.call_async(self._w3.eth.getTransactionReceipt, t.hash)
-            for t in incoming_eth_transactions
-        ]
+
         try:
-            transaction_receipts: List[AttributeDict] = await safe_gather(*get_receipt_tasks)
+            blocks_to_scan: List[AttributeDict] = await self.get_blocks_to_scan(filtered_blocks)
+            block_transactions: List[List[AttributeDict]] = await safe_gather(*[
+                self._blocks_watcher.get_block_transactions(block)
+                for block in blocks_to_scan
+            ])
+            transactions: List[AttributeDict] = list(cytoolz.concat(block_transactions))
+            incoming_eth_transactions: List[AttributeDict] = [t for t in transactions
+                                                              if ((t.get("to") in watch_addresses) and
+                                                                  (t.get("value", 0) > 0))]
+
+            # Receipts not in the block cache are sent to the node in a single JSON-RPC batch.
+            transaction_receipts: List[AttributeDict] = await self._block_cache.get_receipts(
+                self._jsonrpc_client,
+                [t.hash for t in incoming_eth_transactions]
+            )
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -89,4 +134,5 @@ class IncomingEthWatcher(BaseWatcher):
             timestamp: float = block_to_timestamp[incoming_transaction.get("blockHash")]
             self.trigger_event(IncomingEthWatcherEvent.ReceivedEther,
                                WalletReceivedAssetEvent(timestamp, incoming_transaction.hash.hex(),
-                                                        from_address, to_address, "ETH", eth_value, raw_eth_value))
+                                                        from_address, to_address, "ETH", eth_value, raw_eth_value,
+                                                        incoming_transaction.blockNumber))
@@ -3,27 +3,60 @@
 import asyncio
 from async_timeout import timeout
 from collections import OrderedDict
-import functools
 from hexbytes import HexBytes
 import logging
 import time
 from typing import (
+    Any,
+    AsyncIterable,
     Dict,
     List,
     Optional
 )
+import ujson
 from web3 import Web3
 from web3.datastructures import AttributeDict
+from web3.middleware.pythonic import block_formatter
+import websockets
+from websockets.exceptions import ConnectionClosed
 
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import NewBlocksWatcherEvent
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import (
+    safe_ensure_future,
+    safe_gather,
+)
+from hummingbot.wallet.ethereum.async_jsonrpc_client import AsyncJSONRPCClient
+from hummingbot.wallet.ethereum.block_cache import BlockCache
 from .base_watcher import BaseWatcher
 
 DEFAULT_BLOCK_WINDOW_SIZE = 30
+# Missed headers are fetched this many at a time, so each chunk goes out as a single JSON-RPC batch request.
+MISSED_HEADERS_CHUNK_SIZE = 100
+
+
+def has_full_transactions(block: AttributeDict) -> bool:
+    """
+    :return: whether a block includes its full transactions, as opposed to a header or a block with transaction hashes
+    """
+    transactions: Optional[List[Any]] = block.get("transactions")
+    return transactions is not None and (len(transactions) == 0 or not isinstance(transactions[0], (bytes, str)))
 
 
 class NewBlocksWatcher(BaseWatcher):
+    """
+    Emits new blocks, and the replacement blocks of chain reorganizations, to the other watchers.
+
+    By default, the watcher polls the node for the next block with its full transactions. Given a websocket URL, it
+    subscribes to newHeads instead: block headers are pushed as soon as the node sees them, and are emitted without
+    transactions - use `get_block_transactions()` to fetch them when needed.
+
+    Every block seen is added to the shared block cache, and blocks replaced by a chain reorganization are
+    invalidated in it.
+    """
+    MESSAGE_TIMEOUT = 30.0
+    PING_TIMEOUT = 10.0
+
     _nbw_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -32,9 +65,16 @@ class NewBlocksWatcher(BaseWatcher):
             cls._nbw_logger = logging.getLogger(__name__)
         return cls._nbw_logger
 
-    def __init__(self, w3: Web3, block_window_size: Optional[int] = DEFAULT_BLOCK_WINDOW_SIZE):
-        super().__init__(w3)
+    def __init__(self,
+                 w3: Web3,
+                 block_window_size: Optional[int] = DEFAULT_BLOCK_WINDOW_SIZE,
+                 jsonrpc_client: Optional[AsyncJSONRPCClient] = None,
+                 websocket_url: Optional[str] = None,
+                 block_cache: Optional[BlockCache] = None):
+        super().__init__(w3, jsonrpc_client)
         self._block_window_size = block_window_size
+        self._websocket_url: Optional[str] = websocket_url
+        self._block_cache: BlockCache = block_cache or BlockCache()
         self._current_block_number: int = -1
         self._block_number_to_fetch: int = -1
         self._blocks_window: Dict = {}
@@ -49,12 +89,20 @@ class NewBlocksWatcher(BaseWatcher):
     def block_number(self) -> int:
         return self._current_block_number
 
+    @property
+    def block_cache(self) -> BlockCache:
+        return self._block_cache
+
+    @property
+    def subscribed(self) -> bool:
+        return self._websocket_url is not None
+
     async def start_network(self):
         if self._fetch_new_blocks_task is not None:
             await self.stop_network()
 
         try:
-            self._current_block_number = await self.call_async(getattr, self._w3.eth, "blockNumber")
+            self._current_block_number = await self._jsonrpc_client.block_number()
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -63,7 +111,10 @@ class NewBlocksWatcher(BaseWatcher):
                                                   "Check Ethereum node connection",
                                   exc_info=True)
         self._block_number_to_fetch = self._current_block_number
-        self._fetch_new_blocks_task: asyncio.Task = safe_ensure_future(self.fetch_new_blocks_loop())
+        if self._websocket_url is not None:
+            self._fetch_new_blocks_task: asyncio.Task = safe_ensure_future(self.subscribe_new_heads_loop())
+        else:
+            self._fetch_new_blocks_task: asyncio.Task = safe_ensure_future(self.fetch_new_blocks_loop())
 
     async def stop_network(self):
         if self._fetch_new_blocks_task is not None:
@@ -76,6 +127,9 @@ class NewBlocksWatcher(BaseWatcher):
         if block_hash in self._blocks_window:
             block = self._blocks_window[block_hash]
             return block.timestamp
+        block = self._block_cache.get_header(block_hash)
+        if block is not None:
+            return block.timestamp
         else:
             while block is None:
                 try:
@@ -83,12 +137,9 @@ class NewBlocksWatcher(BaseWatcher):
                         raise ValueError(f"Block hash {block_hash.hex()} does not exist.")
                     counter += 1
                     async with timeout(10.0):
-                        block = await self.call_async(
-                            functools.partial(
-                                self._w3.eth.getBlock,
-                                block_hash,
-                                full_transactions=False)
-                        )
+                        block = await self._jsonrpc_client.get_block(block_hash, full_transactions=False)
+                    if block is not None:
+                        self._block_cache.add_block(block)
                 except TimeoutError:
                     self.logger().network(f"Timed out fetching new block - '{block_hash}'.", exc_info=True,
                                           app_warning_msg=f"Timed out fetching new block - '{block_hash}'. "
@@ -102,35 +153,14 @@ class NewBlocksWatcher(BaseWatcher):
         while True:
             try:
                 async with timeout(30.0):
-                    incoming_block: AttributeDict = await self.call_async(
-                        functools.partial(
-                            self._w3.eth.getBlock,
-                            self._block_number_to_fetch,
-                            full_transactions=True)
+                    incoming_block: AttributeDict = await self._jsonrpc_client.get_block(
+                        self._block_number_to_fetch,
+                        full_transactions=True
                     )
                     if incoming_block is not None:
-                        current_block_hash: HexBytes = self._block_number_to_hash_map.get(
-                            self._current_block_number,
-                            None)
-                        incoming_block_hash: HexBytes = incoming_block.hash
-                        incoming_block_parent_hash: HexBytes = incoming_block.parentHash
-                        new_blocks: List[AttributeDict] = []
-                        if current_block_hash is not None and current_block_hash != incoming_block_parent_hash:
-                            block_reorganization: List[AttributeDict] = await self.get_block_reorganization(incoming_block)
-                            new_blocks += block_reorganization
-
-                        self._block_number_to_hash_map[self._block_number_to_fetch] = incoming_block_hash
-                        self._blocks_window[incoming_block_hash] = incoming_block
-                        new_blocks.append(incoming_block)
-                        self._current_block_number = self._block_number_to_fetch
-                        self._block_number_to_fetch += 1
-                        self.trigger_event(NewBlocksWatcherEvent.NewBlocks, new_blocks)
+                        await self._add_new_block(incoming_block, full_transactions=True)
                         last_timestamp_received_blocks = time.time()
 
-                        while len(self._blocks_window) > self._block_window_size:
-                            block_hash = self._block_number_to_hash_map.popitem(last=False)[1]
-                            del self._blocks_window[block_hash]
-
             except asyncio.CancelledError:
                 raise
             except asyncio.TimeoutError:
@@ -153,28 +183,119 @@ class NewBlocksWatcher(BaseWatcher):
                 sleep_time = 2
             await asyncio.sleep(sleep_time)
 
-    async def get_block_reorganization(self, incoming_block: AttributeDict) -> List[AttributeDict]:
+    async def _add_new_block(self, incoming_block: AttributeDict, full_transactions: bool):
+        current_block_hash: HexBytes = self._block_number_to_hash_map.get(self._current_block_number, None)
+        incoming_block_parent_hash: HexBytes = incoming_block.parentHash
+        new_blocks: List[AttributeDict] = []
+        if current_block_hash is not None and current_block_hash != incoming_block_parent_hash:
+            block_reorganization: List[AttributeDict] = await self.get_block_reorganization(
+                incoming_block,
+                full_transactions=full_transactions
+            )
+            new_blocks += block_reorganization
+
+        self._replace_block(incoming_block)
+        new_blocks.append(incoming_block)
+        self._current_block_number = incoming_block.number
+        self._block_number_to_fetch = incoming_block.number + 1
+        self.trigger_event(NewBlocksWatcherEvent.NewBlocks, new_blocks)
+
+        while len(self._blocks_window) > self._block_window_size:
+            block_hash = self._block_number_to_hash_map.popitem(last=False)[1]
+            del self._blocks_window[block_hash]
+
+    async def _add_new_header(self, header: AttributeDict):
+        # Headers missed while the subscription was down are fetched first, so no block is skipped.
+        if 0 <= self._current_block_number < header.number - 1:
+            for chunk_start in range(self._current_block_number + 1, header.number, MISSED_HEADERS_CHUNK_SIZE):
+                missed_headers: List[Optional[AttributeDict]] = await safe_gather(*[
+                    self._jsonrpc_client.get_block(block_number, full_transactions=False)
+                    for block_number in range(chunk_start, min(chunk_start + MISSED_HEADERS_CHUNK_SIZE, header.number))
+                ])
+                for missed_header in missed_headers:
+                    if missed_header is not None:
+                        await self._add_new_block(missed_header, full_transactions=False)
+        await self._add_new_block(header, full_transactions=False)
+
+    async def _inner_messages(self, ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
+        # Terminate the recv() loop as soon as the next message timed out, so the outer loop can reconnect.
+        try:
+            while True:
+                try:
+                    msg: str = await asyncio.wait_for(ws.recv(), timeout=self.MESSAGE_TIMEOUT)
+                    yield msg
+                except asyncio.TimeoutError:
+                    pong_waiter = await ws.ping()
+                    await asyncio.wait_for(pong_waiter, timeout=self.PING_TIMEOUT)
+        except asyncio.TimeoutError:
+            self.logger().warning("WebSocket ping timed out. Going to reconnect...")
+            return
+        except ConnectionClosed:
+            return
+        finally:
+            await ws.close()
+
+    async def subscribe_new_heads_loop(self):
+        while True:
+            try:
+                async with websockets.connect(self._websocket_url) as ws:
+                    ws: websockets.WebSocketClientProtocol = ws
+                    await ws.send(ujson.dumps({"jsonrpc": "2.0",
+                                               "id": 1,
+                                               "method": "eth_subscribe",
+                                               "params": ["newHeads"]}))
+                    async for raw_msg in self._inner_messages(ws):
+                        msg: Dict[str, Any] = ujson.loads(raw_msg)
+                        if "error" in msg:
+                            raise IOError(f"Error subscribing to new block headers - {msg['error']}.")
+                        if msg.get("method") != "eth_subscription":
+                            continue
+                        header: AttributeDict = AttributeDict.recursive(block_formatter(msg["params"]["result"]))
+                        await self._add_new_header(header)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(f"Error receiving new block headers from {self._websocket_url}.",
+                                      exc_info=True,
+                                      app_warning_msg="Error receiving new block headers. "
+                                                      "Check wallet network connection")
+                await asyncio.sleep(5.0)
+
+    async def get_block_transactions(self, block: AttributeDict) -> List[AttributeDict]:
+        """
+        :return: the full transactions of a block - fetched from the node if the block was received as a header, or
+                 with transaction hashes only.
+        """
+        if has_full_transactions(block):
+            return list(block.transactions)
+        full_block: Optional[AttributeDict] = await self._jsonrpc_client.get_block(block.hash, full_transactions=True)
+        return list(full_block.transactions) if full_block is not None else []
+
+    async def get_block_reorganization(self,
+                                       incoming_block: AttributeDict,
+                                       full_transactions: bool = True) -> List[AttributeDict]:
         block_reorganization: List[AttributeDict] = []
         expected_parent_hash: HexBytes = incoming_block.parentHash
         while expected_parent_hash not in self._blocks_window and len(block_reorganization) < len(self._blocks_window):
             replacement_block = None
             while replacement_block is None:
-                replacement_block = await self.call_async(
-                    functools.partial(
-                        self._w3.eth.getBlock,
-                        expected_parent_hash,
-                        full_transactions=True)
-                )
+                replacement_block = await self._jsonrpc_client.get_block(expected_parent_hash,
+                                                                         full_transactions=full_transactions)
                 if replacement_block is None:
                     await asyncio.sleep(0.5)
 
-            replacement_block_number: int = replacement_block.number
-            replacement_block_hash: HexBytes = replacement_block.hash
-            replacement_block_parent_hash: HexBytes = replacement_block.parentHash
-            self._block_number_to_hash_map[replacement_block_number] = replacement_block_hash
-            self._blocks_window[replacement_block_hash] = replacement_block
+            self._replace_block(replacement_block)
             block_reorganization.append(replacement_block)
-            expected_parent_hash = replacement_block_parent_hash
+            expected_parent_hash = replacement_block.parentHash
 
         block_reorganization.reverse()
         return block_reorganization
+
+    def _replace_block(self, block: AttributeDict):
+        replaced_block_hash: Optional[HexBytes] = self._block_number_to_hash_map.get(block.number)
+        if replaced_block_hash is not None and replaced_block_hash != block.hash:
+            self._blocks_window.pop(replaced_block_hash, None)
+            self._block_cache.invalidate_block(replaced_block_hash)
+        self._block_number_to_hash_map[block.number] = block.hash
+        self._blocks_window[block.hash] = block
+        self._block_cache.add_block(block)
@@ -1,7 +1,6 @@
 #!/usr/bin/env python
 
 import asyncio
-from hexbytes import HexBytes
 import logging
 import math
 from typing import (
@@ -24,12 +23,15 @@ from hummingbot.core.event.events import (
 )
 from hummingbot.core.event.event_forwarder import EventForwarder
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.wallet.ethereum.async_jsonrpc_client import AsyncJSONRPCClient
 from .base_watcher import BaseWatcher
 from .new_blocks_watcher import NewBlocksWatcher
-from .contract_event_logs import ContractEventLogger
+from .contract_event_logs import MultiContractEventLogger
 
 DEPOSIT_EVENT_NAME = "Deposit"
 WITHDRAWAL_EVENT_NAME = "Withdrawal"
+# Topic position of the indexed Deposit(dst, wad) recipient and Withdrawal(src, wad) sender.
+WETH_ADDRESS_TOPIC_POSITION = 1
 
 
 class WethWatcher(BaseWatcher):
@@ -45,14 +47,18 @@ class WethWatcher(BaseWatcher):
                  w3: Web3,
                  weth_token: ERC20Token,
                  blocks_watcher: NewBlocksWatcher,
-                 watch_addresses: Iterable[str]):
-        super().__init__(w3)
+                 watch_addresses: Iterable[str],
+                 jsonrpc_client: Optional[AsyncJSONRPCClient] = None):
+        super().__init__(w3, jsonrpc_client)
         self._blocks_watcher: NewBlocksWatcher = blocks_watcher
         self._watch_addresses: Set[str] = set(watch_addresses)
         self._asset_decimals: Dict[str, int] = {}
         self._weth_token = weth_token
         self._weth_contract = weth_token.contract
-        self._contract_event_logger = ContractEventLogger(w3, weth_token.address, weth_token.abi)
+        self._contract_event_logger = MultiContractEventLogger(w3,
+                                                               {weth_token.address: weth_token.abi},
+                                                               jsonrpc_client=self._jsonrpc_client,
+                                                               name="weth")
         self._poll_weth_logs_task: asyncio.Task = None
         self._event_forwarder: EventForwarder = EventForwarder(self.did_receive_new_blocks)
         self._new_blocks_queue: asyncio.Queue = asyncio.Queue()
@@ -76,21 +82,17 @@ class WethWatcher(BaseWatcher):
         while True:
             try:
                 new_blocks: List[AttributeDict] = await self._new_blocks_queue.get()
-                block_hashes: List[HexBytes] = [block["hash"] for block in new_blocks]
 
-                deposit_entries = await self._contract_event_logger.get_new_entries_from_logs(
-                    DEPOSIT_EVENT_NAME,
-                    block_hashes
+                watch_addresses: List[str] = list(self._watch_addresses)
+                entries: List[AttributeDict] = await self._contract_event_logger.get_new_entries_from_logs(
+                    {
+                        DEPOSIT_EVENT_NAME: {WETH_ADDRESS_TOPIC_POSITION: watch_addresses},
+                        WITHDRAWAL_EVENT_NAME: {WETH_ADDRESS_TOPIC_POSITION: watch_addresses},
+                    },
+                    new_blocks
                 )
-
-                withdrawal_entries = await self._contract_event_logger.get_new_entries_from_logs(
-                    WITHDRAWAL_EVENT_NAME,
-                    block_hashes
-                )
-                for deposit_entry in deposit_entries:
-                    await self._handle_event_data(deposit_entry)
-                for withdrawal_entry in withdrawal_entries:
-                    await self._handle_event_data(withdrawal_entry)
+                for entry in entries:
+                    await self._handle_event_data(entry)
 
             except asyncio.CancelledError:
                 raise
@@ -122,7 +124,8 @@ class WethWatcher(BaseWatcher):
         address: str = event_args["dst"]
 
         self.trigger_event(WalletEvent.WrappedEth,
-                           WalletWrappedEthEvent(timestamp, tx_hash, address, normalized_amount, raw_amount))
+                           WalletWrappedEthEvent(timestamp, tx_hash, address, normalized_amount, raw_amount,
+                                                 event_data["blockNumber"]))
 
     def handle_unwrapping_eth_event(self,
                                     timestamp: float, tx_hash: str, event_data: AttributeDict):
@@ -134,4 +137,5 @@ class WethWatcher(BaseWatcher):
         address: str = event_args["src"]
 
         self.trigger_event(WalletEvent.UnwrappedEth,
-                           WalletUnwrappedEthEvent(timestamp, tx_hash, address, normalized_amount, raw_amount))
+                           WalletUnwrappedEthEvent(timestamp, tx_hash, address, normalized_amount, raw_amount,
+                                                   event_data["blockNumber"]))
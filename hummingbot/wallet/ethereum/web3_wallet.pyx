@@ -4,7 +4,7 @@ import itertools
 from eth_account import Account
 import logging
 import time
-from typing import List, Dict
+from typing import List, Dict, Optional
 from web3.contract import (
     ContractFunction
 )
@@ -22,6 +22,7 @@ from hummingbot.core.pubsub cimport PubSub
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.wallet.wallet_base import WalletBase
 from hummingbot.wallet.ethereum.erc20_token import ERC20Token
+from hummingbot.wallet.ethereum.block_cache import BlockCache
 from hummingbot.wallet.ethereum.web3_wallet_backend import Web3WalletBackend
 
 class_logger = None
@@ -60,12 +61,18 @@ cdef class Web3Wallet(WalletBase):
                  private_key: any,
                  backend_urls: List[str],
                  erc20_token_addresses: List[str],
-                 chain: EthereumChain = EthereumChain.ROPSTEN):
+                 chain: EthereumChain = EthereumChain.ROPSTEN,
+                 backend_websocket_urls: Optional[List[Optional[str]]] = None,
+                 block_cache_path: Optional[str] = None):
         super().__init__()
 
         self._local_account = Account.privateKeyToAccount(private_key)
-        self._wallet_backends = [Web3WalletBackend(private_key, url, erc20_token_addresses, chain=chain)
-                                 for url in backend_urls]
+        backend_websocket_urls = backend_websocket_urls or [None] * len(backend_urls)
+        # The backends are connected to the same chain, so they share a single block cache.
+        self._block_cache = BlockCache(path=block_cache_path)
+        self._wallet_backends = [Web3WalletBackend(private_key, url, erc20_token_addresses, chain=chain,
+                                                   websocket_url=websocket_url, block_cache=self._block_cache)
+                                 for url, websocket_url in zip(backend_urls, backend_websocket_urls)]
         self._best_backend = self._wallet_backends[0]
         self._last_backend_network_states = [NetworkStatus.STOPPED] * len(self._wallet_backends)
 
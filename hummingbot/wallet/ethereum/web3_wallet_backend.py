@@ -13,7 +13,6 @@ from typing import (
     List,
     Dict,
     Optional,
-    Set,
     Coroutine
 )
 from web3 import Web3
@@ -23,7 +22,9 @@ from web3.contract import (
 )
 from web3.datastructures import AttributeDict
 
-from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
+from hummingbot.wallet.ethereum.async_jsonrpc_client import AsyncJSONRPCClient
+from hummingbot.wallet.ethereum.block_cache import BlockCache
+from hummingbot.wallet.ethereum.nonce_manager import NonceManager
 from hummingbot.wallet.ethereum.ethereum_chain import EthereumChain
 from hummingbot.core.event.event_forwarder import EventForwarder
 from hummingbot.core.event.events import (
@@ -70,18 +71,25 @@ class Web3WalletBackend(PubSub):
                  private_key: Any,
                  jsonrpc_url: str,
                  erc20_token_addresses: List[str],
-                 chain: EthereumChain = EthereumChain.ROPSTEN):
+                 chain: EthereumChain = EthereumChain.ROPSTEN,
+                 websocket_url: Optional[str] = None,
+                 block_cache: Optional[BlockCache] = None,
+                 stuck_transaction_timeout: Optional[float] = None):
         super().__init__()
 
         # Initialize Web3, accounts and contracts.
         self._w3: Web3 = Web3(Web3.HTTPProvider(jsonrpc_url))
+        self._jsonrpc_client: AsyncJSONRPCClient = AsyncJSONRPCClient(jsonrpc_url)
+        self._websocket_url: Optional[str] = websocket_url
+        self._block_cache: BlockCache = block_cache or BlockCache()
         self._chain: EthereumChain = chain
         self._account: LocalAccount = Account.privateKeyToAccount(private_key)
         self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
 
         # Initialize ERC20 tokens data structures.
         self._erc20_token_list: List[ERC20Token] = [
-            ERC20Token(self._w3, erc20_token_address, self._chain) for erc20_token_address in erc20_token_addresses
+            ERC20Token(self._w3, erc20_token_address, self._chain, jsonrpc_client=self._jsonrpc_client)
+            for erc20_token_address in erc20_token_addresses
         ]
         self._erc20_tokens: Dict[str, ERC20Token] = OrderedDict()
         self._asset_decimals: Dict[str, int] = {"ETH": 18}
@@ -102,7 +110,12 @@ class Web3WalletBackend(PubSub):
         )
 
         # Blockchain data
-        self._local_nonce: int = -1
+        self._nonce_manager: NonceManager = NonceManager(self._account,
+                                                         self._jsonrpc_client,
+                                                         self._chain.value,
+                                                         self._start_tx_tracking,
+                                                         self._did_fail_transaction,
+                                                         stuck_transaction_timeout=stuck_transaction_timeout)
 
         # Watchers
         self._new_blocks_watcher: Optional[NewBlocksWatcher] = None
@@ -114,10 +127,13 @@ class Web3WalletBackend(PubSub):
         # Tasks and transactions
         self._check_network_task: Optional[asyncio.Task] = None
         self._network_status: NetworkStatus = NetworkStatus.STOPPED
-        self._outgoing_transactions_queue: asyncio.Queue = asyncio.Queue()
         self._outgoing_transactions_task: Optional[asyncio.Task] = None
         self._check_transaction_receipts_task: Optional[asyncio.Task] = None
         self._pending_tx_dict: Dict[str, int] = {}
+        # Transaction hash -> the ETH value sent by the transaction
+        self._pending_tx_values: Dict[str, int] = {}
+        # Replacement or gap filler transaction hash -> the hash of the transaction it stands for
+        self._original_tx_hashes: Dict[str, str] = {}
         self._gas_price: int = self.DEFAULT_GAS_PRICE
         self._last_timestamp_received_blocks: float = 0.0
         self._event_forwarder: EventForwarder = EventForwarder(self._did_receive_new_blocks)
@@ -143,14 +159,24 @@ class Web3WalletBackend(PubSub):
     @property
     def nonce(self) -> int:
         """
-        Warning: This property causes network access, even though it's synchronous.
+        Nonces are allocated locally by the nonce manager, and reconciled with the node's transaction counts on every
+        new block, so this doesn't block the event loop on network access.
 
-        :return: Gas price in wei
+        :return: The nonce of the next transaction
         """
-        remote_nonce: int = self._w3.eth.getTransactionCount(self.address, block_identifier="pending")
-        retval: int = max(remote_nonce, self._local_nonce)
-        self._local_nonce = retval
-        return retval
+        return self._nonce_manager.next_nonce
+
+    @property
+    def nonce_manager(self) -> NonceManager:
+        return self._nonce_manager
+
+    @property
+    def jsonrpc_client(self) -> AsyncJSONRPCClient:
+        return self._jsonrpc_client
+
+    @property
+    def block_cache(self) -> BlockCache:
+        return self._block_cache
 
     @property
     def chain(self) -> EthereumChain:
@@ -190,7 +216,6 @@ class Web3WalletBackend(PubSub):
         if self._outgoing_transactions_task is not None:
             await self.stop_network()
 
-        async_scheduler: AsyncCallScheduler = AsyncCallScheduler.shared_instance()
         if len(self._erc20_tokens) < len(self._erc20_token_list):
             # Fetch token data.
             fetch_symbols_tasks: List[Coroutine] = [
@@ -209,40 +234,56 @@ class Web3WalletBackend(PubSub):
             self._weth_token = self._erc20_tokens.get("WETH")
 
             # Fetch blockchain data.
-            self._local_nonce = await async_scheduler.call_async(
-                lambda: self._w3.eth.getTransactionCount(self.address, block_identifier="pending")
-            )
+            self._nonce_manager.reset(await self._jsonrpc_client.get_transaction_count(self.address, "pending"))
+
+            # Load the block headers saved by the last run.
+            if len(self._block_cache) < 1:
+                self._block_cache.load()
 
             # Create event watchers.
-            self._new_blocks_watcher = NewBlocksWatcher(self._w3)
+            self._new_blocks_watcher = NewBlocksWatcher(self._w3,
+                                                        jsonrpc_client=self._jsonrpc_client,
+                                                        websocket_url=self._websocket_url,
+                                                        block_cache=self._block_cache)
             self._new_blocks_watcher.add_listener(NewBlocksWatcherEvent.NewBlocks, self._event_forwarder)
-            self._account_balance_watcher = AccountBalanceWatcher(
-                self._w3,
-                self._new_blocks_watcher,
-                self._account.address,
-                [erc20_token.address for erc20_token in self._erc20_tokens.values()],
-                [token.abi for token in self._erc20_tokens.values()]
-            )
             self._erc20_events_watcher = ERC20EventsWatcher(
                 self._w3,
                 self._new_blocks_watcher,
                 [token.address for token in self._erc20_tokens.values()],
                 [token.abi for token in self._erc20_tokens.values()],
-                [self._account.address]
+                [self._account.address],
+                jsonrpc_client=self._jsonrpc_client
             )
             self._incoming_eth_watcher = IncomingEthWatcher(
                 self._w3,
                 self._new_blocks_watcher,
-                [self._account.address]
+                [self._account.address],
+                jsonrpc_client=self._jsonrpc_client,
+                block_cache=self._block_cache
             )
             if self._weth_token is not None:
                 self._weth_watcher = WethWatcher(
                     self._w3,
                     self._weth_token,
                     self._new_blocks_watcher,
-                    [self._account.address]
+                    [self._account.address],
+                    jsonrpc_client=self._jsonrpc_client
                 )
 
+            # Balances are tracked from the events of the other watchers, and refreshed in full periodically.
+            self._account_balance_watcher = AccountBalanceWatcher(
+                self._w3,
+                self._new_blocks_watcher,
+                self._account.address,
+                [erc20_token.address for erc20_token in self._erc20_tokens.values()],
+                [token.abi for token in self._erc20_tokens.values()],
+                jsonrpc_client=self._jsonrpc_client,
+                chain=self._chain,
+                erc20_events_watcher=self._erc20_events_watcher,
+                incoming_eth_watcher=self._incoming_eth_watcher,
+                weth_watcher=self._weth_watcher
+            )
+
             # Connect the event forwarders.
             self._erc20_events_watcher.add_listener(ERC20WatcherEvent.ReceivedToken,
                                                     self._received_asset_event_forwarder)
@@ -258,7 +299,7 @@ class Web3WalletBackend(PubSub):
                                                 self._unwrapped_eth_event_forwarder)
 
             # Start the transaction processing tasks.
-            self._outgoing_transactions_task = safe_ensure_future(self.outgoing_eth_transactions_loop())
+            self._outgoing_transactions_task = safe_ensure_future(self._nonce_manager.send_transactions_loop())
             self._check_transaction_receipts_task = safe_ensure_future(self.check_transaction_receipts_loop())
 
             # Start the event watchers.
@@ -305,6 +346,8 @@ class Web3WalletBackend(PubSub):
         if self._check_transaction_receipts_task is not None:
             self._check_transaction_receipts_task.cancel()
             self._check_transaction_receipts_task = None
+        self._block_cache.save()
+        await self._jsonrpc_client.close()
 
     async def check_network(self) -> NetworkStatus:
         # Assume connected if received new blocks in last 2 minutes
@@ -358,77 +401,92 @@ class Web3WalletBackend(PubSub):
         """
         Look for failed transactions, and emit transaction fail event if any are found.
         """
-        async_scheduler: AsyncCallScheduler = AsyncCallScheduler.shared_instance()
-        tasks = [async_scheduler.call_async(self._w3.eth.getTransactionReceipt, tx_hash)
-                 for tx_hash in self._pending_tx_dict.keys()]
-        transaction_receipts: List[AttributeDict] = [tr for tr in await safe_gather(*tasks)
-                                                     if (tr is not None and tr.get("blockHash") is not None)]
-        block_hash_set: Set[HexBytes] = set(tr.blockHash for tr in transaction_receipts)
-        fetch_block_tasks = [async_scheduler.call_async(self._w3.eth.getBlock, block_hash)
-                             for block_hash in block_hash_set]
-        blocks: Dict[HexBytes, AttributeDict] = dict((block.hash, block)
-                                                     for block
-                                                     in await safe_gather(*fetch_block_tasks)
-                                                     if block is not None)
+        # Receipts and block timestamps not in the block cache are each fetched in a single JSON-RPC batch.
+        transaction_receipts: List[AttributeDict] = [
+            tr for tr in await self._block_cache.get_receipts(self._jsonrpc_client, self._pending_tx_dict.keys())
+            if tr is not None
+        ]
+        block_hashes: List[HexBytes] = list(set(tr.blockHash for tr in transaction_receipts))
+        block_timestamps: Dict[HexBytes, int] = dict(
+            (block_hash, timestamp)
+            for block_hash, timestamp
+            in zip(block_hashes, await safe_gather(*[self._block_cache.get_timestamp(self._jsonrpc_client, block_hash)
+                                                     for block_hash in block_hashes]))
+            if timestamp is not None
+        )
 
         for receipt in transaction_receipts:
-            # Emit gas used event.
-            tx_hash: str = receipt.transactionHash.hex()
-            gas_price_wei: int = self._pending_tx_dict[tx_hash]
+            # Emit gas used event. Replacements are reported under the hash of the transaction they replaced.
+            tx_hash: str = self._original_tx_hashes.get(receipt.transactionHash.hex(), receipt.transactionHash.hex())
+            gas_price_wei: int = self._pending_tx_dict[receipt.transactionHash.hex()]
             gas_used: int = receipt.gasUsed
             gas_eth_amount_raw: int = gas_price_wei * gas_used
 
-            if receipt.blockHash in blocks:
-                block: AttributeDict = blocks[receipt.blockHash]
+            if receipt.blockHash in block_timestamps:
+                block_timestamp: int = block_timestamps[receipt.blockHash]
 
                 if receipt.status == 0:
                     self.logger().warning(f"The transaction {tx_hash} has failed.")
                     self.trigger_event(WalletEvent.TransactionFailure, tx_hash)
 
-                self.trigger_event(WalletEvent.GasUsed, EthereumGasUsedEvent(
-                    float(block.timestamp),
+                gas_used_event: EthereumGasUsedEvent = EthereumGasUsedEvent(
+                    float(block_timestamp),
                     tx_hash,
                     float(gas_price_wei * 1e-9),
                     gas_price_wei,
                     gas_used,
                     float(gas_eth_amount_raw * 1e-18),
-                    gas_eth_amount_raw
-                ))
+                    gas_eth_amount_raw,
+                    receipt.blockNumber
+                )
+                self.trigger_event(WalletEvent.GasUsed, gas_used_event)
+                if self._account_balance_watcher is not None:
+                    raw_eth_value: int = self._pending_tx_values.get(tx_hash, 0) if receipt.status == 1 else 0
+                    self._account_balance_watcher.did_use_gas(gas_used_event, raw_eth_value)
 
                 # Stop tracking the transaction.
                 self._stop_tx_tracking(tx_hash)
 
-    async def outgoing_eth_transactions_loop(self):
-        async_scheduler: AsyncCallScheduler = AsyncCallScheduler.shared_instance()
-        while True:
-            signed_transaction: AttributeDict = await self._outgoing_transactions_queue.get()
-            tx_hash: str = signed_transaction.hash.hex()
-            try:
-                await async_scheduler.call_async(self._w3.eth.sendRawTransaction, signed_transaction.rawTransaction)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().network(
-                    f"Error sending transaction {tx_hash}.", exc_info=True,
-                    app_warning_msg=f"Error sending transaction {tx_hash}. Check wallet network connection")
-                self.trigger_event(WalletEvent.TransactionFailure, tx_hash)
-                self._local_nonce -= 1
+    def _did_fail_transaction(self, tx_hash: str):
+        self.trigger_event(WalletEvent.TransactionFailure, tx_hash)
+        self._stop_tx_tracking(tx_hash)
 
-    def _start_tx_tracking(self, tx_hash: str, gas_price: int):
+    def _start_tx_tracking(self, tx_hash: str, gas_price: int, original_tx_hash: Optional[str] = None):
         self._pending_tx_dict[tx_hash] = gas_price
+        if original_tx_hash is not None and original_tx_hash != tx_hash:
+            self._original_tx_hashes[tx_hash] = original_tx_hash
 
     def _stop_tx_tracking(self, tx_hash: str):
-        if tx_hash in self._pending_tx_dict:
-            del self._pending_tx_dict[tx_hash]
-
-    def schedule_eth_transaction(self, signed_transaction: AttributeDict, gas_price: int):
+        """
+        Stops tracking a transaction, and every replacement of it.
+        """
+        original_tx_hash: str = self._original_tx_hashes.get(tx_hash, tx_hash)
+        for replacement_tx_hash in [h for h, o in self._original_tx_hashes.items() if o == original_tx_hash]:
+            del self._original_tx_hashes[replacement_tx_hash]
+            self._pending_tx_dict.pop(replacement_tx_hash, None)
+        self._pending_tx_dict.pop(original_tx_hash, None)
+        self._pending_tx_values.pop(original_tx_hash, None)
+
+    def schedule_eth_transaction(self,
+                                 transaction: Dict[str, Any],
+                                 signed_transaction: AttributeDict,
+                                 gas_price: int):
         if self._network_status is not NetworkStatus.CONNECTED:
             raise EnvironmentError("Cannot send transactions when network status is not connected.")
 
-        self._outgoing_transactions_queue.put_nowait(signed_transaction)
         tx_hash: str = signed_transaction.hash.hex()
         self._start_tx_tracking(tx_hash, gas_price)
-        self._local_nonce += 1
+        if transaction.get("value", 0) > 0:
+            self._pending_tx_values[tx_hash] = transaction["value"]
+        self._nonce_manager.submit(transaction, signed_transaction)
+
+    def replace_transaction(self, tx_hash: str, gas_price: Optional[int] = None) -> Optional[str]:
+        """
+        Replaces a pending transaction with the same transaction at a higher gas price, e.g. when it's stuck.
+
+        :return: the hash of the replacement transaction, or None if the transaction isn't pending anymore.
+        """
+        return self._nonce_manager.replace_transaction(tx_hash, gas_price or self._gas_price)
 
     def get_balance(self, symbol: str) -> float:
         if self._account_balance_watcher is not None:
@@ -457,6 +515,13 @@ class Web3WalletBackend(PubSub):
         signature: str = signature_dict["signature"].hex()
         return signature
 
+    def sign_hashes(self, hexstrs: List[str]) -> List[str]:
+        """
+        Signs several hashes at once, like sign_hash(). Signing is CPU bound and doesn't access the network, so this can
+        be run in an executor, off the event loop.
+        """
+        return [self._account.signHash(defunct_hash_message(hexstr=hexstr))["signature"].hex() for hexstr in hexstrs]
+
     def execute_transaction(self, contract_function: ContractFunction, **kwargs) -> str:
         """
         This function WILL result in immediate network calls (e.g. to get the gas price, nonce and gas cost), even
@@ -487,7 +552,7 @@ class Web3WalletBackend(PubSub):
             transaction["gas"] = estimate_gas
         signed_transaction: AttributeDict = self._account.signTransaction(transaction)
         tx_hash: str = signed_transaction.hash.hex()
-        self.schedule_eth_transaction(signed_transaction, gas_price)
+        self.schedule_eth_transaction(transaction, signed_transaction, gas_price)
         return tx_hash
 
     def send(self, address: str, asset_name: str, amount: float) -> str:
@@ -514,7 +579,7 @@ class Web3WalletBackend(PubSub):
             }
             signed_transaction: AttributeDict = self._account.signTransaction(transaction)
             tx_hash: str = signed_transaction.hash.hex()
-            self.schedule_eth_transaction(signed_transaction, gas_price)
+            self.schedule_eth_transaction(transaction, signed_transaction, gas_price)
             self.logger().info(f"Sending {amount} ETH from {self.address} to {address}. tx_hash = {tx_hash}.")
             return tx_hash
         else:
@@ -574,11 +639,10 @@ class Web3WalletBackend(PubSub):
         """
         min_approve_amount: int = int(Decimal("1e35"))
         target_approve_amount: int = int(Decimal("1e36"))
-        async_scheduler: AsyncCallScheduler = AsyncCallScheduler.shared_instance()
 
         # Get currently approved amounts
         get_approved_amounts_tasks: List[Coroutine] = [
-            async_scheduler.call_async(erc20_token.contract.functions.allowance(self.address, spender).call)
+            self._jsonrpc_client.call_function(erc20_token.contract.functions.allowance(self.address, spender))
             for erc20_token in self._erc20_token_list
         ]
         approved_amounts: List[int] = await safe_gather(*get_approved_amounts_tasks)
@@ -618,8 +682,15 @@ class Web3WalletBackend(PubSub):
     def _did_receive_new_blocks(self, new_blocks: List[AttributeDict]):
         self._last_timestamp_received_blocks = time.time()
         safe_ensure_future(self._update_gas_price())
+        safe_ensure_future(self._update_nonce_manager())
 
     async def _update_gas_price(self):
-        async_scheduler: AsyncCallScheduler = AsyncCallScheduler.shared_instance()
-        new_gas_price: int = await async_scheduler.call_async(getattr, self._w3.eth, "gasPrice")
+        new_gas_price: int = await self._jsonrpc_client.gas_price()
         self._gas_price = new_gas_price
+
+    async def _update_nonce_manager(self):
+        latest_nonce, pending_nonce = await safe_gather(
+            self._jsonrpc_client.get_transaction_count(self.address, "latest"),
+            self._jsonrpc_client.get_transaction_count(self.address, "pending")
+        )
+        self._nonce_manager.update(latest_nonce, pending_nonce, self._gas_price)
@@ -1,9 +1,15 @@
 import aiohttp
+import asyncio
+import logging
 import random
 import os
+import time
 from decimal import Decimal
 from typing import (
+    Any,
+    Dict,
     List,
+    Optional,
     Tuple
 )
 import ujson
@@ -15,10 +21,19 @@ from hummingbot.wallet.ethereum.zero_ex.zero_ex_transaction_encoder import (
     SignedZeroExTransaction,
     get_transaction_hash_hex
 )
+from hummingbot.core.utils.async_utils import (
+    safe_ensure_future,
+    safe_gather,
+)
+from hummingbot.core.utils.metrics import (
+    Histogram,
+    MetricsRegistry,
+)
+from hummingbot.logger import HummingbotLogger
 from hummingbot.wallet.ethereum.web3_wallet import Web3Wallet
 from hummingbot.wallet.ethereum.zero_ex.zero_ex_custom_utils import (
+    convert_eth_sign_signature,
     convert_order_to_tuple,
-    fix_signature
 )
 
 with open(os.path.join(os.path.dirname(__file__), "zero_ex_exchange_abi.json")) as exchange_abi_json:
@@ -30,6 +45,15 @@ with open(os.path.join(os.path.dirname(__file__), "zero_ex_coordinator_abi.json"
 with open(os.path.join(os.path.dirname(__file__), "zero_ex_coordinator_registry_abi.json")) as coordinator_registry_abi_json:
     coordinator_registry_abi: List[any] = ujson.load(coordinator_registry_abi_json)
 
+ZERO_EX_SOFT_CANCEL_BATCH_SIZE: Histogram = MetricsRegistry.get_instance().histogram(
+    "zero_ex_soft_cancel_batch_size",
+    "Number of 0x orders soft cancelled together in each Coordinator request.",
+    buckets=(1, 2, 5, 10, 20, 50)
+)
+
+# (orders, future of the cancellation result)
+PendingSoftCancel = Tuple[List[Order], asyncio.Future]
+
 
 class ZeroExCancellationFailedException(Exception):
     def __init__(self, approvedOrders: [], cancellations: [], errors: []):
@@ -38,13 +62,32 @@ class ZeroExCancellationFailedException(Exception):
         self.errors = errors
 
 class ZeroExCoordinator:
+    """
+    Soft cancels and fills 0x orders through the Coordinator servers of their fee recipients.
+
+    The soft cancels requested within `soft_cancel_batch_window` are sent as a single batch cancel transaction, and
+    the requests to different Coordinator servers are made concurrently over a pooled HTTP session. When a batch
+    fails, the failed orders of each soft cancel request in it are resubmitted on their own, so one invalid order
+    doesn't fail the requests it was batched with. Server endpoints
+    are looked up in the Coordinator registry once per `endpoint_cache_ttl` seconds.
+    """
+    _zec_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._zec_logger is None:
+            cls._zec_logger = logging.getLogger(__name__)
+        return cls._zec_logger
+
     def __init__(self,
                  provider: Web3.HTTPProvider,
                  w3: Web3,
                  exchange_address: str,
                  coordinator_address: str,
                  coordinator_registry_address: str,
-                 wallet: Web3Wallet):
+                 wallet: Web3Wallet,
+                 soft_cancel_batch_window: float = 0.05,
+                 endpoint_cache_ttl: float = 3600.0):
         self._provider: Web3.HTTPProvider = provider
         self._w3: Web3 = w3
         self._exchange_contract: Contract = w3.eth.contract(address=exchange_address, abi=exchange_abi)
@@ -54,7 +97,15 @@ class ZeroExCoordinator:
         self._registry_contract: Contract = w3.eth.contract(address=coordinator_registry_address, abi=coordinator_registry_abi)
         self._registry_address: str = coordinator_registry_address
         self._wallet: Web3Wallet = wallet
-        self._feeRecipientToEndpoint = {}
+        self._soft_cancel_batch_window: float = soft_cancel_batch_window
+        self._endpoint_cache_ttl: float = endpoint_cache_ttl
+        self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        # fee recipient address -> (server endpoint, lookup timestamp)
+        self._feeRecipientToEndpoint: Dict[str, Tuple[str, float]] = {}
+        # maker address -> soft cancels waiting for the batch window
+        self._pending_soft_cancels: Dict[str, List[PendingSoftCancel]] = {}
+        self._soft_cancel_flush_handle: Optional[asyncio.TimerHandle] = None
+        self._shared_client: Optional[aiohttp.ClientSession] = None
 
     @property
     def contract(self) -> Contract:
@@ -104,40 +155,80 @@ class ZeroExCoordinator:
         return tx_hash
 
     async def soft_cancel_order(self, order: Order) -> bool:
-        order_tuple: Tuple = convert_order_to_tuple(order)
-
-        # Set gas to 1, so it avoids estimateGas call in Web3, which will revert
-        cancelOrderData = self._exchange_contract.functions.cancelOrder(
-            order_tuple
-        ).buildTransaction({ 'gas': 1 })
-
-        data = cancelOrderData['data']
-
-        transaction = self._generate_signed_zero_ex_transaction(data, order['makerAddress'])
-        endpoint = await self._get_server_endpoint_or_throw(order['feeRecipientAddress'])
-
-        response = await self._execute_server_request(transaction, order['makerAddress'], endpoint)
-        if response['isError']:
-            approvedOrders = []
-            cancellations = []
-            errors = {
-                **response, 
-                'orders': [order]
-            }
-            
-            raise ZeroExCancellationFailedException(
-                approvedOrders,
-                cancellations,
-                errors,
-            )
-        else:
-            return True
+        return await self.batch_soft_cancel_orders([order])
 
     async def batch_soft_cancel_orders(self, orders: List[Order]) -> bool:
-        order_tuples: List[Tuple] = [convert_order_to_tuple(order) for order in orders]
-
         makerAddress = orders[0]['makerAddress']
 
+        future: asyncio.Future = self._ev_loop.create_future()
+        if makerAddress not in self._pending_soft_cancels:
+            self._pending_soft_cancels[makerAddress] = []
+        self._pending_soft_cancels[makerAddress].append((orders, future))
+        if self._soft_cancel_flush_handle is None:
+            self._soft_cancel_flush_handle = self._ev_loop.call_later(self._soft_cancel_batch_window,
+                                                                      self._flush_soft_cancels)
+        return await future
+
+    def _flush_soft_cancels(self):
+        self._soft_cancel_flush_handle = None
+        pending_soft_cancels: Dict[str, List[PendingSoftCancel]] = self._pending_soft_cancels
+        self._pending_soft_cancels = {}
+        for makerAddress, pending in pending_soft_cancels.items():
+            safe_ensure_future(self._soft_cancel_batch(makerAddress, pending))
+
+    async def _soft_cancel_batch(self, makerAddress: str, pending: List[PendingSoftCancel]):
+        orders: List[Order] = [order for requestOrders, _ in pending for order in requestOrders]
+        ZERO_EX_SOFT_CANCEL_BATCH_SIZE.observe(len(orders))
+        try:
+            cancellations, errorsWithOrders = await self._request_soft_cancels(makerAddress, orders)
+        except asyncio.CancelledError:
+            for _, future in pending:
+                future.cancel()
+            raise
+        except Exception as e:
+            if len(pending) > 1:
+                # The error may be down to a single request's orders, so each request is retried on its own.
+                await self._retry_soft_cancels(makerAddress, pending)
+                return
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        failedRequests: List[PendingSoftCancel] = []
+        for requestOrders, future in pending:
+            if future.done():
+                continue
+            requestOrderIds = set(id(order) for order in requestOrders)
+            requestErrors = []
+            for error in errorsWithOrders:
+                erroredOrders = [order for order in error['orders'] if id(order) in requestOrderIds]
+                if len(erroredOrders) > 0:
+                    requestErrors.append({**error, 'orders': erroredOrders})
+
+            if len(requestErrors) == 0:
+                future.set_result(True)
+            elif len(pending) > 1:
+                # A Coordinator server rejects the whole transaction if any of its orders is invalid, so the orders of
+                # the other requests sent to it are resubmitted without it.
+                failedRequests.append(([order for error in requestErrors for order in error['orders']], future))
+            else:
+                approvedOrders = []
+                future.set_exception(ZeroExCancellationFailedException(
+                    approvedOrders,
+                    cancellations,
+                    requestErrors
+                ))
+        if len(failedRequests) > 0:
+            await self._retry_soft_cancels(makerAddress, failedRequests)
+
+    async def _retry_soft_cancels(self, makerAddress: str, pending: List[PendingSoftCancel]):
+        self.logger().debug(f"Retrying {len(pending)} soft cancel requests of a failed batch separately.")
+        await safe_gather(*[self._soft_cancel_batch(makerAddress, [request]) for request in pending])
+
+    async def _request_soft_cancels(self, makerAddress: str, orders: List[Order]) -> Tuple[List[Any], List[Any]]:
+        order_tuples: List[Tuple] = [convert_order_to_tuple(order) for order in orders]
+
         # Set gas to 1, so it avoids estimateGas call in Web3, which will revert
         batchCancelOrderData = self._exchange_contract.functions.batchCancelOrders(
             order_tuples
@@ -145,37 +236,21 @@ class ZeroExCoordinator:
 
         data = batchCancelOrderData['data']
 
-        serverEndpointsToOrders =  await self._map_server_endpoints_to_orders(orders)
+        serverEndpointsToOrders = await self._map_server_endpoints_to_orders(orders)
 
-        errorResponses: [] = []
-        successResponses: [] = []
         transaction = self._generate_signed_zero_ex_transaction(data, makerAddress)
-        for endpoint in serverEndpointsToOrders:
-            response = await self._execute_server_request(transaction, makerAddress, endpoint)
-            if response['isError']:
-                errorResponses.append(response)
-            else:
-                successResponses.append(response['body'])
+        responses = await self._execute_server_requests(transaction, makerAddress, serverEndpointsToOrders)
 
-        if len(errorResponses) == 0:
-            return True
-        else:
-            errorsWithOrders = []
+        cancellations = [response['body'] for response in responses if not response['isError']]
+        errorsWithOrders = []
 
-            for errorResponse in errorResponses:
-                errorsWithOrders.append({
-                    **errorResponse,
-                    'orders': serverEndpointsToOrders[errorResponse['coordinatorOperator']]
-                })
+        for errorResponse in [response for response in responses if response['isError']]:
+            errorsWithOrders.append({
+                **errorResponse,
+                'orders': serverEndpointsToOrders[errorResponse['coordinatorOperator']]
+            })
 
-            approvedOrders = []
-            cancellations = successResponses
-
-            raise ZeroExCancellationFailedException(
-                approvedOrders,
-                cancellations,
-                errorsWithOrders
-            )
+        return cancellations, errorsWithOrders
 
     async def hard_cancel_order(self, order: List[Order]) -> str:
         order_tuple: Tuple = convert_order_to_tuple(order)
@@ -234,8 +309,7 @@ class ZeroExCoordinator:
 
         transaction = self._generate_signed_zero_ex_transaction(data, takerAddress)
 
-        for endpoint in serverEndpointsToOrders:
-            response = await self._execute_server_request(transaction, takerAddress, endpoint)
+        for response in await self._execute_server_requests(transaction, takerAddress, serverEndpointsToOrders):
             if response['isError']:
                 errorResponses.append(response)
             else:
@@ -289,7 +363,7 @@ class ZeroExCoordinator:
                 errorsWithOrders
             )
 
-    async def _map_server_endpoints_to_orders(self, coordinatorOrders: List[Order]) -> List[str]:
+    async def _map_server_endpoints_to_orders(self, coordinatorOrders: List[Order]) -> Dict[str, List[Order]]:
         feeRecipientsToOrders = {}
 
         for order in coordinatorOrders:
@@ -299,9 +373,11 @@ class ZeroExCoordinator:
             feeRecipientsToOrders[feeRecipient].append(order)
         
         serverEndpointsToOrders = {}
+        feeRecipients = list(feeRecipientsToOrders.keys())
+        endpoints = await asyncio.gather(*[self._get_server_endpoint_or_throw(feeRecipient)
+                                           for feeRecipient in feeRecipients])
 
-        for feeRecipient in feeRecipientsToOrders:
-            endpoint = await self._get_server_endpoint_or_throw(feeRecipient)
+        for feeRecipient, endpoint in zip(feeRecipients, endpoints):
             orders = feeRecipientsToOrders[feeRecipient]
             if endpoint not in serverEndpointsToOrders:
                 serverEndpointsToOrders[endpoint] = []
@@ -311,13 +387,21 @@ class ZeroExCoordinator:
         return serverEndpointsToOrders
 
     async def _get_server_endpoint_or_throw(self, feeRecipientAddress: str) -> str:
+        feeRecipientAddress = feeRecipientAddress.lower()
+        now: float = time.time()
         if feeRecipientAddress in self._feeRecipientToEndpoint:
-            return self._feeRecipientToEndpoint[feeRecipientAddress]
-        else:
-            return await self._fetch_server_endpoint_or_throw(feeRecipientAddress)
+            endpoint, lookupTimestamp = self._feeRecipientToEndpoint[feeRecipientAddress]
+            if now - lookupTimestamp < self._endpoint_cache_ttl:
+                return endpoint
+
+        endpoint = await self._fetch_server_endpoint_or_throw(feeRecipientAddress)
+        self._feeRecipientToEndpoint[feeRecipientAddress] = (endpoint, now)
+        return endpoint
 
     async def _fetch_server_endpoint_or_throw(self, feeRecipient: str) -> str:
-        coordinatorOperatorEndpoint: str = self._registry_contract.functions.getCoordinatorEndpoint(Web3.toChecksumAddress(feeRecipient)).call()
+        coordinatorOperatorEndpoint: str = await self._wallet.current_backend.jsonrpc_client.call_function(
+            self._registry_contract.functions.getCoordinatorEndpoint(Web3.toChecksumAddress(feeRecipient))
+        )
 
         if (coordinatorOperatorEndpoint == '') or (coordinatorOperatorEndpoint is None):
             raise Exception(
@@ -337,12 +421,18 @@ class ZeroExCoordinator:
         order_hash_hex = get_transaction_hash_hex(transaction['verifyingContractAddress'], data, transaction['salt'], signerAddress)
 
         signature = self._wallet.current_backend.sign_hash(hexstr=order_hash_hex)
-        fixed_signature = fix_signature(self._provider, signerAddress, order_hash_hex, signature)
 
-        transaction['signature'] = fixed_signature
+        transaction['signature'] = convert_eth_sign_signature(signature)
 
         return transaction
     
+    async def _execute_server_requests(self,
+                                       signedTransaction: SignedZeroExTransaction,
+                                       txOrigin: str,
+                                       serverEndpointsToOrders: Dict[str, List[Order]]) -> List[Dict[str, Any]]:
+        return list(await asyncio.gather(*[self._execute_server_request(signedTransaction, txOrigin, endpoint)
+                                           for endpoint in serverEndpointsToOrders]))
+
     async def _execute_server_request(self, signedTransaction: SignedZeroExTransaction, txOrigin: str, endpoint: str) -> bool:
         requestPayload = {
             "signedTransaction": signedTransaction,
@@ -391,15 +481,27 @@ class ZeroExCoordinator:
         }
         return result
     
+    def _http_client(self) -> aiohttp.ClientSession:
+        if self._shared_client is None or self._shared_client.closed:
+            self._shared_client = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=20, keepalive_timeout=60.0)
+            )
+        return self._shared_client
+
+    async def close(self):
+        if self._shared_client is not None:
+            await self._shared_client.close()
+            self._shared_client = None
+
     async def _post_request(self, url, data, timeout=10):
-        async with aiohttp.ClientSession() as client:
-            async with client.request('POST',
-                                      url=url,
-                                      timeout=timeout,
-                                      json=data,
-                                      headers={'Content-Type': 'application/json; charset=utf-8'}) as response:
-                await response.json()
-                return response
+        client: aiohttp.ClientSession = self._http_client()
+        async with client.request('POST',
+                                  url=url,
+                                  timeout=timeout,
+                                  json=data,
+                                  headers={'Content-Type': 'application/json; charset=utf-8'}) as response:
+            await response.json()
+            return response
 
     async def _submit_coordinator_transaction(
         self,
@@ -1,4 +1,13 @@
-from typing import Tuple
+from eth_utils import keccak
+from functools import lru_cache
+from hexbytes import HexBytes
+from typing import (
+    Any,
+    Dict,
+    List,
+    Tuple,
+    Union,
+)
 from zero_ex.order_utils import (
     _Constants,
     _convert_ec_signature_to_vrs_hex,
@@ -75,3 +84,60 @@ def fix_signature(provider, signer_address, hash_hex, signature) -> str:
         + " Attempted to parse as RSV and as VRS."
     )
 
+
+@lru_cache(maxsize=16)
+def _eip712_domain_struct_hash(exchange_address: str) -> bytes:
+    return keccak(_Constants.eip712_domain_struct_header + bytes(12) + HexBytes(exchange_address))
+
+
+@lru_cache(maxsize=256)
+def _asset_data_hash(asset_data: bytes) -> bytes:
+    return keccak(asset_data)
+
+
+def generate_order_hashes_hex(orders: List[Dict[str, Any]], exchange_address: str) -> List[str]:
+    """
+    Computes the EIP712 hashes of several orders at once - same as zero_ex.order_utils.generate_order_hash_hex(), but
+    without its JSON schema validation, and with the domain hash and the asset data hashes shared by the orders of a
+    market only computed once.
+
+    :param orders: orders as JSON dicts or Web3 structs - the asset data can be either hex strings or bytes.
+    :return: the order hashes, as hex strings without the 0x prefix.
+    """
+    domain_struct_hash: bytes = _eip712_domain_struct_hash(exchange_address.lower())
+    order_hashes: List[str] = []
+    for order in orders:
+        order_struct_hash: bytes = keccak(b"".join([
+            _Constants.eip712_order_schema_hash,
+            bytes(12) + HexBytes(order["makerAddress"]),
+            bytes(12) + HexBytes(order["takerAddress"]),
+            bytes(12) + HexBytes(order["feeRecipientAddress"]),
+            bytes(12) + HexBytes(order["senderAddress"]),
+            int(order["makerAssetAmount"]).to_bytes(32, byteorder="big"),
+            int(order["takerAssetAmount"]).to_bytes(32, byteorder="big"),
+            int(order["makerFee"]).to_bytes(32, byteorder="big"),
+            int(order["takerFee"]).to_bytes(32, byteorder="big"),
+            int(order["expirationTimeSeconds"]).to_bytes(32, byteorder="big"),
+            int(order["salt"]).to_bytes(32, byteorder="big"),
+            _asset_data_hash(bytes(HexBytes(order["makerAssetData"]))),
+            _asset_data_hash(bytes(HexBytes(order["takerAssetData"])))
+        ]))
+        order_hashes.append(keccak(_Constants.eip191_header + domain_struct_hash + order_struct_hash).hex())
+    return order_hashes
+
+
+def convert_eth_sign_signature(signature: Union[str, bytes]) -> str:
+    """
+    Formats a local eth_sign signature - R + S + V, as returned by Web3WalletBackend.sign_hash() - as the V + R + S +
+    signature type expected by the 0x protocol.
+
+    Unlike fix_signature(), this doesn't need to check the signature against the exchange contract: the parameter
+    order of a locally made signature is known.
+    """
+    ec_signature = _parse_signature_hex_as_rsv(HexBytes(signature).hex())
+    if ec_signature["v"] not in (27, 28):
+        raise ValueError(f"Invalid V parameter {ec_signature['v']} in eth_sign signature.")
+    return (
+        _convert_ec_signature_to_vrs_hex(ec_signature)
+        + _Constants.SignatureType.ETH_SIGN.value.to_bytes(1, byteorder="big").hex()
+    )
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+
+import asyncio
+import logging
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from hummingbot import get_executor
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.metrics import (
+    Histogram,
+    MetricsRegistry,
+)
+from hummingbot.logger import HummingbotLogger
+from hummingbot.wallet.ethereum.web3_wallet import Web3Wallet
+from hummingbot.wallet.ethereum.zero_ex.zero_ex_custom_utils import (
+    convert_eth_sign_signature,
+    generate_order_hashes_hex,
+)
+
+ZERO_EX_ORDER_SIGNING_BATCH_SIZE: Histogram = MetricsRegistry.get_instance().histogram(
+    "zero_ex_order_signing_batch_size",
+    "Number of 0x orders hashed and signed together in each batch.",
+    buckets=(1, 2, 5, 10, 20, 50)
+)
+
+# (order, future of its (order hash, signature))
+PendingOrder = Tuple[Dict[str, Any], asyncio.Future]
+
+
+class ZeroExOrderSigner:
+    """
+    Hashes and signs 0x orders in batches, in a worker thread off the event loop.
+
+    The orders given to `sign_order()` within the batch window - e.g. the levels of a multi-level maker strategy,
+    placed in the same tick - are hashed together, sharing the domain and asset data hashes, and signed locally with
+    the wallet's key. The signatures are formatted for the 0x protocol without checking them against the exchange
+    contract, which took 2 blocking node calls per order.
+    """
+    _zeos_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._zeos_logger is None:
+            cls._zeos_logger = logging.getLogger(__name__)
+        return cls._zeos_logger
+
+    def __init__(self,
+                 wallet: Web3Wallet,
+                 exchange_address: str,
+                 batch_window: float = 0.01,
+                 max_batch_size: int = 50):
+        self._wallet: Web3Wallet = wallet
+        self._exchange_address: str = exchange_address
+        self._batch_window: float = batch_window
+        self._max_batch_size: int = max_batch_size
+        self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self._pending_orders: List[PendingOrder] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+    async def sign_order(self, order: Dict[str, Any]) -> Tuple[str, str]:
+        """
+        :param order: the unsigned order, as a JSON dict.
+        :return: the order hash as a hex string without the 0x prefix, and the 0x signature of the order.
+        """
+        future: asyncio.Future = self._ev_loop.create_future()
+        self._pending_orders.append((order, future))
+        if len(self._pending_orders) >= self._max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = self._ev_loop.call_later(self._batch_window, self._flush)
+        return await future
+
+    async def sign_orders(self, orders: List[Dict[str, Any]]) -> List[Tuple[str, str]]:
+        return list(await asyncio.gather(*[self.sign_order(order) for order in orders]))
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending_orders: List[PendingOrder] = self._pending_orders
+        self._pending_orders = []
+        if len(pending_orders) > 0:
+            safe_ensure_future(self._sign_batch(pending_orders))
+
+    def _hash_and_sign(self, orders: List[Dict[str, Any]]) -> List[Tuple[str, str]]:
+        order_hashes: List[str] = generate_order_hashes_hex(orders, self._exchange_address)
+        signatures: List[str] = self._wallet.current_backend.sign_hashes(order_hashes)
+        return [(order_hash, convert_eth_sign_signature(signature))
+                for order_hash, signature in zip(order_hashes, signatures)]
+
+    async def _sign_batch(self, pending_orders: List[PendingOrder]):
+        ZERO_EX_ORDER_SIGNING_BATCH_SIZE.observe(len(pending_orders))
+        try:
+            results: List[Tuple[str, str]] = await self._ev_loop.run_in_executor(
+                get_executor(),
+                self._hash_and_sign,
+                [order for order, _ in pending_orders]
+            )
+        except asyncio.CancelledError:
+            for _, future in pending_orders:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in pending_orders:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(pending_orders, results):
+            if not future.done():
+                future.set_result(result)
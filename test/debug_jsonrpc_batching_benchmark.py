@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import argparse
+import asyncio
+from eth_abi import (
+    decode_abi,
+    encode_abi,
+    encode_single,
+)
+import json
+import os
+import time
+from aiohttp import web
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+from web3 import Web3
+from web3.contract import Contract
+
+from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
+from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.wallet.ethereum.async_jsonrpc_client import AsyncJSONRPCClient
+from hummingbot.wallet.ethereum.ethereum_chain import EthereumChain
+from hummingbot.wallet.ethereum.multicall import (
+    AGGREGATE_SELECTOR,
+    get_account_balances,
+)
+
+ACCOUNT_ADDRESS = "0x5409ED021D9299bf6814279A6A1411A7e866A631"
+with open(realpath(join(__file__, "../../hummingbot/wallet/ethereum/token_abi/erc20_abi.json"))) as fd:
+    ERC20_ABI: List[Dict[str, Any]] = json.load(fd)
+
+
+class StubNode:
+    """
+    Local JSON-RPC server standing in for an Ethereum node. Every HTTP request costs `request_latency` seconds, and
+    every call in it `call_latency` seconds.
+    """
+    def __init__(self, request_latency: float, call_latency: float):
+        self.request_latency: float = request_latency
+        self.call_latency: float = call_latency
+        self.http_requests: int = 0
+        self.calls: int = 0
+
+    def handle_call(self, call: Dict[str, Any]) -> Dict[str, Any]:
+        self.calls += 1
+        method: str = call["method"]
+        params: List[Any] = call["params"]
+        if method == "eth_getTransactionReceipt":
+            result: Any = {"transactionHash": params[0], "blockHash": "0x" + "ab" * 32, "blockNumber": "0x10",
+                           "transactionIndex": "0x0", "gasUsed": "0x5208", "cumulativeGasUsed": "0x5208",
+                           "status": "0x1", "logs": [], "contractAddress": None}
+        elif method in ("eth_getBalance", "eth_gasPrice"):
+            result = hex(10 ** 9 if method == "eth_gasPrice" else 10 ** 18)
+        elif method in ("eth_blockNumber", "eth_getTransactionCount"):
+            result = "0x10"
+        elif method == "eth_getLogs":
+            result = []
+        elif method == "eth_call":
+            data: bytes = bytes.fromhex(params[0]["data"][2:])
+            if data.startswith(AGGREGATE_SELECTOR):
+                (calls,) = decode_abi(["(address,bytes)[]"], data[4:])
+                self.calls += len(calls) - 1
+                result = "0x" + encode_abi(["uint256", "bytes[]"],
+                                           [16, [encode_single("uint256", 10 ** 18)] * len(calls)]).hex()
+            else:
+                result = "0x" + encode_single("uint256", 10 ** 18).hex()
+        else:
+            return {"jsonrpc": "2.0", "id": call["id"], "error": {"code": -32601, "message": "Method not found"}}
+        return {"jsonrpc": "2.0", "id": call["id"], "result": result}
+
+    async def handle_request(self, request: web.Request) -> web.Response:
+        self.http_requests += 1
+        payload: Any = await request.json()
+        calls: List[Dict[str, Any]] = payload if isinstance(payload, list) else [payload]
+        await asyncio.sleep(self.request_latency + self.call_latency * len(calls))
+        responses: List[Dict[str, Any]] = [self.handle_call(call) for call in calls]
+        return web.json_response(responses if isinstance(payload, list) else responses[0])
+
+    async def start(self, port: int) -> web.AppRunner:
+        app: web.Application = web.Application()
+        app.router.add_post("/", self.handle_request)
+        runner: web.AppRunner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", port).start()
+        return runner
+
+
+async def fetch_receipts_web3(w3: Web3, tx_hashes: List[str]):
+    scheduler: AsyncCallScheduler = AsyncCallScheduler.shared_instance()
+    await safe_gather(*[scheduler.call_async(w3.eth.getTransactionReceipt, tx_hash) for tx_hash in tx_hashes])
+
+
+async def fetch_receipts_batched(client: AsyncJSONRPCClient, tx_hashes: List[str]):
+    await safe_gather(*[client.get_transaction_receipt(tx_hash) for tx_hash in tx_hashes])
+
+
+async def fetch_balances_web3(w3: Web3, contracts: List[Contract]):
+    scheduler: AsyncCallScheduler = AsyncCallScheduler.shared_instance()
+    await safe_gather(scheduler.call_async(w3.eth.getBalance, ACCOUNT_ADDRESS),
+                      *[scheduler.call_async(contract.functions.balanceOf(ACCOUNT_ADDRESS).call)
+                        for contract in contracts])
+
+
+async def fetch_balances_batched(client: AsyncJSONRPCClient, contracts: List[Contract], chain: EthereumChain):
+    await get_account_balances(client, chain, ACCOUNT_ADDRESS, [contract.address for contract in contracts])
+
+
+async def new_block_workload_web3(w3: Web3, contracts: List[Contract], block_hash: str):
+    # What the wallet backend and watchers did for each new block: gas price, nonce and per token, per event logs.
+    scheduler: AsyncCallScheduler = AsyncCallScheduler.shared_instance()
+    await safe_gather(
+        scheduler.call_async(getattr, w3.eth, "gasPrice"),
+        scheduler.call_async(lambda: w3.eth.getTransactionCount(ACCOUNT_ADDRESS, block_identifier="pending")),
+        *[scheduler.call_async(w3.eth.getLogs, {"address": contract.address, "blockHash": block_hash})
+          for contract in contracts for _ in range(2)]
+    )
+
+
+async def new_block_workload_batched(client: AsyncJSONRPCClient, contracts: List[Contract], block_hash: str):
+    await safe_gather(
+        client.gas_price(),
+        client.get_transaction_count(ACCOUNT_ADDRESS),
+        *[client.get_logs({"address": contract.address, "blockHash": block_hash})
+          for contract in contracts for _ in range(2)]
+    )
+
+
+async def measure_latency(node: StubNode, name: str, coro_factory, iterations: int):
+    # Sequential single calls - the thread pool hop and the per request overhead, without batching.
+    node.http_requests = node.calls = 0
+    start: float = time.perf_counter()
+    for _ in range(iterations):
+        await coro_factory()
+    elapsed: float = time.perf_counter() - start
+    print(f"{name:<40} {elapsed / iterations * 1e3:8.3f}ms per call")
+
+
+async def measure_throughput(name: str, coro_factory, calls: int):
+    start: float = time.perf_counter()
+    await safe_gather(*[coro_factory() for _ in range(calls)])
+    elapsed: float = time.perf_counter() - start
+    print(f"{name:<40} {calls / elapsed:8.0f} calls/s")
+
+
+async def measure(node: StubNode, name: str, coro_factory, iterations: int):
+    node.http_requests = node.calls = 0
+    start: float = time.perf_counter()
+    for _ in range(iterations):
+        await coro_factory()
+    elapsed: float = time.perf_counter() - start
+    print(f"{name:<40} {elapsed / iterations * 1e3:8.2f}ms per round  "
+          f"{node.http_requests / iterations:6.1f} HTTP requests, {node.calls / iterations:6.1f} calls per round")
+
+
+async def run_benchmark(args):
+    node: StubNode = StubNode(args.request_latency * 1e-3, args.call_latency * 1e-3)
+    runner: web.AppRunner = await node.start(args.port)
+    url: str = f"http://127.0.0.1:{args.port}/"
+    w3: Web3 = Web3(Web3.HTTPProvider(url))
+    client: AsyncJSONRPCClient = AsyncJSONRPCClient(url)
+    tx_hashes: List[str] = ["0x" + os.urandom(32).hex() for _ in range(args.transactions)]
+    contracts: List[Contract] = [w3.eth.contract(address=Web3.toChecksumAddress("0x" + os.urandom(20).hex()),
+                                                 abi=ERC20_ABI)
+                                 for _ in range(args.tokens)]
+
+    print(f"{args.transactions} receipts:")
+    await measure(node, "  web3 + AsyncCallScheduler", lambda: fetch_receipts_web3(w3, tx_hashes), args.iterations)
+    await measure(node, "  AsyncJSONRPCClient batch", lambda: fetch_receipts_batched(client, tx_hashes),
+                  args.iterations)
+    print(f"ETH + {args.tokens} token balances:")
+    await measure(node, "  web3 + AsyncCallScheduler", lambda: fetch_balances_web3(w3, contracts), args.iterations)
+    await measure(node, "  AsyncJSONRPCClient batch",
+                  lambda: fetch_balances_batched(client, contracts, EthereumChain.ROPSTEN), args.iterations)
+    await measure(node, "  AsyncJSONRPCClient Multicall",
+                  lambda: fetch_balances_batched(client, contracts, EthereumChain.MAIN_NET), args.iterations)
+
+    block_hash: str = "0x" + os.urandom(32).hex()
+    print(f"New block workload, {args.tokens} tokens:")
+    await measure(node, "  web3 + AsyncCallScheduler", lambda: new_block_workload_web3(w3, contracts, block_hash),
+                  args.iterations)
+    await measure(node, "  AsyncJSONRPCClient", lambda: new_block_workload_batched(client, contracts, block_hash),
+                  args.iterations)
+
+    scheduler: AsyncCallScheduler = AsyncCallScheduler.shared_instance()
+    single_call_client: AsyncJSONRPCClient = AsyncJSONRPCClient(url, max_batch_size=1)
+    print("eth_gasPrice latency:")
+    await measure_latency(node, "  web3 + AsyncCallScheduler", lambda: scheduler.call_async(getattr, w3.eth, "gasPrice"),
+                          args.iterations * 10)
+    await measure_latency(node, "  AsyncJSONRPCClient, unbatched", single_call_client.gas_price, args.iterations * 10)
+    print(f"eth_gasPrice throughput, {args.concurrency} concurrent calls:")
+    await measure_throughput("  web3 + AsyncCallScheduler", lambda: scheduler.call_async(getattr, w3.eth, "gasPrice"),
+                             args.concurrency)
+    await measure_throughput("  AsyncJSONRPCClient, unbatched", single_call_client.gas_price, args.concurrency)
+    await measure_throughput("  AsyncJSONRPCClient", client.gas_price, args.concurrency)
+
+    await single_call_client.close()
+    await client.close()
+    await runner.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compares per call web3 requests through the async call scheduler "
+                                                 "with batched JSON-RPC requests, against a local stub node.")
+    parser.add_argument("--transactions", type=int, default=50)
+    parser.add_argument("--tokens", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--request-latency", type=float, default=5.0, help="Latency per HTTP request, in ms")
+    parser.add_argument("--call-latency", type=float, default=0.1, help="Latency per JSON-RPC call, in ms")
+    parser.add_argument("--port", type=int, default=18545)
+    args = parser.parse_args()
+
+    asyncio.get_event_loop().run_until_complete(run_benchmark(args))
+
+
+if __name__ == "__main__":
+    main()
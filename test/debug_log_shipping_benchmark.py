@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+from aiohttp import web
+from typing import Dict
+
+from hummingbot.logger.log_server_client import LogServerClient
+from hummingbot.logger.reporting_proxy_handler import ReportingProxyHandler
+
+
+class BenchmarkReportingProxyHandler(ReportingProxyHandler):
+    client_id = "benchmark"
+
+
+class LogSink:
+    """
+    Local HTTP server standing in for the reporting proxy. Counts the requests and log records it receives.
+    """
+    def __init__(self):
+        self.requests: int = 0
+        self.records: int = 0
+        self.bytes_received: int = 0
+
+    async def handle_status(self, request: web.Request) -> web.Response:
+        return web.Response(text="OK")
+
+    async def handle_logs(self, request: web.Request) -> web.Response:
+        # aiohttp decompresses gzip request bodies by itself, so take the size on the wire from the headers.
+        body: bytes = await request.read()
+        self.bytes_received += request.content_length or len(body)
+        self.records += len(json.loads(body))
+        self.requests += 1
+        return web.Response(text="{}")
+
+    async def start(self, port: int) -> web.AppRunner:
+        app: web.Application = web.Application()
+        app.router.add_get("/", self.handle_status)
+        app.router.add_post("/logs", self.handle_logs)
+        runner: web.AppRunner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", port).start()
+        return runner
+
+
+async def measure_loop_stalls(stop_event: asyncio.Event, interval: float, stats: Dict[str, float]):
+    while not stop_event.is_set():
+        start: float = time.perf_counter()
+        await asyncio.sleep(interval)
+        stats["max_stall"] = max(stats["max_stall"], time.perf_counter() - start - interval)
+
+
+async def run_benchmark(capacity: int, compress: bool, num_records: int, port: int):
+    sink: LogSink = LogSink()
+    runner: web.AppRunner = await sink.start(port)
+    client: LogServerClient = LogServerClient(max_queue_size=1000,
+                                              flush_interval=0.5,
+                                              check_network_url=f"http://127.0.0.1:{port}/")
+    handler: ReportingProxyHandler = BenchmarkReportingProxyHandler(level=logging.DEBUG,
+                                                                    proxy_url=f"http://127.0.0.1:{port}",
+                                                                    capacity=capacity,
+                                                                    compress=compress,
+                                                                    log_server_client=client)
+    logger: logging.Logger = logging.getLogger(f"log_shipping_benchmark_{capacity}_{compress}")
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(handler)
+
+    client.start()
+    while client.consume_queue_task is None:
+        await asyncio.sleep(0.1)
+
+    stop_event: asyncio.Event = asyncio.Event()
+    stall_stats: Dict[str, float] = {"max_stall": 0.0}
+    stall_task = asyncio.ensure_future(measure_loop_stalls(stop_event, 0.005, stall_stats))
+
+    start: float = time.perf_counter()
+    for i in range(num_records):
+        logger.info(f"Benchmark log record {i} with some payload to make it look like a real log line.")
+        if i % 100 == 0:
+            # Let the loop run, as it would between clock ticks.
+            await asyncio.sleep(0)
+    emit_time: float = time.perf_counter() - start
+    handler.flush(send_all=True)
+    deadline: float = time.perf_counter() + 120.0
+    while client.pending_requests > 0 or client.requests_sent + client.requests_failed < sink.requests:
+        if time.perf_counter() > deadline:
+            break
+        await asyncio.sleep(0.01)
+    # Let the last in-flight requests complete.
+    await asyncio.sleep(0.5)
+    total_time: float = time.perf_counter() - start
+
+    stop_event.set()
+    await stall_task
+    client.stop()
+    await runner.cleanup()
+    print(f"capacity={capacity:<4} gzip={str(compress):<5} "
+          f"emit={num_records / emit_time:10.0f} records/s  "
+          f"delivered={sink.records:7d} records in {sink.requests:6d} requests, {sink.bytes_received / 1e6:.2f}MB, "
+          f"{total_time:.2f}s  "
+          f"max loop stall={stall_stats['max_stall'] * 1e3:.1f}ms  "
+          f"dropped records={handler.records_dropped} requests={client.requests_dropped}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measures remote log shipping throughput and event loop stalls "
+                                                 "against a local HTTP sink.")
+    parser.add_argument("--records", type=int, default=50000)
+    parser.add_argument("--port", type=int, default=18931)
+    args = parser.parse_args()
+
+    ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+    for capacity, compress in [(1, False), (100, False), (100, True)]:
+        ev_loop.run_until_complete(run_benchmark(capacity, compress, args.records, args.port))
+
+
+if __name__ == "__main__":
+    main()
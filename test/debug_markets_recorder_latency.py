@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import argparse
+import numpy as np
+import os
+import tempfile
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from hummingbot.core.event.events import (
+    BuyOrderCreatedEvent,
+    MarketEvent,
+    OrderCancelledEvent,
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType,
+)
+from hummingbot.market.markets_recorder import MarketsRecorder
+from hummingbot.model.sql_connection_manager import (
+    SQLConnectionManager,
+    SQLConnectionType,
+)
+
+
+class BenchmarkInFlightOrder:
+    def __init__(self, client_order_id: str):
+        self.client_order_id: str = client_order_id
+        self.symbol: str = "ETH-USDT"
+        self.price: str = "100.0"
+        self.amount: str = "1.0"
+        self.executed_amount: str = "0"
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "client_order_id": self.client_order_id,
+            "symbol": self.symbol,
+            "price": self.price,
+            "amount": self.amount,
+            "executed_amount": self.executed_amount,
+        }
+
+
+class LatencyBenchmarkMarket:
+    """
+    The parts of a market that the markets recorder touches, so callback latency can be measured without connecting
+    to an exchange. Like the real markets, `tracking_states` serializes every in-flight order each time it's read.
+    """
+    display_name = "benchmark"
+
+    def __init__(self, tracked_orders: int):
+        self.in_flight_orders: Dict[str, BenchmarkInFlightOrder] = {
+            f"order-{i}": BenchmarkInFlightOrder(f"order-{i}")
+            for i in range(tracked_orders)
+        }
+
+    @property
+    def tracking_states(self) -> Dict[str, Any]:
+        return {
+            key: value.to_json()
+            for key, value in self.in_flight_orders.items()
+        }
+
+    def tracking_state_entry(self, order_id: str) -> Optional[Tuple[List[str], Dict[str, Any]]]:
+        in_flight_order: Optional[BenchmarkInFlightOrder] = self.in_flight_orders.get(order_id)
+        return ([order_id], in_flight_order.to_json()) if in_flight_order is not None else None
+
+    @staticmethod
+    def split_symbol(symbol: str) -> Tuple[str, str]:
+        base_asset, quote_asset = symbol.split("-")
+        return base_asset, quote_asset
+
+    def add_listener(self, event_tag, listener):
+        pass
+
+    def remove_listener(self, event_tag, listener):
+        pass
+
+
+def run_benchmark(write_behind: bool, num_orders: int, tracked_orders: int) -> Tuple[np.ndarray, float]:
+    db_path: str = join(tempfile.mkdtemp(), "benchmark_trades.sqlite")
+    sql: SQLConnectionManager = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path=db_path)
+    market: LatencyBenchmarkMarket = LatencyBenchmarkMarket(tracked_orders)
+    recorder: MarketsRecorder = MarketsRecorder(sql, [market], "benchmark.yml", "benchmark", write_behind=write_behind)
+    recorder.start()
+
+    latencies: List[float] = []
+    start: float = time.perf_counter()
+    for i in range(num_orders):
+        order_id: str = f"buy://ETH-USDT/{i}"
+        now: float = time.time()
+        calls = [
+            (recorder._did_create_order, MarketEvent.BuyOrderCreated,
+             BuyOrderCreatedEvent(now, OrderType.LIMIT, "ETH-USDT", 1.0, 100.0, order_id)),
+            (recorder._did_fill_order, MarketEvent.OrderFilled,
+             OrderFilledEvent(now, order_id, "ETH-USDT", TradeType.BUY, OrderType.LIMIT, 100.0, 0.5,
+                              TradeFee(0.001))),
+            (recorder._did_cancel_order, MarketEvent.OrderCancelled,
+             OrderCancelledEvent(now, order_id)),
+        ]
+        for callback, event_type, event in calls:
+            # Update the market's in-flight orders the way a market does before it emits the event.
+            if event_type is MarketEvent.BuyOrderCreated:
+                market.in_flight_orders[order_id] = BenchmarkInFlightOrder(order_id)
+            elif event_type is MarketEvent.OrderFilled:
+                market.in_flight_orders[order_id].executed_amount = "0.5"
+            else:
+                del market.in_flight_orders[order_id]
+            callback_start: float = time.perf_counter()
+            callback(event_type.value, market, event)
+            latencies.append(time.perf_counter() - callback_start)
+    recorder.stop()
+    total_time: float = time.perf_counter() - start
+    os.unlink(db_path)
+    return np.array(latencies), total_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measures the event callback latency of the markets recorder, with "
+                                                 "synchronous writes and with the write-behind journal.")
+    parser.add_argument("--orders", type=int, default=1000)
+    parser.add_argument("--tracked-orders", type=int, default=20)
+    args = parser.parse_args()
+
+    for write_behind in (False, True):
+        latencies, total_time = run_benchmark(write_behind, args.orders, args.tracked_orders)
+        latencies_ms: np.ndarray = latencies * 1e3
+        print(f"{'write-behind' if write_behind else 'synchronous':>12}: "
+              f"{len(latencies)} callbacks, "
+              f"mean={latencies_ms.mean():.3f}ms "
+              f"p50={np.percentile(latencies_ms, 50):.3f}ms "
+              f"p99={np.percentile(latencies_ms, 99):.3f}ms "
+              f"max={latencies_ms.max():.3f}ms, "
+              f"total incl. final flush={total_time:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
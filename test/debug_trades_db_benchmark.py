@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import argparse
+import random
+import shutil
+import tempfile
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+)
+
+from hummingbot.model.market_state import MarketState
+from hummingbot.model.order import Order
+from hummingbot.model.order_status import OrderStatus
+from hummingbot.model.sql_connection_manager import (
+    SQLConnectionManager,
+    SQLConnectionType,
+)
+from hummingbot.model.trade_fill import TradeFill
+
+INSERT_CHUNK_SIZE = 50000
+UNTUNED_INDEXES = ["ms_config_market_index", "os_timestamp_status_index"]
+
+
+def populate(sql: SQLConnectionManager, num_trades: int, num_configs: int):
+    """
+    Fills a trades database with `num_trades` orders, order statuses and trade fills spread over `num_configs` config
+    files, and one market state per config file.
+    """
+    markets: List[str] = ["binance", "ddex", "huobi", "coinbase_pro"]
+    for chunk_start in range(0, num_trades, INSERT_CHUNK_SIZE):
+        orders: List[Dict[str, Any]] = []
+        order_statuses: List[Dict[str, Any]] = []
+        trade_fills: List[Dict[str, Any]] = []
+        for i in range(chunk_start, min(chunk_start + INSERT_CHUNK_SIZE, num_trades)):
+            order_id: str = f"buy-ETH-USDT-{i}"
+            config_file_path: str = f"conf_{i % num_configs}.yml"
+            market: str = markets[i % len(markets)]
+            orders.append(dict(id=order_id, config_file_path=config_file_path, strategy="pure_market_making",
+                               market=market, symbol="ETH-USDT", base_asset="ETH", quote_asset="USDT",
+                               creation_timestamp=i, order_type="LIMIT", amount=1.0, price=100.0,
+                               last_status="OrderFilled", last_update_timestamp=i))
+            order_statuses.append(dict(order_id=order_id, timestamp=i, status="OrderFilled"))
+            trade_fills.append(dict(config_file_path=config_file_path, strategy="pure_market_making",
+                                    market=market, symbol="ETH-USDT", base_asset="ETH", quote_asset="USDT",
+                                    timestamp=i, order_id=order_id, trade_type="BUY", order_type="LIMIT",
+                                    price=100.0, amount=1.0, trade_fee={"percent": 0.001, "flat_fees": []},
+                                    exchange_trade_id=str(i)))
+        with sql.engine.begin() as conn:
+            conn.execute(Order.__table__.insert(), orders)
+            conn.execute(OrderStatus.__table__.insert(), order_statuses)
+            conn.execute(TradeFill.__table__.insert(), trade_fills)
+    with sql.engine.begin() as conn:
+        conn.execute(MarketState.__table__.insert(), [
+            dict(config_file_path=f"conf_{i}.yml", market=market, timestamp=0, saved_state={})
+            for i in range(num_configs)
+            for market in markets
+        ])
+
+
+def timed(description: str, func: Callable[[], Any], repeat: int):
+    start: float = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed: float = time.perf_counter() - start
+    print(f"    {description:<40} {elapsed / repeat * 1e3:10.3f}ms")
+
+
+def run_queries(sql: SQLConnectionManager, num_trades: int, num_configs: int, repeat: int):
+    session = sql.get_shared_session()
+
+    def get_market_states():
+        (session.query(MarketState)
+         .filter(MarketState.config_file_path == f"conf_{random.randrange(num_configs)}.yml",
+                 MarketState.market == "binance")
+         .one_or_none())
+
+    def get_recent_trades():
+        (session.query(TradeFill)
+         .filter(TradeFill.config_file_path == f"conf_{random.randrange(num_configs)}.yml")
+         .order_by(TradeFill.timestamp.desc())
+         .limit(100)
+         .all())
+
+    def get_recent_order_statuses():
+        (session.query(OrderStatus)
+         .filter(OrderStatus.timestamp > num_trades - 1000)
+         .filter(OrderStatus.status.in_(["OrderFilled", "OrderCancelled"]))
+         .order_by(OrderStatus.timestamp)
+         .all())
+
+    def record_order_status():
+        with sql.begin() as write_session:
+            write_session.add(OrderStatus(order_id="buy-ETH-USDT-0", timestamp=num_trades, status="OrderCancelled"))
+
+    timed("market state lookup", get_market_states, repeat)
+    timed("last 100 trades of a config", get_recent_trades, repeat)
+    timed("bounty order status query", get_recent_order_statuses, repeat)
+    timed("single order status transaction", record_order_status, repeat)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks common trades database queries with and without the "
+                                                 "MarketState / OrderStatus indexes and the tuned SQLite profile.")
+    parser.add_argument("--trades", type=int, default=1000000)
+    parser.add_argument("--configs", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    db_dir: str = tempfile.mkdtemp()
+    try:
+        db_path: str = join(db_dir, "benchmark_trades.sqlite")
+        print(f"Populating {db_path} with {args.trades} trades...")
+        populate_sql: SQLConnectionManager = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path=db_path)
+        populate(populate_sql, args.trades, args.configs)
+        populate_sql.get_shared_session().close()
+        populate_sql.engine.dispose()
+
+        untuned_sql: SQLConnectionManager = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path=db_path,
+                                                                 tune_sqlite=False)
+        untuned_sql.get_shared_session().close()
+        with untuned_sql.engine.begin() as conn:
+            conn.execute("PRAGMA journal_mode=DELETE")
+            for index_name in UNTUNED_INDEXES:
+                conn.execute(f"DROP INDEX {index_name}")
+        print("Without indexes, default SQLite settings:")
+        run_queries(untuned_sql, args.trades, args.configs, args.repeat)
+        untuned_sql.get_shared_session().close()
+        untuned_sql.engine.dispose()
+
+        tuned_sql: SQLConnectionManager = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path=db_path)
+        tuned_sql.create_missing_indexes()
+        print("With indexes, tuned SQLite settings:")
+        run_queries(tuned_sql, args.trades, args.configs, args.repeat)
+    finally:
+        shutil.rmtree(db_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -449,6 +449,59 @@ class PaperTradeMarketTest(unittest.TestCase):
         self.assertAlmostEqual(self.market.get_available_balance(trading_pair.base_asset),
                                starting_base_balance - base_quantity)
 
+    def test_bid_limit_order_partial_fill(self):
+        """
+        Test that trades only fill a limit order up to the trade amount, and that fees are applied
+        """
+        trading_pair = TradingPair("ETHUSDT", "ETH", "USDT")
+        base_quantity = 2.0
+        starting_base_balance = 200
+        starting_quote_balance = 2000
+        self.market.set_balance(trading_pair.base_asset, starting_base_balance)
+        self.market.set_balance(trading_pair.quote_asset, starting_quote_balance)
+
+        # Place the bid far away from the market, so there's no volume queued ahead of it and it is not crossed.
+        bid_price = round(self.market.order_books[trading_pair.trading_pair].get_price(False) * 0.5)
+        client_order_id = self.market.buy(trading_pair.trading_pair, base_quantity, OrderType.LIMIT, bid_price)
+        self.assertEqual(0, self.market.limit_order_fill_states[client_order_id].queue_ahead)
+
+        async def delay_trigger_partial_fill():
+            await asyncio.sleep(1)
+            self.market.order_books[trading_pair.trading_pair].apply_trade(OrderBookTradeEvent(
+                symbol=trading_pair.trading_pair, timestamp=time.time(), type=TradeType.SELL, price=bid_price,
+                amount=base_quantity / 2))
+
+        safe_ensure_future(delay_trigger_partial_fill())
+        self.run_parallel(self.market_logger.wait_for(OrderFilledEvent))
+
+        matched_order_fill_events = TestUtils.get_match_events(
+            self.market_logger.event_log, OrderFilledEvent, {
+                "order_type": OrderType.LIMIT,
+                "trade_type": TradeType.BUY,
+                "amount": base_quantity / 2,
+                "order_id": client_order_id
+            })
+        # Market should emit a partial OrderFilledEvent, and keep the rest of the order open
+        self.assertEqual(1, len(matched_order_fill_events))
+        self.assertEqual(1, len([o for o in self.market.limit_orders if o.client_order_id == client_order_id]))
+        self.assertAlmostEqual(float(self.market.on_hold_balances[trading_pair.quote_asset]),
+                               base_quantity / 2 * bid_price)
+
+        async def delay_trigger_final_fill():
+            await asyncio.sleep(1)
+            self.market.order_books[trading_pair.trading_pair].apply_trade(OrderBookTradeEvent(
+                symbol=trading_pair.trading_pair, timestamp=time.time(), type=TradeType.SELL, price=bid_price - 1,
+                amount=base_quantity))
+
+        safe_ensure_future(delay_trigger_final_fill())
+        [completed_event] = self.run_parallel(self.market_logger.wait_for(BuyOrderCompletedEvent))
+        self.assertEqual(client_order_id, completed_event.order_id)
+        self.assertAlmostEqual(base_quantity, completed_event.base_asset_amount)
+        self.assertAlmostEqual(base_quantity * bid_price, completed_event.quote_asset_amount)
+        self.assertAlmostEqual(starting_base_balance + base_quantity, self.market.get_balance(trading_pair.base_asset))
+        self.assertAlmostEqual(starting_quote_balance - base_quantity * bid_price,
+                               self.market.get_balance(trading_pair.quote_asset))
+
     def test_order_cancellation(self):
         trading_pair = TradingPair("ETHUSDT", "ETH", "USDT")
         base_quantity = 2.0
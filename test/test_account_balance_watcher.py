@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from eth_abi import encode_single
+from hexbytes import HexBytes
+from typing import (
+    Dict,
+    List,
+    Union,
+)
+import unittest
+from unittest.mock import MagicMock
+from web3.datastructures import AttributeDict
+
+from hummingbot.core.event.events import (
+    EthereumGasUsedEvent,
+    WalletReceivedAssetEvent,
+    WalletSentAssetEvent,
+    WalletUnwrappedEthEvent,
+)
+from hummingbot.wallet.ethereum.watcher.account_balance_watcher import AccountBalanceWatcher
+
+ACCOUNT_ADDRESS = "0x" + "11" * 20
+WETH_ADDRESS = "0x" + "22" * 20
+OTHER_ADDRESS = "0x" + "33" * 20
+
+
+def make_block(number: int, timestamp: int = 1560000000) -> AttributeDict:
+    return AttributeDict({"number": number, "timestamp": timestamp})
+
+
+class MockJSONRPCClient:
+    def __init__(self):
+        # block number -> (raw ETH balance, raw WETH balance)
+        self.balances: Dict[int, List[int]] = {}
+        self.requests: int = 0
+
+    async def get_balance(self, address: str, block_identifier: Union[int, str] = "latest") -> int:
+        self.requests += 1
+        return self.balances[block_identifier][0]
+
+    async def call(self, to: str, data: bytes, block_identifier: Union[int, str] = "latest") -> HexBytes:
+        self.requests += 1
+        return HexBytes(encode_single("uint256", self.balances[block_identifier][1]))
+
+
+class AccountBalanceWatcherUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self.client: MockJSONRPCClient = MockJSONRPCClient()
+        self.watcher: AccountBalanceWatcher = AccountBalanceWatcher(MagicMock(),
+                                                                    MagicMock(),
+                                                                    ACCOUNT_ADDRESS,
+                                                                    [],
+                                                                    [],
+                                                                    jsonrpc_client=self.client,
+                                                                    erc20_events_watcher=MagicMock(),
+                                                                    incoming_eth_watcher=MagicMock(),
+                                                                    weth_watcher=MagicMock())
+        self.watcher._erc20_contracts["WETH"] = MagicMock(address=WETH_ADDRESS)
+        self.watcher._erc20_decimals["WETH"] = 18
+        self.client.balances[10] = [10 ** 18, 5 * 10 ** 18]
+        self.watcher.did_receive_new_blocks([make_block(10)])
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+
+    def received_weth(self, block: AttributeDict, raw_amount: int):
+        self.watcher.did_receive_asset(WalletReceivedAssetEvent(float(block.timestamp), "0x01", OTHER_ADDRESS,
+                                                                ACCOUNT_ADDRESS, "WETH", raw_amount * 1e-18,
+                                                                raw_amount, block.number))
+
+    def test_balance_deltas(self):
+        self.assertEqual({"ETH": 10 ** 18, "WETH": 5 * 10 ** 18}, self.watcher.get_raw_balances())
+        requests: int = self.client.requests
+
+        block: AttributeDict = make_block(11)
+        self.watcher.did_receive_new_blocks([block])
+        self.received_weth(block, 10 ** 18)
+        self.watcher.did_send_asset(WalletSentAssetEvent(float(block.timestamp), "0x02", ACCOUNT_ADDRESS,
+                                                         OTHER_ADDRESS, "WETH", 0.5, 5 * 10 ** 17, block.number))
+        self.watcher.did_unwrap_eth(WalletUnwrappedEthEvent(float(block.timestamp), "0x03", ACCOUNT_ADDRESS,
+                                                            2.0, 2 * 10 ** 18, block.number))
+        self.watcher.did_use_gas(EthereumGasUsedEvent(float(block.timestamp), "0x03", 1.0, 10 ** 9, 50000,
+                                                      5e-5, 5 * 10 ** 13, block.number))
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+        self.assertEqual({"ETH": 3 * 10 ** 18 - 5 * 10 ** 13, "WETH": 35 * 10 ** 17}, self.watcher.get_raw_balances())
+        # No balance queries until the next full refresh.
+        self.assertEqual(requests, self.client.requests)
+
+    def test_reconciliation(self):
+        # Blocks 11 and 12 share a timestamp, so events are told apart by block number.
+        block_11: AttributeDict = make_block(11)
+        block_12: AttributeDict = make_block(12)
+
+        # The refresh is read at block 11, and events from blocks 11 and 12 are handled while it is in flight. The
+        # node also has some ETH the events didn't show.
+        self.client.balances[11] = [2 * 10 ** 18, 6 * 10 ** 18]
+        self.watcher._last_reconciliation_time = 0
+        self.watcher.did_receive_new_blocks([block_11])
+        self.received_weth(block_11, 10 ** 18)
+        self.received_weth(block_12, 2 * 10 ** 18)
+        self.assertEqual(8 * 10 ** 18, self.watcher.get_raw_balance("WETH"))
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+        self.assertEqual({"ETH": 2 * 10 ** 18, "WETH": 8 * 10 ** 18}, self.watcher.get_raw_balances())
+
+        # Events from blocks included in the refresh are already counted.
+        self.received_weth(block_11, 10 ** 18)
+        self.assertEqual(8 * 10 ** 18, self.watcher.get_raw_balance("WETH"))
+        self.received_weth(make_block(13, 1560000015), 10 ** 18)
+        self.assertEqual(9 * 10 ** 18, self.watcher.get_raw_balance("WETH"))
+
+
+if __name__ == "__main__":
+    unittest.main()
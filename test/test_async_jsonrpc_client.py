@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from aiohttp import web
+import asyncio
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+)
+import unittest
+
+from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.wallet.ethereum.async_jsonrpc_client import (
+    AsyncJSONRPCClient,
+    JSONRPCError,
+)
+
+# Responses to the calls of one HTTP request - each response is given the request, and returns its JSON-RPC reply.
+ResponseHandler = Callable[[List[Dict[str, Any]]], Any]
+
+
+def results(calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [{"jsonrpc": "2.0", "id": call["id"], "result": hex(100 + call["id"])} for call in calls]
+
+
+class MockNode:
+    """
+    JSON-RPC endpoint that records the payload of every HTTP request, and replies with the response handler's result.
+    """
+    def __init__(self):
+        self.payloads: List[Any] = []
+        self.response_handler: ResponseHandler = results
+        self.status: int = 200
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._runner.addresses[0][:2]
+        return f"http://{host}:{port}/"
+
+    async def handle_request(self, request: web.Request) -> web.Response:
+        payload: Any = await request.json()
+        self.payloads.append(payload)
+        if self.status != 200:
+            return web.Response(status=self.status)
+        calls: List[Dict[str, Any]] = payload if isinstance(payload, list) else [payload]
+        return web.json_response(self.response_handler(calls))
+
+    async def start(self):
+        app: web.Application = web.Application()
+        app.router.add_post("/", self.handle_request)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, "127.0.0.1", 0).start()
+
+    async def stop(self):
+        await self._runner.cleanup()
+
+
+class AsyncJSONRPCClientUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self.node: MockNode = MockNode()
+        self.ev_loop.run_until_complete(self.node.start())
+        self.client: AsyncJSONRPCClient = AsyncJSONRPCClient(self.node.url, max_batch_size=3)
+
+    def tearDown(self):
+        self.ev_loop.run_until_complete(self.client.close())
+        self.ev_loop.run_until_complete(self.node.stop())
+
+    def run_calls(self, num_calls: int) -> List[Any]:
+        return self.ev_loop.run_until_complete(safe_gather(*[
+            self.client.get_balance("0x" + "11" * 20, block_number) for block_number in range(num_calls)
+        ], return_exceptions=True))
+
+    def test_single_call(self):
+        self.assertEqual([100], self.run_calls(1))
+        # A single call is sent as a plain JSON-RPC request, not as a batch.
+        self.assertEqual([{"jsonrpc": "2.0", "id": 0, "method": "eth_getBalance",
+                           "params": ["0x" + "11" * 20, "0x0"]}], self.node.payloads)
+
+    def test_batch(self):
+        self.assertEqual([100, 101, 102, 100, 101], self.run_calls(5))
+        # Calls beyond the maximum batch size go out in the next request.
+        self.assertEqual([3, 2], [len(payload) for payload in self.node.payloads])
+        self.assertEqual(["0x0", "0x1", "0x2"], [call["params"][1] for call in self.node.payloads[0]])
+
+    def test_out_of_order_responses(self):
+        self.node.response_handler = lambda calls: list(reversed(results(calls)))
+        self.assertEqual([100, 101, 102], self.run_calls(3))
+
+    def test_missing_response(self):
+        self.node.response_handler = lambda calls: [response for response in results(calls) if response["id"] != 1]
+        call_results: List[Any] = self.run_calls(3)
+        self.assertEqual(100, call_results[0])
+        self.assertIsInstance(call_results[1], IOError)
+        self.assertEqual("No response to JSON-RPC call eth_getBalance.", str(call_results[1]))
+        self.assertEqual(102, call_results[2])
+
+    def test_error_response(self):
+        error: Dict[str, Any] = {"code": -32000, "message": "header not found"}
+
+        def respond(calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            responses: List[Dict[str, Any]] = results(calls)
+            responses[1] = {"jsonrpc": "2.0", "id": 1, "error": error}
+            return responses
+
+        self.node.response_handler = respond
+        call_results: List[Any] = self.run_calls(3)
+        self.assertEqual(100, call_results[0])
+        self.assertIsInstance(call_results[1], JSONRPCError)
+        self.assertEqual(error, call_results[1].error)
+        self.assertEqual(102, call_results[2])
+
+    def test_batch_error_response(self):
+        # A node rejects a whole batch with a single error response, without an ID.
+        error: Dict[str, Any] = {"code": -32600, "message": "batch too large"}
+        self.node.response_handler = lambda calls: {"jsonrpc": "2.0", "id": None, "error": error}
+        call_results: List[Any] = self.run_calls(3)
+        for call_result in call_results:
+            self.assertIsInstance(call_result, JSONRPCError)
+            self.assertEqual(error, call_result.error)
+
+    def test_http_error(self):
+        self.node.status = 502
+        call_results: List[Any] = self.run_calls(2)
+        for call_result in call_results:
+            self.assertIsInstance(call_result, IOError)
+            self.assertNotIsInstance(call_result, JSONRPCError)
+            self.assertIn("HTTP status is 502", str(call_result))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from hexbytes import HexBytes
+import os
+import tempfile
+from typing import (
+    Dict,
+    List,
+)
+import unittest
+from web3.datastructures import AttributeDict
+
+from hummingbot.wallet.ethereum.block_cache import BlockCache
+
+
+def make_block(number: int, fork: int = 0) -> AttributeDict:
+    return AttributeDict({
+        "number": number,
+        "hash": HexBytes(bytes([fork, number]) * 16),
+        "parentHash": HexBytes(bytes([fork, number - 1]) * 16),
+        "timestamp": 1560000000 + number * 15,
+        "logsBloom": HexBytes(b"\x00" * 256),
+        "transactions": []
+    })
+
+
+def make_receipt(tx_index: int, block: AttributeDict) -> AttributeDict:
+    return AttributeDict({
+        "transactionHash": HexBytes(bytes([tx_index]) * 32),
+        "blockHash": block.hash,
+        "blockNumber": block.number,
+        "status": 1
+    })
+
+
+class MockJSONRPCClient:
+    def __init__(self, blocks: List[AttributeDict], receipts: List[AttributeDict]):
+        self.blocks: Dict[HexBytes, AttributeDict] = dict((block.hash, block) for block in blocks)
+        self.receipts: Dict[HexBytes, AttributeDict] = dict((receipt.transactionHash, receipt) for receipt in receipts)
+        self.requests: int = 0
+
+    async def get_block(self, block_hash, full_transactions: bool = False):
+        self.requests += 1
+        return self.blocks.get(HexBytes(block_hash))
+
+    async def get_transaction_receipt(self, tx_hash):
+        self.requests += 1
+        return self.receipts.get(HexBytes(tx_hash))
+
+
+class BlockCacheUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+    def test_lru_eviction(self):
+        cache: BlockCache = BlockCache(max_headers=3)
+        blocks: List[AttributeDict] = [make_block(i) for i in range(1, 5)]
+        for block in blocks[:3]:
+            cache.add_block(block)
+        self.assertEqual(blocks[0].timestamp, cache.get_header(blocks[0].hash).timestamp)
+        cache.add_block(blocks[3])
+        self.assertEqual(3, len(cache))
+        self.assertIsNone(cache.get_header(blocks[1].hash))
+        self.assertIsNotNone(cache.get_header(blocks[0].hash))
+        self.assertNotIn("transactions", cache.get_header(blocks[3].hash))
+
+    def test_receipts_and_reorganization(self):
+        cache: BlockCache = BlockCache()
+        block: AttributeDict = make_block(10)
+        receipts: List[AttributeDict] = [make_receipt(i, block) for i in range(3)]
+        pending_tx_hash: HexBytes = HexBytes(b"\xff" * 32)
+        client: MockJSONRPCClient = MockJSONRPCClient([block], receipts)
+
+        fetched: List[AttributeDict] = self.ev_loop.run_until_complete(
+            cache.get_receipts(client, [r.transactionHash for r in receipts] + [pending_tx_hash])
+        )
+        self.assertEqual(receipts + [None], fetched)
+        self.assertEqual(4, client.requests)
+        self.ev_loop.run_until_complete(cache.get_receipts(client, [r.transactionHash for r in receipts]))
+        self.assertEqual(4, client.requests)
+
+        self.assertEqual(block.timestamp, self.ev_loop.run_until_complete(cache.get_timestamp(client, block.hash)))
+        self.assertEqual(5, client.requests)
+        self.assertEqual(block.timestamp, self.ev_loop.run_until_complete(cache.get_timestamp(client, block.hash)))
+        self.assertEqual(5, client.requests)
+
+        cache.invalidate_block(block.hash)
+        self.assertIsNone(cache.get_header(block.hash))
+        for receipt in receipts:
+            self.assertIsNone(cache.get_receipt(receipt.transactionHash))
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path: str = os.path.join(temp_dir, "ethereum_block_cache.json")
+            cache: BlockCache = BlockCache(path=path)
+            blocks: List[AttributeDict] = [make_block(i) for i in range(1, 6)]
+            for block in blocks:
+                cache.add_block(block)
+            cache.save()
+
+            loaded_cache: BlockCache = BlockCache(max_headers=3, path=path)
+            loaded_cache.load()
+            self.assertEqual(3, len(loaded_cache))
+            for block in blocks[2:]:
+                header: AttributeDict = loaded_cache.get_header(block.hash)
+                self.assertEqual(block.timestamp, header.timestamp)
+                self.assertEqual(block.parentHash, header.parentHash)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from eth_abi import encode_single
+from eth_utils import (
+    encode_hex,
+    event_abi_to_log_topic,
+    to_checksum_address,
+)
+from hexbytes import HexBytes
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+import unittest
+from unittest.mock import MagicMock
+from web3.datastructures import AttributeDict
+
+from hummingbot.wallet.ethereum.logs_bloom import bloom_mask
+from hummingbot.wallet.ethereum.watcher.contract_event_logs import (
+    MultiContractEventLogger,
+    address_to_topic,
+)
+
+TRANSFER_EVENT_ABI: Dict[str, Any] = {
+    "anonymous": False,
+    "inputs": [
+        {"indexed": True, "name": "from", "type": "address"},
+        {"indexed": True, "name": "to", "type": "address"},
+        {"indexed": False, "name": "value", "type": "uint256"},
+    ],
+    "name": "Transfer",
+    "type": "event",
+}
+TRANSFER_TOPIC: str = encode_hex(event_abi_to_log_topic(TRANSFER_EVENT_ABI))
+TOKEN_A = to_checksum_address("0x" + "aa" * 20)
+TOKEN_B = to_checksum_address("0x" + "bb" * 20)
+WALLET_ADDRESS = to_checksum_address("0x" + "11" * 20)
+OTHER_ADDRESS = to_checksum_address("0x" + "22" * 20)
+
+
+def block_hash(number: int, fork: int = 0) -> HexBytes:
+    return HexBytes(bytes([fork]) + number.to_bytes(31, "big"))
+
+
+def make_log(block_number: int, log_index: int, token: str, to_address: str, value: int,
+             tx_index: int = 0, fork: int = 0) -> AttributeDict:
+    return AttributeDict({
+        "address": token,
+        "topics": [HexBytes(TRANSFER_TOPIC), HexBytes(address_to_topic(OTHER_ADDRESS)),
+                   HexBytes(address_to_topic(to_address))],
+        "data": "0x" + encode_single("uint256", value).hex(),
+        "blockNumber": block_number,
+        "blockHash": block_hash(block_number, fork),
+        "transactionHash": HexBytes(bytes([fork, block_number, tx_index]) * 8 + bytes(8)),
+        "transactionIndex": tx_index,
+        "logIndex": log_index,
+        "removed": False,
+    })
+
+
+def make_block(number: int, logs: List[AttributeDict], fork: int = 0) -> AttributeDict:
+    # The logs bloom has the address and topic bits of every log in the block.
+    bloom: int = 0
+    for log in logs:
+        for value in [log.address] + log.topics:
+            bloom |= bloom_mask(value)
+    return AttributeDict({
+        "number": number,
+        "hash": block_hash(number, fork),
+        "parentHash": block_hash(number - 1, fork),
+        "logsBloom": HexBytes(bloom.to_bytes(256, "big")),
+    })
+
+
+class MockJSONRPCClient:
+    def __init__(self):
+        self.logs: List[AttributeDict] = []
+        self.requests: List[Dict[str, Any]] = []
+
+    async def get_logs(self, filter_params: Dict[str, Any]) -> List[AttributeDict]:
+        self.requests.append(filter_params)
+        return [log for log in self.logs if self.matches(filter_params, log)]
+
+    @staticmethod
+    def matches(filter_params: Dict[str, Any], log: AttributeDict) -> bool:
+        if not filter_params["fromBlock"] <= log.blockNumber <= filter_params["toBlock"]:
+            return False
+        if log.address not in filter_params["address"]:
+            return False
+        for topic_filter, topic in zip(filter_params["topics"], log.topics):
+            topic_filters: List[str] = topic_filter if isinstance(topic_filter, list) else [topic_filter]
+            if topic_filter is not None and topic.hex() not in [HexBytes(t).hex() for t in topic_filters]:
+                return False
+        return True
+
+
+class MultiContractEventLoggerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self.client: MockJSONRPCClient = MockJSONRPCClient()
+        self.event_logger: MultiContractEventLogger = MultiContractEventLogger(
+            MagicMock(),
+            {TOKEN_A: [TRANSFER_EVENT_ABI], TOKEN_B: [TRANSFER_EVENT_ABI]},
+            block_events_window_size=3,
+            jsonrpc_client=self.client,
+            name="test_contract_events"
+        )
+
+    def get_incoming_transfers(self, blocks: List[AttributeDict]) -> List[AttributeDict]:
+        return self.ev_loop.run_until_complete(
+            self.event_logger.get_new_entries_from_logs({"Transfer": {2: [WALLET_ADDRESS]}}, blocks)
+        )
+
+    def test_block_range_query(self):
+        logs: List[AttributeDict] = [make_log(11, 3, TOKEN_B, WALLET_ADDRESS, 2),
+                                     make_log(11, 1, TOKEN_A, WALLET_ADDRESS, 1),
+                                     make_log(13, 0, TOKEN_A, WALLET_ADDRESS, 3),
+                                     make_log(13, 1, TOKEN_A, OTHER_ADDRESS, 4)]
+        self.client.logs = logs
+        blocks: List[AttributeDict] = [make_block(11, logs[:2]), make_block(12, []), make_block(13, logs[2:])]
+        transfers: List[AttributeDict] = self.get_incoming_transfers(blocks)
+
+        # One query for the blocks' number range, all contracts, and the recipient topic.
+        self.assertEqual([{
+            "fromBlock": 11,
+            "toBlock": 13,
+            "address": [TOKEN_A, TOKEN_B],
+            "topics": [TRANSFER_TOPIC, None, [address_to_topic(WALLET_ADDRESS)]],
+        }], self.client.requests)
+        # Decoded events, in block and log index order.
+        self.assertEqual([(11, TOKEN_A, 1), (11, TOKEN_B, 2), (13, TOKEN_A, 3)],
+                         [(t.blockNumber, t.address, t.args.value) for t in transfers])
+        self.assertEqual([WALLET_ADDRESS] * 3, [to_checksum_address(t.args.to) for t in transfers])
+
+    def test_skip_blocks_by_logs_bloom(self):
+        logs: List[AttributeDict] = [make_log(11, 0, TOKEN_A, WALLET_ADDRESS, 1),
+                                     make_log(13, 0, TOKEN_A, OTHER_ADDRESS, 2)]
+        self.client.logs = logs
+        # Block 13 only has a transfer to another address, so its bloom rules it out.
+        blocks: List[AttributeDict] = [make_block(11, logs[:1]), make_block(12, []), make_block(13, logs[1:])]
+        self.assertEqual(1, len(self.get_incoming_transfers(blocks)))
+        self.assertEqual([(11, 11)], [(r["fromBlock"], r["toBlock"]) for r in self.client.requests])
+
+        self.client.requests.clear()
+        self.assertEqual([], self.get_incoming_transfers(blocks[1:]))
+        self.assertEqual([], self.client.requests)
+
+    def test_skip_logs_of_other_forks(self):
+        # The node has already reorganized block 12, while the blocks watcher is still on the old fork.
+        old_fork_logs: List[AttributeDict] = [make_log(12, 0, TOKEN_A, WALLET_ADDRESS, 1)]
+        new_fork_logs: List[AttributeDict] = [make_log(12, 0, TOKEN_A, WALLET_ADDRESS, 5, fork=1)]
+        self.client.logs = new_fork_logs
+        self.assertEqual([], self.get_incoming_transfers([make_block(12, old_fork_logs)]))
+
+        # Removed logs are skipped as well.
+        self.client.logs = [AttributeDict(dict(new_fork_logs[0], removed=True))]
+        self.assertEqual([], self.get_incoming_transfers([make_block(12, new_fork_logs, fork=1)]))
+
+        # The event is reported once the replacement block comes in.
+        self.client.logs = new_fork_logs
+        transfers: List[AttributeDict] = self.get_incoming_transfers([make_block(12, new_fork_logs, fork=1)])
+        self.assertEqual([(block_hash(12, fork=1), 5)], [(t.blockHash, t.args.value) for t in transfers])
+
+    def test_skip_duplicates(self):
+        # Transfers of two tokens in the same transaction are different events.
+        logs: List[AttributeDict] = [make_log(11, 0, TOKEN_A, WALLET_ADDRESS, 1),
+                                     make_log(11, 1, TOKEN_B, WALLET_ADDRESS, 2)]
+        self.client.logs = logs
+        blocks: List[AttributeDict] = [make_block(11, logs)]
+        self.assertEqual(2, len(self.get_incoming_transfers(blocks)))
+        self.assertEqual([], self.get_incoming_transfers(blocks))
+
+        # Events are remembered for the last block_events_window_size blocks with events.
+        for block_number in range(12, 15):
+            block_logs: List[AttributeDict] = [make_log(block_number, 0, TOKEN_A, WALLET_ADDRESS, block_number)]
+            self.client.logs = block_logs
+            self.assertEqual(1, len(self.get_incoming_transfers([make_block(block_number, block_logs)])))
+        self.client.logs = logs
+        self.assertEqual(2, len(self.get_incoming_transfers(blocks)))
+
+
+if __name__ == "__main__":
+    unittest.main()
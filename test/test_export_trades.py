@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import os
+import pandas as pd
+import shutil
+import tempfile
+from typing import (
+    Any,
+    Iterator,
+    List,
+)
+import unittest
+
+from hummingbot.client.command.export_trades_command import (
+    export_trades_to_csv,
+    export_trades_to_npz,
+    iter_trade_chunks,
+    load_npz_trades_export,
+)
+from hummingbot.core.event.events import TradeFee
+from hummingbot.model.sql_connection_manager import (
+    SQLConnectionManager,
+    SQLConnectionType,
+)
+from hummingbot.model.trade_fill import TradeFill
+
+
+class ExportTradesUnitTest(unittest.TestCase):
+    NUM_TRADES = 25
+
+    def setUp(self):
+        self.temp_dir: str = tempfile.mkdtemp()
+        self.sql: SQLConnectionManager = SQLConnectionManager(SQLConnectionType.TRADE_FILLS,
+                                                              db_path=os.path.join(self.temp_dir, "trades.sqlite"))
+        with self.sql.begin() as session:
+            for i in range(self.NUM_TRADES):
+                flat_fees = [("ETH", 0.001 * i)] if i % 2 == 0 else []
+                session.add(TradeFill(config_file_path="test_config.yml",
+                                      strategy="test_strategy",
+                                      market="binance",
+                                      symbol="ETHUSDT",
+                                      base_asset="ETH",
+                                      quote_asset="USDT",
+                                      timestamp=1560000000000 + i * 1000,
+                                      order_id=f"order-{i}",
+                                      trade_type="BUY" if i % 3 == 0 else "SELL",
+                                      order_type="LIMIT",
+                                      price=100.0 + i,
+                                      amount=0.5 * (i + 1),
+                                      trade_fee=TradeFee.to_json(TradeFee(0.001, flat_fees)),
+                                      exchange_trade_id=f"trade-{i}"))
+        self.expected_df: pd.DataFrame = TradeFill.to_pandas(list(self.iter_trades()))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def iter_trades(self) -> Iterator[Any]:
+        with self.sql.begin() as session:
+            yield from (session
+                        .query(*TradeFill.display_query_columns())
+                        .order_by(TradeFill.timestamp)
+                        .yield_per(10))
+
+    def test_iter_trade_chunks(self):
+        chunks: List[pd.DataFrame] = list(iter_trade_chunks(self.iter_trades(), chunk_size=10))
+        self.assertEqual([10, 10, 5], [len(chunk) for chunk in chunks])
+        df: pd.DataFrame = pd.concat(chunks)
+        self.assertEqual(list(range(self.NUM_TRADES)), list(df.index))
+        pd.testing.assert_frame_equal(self.expected_df, df)
+        self.assertEqual("0.024 ETH", df["flat_fee / gas"][24])
+        self.assertEqual("None", df["flat_fee / gas"][23])
+        self.assertEqual([], list(iter_trade_chunks([], chunk_size=10)))
+
+    def test_export_trades_to_csv(self):
+        path: str = os.path.join(self.temp_dir, "trades.csv")
+        self.assertEqual(self.NUM_TRADES, export_trades_to_csv(self.iter_trades(), path, chunk_size=10))
+        df: pd.DataFrame = pd.read_csv(path, index_col=0, keep_default_na=False)
+        # The header is written once, with the index continuing across chunks.
+        self.assertEqual(list(range(self.NUM_TRADES)), list(df.index))
+        pd.testing.assert_frame_equal(self.expected_df, df, check_dtype=False)
+
+        self.assertEqual(0, export_trades_to_csv([], os.path.join(self.temp_dir, "empty.csv")))
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir, "empty.csv")))
+
+    def test_export_trades_to_npz(self):
+        path: str = os.path.join(self.temp_dir, "trades_npz")
+        self.assertEqual(self.NUM_TRADES, export_trades_to_npz(self.iter_trades(), path, chunk_size=10))
+        self.assertEqual(["part-00000.npz", "part-00001.npz", "part-00002.npz"], sorted(os.listdir(path)))
+        df: pd.DataFrame = load_npz_trades_export(path)
+        pd.testing.assert_frame_equal(self.expected_df, df, check_dtype=False)
+
+        empty_path: str = os.path.join(self.temp_dir, "empty_npz")
+        self.assertEqual(0, export_trades_to_npz([], empty_path))
+        self.assertFalse(os.path.exists(empty_path))
+        os.makedirs(empty_path)
+        self.assertEqual(TradeFill.DISPLAY_COLUMNS, list(load_npz_trades_export(empty_path).columns))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from typing import (
+    Dict,
+    List,
+)
+import unittest
+
+from hummingbot.client.command.history_command import HistoryCommand
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+
+
+class MockMarket:
+    def __init__(self, name: str, balances: Dict[str, float], price: float):
+        self.name: str = name
+        self.balances: Dict[str, float] = balances
+        self.price: float = price
+        self.balance_reads: int = 0
+
+    def get_all_balances(self) -> Dict[str, float]:
+        self.balance_reads += 1
+        return dict(self.balances)
+
+    def get_price(self, symbol: str, is_buy: bool) -> float:
+        return self.price
+
+
+class MockApplication(HistoryCommand):
+    def __init__(self, market: MockMarket, market_trading_pair_tuples: List[MarketTradingPairTuple]):
+        self.markets: Dict[str, MockMarket] = {market.name: market}
+        self.market_trading_pair_tuples: List[MarketTradingPairTuple] = market_trading_pair_tuples
+        self.assets: List[str] = ["ETH", "USDT"]
+        self.starting_balances: Dict[str, Dict[str, float]] = self.balance_snapshot()
+
+
+class HistoryCommandUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.market: MockMarket = MockMarket("binance", {"ETH": 10.0, "USDT": 1000.0}, 100.0)
+        self.market_info: MarketTradingPairTuple = MarketTradingPairTuple(self.market, "ETHUSDT", "ETH", "USDT")
+        self.app: MockApplication = MockApplication(self.market, [self.market_info])
+
+    def test_calculate_profitability(self):
+        self.assertAlmostEqual(0.0, self.app.calculate_profitability())
+
+        # Profitability follows the market balances, transfers and fees included.
+        self.market.balances.update({"ETH": 11.0, "USDT": 910.0})
+        self.assertAlmostEqual(0.5, self.app.calculate_profitability())
+        self.market.balances["USDT"] = 890.0
+        self.assertAlmostEqual(-0.5, self.app.calculate_profitability())
+
+    def test_single_balance_snapshot(self):
+        # The balances are read once per call, not once per trading pair and asset.
+        self.market.balance_reads = 0
+        self.app.calculate_profitability()
+        self.assertEqual(1, self.market.balance_reads)
+
+
+if __name__ == "__main__":
+    unittest.main()
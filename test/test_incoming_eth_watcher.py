@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from hexbytes import HexBytes
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+import unittest
+from unittest.mock import MagicMock
+from web3.datastructures import AttributeDict
+
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import (
+    IncomingEthWatcherEvent,
+    WalletReceivedAssetEvent,
+)
+from hummingbot.wallet.ethereum.watcher.incoming_eth_watcher import IncomingEthWatcher
+from hummingbot.wallet.ethereum.watcher.new_blocks_watcher import NewBlocksWatcher
+
+WATCH_ADDRESS = "0x" + "11" * 20
+OTHER_ADDRESS = "0x" + "22" * 20
+
+
+def block_hash(number: int) -> HexBytes:
+    return HexBytes(number.to_bytes(32, "big"))
+
+
+def make_transaction(block_number: int, tx_index: int, to_address: str, value: int) -> AttributeDict:
+    return AttributeDict({
+        "hash": HexBytes(bytes([block_number, tx_index]) * 16),
+        "blockHash": block_hash(block_number),
+        "blockNumber": block_number,
+        "from": OTHER_ADDRESS,
+        "to": to_address,
+        "value": value,
+    })
+
+
+def make_block(number: int, transactions: List[AttributeDict]) -> AttributeDict:
+    return AttributeDict({
+        "number": number,
+        "hash": block_hash(number),
+        "parentHash": block_hash(number - 1),
+        "timestamp": 1560000000 + number * 15,
+        "transactions": transactions,
+    })
+
+
+def make_header(block: AttributeDict) -> AttributeDict:
+    return AttributeDict({key: value for key, value in block.items() if key != "transactions"})
+
+
+class MockJSONRPCClient:
+    def __init__(self, blocks: List[AttributeDict], balances: Dict[int, int]):
+        self.blocks: Dict[HexBytes, AttributeDict] = dict((block.hash, block) for block in blocks)
+        # block number -> raw ETH balance of the watched address
+        self.balances: Dict[int, int] = balances
+        self.requested_blocks: List[int] = []
+        self.requested_balances: List[Tuple[str, int]] = []
+
+    async def get_block(self, block_identifier: bytes, full_transactions: bool = False) -> Optional[AttributeDict]:
+        block: AttributeDict = self.blocks[HexBytes(block_identifier)]
+        self.requested_blocks.append(block.number)
+        return block if full_transactions else make_header(block)
+
+    async def get_balance(self, address: str, block_identifier: int) -> int:
+        self.requested_balances.append((address, block_identifier))
+        return self.balances[block_identifier]
+
+    async def get_transaction_receipt(self, tx_hash: bytes) -> AttributeDict:
+        return AttributeDict({"transactionHash": HexBytes(tx_hash), "status": 1})
+
+
+class IncomingEthWatcherUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        # Block 11 only has transactions of other addresses, block 12 pays the watched address 2 ETH.
+        self.blocks: List[AttributeDict] = [
+            make_block(11, [make_transaction(11, 0, OTHER_ADDRESS, 10 ** 18)]),
+            make_block(12, [make_transaction(12, 0, OTHER_ADDRESS, 10 ** 18),
+                            make_transaction(12, 1, WATCH_ADDRESS, 2 * 10 ** 18)]),
+        ]
+        self.client: MockJSONRPCClient = MockJSONRPCClient(self.blocks, {10: 10 ** 18, 11: 10 ** 18, 12: 3 * 10 ** 18})
+        blocks_watcher: NewBlocksWatcher = NewBlocksWatcher(MagicMock(), jsonrpc_client=self.client)
+        self.watcher: IncomingEthWatcher = IncomingEthWatcher(MagicMock(),
+                                                              blocks_watcher,
+                                                              [WATCH_ADDRESS],
+                                                              jsonrpc_client=self.client)
+        self.received_ether: List[WalletReceivedAssetEvent] = []
+        self.received_ether_forwarder: EventForwarder = EventForwarder(self.received_ether.append)
+        self.watcher.add_listener(IncomingEthWatcherEvent.ReceivedEther, self.received_ether_forwarder)
+
+    def test_headers_fetched_on_balance_change(self):
+        headers: List[AttributeDict] = [make_header(block) for block in self.blocks]
+        self.ev_loop.run_until_complete(self.watcher.check_incoming_eth(headers))
+
+        # The balances at blocks 10 to 12 are compared, and only block 12 is fetched with its transactions.
+        self.assertEqual([(WATCH_ADDRESS, block_number) for block_number in (10, 11, 12)],
+                         self.client.requested_balances)
+        self.assertEqual([12], self.client.requested_blocks)
+        self.assertEqual(1, len(self.received_ether))
+        self.assertEqual(WATCH_ADDRESS, self.received_ether[0].to_address)
+        self.assertEqual(2 * 10 ** 18, self.received_ether[0].raw_amount_received)
+        self.assertEqual(12, self.received_ether[0].block_number)
+        self.assertEqual(float(self.blocks[1].timestamp), self.received_ether[0].timestamp)
+
+    def test_full_blocks_not_filtered(self):
+        self.ev_loop.run_until_complete(self.watcher.check_incoming_eth(self.blocks))
+        self.assertEqual([], self.client.requested_balances)
+        self.assertEqual([], self.client.requested_blocks)
+        self.assertEqual(1, len(self.received_ether))
+
+
+if __name__ == "__main__":
+    unittest.main()
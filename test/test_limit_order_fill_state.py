@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import unittest
+
+from hummingbot.market.paper_trade.limit_order_fill_state import LimitOrderFillState
+
+
+class LimitOrderFillStateUnitTest(unittest.TestCase):
+    def test_trade_at_price_consumes_queue_first(self):
+        fill_state: LimitOrderFillState = LimitOrderFillState("buy://ETHUSDT/1", True, 100.0, 2.0, queue_ahead=3.0)
+
+        self.assertEqual(0.0, fill_state.match_trade(100.0, 2.0, 2.0))
+        self.assertEqual(1.0, fill_state.queue_ahead)
+
+        self.assertEqual(1.5, fill_state.match_trade(100.0, 2.5, 2.5))
+        self.assertEqual(0.0, fill_state.queue_ahead)
+        self.assertEqual(0.5, fill_state.remaining_quantity)
+        self.assertFalse(fill_state.is_done)
+
+        self.assertEqual(0.5, fill_state.match_trade(100.0, 4.0, 4.0))
+        self.assertTrue(fill_state.is_done)
+        self.assertEqual(2.0, fill_state.filled_base)
+        self.assertEqual(200.0, fill_state.filled_quote)
+
+    def test_trade_through_price_skips_queue(self):
+        fill_state: LimitOrderFillState = LimitOrderFillState("sell://ETHUSDT/1", False, 100.0, 2.0, queue_ahead=5.0)
+        self.assertEqual(0.0, fill_state.match_trade(99.0, 1.0, 1.0))
+        self.assertEqual(1.0, fill_state.match_trade(101.0, 1.0, 1.0))
+        self.assertEqual(0.0, fill_state.queue_ahead)
+        self.assertEqual(1.0, fill_state.remaining_quantity)
+
+    def test_fill_limited_by_available_trade_quantity(self):
+        fill_state: LimitOrderFillState = LimitOrderFillState("buy://ETHUSDT/1", True, 100.0, 2.0, queue_ahead=1.0)
+        # The full trade amount moves the queue, but other simulated orders already took most of the volume.
+        self.assertEqual(0.25, fill_state.match_trade(100.0, 3.0, 0.25))
+        self.assertEqual(0.0, fill_state.queue_ahead)
+
+    def test_crossed_book(self):
+        fill_state: LimitOrderFillState = LimitOrderFillState("buy://ETHUSDT/1", True, 100.0, 2.0, queue_ahead=1.0)
+        self.assertEqual(1.5, fill_state.match_crossed_book(1.5))
+        self.assertEqual(0.5, fill_state.match_crossed_book(10.0))
+        self.assertEqual(0.0, fill_state.match_crossed_book(10.0))
+        self.assertTrue(fill_state.is_done)
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import random
+import unittest
+
+from hummingbot.wallet.ethereum.logs_bloom import (
+    bloom_contains,
+    bloom_contains_any,
+    bloom_mask,
+    bloom_to_int,
+)
+
+
+class LogsBloomUnitTest(unittest.TestCase):
+    def test_bloom_mask(self):
+        # 3 bits per value, from the first 3 byte pairs of its keccak hash.
+        self.assertEqual(3, bin(bloom_mask("0x" + "11" * 20)).count("1"))
+        self.assertEqual(bloom_mask("0x" + "ab" * 20), bloom_mask(bytes.fromhex("ab" * 20)))
+
+    def test_block_bloom(self):
+        random.seed(42)
+        addresses = ["0x" + bytes(random.getrandbits(8) for _ in range(20)).hex() for _ in range(5)]
+        topics = ["0x" + bytes(random.getrandbits(8) for _ in range(32)).hex() for _ in range(5)]
+        mask: int = 0
+        for value in addresses[:2] + topics[:2]:
+            mask |= bloom_mask(value)
+        logs_bloom: bytes = mask.to_bytes(256, "big")
+        bloom: int = bloom_to_int(logs_bloom)
+        self.assertEqual(bloom, bloom_to_int("0x" + logs_bloom.hex()))
+
+        for value in addresses[:2] + topics[:2]:
+            self.assertTrue(bloom_contains(bloom, bloom_mask(value)))
+        for value in addresses[2:] + topics[2:]:
+            self.assertFalse(bloom_contains(bloom, bloom_mask(value)))
+        self.assertTrue(bloom_contains_any(bloom, [bloom_mask(value) for value in addresses]))
+        self.assertFalse(bloom_contains_any(bloom, [bloom_mask(value) for value in addresses[2:]]))
+        self.assertFalse(bloom_contains(0, bloom_mask(addresses[0])))
+
+    def test_mainnet_block_bloom(self):
+        # logsBloom of mainnet block 1920003
+        # (0x93e4cbf81c3a61e1ca6efdc81b039bb2ebacca6654a8a840017a5e39f540c18d), two blocks after the DAO fork.
+        # Its only log is an Approval event of The DAO token.
+        bloom: int = bloom_to_int("0x"
+                                  "0000000000000002000000000002000000000000000000000000000000000000"
+                                  "0000000000000000000000000000400000000000000000000000000000202010"
+                                  "0000000000000000000000000000000000000000000000004000000000000000"
+                                  "0000000000000000000000000000000000000000000000000000000000000000"
+                                  "0000000000000000000000000000000000000000000000000000000001001000"
+                                  "0200000000000000000000000000000000000000000000000000000000000000"
+                                  "0000000000000000000000000000000000400000000000000000000000000000"
+                                  "0010000000000000000000000000000000000000000000000000000000000000")
+        dao_token_address: str = "0xBB9bc244D798123fDe783fCc1C72d3Bb8C189413"
+        approval_topic: str = "0x8c5be1e5ebec7d5bd14f71427d1e84f3dd0314c0f7b2291e5b200ac8c7c3b925"
+        transfer_topic: str = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+        usdt_token_address: str = "0xdAC17F958D2ee523a2206206994597C13D831ec7"
+        self.assertEqual(12, bin(bloom).count("1"))
+
+        self.assertTrue(bloom_contains(bloom, bloom_mask(dao_token_address)))
+        self.assertTrue(bloom_contains(bloom, bloom_mask(approval_topic)))
+        self.assertTrue(bloom_contains(bloom, bloom_mask(dao_token_address) | bloom_mask(approval_topic)))
+        self.assertFalse(bloom_contains(bloom, bloom_mask(transfer_topic)))
+        self.assertFalse(bloom_contains(bloom, bloom_mask(usdt_token_address)))
+        self.assertFalse(bloom_contains_any(bloom, [bloom_mask(transfer_topic), bloom_mask(usdt_token_address)]))
+
+
+if __name__ == "__main__":
+    unittest.main()
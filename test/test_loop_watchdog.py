@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import threading
+import time
+import unittest
+from typing import List
+
+from hummingbot.core.utils.loop_watchdog import (
+    LoopStall,
+    LoopWatchdog,
+)
+from hummingbot.logger.application_warning import ApplicationWarning
+
+
+class MockApplication:
+    def __init__(self):
+        self.app_warnings: List[ApplicationWarning] = []
+
+    def add_application_warning(self, app_warning: ApplicationWarning):
+        self.app_warnings.append(app_warning)
+
+
+class LoopWatchdogUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        self.app: MockApplication = MockApplication()
+        self.watchdog: LoopWatchdog = LoopWatchdog(self.app,
+                                                   check_interval=0.02,
+                                                   lag_threshold=0.1,
+                                                   sample_interval=0.02)
+
+    def tearDown(self):
+        self.watchdog.stop()
+        self.ev_loop.close()
+
+    async def blocking_coroutine(self):
+        await asyncio.sleep(0.1)
+        time.sleep(0.5)
+        await asyncio.sleep(0.1)
+
+    def test_loop_stall(self):
+        self.watchdog._loop_thread_id = threading.get_ident()
+        self.watchdog._start_sampler()
+        monitor_task: asyncio.Task = self.ev_loop.create_task(self.watchdog._monitor_loop())
+        self.ev_loop.run_until_complete(self.blocking_coroutine())
+        monitor_task.cancel()
+
+        stalls: List[LoopStall] = self.watchdog.stalls
+        self.assertEqual(1, len(stalls))
+        self.assertEqual("loop_lag", stalls[0].kind)
+        self.assertGreater(stalls[0].duration, 0.3)
+        self.assertIn("blocking_coroutine", stalls[0].culprit)
+        self.assertIn("time.sleep(0.5)", stalls[0].stack)
+        self.assertEqual(1, len(self.app.app_warnings))
+
+    def test_tick_overrun(self):
+        self.watchdog.tick_overrun(1000.0, 1.5, "BinanceMarket", 1.2)
+        self.watchdog.tick_overrun(1001.0, 2.0, "PureMarketMakingStrategyV2", 1.9)
+        self.assertEqual(["BinanceMarket took 1.200s", "PureMarketMakingStrategyV2 took 1.900s"],
+                         [stall.culprit for stall in self.watchdog.stalls])
+        # Application warnings are rate limited.
+        self.assertEqual(1, len(self.app.app_warnings))
+        self.assertIn("PureMarketMakingStrategyV2 took 1.900s", self.watchdog.format_status())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import copy
+import unittest
+
+from hummingbot.market.markets_recorder import (
+    apply_tracking_state_deltas,
+    find_tracking_state_entry,
+    tracking_state_deltas,
+    tracking_state_entry_deltas,
+)
+
+
+class MarketStateDeltasUnitTest(unittest.TestCase):
+    def test_flat_tracking_states(self):
+        old_states = {
+            "order-1": {"client_order_id": "order-1", "executed_amount": "0"},
+            "order-2": {"client_order_id": "order-2", "executed_amount": "0"},
+        }
+        new_states = {
+            "order-1": {"client_order_id": "order-1", "executed_amount": "0.5"},
+            "order-3": {"client_order_id": "order-3", "executed_amount": "0"},
+        }
+        deltas = tracking_state_deltas(old_states, new_states)
+        self.assertEqual([
+            (["order-1"], new_states["order-1"]),
+            (["order-3"], new_states["order-3"]),
+            (["order-2"], None),
+        ], deltas)
+
+        restored_states = copy.deepcopy(old_states)
+        apply_tracking_state_deltas(restored_states, deltas)
+        self.assertEqual(new_states, restored_states)
+
+    def test_nested_tracking_states(self):
+        old_states = {
+            "market_orders": {"order-1": {"client_order_id": "order-1"}},
+            "limit_orders": {},
+        }
+        new_states = {
+            "market_orders": {},
+            "limit_orders": {"order-2": {"client_order_id": "order-2"}},
+        }
+        deltas = tracking_state_deltas(old_states, new_states)
+        self.assertEqual([
+            (["market_orders", "order-1"], None),
+            (["limit_orders", "order-2"], new_states["limit_orders"]["order-2"]),
+        ], deltas)
+
+        restored_states = copy.deepcopy(old_states)
+        apply_tracking_state_deltas(restored_states, deltas)
+        self.assertEqual(new_states, restored_states)
+        self.assertEqual([], tracking_state_deltas(new_states, restored_states))
+
+    def test_entry_deltas(self):
+        old_states = {
+            "market_orders": {"order-1": {"client_order_id": "order-1"}},
+            "limit_orders": {"order-2": {"client_order_id": "order-2", "executed_amount": "0"}},
+        }
+        new_states = {
+            "market_orders": {},
+            "limit_orders": {
+                "order-2": {"client_order_id": "order-2", "executed_amount": "0.5"},
+                "order-3": {"client_order_id": "order-3", "executed_amount": "0"},
+            },
+        }
+        self.assertEqual(["limit_orders", "order-2"], find_tracking_state_entry(old_states, "order-2"))
+        self.assertIsNone(find_tracking_state_entry(old_states, "order-3"))
+
+        # Only the given entry is compared.
+        order_2 = (["limit_orders", "order-2"], new_states["limit_orders"]["order-2"])
+        self.assertEqual([order_2], tracking_state_entry_deltas(old_states, "order-2", order_2))
+        self.assertEqual([(["market_orders", "order-1"], None)],
+                         tracking_state_entry_deltas(old_states, "order-1", None))
+        self.assertEqual([], tracking_state_entry_deltas(old_states, "order-4", None))
+        self.assertEqual([], tracking_state_entry_deltas(old_states, "order-1",
+                                                         (["market_orders", "order-1"], {"client_order_id": "order-1"})))
+        # An entry that moved is removed from its old path.
+        self.assertEqual([(["market_orders", "order-1"], None), (["limit_orders", "order-1"], {})],
+                         tracking_state_entry_deltas(old_states, "order-1", (["limit_orders", "order-1"], {})))
+
+        deltas = []
+        for entry_key in ["order-1", "order-2", "order-3"]:
+            entry_path = find_tracking_state_entry(new_states, entry_key)
+            new_entry = (entry_path, new_states[entry_path[0]][entry_path[1]]) if entry_path is not None else None
+            deltas.extend(tracking_state_entry_deltas(old_states, entry_key, new_entry))
+        self.assertEqual(sorted(tracking_state_deltas(old_states, new_states)), sorted(deltas))
+
+
+if __name__ == "__main__":
+    unittest.main()
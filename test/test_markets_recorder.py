@@ -0,0 +1,251 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import logging; logging.basicConfig(level=logging.CRITICAL)
+import os
+import shutil
+from sqlalchemy.exc import OperationalError
+import tempfile
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+import unittest
+
+from hummingbot.core.event.events import (
+    BuyOrderCreatedEvent,
+    MarketEvent,
+    OrderCancelledEvent,
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType,
+)
+from hummingbot.market.markets_recorder import MarketsRecorder
+from hummingbot.model.market_state import MarketState
+from hummingbot.model.market_state_delta import MarketStateDelta
+from hummingbot.model.order import Order
+from hummingbot.model.sql_connection_manager import (
+    SQLConnectionManager,
+    SQLConnectionType,
+    SQLSessionWrapper,
+)
+from hummingbot.model.trade_fill import TradeFill
+
+CONFIG_FILE_PATH = "test_config.yml"
+
+
+class MockMarket:
+    """
+    The parts of a market that the markets recorder touches.
+    """
+    display_name = "mock_market"
+
+    def __init__(self):
+        self.in_flight_orders: Dict[str, Dict[str, Any]] = {}
+        self.tracking_states_reads: int = 0
+
+    @property
+    def tracking_states(self) -> Dict[str, Any]:
+        self.tracking_states_reads += 1
+        return {key: dict(value) for key, value in self.in_flight_orders.items()}
+
+    def tracking_state_entry(self, order_id: str) -> Optional[Tuple[List[str], Dict[str, Any]]]:
+        if order_id not in self.in_flight_orders:
+            return None
+        return [order_id], dict(self.in_flight_orders[order_id])
+
+    @staticmethod
+    def split_symbol(symbol: str) -> Tuple[str, str]:
+        base_asset, quote_asset = symbol.split("-")
+        return base_asset, quote_asset
+
+    def add_listener(self, event_tag, listener):
+        pass
+
+    def remove_listener(self, event_tag, listener):
+        pass
+
+
+class MarketsRecorderUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.db_dir: str = tempfile.mkdtemp()
+        self.sql: SQLConnectionManager = SQLConnectionManager(SQLConnectionType.TRADE_FILLS,
+                                                              db_path=os.path.join(self.db_dir, "trades.sqlite"))
+        self.market: MockMarket = MockMarket()
+        self.transactions: int = 0
+        self.recorders: List[MarketsRecorder] = []
+        self.release_writer: threading.Event = threading.Event()
+
+    def tearDown(self):
+        self.release_writer.set()
+        for recorder in self.recorders:
+            recorder.stop()
+        shutil.rmtree(self.db_dir)
+
+    def create_recorder(self, **kwargs) -> MarketsRecorder:
+        recorder: MarketsRecorder = MarketsRecorder(self.sql, [self.market], CONFIG_FILE_PATH, "test_strategy",
+                                                    **kwargs)
+        recorder.start()
+        self.recorders.append(recorder)
+        return recorder
+
+    def patch_begin(self, before_begin: Callable[[], None]):
+        begin: Callable[[], SQLSessionWrapper] = self.sql.begin
+
+        def patched_begin() -> SQLSessionWrapper:
+            self.transactions += 1
+            before_begin()
+            return begin()
+        self.sql.begin = patched_begin
+
+    def create_order(self, recorder: MarketsRecorder, order_id: str):
+        self.market.in_flight_orders[order_id] = {"client_order_id": order_id, "executed_amount_base": "0"}
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self.market,
+                                   BuyOrderCreatedEvent(time.time(), OrderType.LIMIT, "ETH-USDT", 1.0, 100.0, order_id))
+
+    def fill_order(self, recorder: MarketsRecorder, order_id: str):
+        if order_id in self.market.in_flight_orders:
+            self.market.in_flight_orders[order_id]["executed_amount_base"] = "1.0"
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self.market,
+                                 OrderFilledEvent(time.time(), order_id, "ETH-USDT", TradeType.BUY, OrderType.LIMIT,
+                                                  100.0, 1.0, TradeFee(0.001)))
+
+    def cancel_order(self, recorder: MarketsRecorder, order_id: str):
+        del self.market.in_flight_orders[order_id]
+        recorder._did_cancel_order(MarketEvent.OrderCancelled.value, self.market,
+                                   OrderCancelledEvent(time.time(), order_id))
+
+    def wait_for(self, condition: Callable[[], bool], timeout: float = 5.0):
+        deadline: float = time.time() + timeout
+        while not condition():
+            self.assertLess(time.time(), deadline)
+            time.sleep(0.01)
+
+    def test_batching(self):
+        self.patch_begin(lambda: None)
+        recorder: MarketsRecorder = self.create_recorder(flush_interval=60.0, max_batch_size=10)
+        # Each event records the order and its market state - a snapshot, then deltas. 38 records in all.
+        for i in range(19):
+            self.create_order(recorder, f"order-{i}")
+
+        # Full batches are written right away, the rest waits for the flush interval or a read.
+        self.wait_for(lambda: recorder.pending_records == 8)
+        self.assertEqual(3, self.transactions)
+        orders: List[Order] = recorder.get_orders_for_config_and_market(CONFIG_FILE_PATH, self.market)
+        self.assertEqual([f"order-{i}" for i in range(19)], [order.id for order in orders])
+        self.assertEqual(4, self.transactions)
+        self.assertEqual(0, recorder.pending_records)
+
+    def test_operational_error_retry(self):
+        failures: List[int] = [2]
+
+        def lock_database():
+            if failures[0] > 0:
+                failures[0] -= 1
+                raise OperationalError("INSERT", {}, Exception("database is locked"))
+        self.patch_begin(lock_database)
+        recorder: MarketsRecorder = self.create_recorder(flush_interval=0.01)
+        self.create_order(recorder, "order-0")
+        self.fill_order(recorder, "order-0")
+
+        trades: List[TradeFill] = recorder.get_trades_for_config(CONFIG_FILE_PATH)
+        self.assertEqual(["order-0"], [trade.order_id for trade in trades])
+        self.assertEqual(3, self.transactions)
+        self.assertEqual(0, recorder.dropped_records)
+
+    def test_operational_error_give_up(self):
+        def lock_database():
+            raise OperationalError("INSERT", {}, Exception("database is locked"))
+        self.patch_begin(lock_database)
+        recorder: MarketsRecorder = self.create_recorder(flush_interval=0.01, max_write_attempts=3)
+        self.create_order(recorder, "order-0")
+
+        # The batch is dropped after the last attempt, rather than retried forever.
+        self.assertTrue(recorder.flush(5.0))
+        self.assertEqual(3, self.transactions)
+        self.assertEqual(2, recorder.dropped_records)
+        self.assertEqual(0, recorder.pending_records)
+
+    def test_poison_record(self):
+        recorder: MarketsRecorder = self.create_recorder(flush_interval=60.0)
+        self.create_order(recorder, "order-0")
+        # The second order created with the same id violates the primary key - the rest of the batch is kept.
+        self.create_order(recorder, "order-0")
+        self.create_order(recorder, "order-1")
+        self.fill_order(recorder, "order-1")
+
+        orders: List[Order] = recorder.get_orders_for_config_and_market(CONFIG_FILE_PATH, self.market)
+        self.assertEqual(["order-0", "order-1"], [order.id for order in orders])
+        self.assertEqual(1, len(recorder.get_trades_for_config(CONFIG_FILE_PATH)))
+        self.assertEqual(1, recorder.dropped_records)
+
+        # The journal keeps going after the bad record.
+        self.create_order(recorder, "order-2")
+        self.assertEqual(3, len(recorder.get_orders_for_config_and_market(CONFIG_FILE_PATH, self.market)))
+
+    def test_market_states_round_trip(self):
+        for compaction_interval in (2, 100):
+            self.market.tracking_states_reads = 0
+            recorder: MarketsRecorder = self.create_recorder(compaction_interval=compaction_interval)
+            for i in range(3):
+                self.create_order(recorder, f"order-{compaction_interval}-{i}")
+            self.fill_order(recorder, f"order-{compaction_interval}-0")
+            self.cancel_order(recorder, f"order-{compaction_interval}-1")
+            # A change without an event is only saved by the next snapshot.
+            self.market.in_flight_orders[f"order-{compaction_interval}-2"]["exchange_order_id"] = "1234"
+            self.fill_order(recorder, f"order-{compaction_interval}-0")
+            if compaction_interval == 100:
+                # Only the first snapshot serializes every tracked order, deltas serialize the event's order.
+                self.assertEqual(1, self.market.tracking_states_reads)
+
+            market_states: MarketState = recorder.get_market_states(CONFIG_FILE_PATH, self.market)
+            expected_states: Dict[str, Any] = self.market.tracking_states
+            expected_states[f"order-{compaction_interval}-2"].pop("exchange_order_id")
+            self.assertEqual(expected_states, market_states.saved_state)
+            delta_count: int = self.sql.get_shared_session().query(MarketStateDelta).count()
+            self.assertEqual(1 if compaction_interval == 2 else 4, delta_count)
+
+            # Stopping compacts the deltas into a snapshot of the current tracking states.
+            recorder.stop()
+            self.assertEqual(self.market.tracking_states,
+                             recorder.get_market_states(CONFIG_FILE_PATH, self.market).saved_state)
+            self.assertEqual(0, self.sql.get_shared_session().query(MarketStateDelta).count())
+            self.market.in_flight_orders.clear()
+
+    def test_stop(self):
+        recorder: MarketsRecorder = self.create_recorder(flush_interval=60.0)
+        for i in range(5):
+            self.create_order(recorder, f"order-{i}")
+
+        # The writer drains the journal before stopping.
+        recorder.stop()
+        self.assertEqual(0, recorder.pending_records)
+        self.assertEqual(5, self.sql.get_shared_session().query(Order).count())
+
+    def test_timeouts(self):
+        self.patch_begin(self.release_writer.wait)
+        recorder: MarketsRecorder = self.create_recorder(flush_interval=0.01, flush_timeout=0.1, stop_timeout=0.1)
+        self.create_order(recorder, "order-0")
+
+        # Reads don't wait for a writer that is stuck.
+        started: float = time.time()
+        self.assertEqual([], recorder.get_orders_for_config_and_market(CONFIG_FILE_PATH, self.market))
+        self.assertLess(time.time() - started, 1.0)
+
+        # Neither does stop().
+        started = time.time()
+        recorder.stop()
+        self.assertLess(time.time() - started, 1.0)
+        self.assertEqual(2, recorder.pending_records)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import unittest
+
+from hummingbot.core.management.metrics_exporter import format_metrics
+from hummingbot.core.utils.metrics import (
+    Counter,
+    CounterChild,
+    CounterDeltas,
+    Histogram,
+    HistogramSnapshot,
+    MetricsRegistry,
+    url_endpoint_label,
+)
+
+
+class MetricsRegistryUnitTest(unittest.TestCase):
+    def test_counter_labels(self):
+        registry: MetricsRegistry = MetricsRegistry()
+        counter: Counter = registry.counter("messages", "Messages.", ["exchange", "outcome"])
+        self.assertIs(counter, registry.counter("messages", "Messages.", ["exchange", "outcome"]))
+        accepted: CounterChild = counter.labels("binance", "accepted")
+        self.assertIs(accepted, counter.labels("binance", "accepted"))
+        accepted.inc()
+        accepted.inc(2)
+        counter.labels("binance", "rejected").inc()
+        self.assertEqual({("binance", "accepted"): 3, ("binance", "rejected"): 1}, counter.snapshot())
+
+        with self.assertRaises(ValueError):
+            counter.labels("binance")
+        with self.assertRaises(ValueError):
+            registry.gauge("messages", "Messages.")
+
+    def test_non_string_labels(self):
+        registry: MetricsRegistry = MetricsRegistry()
+        counter: Counter = registry.counter("receipts", "Receipts.", ["status"])
+        succeeded: CounterChild = counter.labels(1)
+        self.assertIs(succeeded, counter.labels(1))
+        self.assertIs(succeeded, counter.labels("1"))
+        succeeded.inc()
+        counter.labels(1).inc()
+        self.assertEqual({("1",): 2}, counter.snapshot())
+
+    def test_snapshot_and_reset(self):
+        registry: MetricsRegistry = MetricsRegistry()
+        counter: Counter = registry.counter("volume", "Volume.", ["market"])
+        histogram: Histogram = registry.histogram("latency", "Latency.", ["market"], buckets=[0.1, 1.0])
+        volume: CounterChild = counter.labels("ddex")
+        volume.inc(10)
+        for value in [0.05, 0.5, 5.0]:
+            histogram.labels("ddex").observe(value)
+
+        snapshot = registry.snapshot(reset=True)
+        self.assertEqual({("ddex",): 10}, snapshot["volume"])
+        latency: HistogramSnapshot = snapshot["latency"][("ddex",)]
+        self.assertEqual(3, latency.count)
+        self.assertEqual((1, 1, 1), latency.bucket_counts)
+        self.assertAlmostEqual(0.05, latency.min)
+        self.assertAlmostEqual(5.0, latency.max)
+        self.assertAlmostEqual(5.55 / 3, latency.mean)
+
+        # Children are reset in place, so kept handles keep counting.
+        volume.inc(1)
+        self.assertEqual({("ddex",): 1}, counter.snapshot())
+        self.assertEqual(0, histogram.snapshot()[("ddex",)].count)
+
+    def test_counter_deltas(self):
+        counter: Counter = MetricsRegistry().counter("diffs", "Diffs.", ["symbol"])
+        diffs: CounterChild = counter.labels("ETH-USDT")
+        diffs.inc(5)
+        deltas: CounterDeltas = CounterDeltas(diffs)
+        diffs.inc(3)
+        self.assertEqual([3], deltas.take())
+        self.assertEqual([0], deltas.take())
+        self.assertEqual(8, diffs.value)
+
+    def test_url_endpoint_label(self):
+        self.assertEqual("api.ddex.io/v3/orders/:id",
+                         url_endpoint_label("https://api.ddex.io/v3/orders/0x6ef3b1d2e4?status=all"))
+        self.assertEqual("api.huobi.pro/v1/order/orders/:id/submitcancel",
+                         url_endpoint_label("https://api.huobi.pro/v1/order/orders/12345/submitcancel"))
+        self.assertEqual("api.pro.coinbase.com/accounts", url_endpoint_label("https://api.pro.coinbase.com/accounts"))
+
+    def test_format_metrics(self):
+        registry: MetricsRegistry = MetricsRegistry()
+        registry.counter("diffs", "Diffs.", ["symbol"]).labels('ETH-"USDT"').inc(2)
+        registry.histogram("tick_seconds", "Tick duration.", ["iterator"], buckets=[0.1, 1.0]).labels("Strategy")\
+            .observe(0.5)
+        self.assertEqual("\n".join([
+            "# HELP hummingbot_diffs_total Diffs.",
+            "# TYPE hummingbot_diffs_total counter",
+            'hummingbot_diffs_total{symbol="ETH-\\"USDT\\""} 2.0',
+            "# HELP hummingbot_tick_seconds Tick duration.",
+            "# TYPE hummingbot_tick_seconds histogram",
+            'hummingbot_tick_seconds_bucket{iterator="Strategy",le="0.1"} 0',
+            'hummingbot_tick_seconds_bucket{iterator="Strategy",le="1.0"} 1',
+            'hummingbot_tick_seconds_bucket{iterator="Strategy",le="+Inf"} 1',
+            'hummingbot_tick_seconds_sum{iterator="Strategy"} 0.5',
+            'hummingbot_tick_seconds_count{iterator="Strategy"} 1',
+        ]) + "\n", format_metrics(registry))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from aiohttp import web
+import asyncio
+from hexbytes import HexBytes
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+import unittest
+from unittest.mock import MagicMock
+from web3.datastructures import AttributeDict
+
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import NewBlocksWatcherEvent
+from hummingbot.wallet.ethereum.watcher.new_blocks_watcher import (
+    MISSED_HEADERS_CHUNK_SIZE,
+    NewBlocksWatcher,
+)
+
+
+def block_hash(number: int) -> HexBytes:
+    return HexBytes(number.to_bytes(32, "big"))
+
+
+def make_header(number: int) -> AttributeDict:
+    return AttributeDict({
+        "number": number,
+        "hash": block_hash(number),
+        "parentHash": block_hash(number - 1),
+        "timestamp": 1560000000 + number * 15,
+    })
+
+
+class MockJSONRPCClient:
+    def __init__(self):
+        self.requested_blocks: List[Tuple[Union[int, bytes], bool]] = []
+        self.in_flight_requests: int = 0
+        self.max_in_flight_requests: int = 0
+
+    async def get_block(self, block_identifier: Union[int, bytes], full_transactions: bool = False) -> AttributeDict:
+        self.requested_blocks.append((block_identifier, full_transactions))
+        self.in_flight_requests += 1
+        self.max_in_flight_requests = max(self.max_in_flight_requests, self.in_flight_requests)
+        # Yield, so the calls gathered together are all in flight at the same time.
+        await asyncio.sleep(0)
+        self.in_flight_requests -= 1
+        return make_header(block_identifier)
+
+
+class MockNewHeadsServer:
+    """
+    Websocket endpoint that confirms a newHeads subscription, and pushes the headers it is given as a node would.
+    """
+    def __init__(self, headers: List[AttributeDict]):
+        self.headers: List[AttributeDict] = headers
+        self.requests: List[Dict[str, Any]] = []
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._runner.addresses[0][:2]
+        return f"ws://{host}:{port}/"
+
+    async def handle_websocket(self, request: web.Request) -> web.WebSocketResponse:
+        ws: web.WebSocketResponse = web.WebSocketResponse()
+        await ws.prepare(request)
+        subscribe_request: Dict[str, Any] = await ws.receive_json()
+        self.requests.append(subscribe_request)
+        await ws.send_json({"jsonrpc": "2.0", "id": subscribe_request["id"], "result": "0x1"})
+        for header in self.headers:
+            await ws.send_json({"jsonrpc": "2.0", "method": "eth_subscription", "params": {
+                "subscription": "0x1",
+                "result": {
+                    "number": hex(header.number),
+                    "hash": header.hash.hex(),
+                    "parentHash": header.parentHash.hex(),
+                    "timestamp": hex(header.timestamp),
+                }
+            }})
+        async for _ in ws:
+            pass
+        return ws
+
+    async def start(self):
+        app: web.Application = web.Application()
+        app.router.add_get("/", self.handle_websocket)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, "127.0.0.1", 0).start()
+
+    async def stop(self):
+        await self._runner.cleanup()
+
+
+class NewBlocksWatcherUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self.client: MockJSONRPCClient = MockJSONRPCClient()
+        self.new_blocks: List[List[AttributeDict]] = []
+        self.new_blocks_forwarder: EventForwarder = EventForwarder(self.new_blocks.append)
+
+    def make_watcher(self, websocket_url: Optional[str] = None) -> NewBlocksWatcher:
+        watcher: NewBlocksWatcher = NewBlocksWatcher(MagicMock(),
+                                                     block_window_size=1000,
+                                                     jsonrpc_client=self.client,
+                                                     websocket_url=websocket_url)
+        watcher.add_listener(NewBlocksWatcherEvent.NewBlocks, self.new_blocks_forwarder)
+        self.ev_loop.run_until_complete(watcher._add_new_block(make_header(10), full_transactions=False))
+        self.new_blocks.clear()
+        return watcher
+
+    def emitted_block_numbers(self) -> List[int]:
+        return [block.number for new_blocks in self.new_blocks for block in new_blocks]
+
+    def test_backfill_missed_headers(self):
+        watcher: NewBlocksWatcher = self.make_watcher()
+        self.ev_loop.run_until_complete(watcher._add_new_header(make_header(260)))
+
+        # Headers 11 to 259 are fetched without transactions, a chunk of requests at a time, and emitted in order.
+        self.assertEqual([(block_number, False) for block_number in range(11, 260)], self.client.requested_blocks)
+        self.assertEqual(MISSED_HEADERS_CHUNK_SIZE, self.client.max_in_flight_requests)
+        self.assertEqual(list(range(11, 261)), self.emitted_block_numbers())
+        self.assertEqual(260, watcher.block_number)
+
+    def test_no_backfill_for_consecutive_headers(self):
+        watcher: NewBlocksWatcher = self.make_watcher()
+        self.ev_loop.run_until_complete(watcher._add_new_header(make_header(11)))
+        self.ev_loop.run_until_complete(watcher._add_new_header(make_header(12)))
+        self.assertEqual([], self.client.requested_blocks)
+        self.assertEqual([11, 12], self.emitted_block_numbers())
+
+    def test_subscribe_new_heads_loop(self):
+        server: MockNewHeadsServer = MockNewHeadsServer([make_header(11), make_header(13)])
+        self.ev_loop.run_until_complete(server.start())
+        watcher: NewBlocksWatcher = self.make_watcher(websocket_url=server.url)
+        self.assertTrue(watcher.subscribed)
+
+        async def subscribe():
+            task: asyncio.Task = asyncio.ensure_future(watcher.subscribe_new_heads_loop())
+            try:
+                for _ in range(100):
+                    if len(self.emitted_block_numbers()) >= 3:
+                        break
+                    await asyncio.sleep(0.05)
+            finally:
+                task.cancel()
+                await asyncio.wait([task])
+                await server.stop()
+
+        self.ev_loop.run_until_complete(subscribe())
+        self.assertEqual([{"jsonrpc": "2.0", "id": 1, "method": "eth_subscribe", "params": ["newHeads"]}],
+                         server.requests)
+        # Block 12 was skipped by the subscription, so it is fetched before block 13 is emitted.
+        self.assertEqual([(12, False)], self.client.requested_blocks)
+        self.assertEqual([11, 12, 13], self.emitted_block_numbers())
+        self.assertEqual(block_hash(13), self.new_blocks[-1][-1].hash)
+        self.assertEqual(make_header(13).timestamp, self.new_blocks[-1][-1].timestamp)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from eth_account import Account
+from eth_account.local import LocalAccount
+from hexbytes import HexBytes
+from typing import (
+    Any,
+    Dict,
+    List,
+    Set,
+    Tuple,
+)
+import unittest
+
+from hummingbot.wallet.ethereum.async_jsonrpc_client import JSONRPCError
+from hummingbot.wallet.ethereum.nonce_manager import NonceManager
+
+
+class MockJSONRPCClient:
+    def __init__(self):
+        self.sent_transactions: List[HexBytes] = []
+        self.rejected_transactions: Set[HexBytes] = set()
+        self.transport_failures: int = 0
+
+    async def send_raw_transaction(self, raw_transaction: bytes) -> HexBytes:
+        if self.transport_failures > 0:
+            self.transport_failures -= 1
+            raise IOError("No response to JSON-RPC call eth_sendRawTransaction.")
+        if HexBytes(raw_transaction) in self.rejected_transactions:
+            raise JSONRPCError({"code": -32000, "message": "insufficient funds for gas * price + value"})
+        self.sent_transactions.append(HexBytes(raw_transaction))
+        return HexBytes(b"\x00" * 32)
+
+
+class NonceManagerUnitTest(unittest.TestCase):
+    GAS_PRICE = 2 * 10 ** 9
+
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self.account: LocalAccount = Account.create()
+        self.client: MockJSONRPCClient = MockJSONRPCClient()
+        self.tracked_transactions: List[Tuple[str, int, str]] = []
+        self.failed_transactions: List[str] = []
+        self.nonce_manager: NonceManager = NonceManager(
+            self.account,
+            self.client,
+            1,
+            lambda tx_hash, gas_price, original_tx_hash: self.tracked_transactions.append(
+                (tx_hash, gas_price, original_tx_hash)
+            ),
+            self.failed_transactions.append,
+            stuck_transaction_timeout=60.0
+        )
+        self.nonce_manager.reset(5)
+        self.send_task: asyncio.Task = self.ev_loop.create_task(self.nonce_manager.send_transactions_loop())
+
+    def tearDown(self):
+        self.send_task.cancel()
+
+    def submit_transaction(self) -> Tuple[Dict[str, Any], str]:
+        transaction: Dict[str, Any] = {
+            "to": "0x" + "11" * 20,
+            "value": 1,
+            "gas": 21000,
+            "gasPrice": self.GAS_PRICE,
+            "nonce": self.nonce_manager.next_nonce,
+            "chainId": 1
+        }
+        signed_transaction = self.account.signTransaction(transaction)
+        self.nonce_manager.submit(transaction, signed_transaction)
+        return transaction, signed_transaction.hash.hex()
+
+    def run_send_loop(self):
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+
+    def test_pipelined_sends(self):
+        nonces: List[int] = [self.submit_transaction()[0]["nonce"] for _ in range(10)]
+        self.assertEqual(list(range(5, 15)), nonces)
+        self.assertEqual(15, self.nonce_manager.next_nonce)
+        self.run_send_loop()
+        self.assertEqual(10, len(self.client.sent_transactions))
+
+        # Mined transactions are dropped, and nonces used by something else are skipped.
+        self.nonce_manager.update(10, 16, self.GAS_PRICE)
+        self.assertEqual(list(range(10, 15)), [t.nonce for t in self.nonce_manager.get_pending_transactions()])
+        self.assertEqual(16, self.nonce_manager.next_nonce)
+
+    def test_nonce_gap_filling(self):
+        self.submit_transaction()
+        transaction, tx_hash = self.submit_transaction()
+        self.client.rejected_transactions.add(HexBytes(self.account.signTransaction(transaction).rawTransaction))
+        self.submit_transaction()
+        self.run_send_loop()
+        self.assertEqual([tx_hash], self.failed_transactions)
+        self.assertEqual([5, 7], [t.nonce for t in self.nonce_manager.get_pending_transactions()])
+
+        # The node only counts the transactions before the gap as pending.
+        self.nonce_manager.update(5, 6, self.GAS_PRICE)
+        self.run_send_loop()
+        self.assertEqual([5, 6, 7], [t.nonce for t in self.nonce_manager.get_pending_transactions()])
+        gap_filler = self.nonce_manager.get_pending_transactions()[1]
+        self.assertEqual(self.account.address, gap_filler.transaction["to"])
+        self.assertEqual(0, gap_filler.transaction["value"])
+        self.assertEqual([(gap_filler.tx_hash, self.GAS_PRICE, gap_filler.tx_hash)], self.tracked_transactions)
+        self.assertEqual(3, len(self.client.sent_transactions))
+
+    def test_transport_error_resend(self):
+        self.nonce_manager.RESEND_DELAY = 0.05
+        self.client.transport_failures = 2
+        _, tx_hash = self.submit_transaction()
+        self.run_send_loop()
+        self.ev_loop.run_until_complete(asyncio.sleep(0.2))
+        # Transport errors are not rejections - the same transaction is sent again, without filling its nonce.
+        self.assertEqual([], self.failed_transactions)
+        self.assertEqual(0, self.client.transport_failures)
+        self.assertEqual(1, len(self.client.sent_transactions))
+        [pending_transaction] = self.nonce_manager.get_pending_transactions()
+        self.assertEqual(tx_hash, pending_transaction.tx_hash)
+        self.assertEqual(0, len(self.tracked_transactions))
+
+    def test_stuck_transaction_replacement(self):
+        _, tx_hash = self.submit_transaction()
+        self.run_send_loop()
+        self.nonce_manager.update(5, 6, self.GAS_PRICE)
+        self.assertEqual(0, len(self.tracked_transactions))
+
+        self.nonce_manager.get_pending_transactions()[0].last_sent_timestamp -= 120
+        self.nonce_manager.update(5, 6, self.GAS_PRICE)
+        self.run_send_loop()
+        replacement = self.nonce_manager.get_pending_transactions()[0]
+        self.assertEqual(5, replacement.nonce)
+        self.assertEqual(tx_hash, replacement.original_tx_hash)
+        self.assertGreater(replacement.gas_price, self.GAS_PRICE * 1.1)
+        self.assertEqual([(replacement.tx_hash, replacement.gas_price, tx_hash)], self.tracked_transactions)
+        self.assertEqual(2, len(self.client.sent_transactions))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import logging; logging.basicConfig(level=logging.ERROR)
+import os
+import shutil
+import tempfile
+import unittest
+
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_recorder import (
+    ASK_SIDE,
+    BID_SIDE,
+    OrderBookRecorder,
+    iter_capture_files,
+    load_capture,
+)
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+
+
+class MockOrderBookTracker(OrderBookTracker):
+    @property
+    def data_source(self):
+        return None
+
+
+class OrderBookRecorderUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        self.capture_dir: str = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.capture_dir)
+
+    @staticmethod
+    def diff_message(update_id: int, timestamp: float) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "symbol": "ETHUSDT",
+            "update_id": update_id,
+            "bids": [[100.0 + update_id, 1.0]],
+            "asks": [[110.0, 2.0]],
+        }, timestamp)
+
+    def run_recorder(self, recorder: OrderBookRecorder, messages):
+        async def record():
+            recorder.start()
+            for message in messages:
+                recorder.record(message)
+            recorder.flush()
+            while recorder.pending_batches > 0:
+                await asyncio.sleep(0.01)
+            recorder.stop()
+        self.ev_loop.run_until_complete(record())
+
+    def test_record_and_load(self):
+        recorder: OrderBookRecorder = OrderBookRecorder(self.capture_dir, batch_size=3)
+        messages = [self.diff_message(i, 1000.0 + i) for i in range(5)]
+        messages.append(OrderBookMessage(OrderBookMessageType.TRADE, {
+            "symbol": "ETHUSDT",
+            "trade_id": 42,
+            "trade_type": 2.0,
+            "price": "105.0",
+            "amount": "0.5",
+        }, 1010.0))
+        self.run_recorder(recorder, messages)
+
+        self.assertEqual(11, recorder.rows_recorded)
+        self.assertEqual(0, recorder.rows_dropped)
+        self.assertEqual(4, len(list(iter_capture_files(self.capture_dir, "ETHUSDT"))))
+
+        capture = load_capture(self.capture_dir, "ETHUSDT")
+        self.assertEqual(11, len(capture["timestamp"]))
+        self.assertEqual([BID_SIDE, ASK_SIDE] * 5 + [2], capture["side"].tolist())
+        self.assertEqual([0, 0, 1, 1, 2, 2, 3, 3, 4, 4, 42], capture["update_id"].tolist())
+        self.assertEqual(105.0, capture["price"][-1])
+
+        capture = load_capture(self.capture_dir, "ETHUSDT", start_timestamp=1002.0, end_timestamp=1004.0)
+        self.assertEqual([2, 2, 3, 3], capture["update_id"].tolist())
+
+    def test_time_partitions(self):
+        recorder: OrderBookRecorder = OrderBookRecorder(self.capture_dir, batch_size=1, partition_interval=60.0)
+        self.run_recorder(recorder, [self.diff_message(1, 30.0), self.diff_message(2, 90.0)])
+        self.assertEqual(["19700101-000000", "19700101-000100"],
+                         sorted(os.listdir(os.path.join(self.capture_dir, "ETHUSDT"))))
+
+    def test_drop_batches_when_writer_falls_behind(self):
+        recorder: OrderBookRecorder = OrderBookRecorder(self.capture_dir, batch_size=2, max_pending_batches=1)
+        # The writer task is not running, so only the first batch fits into the write queue.
+        for i in range(3):
+            recorder.record(self.diff_message(i, 1000.0 + i))
+        self.assertEqual(1, recorder.pending_batches)
+        self.assertEqual(4, recorder.rows_dropped)
+
+    def test_close_writes_buffered_messages(self):
+        recorder: OrderBookRecorder = OrderBookRecorder(self.capture_dir, batch_size=4)
+
+        async def record_and_close():
+            recorder.start()
+            for i in range(5):
+                recorder.record(self.diff_message(i, 1000.0 + i))
+            # Two full batches are queued and one message is still buffered when the recorder is closed.
+            self.assertEqual(2, recorder.pending_batches)
+            await recorder.close()
+        self.ev_loop.run_until_complete(record_and_close())
+
+        self.assertFalse(recorder.running)
+        self.assertEqual(0, recorder.pending_batches)
+        self.assertEqual(0, recorder.rows_dropped)
+        self.assertEqual(list(range(5)), load_capture(self.capture_dir, "ETHUSDT")["update_id"].tolist()[::2])
+
+    def test_close_tracker(self):
+        tracker: MockOrderBookTracker = MockOrderBookTracker()
+        recorder: OrderBookRecorder = OrderBookRecorder(self.capture_dir)
+        tracker.attach_recorder(recorder)
+
+        async def track_and_close():
+            await tracker.start()
+            stream: asyncio.Queue = tracker._recorded_stream(asyncio.Queue())
+            for i in range(3):
+                stream.put_nowait(self.diff_message(i, 1000.0 + i))
+            await tracker.close()
+        self.ev_loop.run_until_complete(track_and_close())
+
+        self.assertFalse(recorder.running)
+        self.assertIsNone(tracker._emit_trade_event_task)
+        self.assertEqual([0, 0, 1, 1, 2, 2], load_capture(self.capture_dir, "ETHUSDT")["update_id"].tolist())
+
+    def test_skip_unrecordable_messages(self):
+        recorder: OrderBookRecorder = OrderBookRecorder(self.capture_dir, batch_size=3)
+        messages = [OrderBookMessage(OrderBookMessageType.TRADE, {
+            "symbol": "ETHUSDT",
+            "trade_id": trade_id,
+            "trade_type": 1.0,
+            "price": "105.0",
+            "amount": "0.5",
+        }, 1010.0) for trade_id in (10 ** 20, "not-an-id", None)]
+        messages.append(self.diff_message(1, 1000.0))
+        self.run_recorder(recorder, messages)
+        self.assertEqual(3, recorder.unsupported_messages)
+        self.assertEqual(2, recorder.rows_recorded)
+        self.assertEqual([1, 1], load_capture(self.capture_dir, "ETHUSDT")["update_id"].tolist())
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
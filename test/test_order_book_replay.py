@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import logging; logging.basicConfig(level=logging.ERROR)
+import shutil
+import tempfile
+import unittest
+
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecorder
+from hummingbot.core.data_type.order_book_replay import (
+    OrderBookReplayIterator,
+    ReplayOrderBookTracker,
+    load_replay_dataset,
+    prepare_replay_dataset,
+)
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    OrderBookEvent,
+    OrderBookTradeEvent,
+    TradeType,
+)
+
+
+class OrderBookReplayUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        self.capture_dir: str = tempfile.mkdtemp()
+        self.dataset_dir: str = tempfile.mkdtemp()
+        messages = [
+            OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+                "symbol": "ETHUSDT",
+                "update_id": 1,
+                "bids": [[99.0, 1.0], [98.0, 2.0]],
+                "asks": [[101.0, 1.0], [102.0, 2.0]],
+            }, 1000.0),
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "symbol": "ETHUSDT",
+                "update_id": 2,
+                "bids": [[99.5, 3.0]],
+                "asks": [[101.0, 0.0]],
+            }, 1001.5),
+            OrderBookMessage(OrderBookMessageType.TRADE, {
+                "symbol": "ETHUSDT",
+                "trade_id": 3,
+                "trade_type": float(TradeType.SELL.value),
+                "price": "99.5",
+                "amount": "0.5",
+            }, 1002.0),
+        ]
+        recorder: OrderBookRecorder = OrderBookRecorder(self.capture_dir)
+
+        async def record():
+            recorder.start()
+            for message in messages:
+                recorder.record(message)
+            recorder.flush()
+            while recorder.pending_batches > 0:
+                await asyncio.sleep(0.01)
+            recorder.stop()
+        self.ev_loop.run_until_complete(record())
+        prepare_replay_dataset(self.capture_dir, ["ETHUSDT"], self.dataset_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.capture_dir)
+        shutil.rmtree(self.dataset_dir)
+
+    def test_replay(self):
+        dataset = load_replay_dataset(self.dataset_dir, ["ETHUSDT"])
+        self.assertEqual(3, len(dataset["ETHUSDT"]))
+
+        tracker: ReplayOrderBookTracker = ReplayOrderBookTracker(["ETHUSDT"])
+        order_book: OrderBook = tracker.order_books["ETHUSDT"]
+        trade_logger: EventLogger = EventLogger()
+        order_book.add_listener(OrderBookEvent.TradeEvent, trade_logger)
+        replay_iterator: OrderBookReplayIterator = OrderBookReplayIterator(tracker, dataset)
+        clock: Clock = Clock(ClockMode.BACKTEST, 1.0, 999.0, 1010.0)
+        clock.add_iterator(replay_iterator)
+
+        clock.backtest_til(1000.0)
+        self.assertEqual(99.0, order_book.get_price(False))
+        self.assertEqual(101.0, order_book.get_price(True))
+
+        clock.backtest_til(1002.0)
+        self.assertEqual(99.5, order_book.get_price(False))
+        self.assertEqual(102.0, order_book.get_price(True))
+        self.assertTrue(replay_iterator.finished)
+        self.assertEqual(3, replay_iterator.messages_replayed)
+
+        [trade_event] = trade_logger.event_log
+        self.assertIsInstance(trade_event, OrderBookTradeEvent)
+        self.assertEqual(TradeType.SELL, trade_event.type)
+        self.assertEqual(0.5, trade_event.amount)
+
+
+if __name__ == "__main__":
+    unittest.main()
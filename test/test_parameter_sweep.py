@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from decimal import Decimal
+import logging; logging.basicConfig(level=logging.ERROR)
+import numpy as np
+import os
+import pandas as pd
+import shutil
+import tempfile
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+import unittest
+
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecorder
+from hummingbot.core.data_type.order_book_replay import prepare_replay_dataset
+from hummingbot.core.py_time_iterator import PyTimeIterator
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy import parameter_sweep
+from hummingbot.strategy.parameter_sweep import (
+    SweepMarket,
+    SweepResult,
+    SweepSettings,
+    expand_parameter_grid,
+    run_parameter_sweep,
+    run_sweep_case,
+)
+
+
+class BuyOnceStrategy(PyTimeIterator):
+    """
+    Stub strategy that buys `order_amount` with a market order, once the market is ready.
+    """
+    def __init__(self, market_info: MarketTradingPairTuple, order_amount: float):
+        super().__init__()
+        self._market_info: MarketTradingPairTuple = market_info
+        self._order_amount: float = order_amount
+        self._order_placed: bool = False
+
+    def tick(self, timestamp: float):
+        if self._order_placed or not self._market_info.market.ready:
+            return
+        if len(list(self._market_info.order_book.ask_entries())) == 0:
+            return
+        self._market_info.market.buy(self._market_info.trading_pair, Decimal(str(self._order_amount)))
+        self._order_placed = True
+
+
+def buy_once_factory(market_infos: List[MarketTradingPairTuple], params: Dict[str, Any]) -> BuyOnceStrategy:
+    return BuyOnceStrategy(market_infos[0], params["order_amount"])
+
+
+class ParameterSweepUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        self.capture_dir: str = tempfile.mkdtemp()
+        self.dataset_dir: str = tempfile.mkdtemp()
+        self.output_dir: str = tempfile.mkdtemp()
+        messages = [
+            OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+                "symbol": "ETHUSDT",
+                "update_id": 1,
+                "bids": [[99.0, 10.0], [98.0, 20.0]],
+                "asks": [[101.0, 10.0], [102.0, 20.0]],
+            }, 1000.0),
+        ]
+        recorder: OrderBookRecorder = OrderBookRecorder(self.capture_dir)
+
+        async def record():
+            recorder.start()
+            for message in messages:
+                recorder.record(message)
+            recorder.flush()
+            while recorder.pending_batches > 0:
+                await asyncio.sleep(0.01)
+            recorder.stop()
+        self.ev_loop.run_until_complete(record())
+        prepare_replay_dataset(self.capture_dir, ["ETHUSDT"], os.path.join(self.dataset_dir, "binance"))
+        self.settings: SweepSettings = SweepSettings(dataset_dir=self.dataset_dir,
+                                                     markets=[SweepMarket("binance", "ETHUSDT", 10.0, 1000.0)],
+                                                     start_timestamp=999.0,
+                                                     end_timestamp=1020.0,
+                                                     inventory_sample_interval=5.0)
+
+    def tearDown(self):
+        shutil.rmtree(self.capture_dir)
+        shutil.rmtree(self.dataset_dir)
+        shutil.rmtree(self.output_dir)
+        # `run_sweep_case()` caches the dataset in the test process, as it would in a worker process.
+        parameter_sweep._worker_datasets = None
+
+    def test_expand_parameter_grid(self):
+        self.assertEqual([
+            {"order_amount": 1.0, "mode": "single"},
+            {"order_amount": 1.0, "mode": "multiple"},
+            {"order_amount": 2.0, "mode": "single"},
+            {"order_amount": 2.0, "mode": "multiple"},
+        ], expand_parameter_grid({"order_amount": [1.0, 2.0], "mode": ["single", "multiple"]}))
+        self.assertEqual([{}], expand_parameter_grid({}))
+
+    def test_run_sweep_case(self):
+        result: SweepResult = run_sweep_case(self.settings, buy_once_factory, 3, {"order_amount": 2.0})
+        self.assertEqual(3, result.case_index)
+        self.assertEqual({"order_amount": 2.0}, result.params)
+        self.assertEqual(1, result.buy_fills)
+        self.assertEqual(0, result.sell_fills)
+        self.assertAlmostEqual(2.0, result.filled_base_volume)
+        # Bought 2 ETH at 101, valued at the 100 mid price.
+        self.assertAlmostEqual(-2.0, result.pnl)
+        self.assertEqual((len(result.inventory_timestamps), 2), result.inventory_path.shape)
+        self.assertEqual([10.0, 1000.0], list(result.inventory_path[0]))
+        self.assertEqual([12.0, 798.0], list(result.inventory_path[-1]))
+
+    def test_run_parameter_sweep(self):
+        results_df: pd.DataFrame = run_parameter_sweep(self.settings,
+                                                       buy_once_factory,
+                                                       {"order_amount": [1.0, 2.0, 3.0]},
+                                                       max_workers=2,
+                                                       output_dir=self.output_dir)
+        self.assertEqual([0, 1, 2], list(results_df.case_index))
+        self.assertEqual([1.0, 2.0, 3.0], list(results_df.order_amount))
+        self.assertEqual([1, 1, 1], list(results_df.buy_fills))
+        self.assertEqual([1.0, 2.0, 3.0], list(results_df.filled_base_volume))
+        self.assertEqual([-1.0, -2.0, -3.0], list(results_df.pnl.round(6)))
+
+        saved_df: pd.DataFrame = pd.read_csv(os.path.join(self.output_dir, "results.csv"))
+        self.assertEqual(list(results_df.columns), list(saved_df.columns))
+        self.assertEqual(3, len(saved_df))
+        inventory_paths = np.load(os.path.join(self.output_dir, "inventory_paths.npz"))
+        self.assertEqual({f"{name}_{case_index}" for name in ("timestamps", "inventory") for case_index in range(3)},
+                         set(inventory_paths.files))
+        self.assertEqual([13.0, 697.0], list(inventory_paths["inventory_2"][-1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
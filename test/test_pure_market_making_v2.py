@@ -278,6 +278,41 @@ class PureMarketMakingV2UnitTest(unittest.TestCase):
         self.assertEqual(1, self.strategy.active_bids[0][1].quantity)
         self.assertEqual(1, self.strategy.active_asks[0][1].quantity)
 
+    def test_tick_cache(self):
+        strategy: PureMarketMakingStrategyV2 = self.multi_order_equal_strategy
+        symbol: str = self.maker_symbols[0]
+
+        # Lookups with arguments seen before in the tick are hits, anything else is a miss.
+        strategy.quantize_order_price_cached(self.maker_market, symbol, Decimal("99"))
+        strategy.quantize_order_price_cached(self.maker_market, symbol, Decimal("101"))
+        strategy.quantize_order_price_cached(self.maker_market, symbol, Decimal("99"))
+        strategy.get_order_price_quantum_cached(self.maker_market, symbol, Decimal("99"))
+        for _ in range(2):
+            strategy.get_fee_cached(self.maker_market, "COINALPHA", "WETH", OrderType.LIMIT, TradeType.BUY,
+                                    Decimal(1), Decimal("99"))
+        self.assertEqual(2, strategy.tick_cache_hits)
+        self.assertEqual(4, strategy.tick_cache_misses)
+        self.assertAlmostEqual(2 / 6, strategy.tick_cache_hit_rate)
+
+        self.clock.remove_iterator(self.strategy)
+        self.clock.add_iterator(strategy)
+        self.clock.backtest_til(self.start_timestamp + self.clock_tick_size)
+        self.assertEqual(5, len(strategy.active_bids))
+        hits: int = strategy.tick_cache_hits
+        misses: int = strategy.tick_cache_misses
+        for _ in range(2):
+            strategy.quantize_order_price_cached(self.maker_market, symbol, Decimal("12.345"))
+        self.assertEqual(hits + 1, strategy.tick_cache_hits)
+        self.assertEqual(misses + 1, strategy.tick_cache_misses)
+
+        # Cached values do not outlive a tick.
+        self.clock.backtest_til(self.start_timestamp + 2 * self.clock_tick_size)
+        hits = strategy.tick_cache_hits
+        misses = strategy.tick_cache_misses
+        strategy.quantize_order_price_cached(self.maker_market, symbol, Decimal("12.345"))
+        self.assertEqual(hits, strategy.tick_cache_hits)
+        self.assertEqual(misses + 1, strategy.tick_cache_misses)
+
     def test_check_sufficient_balance(self):
         self.maker_market.set_balance("WETH", 0)
         end_ts = self.start_timestamp + self.clock_tick_size
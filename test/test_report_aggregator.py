@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from decimal import Decimal
+from typing import (
+    Dict,
+    List,
+    Tuple,
+)
+import unittest
+from unittest.mock import MagicMock
+
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.utils.metrics import (
+    HistogramSnapshot,
+    LabelValues,
+)
+from hummingbot.logger.report_aggregator import ReportAggregator
+
+
+class ReportAggregatorUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self.binance: MagicMock = MagicMock()
+        self.binance.name = "binance"
+        self.huobi: MagicMock = MagicMock()
+        self.huobi.name = "huobi"
+        self.active_maker_orders: List[Tuple[MagicMock, LimitOrder]] = [
+            (self.binance, LimitOrder("buy-1", "ETHUSDT", True, "ETH", "USDT", Decimal("100.5"), Decimal("2"))),
+            (self.binance, LimitOrder("sell-1", "ETHUSDT", False, "ETH", "USDT", Decimal("101.5"), Decimal("1"))),
+            (self.huobi, LimitOrder("buy-2", "ethusdt", True, "ETH", "USDT", Decimal("99"), Decimal("0.5"))),
+        ]
+        self.app: MagicMock = MagicMock()
+        self.app.strategy.active_maker_orders = self.active_maker_orders
+        self.aggregator: ReportAggregator = ReportAggregator(self.app, report_aggregation_interval=0.01)
+
+    def test_open_order_stats(self):
+        async def sample_open_orders():
+            task: asyncio.Task = asyncio.ensure_future(self.aggregator.get_open_order_stats())
+            await asyncio.sleep(0.1)
+            task.cancel()
+        self.ev_loop.run_until_complete(sample_open_orders())
+
+        snapshots: Dict[LabelValues, HistogramSnapshot] = self.aggregator._open_order_quote_volume_sum.snapshot()
+        self.assertEqual({("binance", "ETHUSDT"), ("huobi", "ethusdt")}, set(snapshots.keys()))
+        self.assertGreater(snapshots[("binance", "ETHUSDT")].count, 0)
+        self.assertAlmostEqual(302.5, snapshots[("binance", "ETHUSDT")].mean)
+        self.assertAlmostEqual(49.5, snapshots[("huobi", "ethusdt")].mean)
+
+    def test_sample_open_orders(self):
+        self.aggregator.sample_open_orders(self.active_maker_orders)
+        self.aggregator.sample_open_orders(self.active_maker_orders[:1])
+        snapshot: HistogramSnapshot = self.aggregator._open_order_quote_volume_sum.snapshot()[("binance", "ETHUSDT")]
+        self.assertEqual(2, snapshot.count)
+        self.assertAlmostEqual((302.5 + 201.0) / 2, snapshot.mean)
+
+
+if __name__ == "__main__":
+    unittest.main()
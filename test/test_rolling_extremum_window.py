@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import math
+import random
+import unittest
+
+from hummingbot.core.data_type.rolling_extremum_window import RollingExtremumWindow
+
+
+class RollingExtremumWindowUnitTest(unittest.TestCase):
+    def test_matches_brute_force(self):
+        random.seed(42)
+        max_window: RollingExtremumWindow = RollingExtremumWindow(12, True)
+        min_window: RollingExtremumWindow = RollingExtremumWindow(12, False)
+        samples = []
+        for _ in range(500):
+            value: float = random.choice([random.uniform(90, 110), float(random.randint(95, 105))])
+            samples.append(value)
+            max_window.append(value)
+            min_window.append(value)
+            window = samples[-12:]
+            self.assertEqual(window, max_window.samples)
+            self.assertEqual(max(window), max_window.extremum)
+            self.assertEqual(min(window), min_window.extremum)
+            self.assertEqual(max(window + [100.0]), max_window.extremum_with(100.0))
+            self.assertEqual(min(window + [100.0]), min_window.extremum_with(100.0))
+
+    def test_nan_tracking(self):
+        window: RollingExtremumWindow = RollingExtremumWindow(3, True)
+        self.assertFalse(window.has_nan)
+        self.assertTrue(math.isnan(window.extremum))
+        self.assertEqual(5.0, window.extremum_with(5.0))
+
+        window.append(float("nan"))
+        window.append(2.0)
+        self.assertTrue(window.has_nan)
+        self.assertEqual(2.0, window.extremum)
+        self.assertEqual(2.0, window.extremum_with(float("nan")))
+        window.append(1.0)
+        self.assertTrue(window.has_nan)
+        window.append(1.5)
+        self.assertFalse(window.has_nan)
+        self.assertEqual(2.0, window.extremum)
+        window.append(0.5)
+        self.assertEqual(1.5, window.extremum)
+
+
+if __name__ == "__main__":
+    unittest.main()
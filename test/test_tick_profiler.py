@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import time
+import unittest
+from typing import List
+
+from hummingbot.core.event.events import MarketEvent
+from hummingbot.core.utils.tick_profiler import (
+    SlowTick,
+    TickProfiler,
+)
+
+
+class MockMarket:
+    pass
+
+
+class MockStrategy:
+    def did_fill_order(self, event_tag: int, market: MockMarket, evt):
+        pass
+
+
+class MockForwarder:
+    def __init__(self, to_function):
+        self._to_function = to_function
+
+
+class TickProfilerUnitTest(unittest.TestCase):
+    def run_tick(self, profiler: TickProfiler, timestamp: float, market_time: float):
+        profiler.begin_tick(timestamp)
+        profiler.enter_iterator(MockMarket())
+        profiler.enter_listener(MarketEvent.OrderFilled.value, MockForwarder(MockStrategy().did_fill_order))
+        time.sleep(market_time)
+        profiler.exit()
+        profiler.exit_iterator()
+        profiler.enter_iterator(MockStrategy())
+        profiler.exit_iterator()
+        profiler.end_tick()
+
+    def test_collapsed_stacks(self):
+        profiler: TickProfiler = TickProfiler(max_slow_ticks=2)
+        for i, market_time in enumerate([0.001, 0.02, 0.005]):
+            self.run_tick(profiler, 1000.0 + i, market_time)
+
+        self.assertEqual(3, profiler.num_ticks)
+        stacks: List[str] = [line.rsplit(" ", 1)[0] for line in profiler.collapsed_stacks()]
+        self.assertIn("Clock.tick;MockMarket;MarketEvent.OrderFilled:MockStrategy.did_fill_order", stacks)
+        listener_time: int = int(profiler.collapsed_stacks()[stacks.index(
+            "Clock.tick;MockMarket;MarketEvent.OrderFilled:MockStrategy.did_fill_order")].rsplit(" ", 1)[1])
+        self.assertGreaterEqual(listener_time, 26000)
+
+        slowest_ticks: List[SlowTick] = profiler.slowest_ticks()
+        self.assertEqual([1001.0, 1002.0], [slow_tick.timestamp for slow_tick in slowest_ticks])
+        self.assertEqual(["MockMarket", "MockStrategy"],
+                         [name for name, _ in slowest_ticks[0].iterator_durations])
+        self.assertEqual("MarketEvent.OrderFilled:MockStrategy.did_fill_order", profiler.frame_totals()[0][0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from typing import (
+    Any,
+    Dict,
+    List,
+    Tuple,
+)
+import unittest
+from unittest.mock import MagicMock
+
+from hummingbot.wallet.ethereum.zero_ex.zero_ex_coordinator import (
+    ZeroExCancellationFailedException,
+    ZeroExCoordinator,
+)
+
+MAKER_ADDRESS = "0x" + "11" * 20
+FEE_RECIPIENTS = {
+    "0x" + "aa" * 20: "https://coordinator-a.example.com",
+    "0x" + "bb" * 20: "https://coordinator-b.example.com",
+}
+
+
+def make_order(fee_recipient: str, salt: int) -> Dict[str, Any]:
+    return {
+        "makerAddress": MAKER_ADDRESS,
+        "feeRecipientAddress": fee_recipient,
+        "salt": str(salt),
+    }
+
+
+class MockZeroExCoordinator(ZeroExCoordinator):
+    def __init__(self):
+        super().__init__(MagicMock(), MagicMock(), "0x" + "22" * 20, "0x" + "33" * 20, "0x" + "44" * 20, MagicMock(),
+                         endpoint_cache_ttl=60.0)
+        self.endpoint_lookups: List[str] = []
+        self.cancel_requests: List[Tuple[str, List[Dict[str, Any]]]] = []
+        self.failing_endpoints: List[str] = []
+        # A Coordinator server rejects the whole request if it contains any of these orders.
+        self.invalid_salts: List[str] = []
+
+    async def _fetch_server_endpoint_or_throw(self, feeRecipient: str) -> str:
+        self.endpoint_lookups.append(feeRecipient)
+        return FEE_RECIPIENTS[feeRecipient]
+
+    async def _request_soft_cancels(self, makerAddress: str, orders: List[Dict[str, Any]]):
+        self.cancel_requests.append((makerAddress, orders))
+        serverEndpointsToOrders = await self._map_server_endpoints_to_orders(orders)
+        errorsWithOrders = [{"isError": True, "coordinatorOperator": endpoint, "orders": endpoint_orders}
+                            for endpoint, endpoint_orders in serverEndpointsToOrders.items()
+                            if endpoint in self.failing_endpoints or
+                            any(order["salt"] in self.invalid_salts for order in endpoint_orders)]
+        return [], errorsWithOrders
+
+
+class ZeroExCoordinatorUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self.coordinator: MockZeroExCoordinator = MockZeroExCoordinator()
+        self.fee_recipient_a, self.fee_recipient_b = list(FEE_RECIPIENTS.keys())
+
+    def test_soft_cancel_aggregation(self):
+        orders: List[Dict[str, Any]] = [make_order(self.fee_recipient_a, salt) for salt in range(5)]
+        results: List[bool] = self.ev_loop.run_until_complete(asyncio.gather(
+            self.coordinator.batch_soft_cancel_orders(orders[:2]),
+            *[self.coordinator.soft_cancel_order(order) for order in orders[2:]]
+        ))
+        self.assertEqual([True] * 4, results)
+        self.assertEqual(1, len(self.coordinator.cancel_requests))
+        self.assertEqual(orders, self.coordinator.cancel_requests[0][1])
+
+        # Only the requests with orders on the failing Coordinator server fail.
+        self.coordinator.failing_endpoints.append(FEE_RECIPIENTS[self.fee_recipient_b])
+        order_b: Dict[str, Any] = make_order(self.fee_recipient_b, 10)
+        results = self.ev_loop.run_until_complete(asyncio.gather(
+            self.coordinator.soft_cancel_order(orders[0]),
+            self.coordinator.batch_soft_cancel_orders([orders[1], order_b]),
+            return_exceptions=True
+        ))
+        self.assertTrue(results[0])
+        self.assertIsInstance(results[1], ZeroExCancellationFailedException)
+        self.assertEqual([order_b], results[1].errors[0]["orders"])
+        # The failed order is resubmitted on its own before the request fails.
+        self.assertEqual(3, len(self.coordinator.cancel_requests))
+        self.assertEqual([order_b], self.coordinator.cancel_requests[2][1])
+
+    def test_soft_cancel_retry(self):
+        # One invalid order makes the Coordinator server reject the orders of every request it was batched with.
+        orders: List[Dict[str, Any]] = [make_order(self.fee_recipient_a, salt) for salt in range(4)]
+        self.coordinator.invalid_salts.append(orders[3]["salt"])
+        results: List[Any] = self.ev_loop.run_until_complete(asyncio.gather(
+            self.coordinator.batch_soft_cancel_orders(orders[:2]),
+            self.coordinator.soft_cancel_order(orders[2]),
+            self.coordinator.soft_cancel_order(orders[3]),
+            return_exceptions=True
+        ))
+        self.assertEqual([True, True], results[:2])
+        self.assertIsInstance(results[2], ZeroExCancellationFailedException)
+        self.assertEqual([orders[3]], results[2].errors[0]["orders"])
+        self.assertEqual([orders, orders[:2], orders[2:3], orders[3:]],
+                         sorted([request_orders for _, request_orders in self.coordinator.cancel_requests],
+                                key=len, reverse=True))
+
+        # The same goes for requests that fail altogether, e.g. on an unknown fee recipient.
+        self.coordinator.cancel_requests.clear()
+        unknown_order: Dict[str, Any] = make_order("0x" + "cc" * 20, 10)
+        results = self.ev_loop.run_until_complete(asyncio.gather(
+            self.coordinator.soft_cancel_order(orders[0]),
+            self.coordinator.soft_cancel_order(unknown_order),
+            return_exceptions=True
+        ))
+        self.assertTrue(results[0])
+        self.assertIsInstance(results[1], KeyError)
+        self.assertEqual(3, len(self.coordinator.cancel_requests))
+
+    def test_endpoint_cache(self):
+        for _ in range(3):
+            self.ev_loop.run_until_complete(self.coordinator._map_server_endpoints_to_orders(
+                [make_order(self.fee_recipient_a, 1), make_order(self.fee_recipient_b, 2)]
+            ))
+        self.assertEqual(2, len(self.coordinator.endpoint_lookups))
+
+        endpoint, lookup_timestamp = self.coordinator._feeRecipientToEndpoint[self.fee_recipient_a]
+        self.coordinator._feeRecipientToEndpoint[self.fee_recipient_a] = (endpoint, lookup_timestamp - 120)
+        self.ev_loop.run_until_complete(self.coordinator._get_server_endpoint_or_throw(self.fee_recipient_a))
+        self.assertEqual([self.fee_recipient_a, self.fee_recipient_b, self.fee_recipient_a],
+                         self.coordinator.endpoint_lookups)
+
+
+if __name__ == "__main__":
+    unittest.main()
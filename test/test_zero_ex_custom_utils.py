@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from eth_account import Account
+from eth_account.local import LocalAccount
+from eth_account.messages import defunct_hash_message
+import random
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+import unittest
+from zero_ex.order_utils import generate_order_hash_hex
+
+from hummingbot.wallet.ethereum.zero_ex.zero_ex_custom_utils import (
+    convert_eth_sign_signature,
+    generate_order_hashes_hex,
+)
+
+NULL_ADDRESS = "0x0000000000000000000000000000000000000000"
+EXCHANGE_ADDRESS = "0x4f833a24e1f95d70f028921e27040ca56e09ab0b"
+
+
+class ZeroExCustomUtilsUnitTest(unittest.TestCase):
+    def test_generate_order_hashes_hex(self):
+        random.seed(42)
+        orders: List[Dict[str, Any]] = [{
+            "makerAddress": "0x" + bytes(random.getrandbits(8) for _ in range(20)).hex(),
+            "takerAddress": NULL_ADDRESS,
+            "feeRecipientAddress": "0x" + bytes(random.getrandbits(8) for _ in range(20)).hex(),
+            "senderAddress": NULL_ADDRESS,
+            "makerAssetAmount": str(random.getrandbits(80)),
+            "takerAssetAmount": str(random.getrandbits(80)),
+            "makerFee": "0",
+            "takerFee": "0",
+            "expirationTimeSeconds": str(random.getrandbits(32)),
+            "salt": str(random.getrandbits(128)),
+            "makerAssetData": bytes.fromhex("f47261b0" + "00" * 12 + "ab" * 20),
+            "takerAssetData": bytes.fromhex("f47261b0" + "00" * 12 + "cd" * 20),
+        } for _ in range(10)]
+        expected_hashes: List[str] = [generate_order_hash_hex(order, EXCHANGE_ADDRESS) for order in orders]
+        self.assertEqual(expected_hashes, generate_order_hashes_hex(orders, EXCHANGE_ADDRESS))
+
+        # JSON dicts have hex string asset data.
+        jsdict_orders: List[Dict[str, Any]] = [
+            dict(order,
+                 makerAssetData="0x" + order["makerAssetData"].hex(),
+                 takerAssetData="0x" + order["takerAssetData"].hex())
+            for order in orders
+        ]
+        self.assertEqual(expected_hashes, generate_order_hashes_hex(jsdict_orders, EXCHANGE_ADDRESS))
+
+    def test_convert_eth_sign_signature(self):
+        account: LocalAccount = Account.create()
+        order_hash_hex: str = "55eaa6ec02f3224d30873577e9ddd069a288c16d6fb407210eecbc501fa76692"
+        message_hash: bytes = defunct_hash_message(hexstr=order_hash_hex)
+        signature: str = convert_eth_sign_signature(account.signHash(message_hash)["signature"])
+
+        # V + R + S + the ETH_SIGN signature type
+        self.assertEqual(2 + 66 * 2, len(signature))
+        self.assertTrue(signature.endswith("03"))
+        vrs = (int(signature[2:4], 16), int(signature[4:68], 16), int(signature[68:132], 16))
+        self.assertEqual(account.address, Account.recoverHash(message_hash, vrs=vrs))
+
+
+if __name__ == "__main__":
+    unittest.main()